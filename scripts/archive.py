@@ -0,0 +1,284 @@
+"""
+KOSPI Strategy Dashboard - Decision history archive
+One row per trading day — decision state, the latest indicator values, the
+day's signal and investor net-buy figures — appended to yearly columnar
+partitions, so questions like "how often was STRONG_SELL followed by a
+drawdown" are answered from the archive instead of replaying the git
+history of market_data.json.
+
+    public/data/archive/index.json    columns, categorical vocabularies, partitions
+    public/data/archive/<year>.npz    one array per column (date = days since 1970-01-01)
+
+Only the partition of the year being appended is rewritten (temp file +
+os.replace); earlier years never change. A re-run for the same date
+replaces that day's row, and an identical row writes nothing. Queries read
+index.json, open only the years overlapping the requested range and load
+only the requested columns (npz members are read on access).
+
+    python scripts/archive.py range --from 2025-01-01 --columns state,close,rsi14
+    python scripts/archive.py transitions [--from ...] [--to ...]
+    python scripts/archive.py outcomes --state STRONG_SELL --horizon 20 --drawdown 0.05
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+ARCHIVE_DIR = "public/data/archive"
+ARCHIVE_VERSION = 1
+CATEGORICAL = ("state", "signal")       # 문자열 → 어휘 인덱스 (int16, -1 = 없음)
+DAY = np.timedelta64(1, "D")
+EPOCH = np.datetime64("1970-01-01", "D")
+
+
+def snapshot_row(sections, supply_demand=None):
+    """Archive row for one run from analyze_symbol() sections and the supplyDemand section."""
+    latest, decision = sections["latest"], sections["decisionTree"]
+    today = [s for s in sections["signals"] if s["date"] == latest["date"]]
+    row = {
+        "date": latest["date"],
+        "state": decision["currentState"],
+        "signal": f"{today[-1]['type']}:{today[-1]['reason']}" if today else None,
+        "cashRatio": decision.get("cashRatio"),
+        "confidence": decision.get("confidence"),
+        "close": latest["close"],
+        "volume": latest["volume"],
+        **latest["indicators"],
+    }
+    for mkt, data in (supply_demand or {}).items():
+        row.update({f"{mkt}_{who}": val for who, val in (data.get("latest") or {}).items()})
+    return row
+
+
+def _days(dates):
+    return ((np.asarray(dates, dtype="datetime64[D]") - EPOCH) // DAY).astype(np.int64)
+
+
+def _year(day):
+    return int(str(EPOCH + int(day) * DAY)[:4])
+
+
+class Archive:
+    """Yearly npz partitions under `directory`, described by index.json."""
+
+    def __init__(self, directory=ARCHIVE_DIR):
+        self.directory = directory
+        self._index = None
+
+    # ---------------------------------------------------------------------
+    # Index / partitions
+    # ---------------------------------------------------------------------
+
+    @property
+    def index(self):
+        if self._index is None:
+            try:
+                with open(os.path.join(self.directory, "index.json"), encoding="utf-8") as f:
+                    self._index = json.load(f)
+                if self._index.get("version") != ARCHIVE_VERSION:
+                    raise ValueError(f"archive version {self._index.get('version')} != {ARCHIVE_VERSION}")
+            except FileNotFoundError:
+                self._index = {"version": ARCHIVE_VERSION, "columns": ["date"],
+                               "categories": {c: [] for c in CATEGORICAL}, "partitions": {}}
+        return self._index
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _load(self, year, columns=None):
+        """{column: array} of one partition; columns it predates come back as NaN / -1."""
+        part = self.index["partitions"][str(year)]
+        with np.load(self._path(part["file"])) as npz:
+            names = npz.files if columns is None else columns
+            out = {}
+            for c in names:
+                if c in npz.files:
+                    out[c] = npz[c]
+                else:
+                    out[c] = np.full(part["rows"], -1 if c in CATEGORICAL else np.nan,
+                                     dtype=np.int16 if c in CATEGORICAL else float)
+        return out
+
+    def _save(self, year, arrays):
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"{year}.npz"
+        tmp = self._path(name + ".tmp.npz")
+        np.savez_compressed(tmp, **arrays)
+        os.replace(tmp, self._path(name))
+        days = arrays["date"]
+        self.index["partitions"][str(year)] = {
+            "file": name, "rows": len(days),
+            "first": str(EPOCH + int(days[0]) * DAY), "last": str(EPOCH + int(days[-1]) * DAY)}
+
+    def _write_index(self):
+        tmp = self._path("index.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, self._path("index.json"))
+
+    def _encode(self, column, values):
+        vocab = self.index["categories"].setdefault(column, [])
+        codes = np.empty(len(values), dtype=np.int16)
+        for i, v in enumerate(values):
+            if v is None:
+                codes[i] = -1
+                continue
+            if v not in vocab:
+                vocab.append(v)               # 어휘는 뒤에만 붙인다 — 기존 코드는 그대로
+            codes[i] = vocab.index(v)
+        return codes
+
+    # ---------------------------------------------------------------------
+    # Append
+    # ---------------------------------------------------------------------
+
+    def append(self, rows):
+        """Add rows (dicts with an ISO "date"); returns the number of rows written.
+
+        Rows must not predate the last archived day (append-only); a row for
+        the last day replaces it. Columns unseen so far are added, and
+        earlier rows read them as missing.
+        """
+        rows = sorted(rows, key=lambda r: r["date"])
+        if not rows:
+            return 0
+        last = max((p["last"] for p in self.index["partitions"].values()), default=None)
+        if last is not None and rows[0]["date"] < last:
+            raise ValueError(f"archive is append-only: {rows[0]['date']} is before the last day {last}")
+
+        columns = self.index["columns"]
+        for r in rows:
+            columns.extend(k for k in r if k not in columns)
+        days = _days([r["date"] for r in rows])
+        new = {"date": days}
+        for c in columns[1:]:
+            vals = [r.get(c) for r in rows]
+            new[c] = self._encode(c, vals) if c in CATEGORICAL else \
+                np.array([np.nan if v is None else v for v in vals], dtype=float)
+
+        written = 0
+        years = np.array([_year(d) for d in days])
+        for year in np.unique(years):
+            take = years == year
+            chunk = {c: a[take] for c, a in new.items()}
+            if str(year) in self.index["partitions"]:
+                old = self._load(year, columns)
+                keep = old["date"] < chunk["date"][0]           # 같은 날짜는 새 행으로 교체
+                if (~keep).sum() == len(chunk["date"]) and all(
+                        np.array_equal(old[c][~keep], chunk[c], equal_nan=c not in CATEGORICAL)
+                        for c in columns):
+                    continue                                     # 같은 내용 — 쓰지 않는다
+                chunk = {c: np.concatenate([old[c][keep], chunk[c]]) for c in columns}
+            self._save(year, chunk)
+            written += int(take.sum())
+        if written:
+            self._write_index()
+        return written
+
+    # ---------------------------------------------------------------------
+    # Queries
+    # ---------------------------------------------------------------------
+
+    def years(self, start=None, end=None):
+        """Partition years overlapping [start, end] (ISO dates, inclusive)."""
+        return sorted(int(y) for y, p in self.index["partitions"].items()
+                      if (start is None or p["last"] >= start) and (end is None or p["first"] <= end))
+
+    def read(self, columns=None, start=None, end=None):
+        """DataFrame (date index) of `columns` for [start, end], from the overlapping partitions only."""
+        import pandas as pd
+
+        wanted = [c for c in (columns or self.index["columns"]) if c != "date"]
+        unknown = set(wanted) - set(self.index["columns"])
+        if unknown:
+            raise KeyError(f"unknown archive columns: {', '.join(sorted(unknown))}")
+        parts = [self._load(y, ["date"] + wanted) for y in self.years(start, end)]
+        if not parts:
+            return pd.DataFrame(columns=wanted, index=pd.DatetimeIndex([], name="date"))
+        cols = {c: np.concatenate([p[c] for p in parts]) for c in ["date"] + wanted}
+        lo = 0 if start is None else np.searchsorted(cols["date"], _days([start])[0])
+        hi = len(cols["date"]) if end is None else np.searchsorted(cols["date"], _days([end])[0], side="right")
+        index = pd.DatetimeIndex((EPOCH + cols["date"][lo:hi] * DAY).astype("datetime64[ns]"), name="date")
+        data = {}
+        for c in wanted:
+            vals = cols[c][lo:hi]
+            if c in CATEGORICAL:
+                vals = pd.Categorical.from_codes(vals, categories=self.index["categories"][c])
+            data[c] = vals
+        return pd.DataFrame(data, index=index)
+
+    def transitions(self, start=None, end=None, column="state"):
+        """Day-to-day transition counts of a categorical column: DataFrame from × to."""
+        import pandas as pd
+
+        codes = self.read([column], start, end)[column].cat.codes.to_numpy()
+        vocab = self.index["categories"][column]
+        counts = np.zeros((len(vocab), len(vocab)), dtype=np.int64)
+        pairs = (codes[:-1] >= 0) & (codes[1:] >= 0)
+        np.add.at(counts, (codes[:-1][pairs], codes[1:][pairs]), 1)
+        return pd.DataFrame(counts, index=pd.Index(vocab, name="from"), columns=pd.Index(vocab, name="to"))
+
+    def outcomes(self, state, horizon=20, drawdown=0.05, start=None, end=None, onset=True):
+        """What followed `state`: forward return / max drawdown of close over `horizon` days.
+
+        onset=True counts only the first day of each run of `state`.
+        Returns (per-occurrence DataFrame, summary dict); occurrences with
+        fewer than `horizon` archived days after them are left out.
+        """
+        df = self.read(["state", "close"], start, end)
+        hit = (df["state"] == state).to_numpy()
+        if onset:
+            hit = hit & ~np.concatenate([[False], hit[:-1]])
+        close = df["close"].to_numpy()
+        idx = np.flatnonzero(hit)
+        idx = idx[idx + horizon < len(close)]
+        # (발생 × horizon) 창 — 이후 종가의 최저점과 마지막 값
+        window = close[idx[:, None] + np.arange(1, horizon + 1)]
+        base = close[idx]
+        fwd_return = window[:, -1] / base - 1
+        max_dd = np.minimum(window.min(axis=1) / base - 1, 0.0)
+        rows = df.iloc[idx][[]].assign(close=base, forwardReturn=fwd_return, maxDrawdown=max_dd)
+        n = len(idx)
+        summary = {
+            "state": state, "horizon": horizon, "drawdown": drawdown, "occurrences": n,
+            "followedByDrawdown": int((max_dd <= -drawdown).sum()),
+            "rate": float((max_dd <= -drawdown).mean()) if n else None,
+            "meanForwardReturn": float(fwd_return.mean()) if n else None,
+            "meanMaxDrawdown": float(max_dd.mean()) if n else None,
+        }
+        return rows, summary
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Query the decision history archive")
+    ap.add_argument("--archive", default=ARCHIVE_DIR, help=f"archive directory (default: {ARCHIVE_DIR})")
+    sub = ap.add_subparsers(dest="command", required=True)
+    q = sub.add_parser("range", help="rows of selected columns in a date range")
+    q.add_argument("--columns", default="state,signal,close", help="comma-separated columns")
+    t = sub.add_parser("transitions", help="day-to-day state transition counts")
+    o = sub.add_parser("outcomes", help="forward return / drawdown after a state")
+    o.add_argument("--state", required=True)
+    o.add_argument("--horizon", type=int, default=20, help="trading days after the state (default: 20)")
+    o.add_argument("--drawdown", type=float, default=0.05, help="drawdown threshold (default: 0.05)")
+    o.add_argument("--every-day", action="store_true", help="count every day in the state, not only onsets")
+    for p in (q, t, o):
+        p.add_argument("--from", dest="start", default=None, help="YYYY-MM-DD")
+        p.add_argument("--to", dest="end", default=None, help="YYYY-MM-DD")
+    args = ap.parse_args(argv)
+
+    archive = Archive(args.archive)
+    if args.command == "range":
+        print(archive.read(args.columns.split(","), args.start, args.end).to_string())
+    elif args.command == "transitions":
+        print(archive.transitions(args.start, args.end).to_string())
+    else:
+        rows, summary = archive.outcomes(args.state, args.horizon, args.drawdown, args.start, args.end,
+                                         onset=not args.every_day)
+        print(rows.to_string())
+        print(json.dumps(summary, ensure_ascii=False, indent=1))
+
+
+if __name__ == "__main__":
+    main()
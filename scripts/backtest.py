@@ -0,0 +1,252 @@
+"""
+KOSPI Strategy Dashboard - Parameter-sweep backtester
+Evaluates every combination of signal parameters (RSI period/thresholds,
+MA cross periods, MACD spans, Bollinger period/width) and holding periods
+with the same rules as generate_signals/compute_metrics, without a Python
+loop per combination:
+
+1. each distinct indicator setting is computed once (pandas, as in
+   compute_indicators) into a small "bank" of rows over the window;
+2. a chunk of combinations gathers its rows by fancy indexing into
+   (combinations × time) arrays and runs fetch_data.signal_codes on them;
+3. winRate / MDD / Sharpe / avgReturn are reduced along the time axis for
+   every holding period at once.
+
+Chunks run on a process pool for large grids. With the default grid the
+result equals compute_metrics(df1y, generate_signals(df1y)).
+
+    python scripts/backtest.py --grid rsi_low=20,25,30 --grid holding_days=5,10,20 [--workers N]
+"""
+
+import argparse
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from fetch_data import SIGNAL_RULES, compute_macd, compute_rsi, signal_codes
+
+DEFAULT_GRID = {
+    "rsi_period": [14], "rsi_low": [30], "rsi_high": [70],
+    "ma_fast": [5], "ma_slow": [20],
+    "macd_fast": [12], "macd_slow": [26], "macd_signal": [9],
+    "bb_period": [20], "bb_k": [2.0],
+    "holding_days": [20],
+}
+SIGNAL_PARAMS = [k for k in DEFAULT_GRID if k != "holding_days"]
+METRICS = ["winRate", "mdd", "sharpeRatio", "avgReturn", "totalSignals", "buySignals",
+           "profitableSignals", "maxReturn", "minReturn"]
+BUY_CODES = [i for i, (kind, _, _) in enumerate(SIGNAL_RULES) if kind == "BUY"]
+RISK_FREE = 0.03
+CHUNK = 2048              # 청크당 조합 수 — (조합 × 시간) 배열 메모리 상한
+
+
+# ---------------------------------------------------------------------------
+# Grid / indicator bank
+# ---------------------------------------------------------------------------
+
+def combinations(grid):
+    """DataFrame of valid signal-parameter combinations (holding periods excluded)."""
+    grid = {**DEFAULT_GRID, **grid}
+    combos = pd.DataFrame(list(itertools.product(*(grid[k] for k in SIGNAL_PARAMS))),
+                          columns=SIGNAL_PARAMS)
+    valid = ((combos["ma_fast"] < combos["ma_slow"]) & (combos["macd_fast"] < combos["macd_slow"])
+             & (combos["rsi_low"] < combos["rsi_high"]))
+    return combos[valid].reset_index(drop=True)
+
+
+def build_bank(close, combos, start):
+    """Indicator rows for every distinct setting in `combos`, sliced to [start:].
+
+    Returns (bank, rows): bank maps a name to a (settings × window) matrix,
+    rows maps it to each combination's row index in that matrix.
+    """
+    s = pd.Series(close)
+
+    def matrix(keys, fn):
+        keys = list(dict.fromkeys(keys))
+        mat = np.stack([np.asarray(fn(k), dtype=float)[start:] for k in keys])
+        return mat, {k: i for i, k in enumerate(keys)}
+
+    def ids(lookup, keys):
+        return np.fromiter((lookup[k] for k in keys), dtype=np.int64, count=len(combos))
+
+    bank, rows = {}, {}
+    bank["rsi"], lk = matrix(combos["rsi_period"], lambda p: compute_rsi(s, p))
+    rows["rsi"] = ids(lk, combos["rsi_period"])
+
+    ma_keys = pd.concat([combos["ma_fast"], combos["ma_slow"]])
+    bank["ma"], lk = matrix(ma_keys, lambda p: s.rolling(p).mean())
+    rows["ma_fast"], rows["ma_slow"] = ids(lk, combos["ma_fast"]), ids(lk, combos["ma_slow"])
+
+    macd_keys = list(zip(combos["macd_fast"], combos["macd_slow"], combos["macd_signal"]))
+    macd = {k: compute_macd(s, *k) for k in dict.fromkeys(macd_keys)}
+    bank["macd"], lk = matrix(macd_keys, lambda k: macd[k][0])
+    bank["macd_signal"], _ = matrix(macd_keys, lambda k: macd[k][1])
+    rows["macd"] = ids(lk, macd_keys)
+
+    bank["bb_mid"], lk = matrix(combos["bb_period"], lambda p: s.rolling(p).mean())
+    bank["bb_std"], _ = matrix(combos["bb_period"], lambda p: s.rolling(p).std())
+    rows["bb"] = ids(lk, combos["bb_period"])
+    return bank, rows
+
+
+# ---------------------------------------------------------------------------
+# Vectorized evaluation
+# ---------------------------------------------------------------------------
+
+def evaluate(bank, close, rows, rsi_low, rsi_high, bb_k, holdings):
+    """Metrics for one chunk: {metric: (combinations × holdings) array}."""
+    n_combo, n_t = len(rsi_low), len(close)
+    mid, std = bank["bb_mid"][rows["bb"]], bank["bb_std"][rows["bb"]]
+    k = np.asarray(bb_k, dtype=float)[:, None]
+    codes = signal_codes(
+        close, bank["rsi"][rows["rsi"]], bank["macd"][rows["macd"]], bank["macd_signal"][rows["macd"]],
+        mid + k * std, mid - k * std, bank["ma"][rows["ma_fast"]], bank["ma"][rows["ma_slow"]],
+        rsi_low=np.asarray(rsi_low, dtype=float)[:, None],
+        rsi_high=np.asarray(rsi_high, dtype=float)[:, None],
+    )
+    buy = np.isin(codes, BUY_CODES)
+    n = buy.sum(axis=1)
+    total = (codes >= 0).sum(axis=1)
+
+    out = {m: np.zeros((n_combo, len(holdings))) for m in METRICS}
+    out["totalSignals"][:] = total[:, None]
+    out["buySignals"][:] = n[:, None]
+    has = n > 0
+    for j, h in enumerate(holdings):
+        exit_idx = np.minimum(np.arange(n_t) + h, n_t - 1)
+        fwd = (close[exit_idx] - close) / close
+        r = np.where(buy, fwd, 0.0)
+        wins = (buy & (fwd > 0)).sum(axis=1)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            avg = r.sum(axis=1) / n
+            var = (np.where(buy, fwd - avg[:, None], 0.0) ** 2).sum(axis=1) / (n - 1)
+            std_r = np.where(n > 1, np.sqrt(var), 0.0)
+            sharpe = np.where(std_r > 0, (avg - RISK_FREE / (252 / h)) / std_r * np.sqrt(252 / h), 0.0)
+
+        # compute_metrics 처럼 첫 매수 신호의 누적값부터 고점을 잡는다;
+        # 신호 사이 구간은 누적값이 그대로라 낙폭 최소값에 영향이 없다
+        cum = np.cumprod(np.where(buy, 1.0 + fwd, 1.0), axis=1)
+        seen = np.cumsum(buy, axis=1) > 0
+        peak = np.maximum.accumulate(np.where(seen, cum, 0.0), axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mdd = np.where(seen, (cum - peak) / peak, 0.0).min(axis=1)
+
+        out["winRate"][:, j] = np.where(has, wins / np.maximum(n, 1), 0)
+        out["avgReturn"][:, j] = np.where(has, avg, 0)
+        out["sharpeRatio"][:, j] = np.where(has, sharpe, 0)
+        out["mdd"][:, j] = np.where(has, mdd, 0)
+        out["profitableSignals"][:, j] = wins
+        out["maxReturn"][:, j] = np.where(has, np.where(buy, fwd, -np.inf).max(axis=1), 0)
+        out["minReturn"][:, j] = np.where(has, np.where(buy, fwd, np.inf).min(axis=1), 0)
+    return out
+
+
+_WORKER = {}
+
+
+def _init_worker(bank, close):
+    _WORKER["bank"], _WORKER["close"] = bank, close
+
+
+def _evaluate_chunk(rows, rsi_low, rsi_high, bb_k, holdings):
+    return evaluate(_WORKER["bank"], _WORKER["close"], rows, rsi_low, rsi_high, bb_k, holdings)
+
+
+def sweep(ohlcv, grid=None, start=None, workers=1, chunk=CHUNK):
+    """Backtest every combination in `grid` over rows dated >= start.
+
+    Indicators are computed on the full frame first (as in main()), so the
+    window sees warmed-up values. Returns one row per (combination, holding
+    period) with the parameter columns and METRICS.
+    """
+    grid = {**DEFAULT_GRID, **(grid or {})}
+    holdings = list(grid["holding_days"])
+    combos = combinations(grid)
+    close_full = ohlcv["Close"].to_numpy(dtype=float)
+    first = 0 if start is None else int(np.searchsorted(ohlcv.index, pd.Timestamp(start)))
+    bank, rows = build_bank(close_full, combos, first)
+    close = close_full[first:]
+
+    bounds = [(i, min(i + chunk, len(combos))) for i in range(0, len(combos), chunk)]
+    tasks = [({k: v[a:b] for k, v in rows.items()},
+              combos["rsi_low"].to_numpy()[a:b], combos["rsi_high"].to_numpy()[a:b],
+              combos["bb_k"].to_numpy()[a:b], holdings) for a, b in bounds]
+
+    if workers == 1 or len(tasks) == 1:
+        parts = [evaluate(bank, close, *t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(bank, close)) as pool:
+            parts = list(pool.map(_evaluate_chunk, *zip(*tasks)))
+
+    metrics = {m: np.concatenate([p[m] for p in parts]) if parts else np.empty((0, len(holdings)))
+               for m in METRICS}
+    result = combos.loc[combos.index.repeat(len(holdings))].reset_index(drop=True)
+    result["holding_days"] = np.tile(holdings, len(combos))
+    for m in METRICS:
+        result[m] = metrics[m].ravel()
+    for m in ("totalSignals", "buySignals", "profitableSignals"):
+        result[m] = result[m].astype(int)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def parse_grid(items):
+    """["rsi_low=20,25,30", ...] → {"rsi_low": [20, 25, 30], ...}"""
+    grid = {}
+    for item in items or []:
+        key, _, vals = item.partition("=")
+        if key not in DEFAULT_GRID:
+            raise SystemExit(f"unknown grid parameter: {key} (choose from {', '.join(DEFAULT_GRID)})")
+        cast = float if key == "bb_k" else int
+        grid[key] = [cast(v) for v in vals.split(",") if v]
+    return grid
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Sweep signal parameters and holding periods")
+    ap.add_argument("--grid", action="append", metavar="PARAM=V1,V2,...",
+                    help=f"repeatable; parameters: {', '.join(DEFAULT_GRID)}")
+    ap.add_argument("--ticker", default="^KS11")
+    ap.add_argument("--window", type=int, default=365, help="evaluation window in days (default: 365)")
+    ap.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    ap.add_argument("--fixtures", default=None, help="read prices from <dir>/<ticker>.csv (offline)")
+    ap.add_argument("--out", default=None, help="write all results to this CSV")
+    ap.add_argument("--top", type=int, default=10, help="print the N best by Sharpe ratio")
+    args = ap.parse_args(argv)
+
+    from price_cache import FixtureProvider, OHLCVCache, PriceLoader
+
+    end = datetime.now()
+    start = end - timedelta(days=args.window)
+    loader = PriceLoader(FixtureProvider(args.fixtures) if args.fixtures else None, OHLCVCache())
+    ohlcv = loader.fetch([args.ticker], start - timedelta(days=400), end)[args.ticker]
+    if ohlcv.empty:
+        raise SystemExit(f"{args.ticker}: no data")
+
+    grid = parse_grid(args.grid)
+    t0 = time.perf_counter()
+    result = sweep(ohlcv, grid, start, workers=args.workers or os.cpu_count())
+    sec = time.perf_counter() - t0
+    print(f"{len(result):,} combinations in {sec:.2f}s ({len(result) / sec:,.0f} combos/s)\n")
+
+    if args.out:
+        result.to_csv(args.out, index=False)
+        print(f"[OK] {args.out} written")
+    varied = [k for k, v in {**DEFAULT_GRID, **grid}.items() if len(v) > 1]
+    cols = varied + ["winRate", "mdd", "sharpeRatio", "avgReturn", "buySignals"]
+    print(result.sort_values("sharpeRatio", ascending=False)[cols].head(args.top).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
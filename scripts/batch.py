@@ -0,0 +1,192 @@
+"""
+KOSPI Strategy Dashboard - Multi-symbol batch runner
+Runs the per-symbol pipeline (compute_indicators → analyze_symbol) over a
+ticker universe, e.g. KOSPI200 constituents and sector indices. Prices are
+downloaded once in the parent through the cached PriceLoader (I/O bound);
+the CPU-bound analysis runs on a process pool using every core. A failing
+symbol is recorded in the index and does not stop the batch.
+
+    python scripts/batch.py --universe scripts/universe.example.txt [--workers N]
+
+Outputs (default public/data/universe/):
+    <ticker>.json   same sections as market_data.json for one symbol
+    index.json      {"generated", "start", "symbols": [...], "errors": [...]}
+
+Each symbol's history and 1-year window are anchored to its own last bar
+(fetch_data.anchor_history / window_start), so a rerun on a non-trading day or
+a suspended symbol does not shift its windows. Each index row's "start" is
+the first bar of its 1-year window; the top-level "start" is the earliest.
+
+Universe file: one ticker per line, optionally "ticker,name"; '#' comments.
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+from resampling import RESAMPLES
+from serialize import write_json
+
+OUT_DIR = "public/data/universe"
+
+
+def load_universe(spec):
+    """[(ticker, name)] from a universe file or a comma-separated ticker list."""
+    if os.path.exists(spec):
+        with open(spec, encoding="utf-8") as f:
+            lines = [ln.split("#", 1)[0].strip() for ln in f]
+    else:
+        lines = spec.split(",")
+    out = []
+    for ln in lines:
+        if not ln.strip():
+            continue
+        ticker, _, name = ln.partition(",")
+        out.append((ticker.strip(), name.strip() or ticker.strip()))
+    return out
+
+
+def symbol_file(ticker):
+    return ticker.replace("^", "_").replace("/", "_") + ".json"
+
+
+def index_entry(ticker, name, sections):
+    """Universe index row: the latest state of one symbol."""
+    latest = sections["latest"]
+    ohlcv = sections["ohlcv"]
+    first = ohlcv[0]["close"]
+    return {
+        "ticker": ticker,
+        "name": name,
+        "file": symbol_file(ticker),
+        "start": sections["metadata"]["dataStart"],
+        "date": latest["date"],
+        "close": latest["close"],
+        "change": (latest["close"] / latest["prevClose"] - 1) * 100
+                  if latest["close"] is not None and latest["prevClose"] else None,
+        "return1y": (latest["close"] / first - 1) * 100 if first and latest["close"] is not None else None,
+        "rsi14": latest["indicators"].get("rsi14"),
+        "state": sections["decisionTree"]["currentState"],
+        "cashRatio": sections["decisionTree"]["cashRatio"],
+        "signals": len(sections["signals"]),
+        "winRate": sections["metrics"]["winRate"],
+        "position52w": sections["range52w"]["position"],
+    }
+
+
+def run_symbol(ticker, name, ohlcv, out_dir, low_memory=False, resamples=RESAMPLES):
+    """Worker: analyze one symbol, write <ticker>.json, return its index row.
+
+    The history and the 1-year window start from the symbol's last bar.
+    Exceptions are returned as {"ticker", "error"} so one bad symbol (empty
+    download, too little history) never takes down the pool.
+    """
+    from fetch_data import WINDOW_DAYS, analyze_symbol, anchor_history, compute_indicators, window_start
+
+    try:
+        if ohlcv.empty:
+            raise ValueError("no data")
+        ohlcv, = anchor_history(ohlcv)
+        start_1y = window_start(ohlcv.index[-1], WINDOW_DAYS)
+        doc = {"ticker": ticker, "name": name,
+               **analyze_symbol(compute_indicators(ohlcv, low_memory=low_memory), start_1y, low_memory,
+                                resamples)}
+        entry = index_entry(ticker, name, doc)
+        if out_dir:
+            write_json(os.path.join(out_dir, symbol_file(ticker)), doc, consume=low_memory)
+        return entry
+    except Exception as exc:
+        return {"ticker": ticker, "name": name, "error": f"{type(exc).__name__}: {exc}"}
+
+
+def run_batch(frames, out_dir=OUT_DIR, workers=None, names=None, low_memory=False, resamples=RESAMPLES):
+    """Analyze {ticker: OHLCV frame} on `workers` processes; returns the index.
+
+    workers=1 runs in-process (no pool), which is also the fallback baseline
+    of bench_batch.py. low_memory=True is fetch_data's --low-memory per symbol;
+    `resamples` is its --resamples (metrics intervals).
+    """
+    names = names or {}
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    jobs = [(t, names.get(t, t), df, out_dir, low_memory, resamples) for t, df in frames.items()]
+
+    results = []
+    if workers == 1:
+        results = [run_symbol(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_symbol, *job) for job in jobs]
+            for job, fut in zip(jobs, futures):
+                try:
+                    results.append(fut.result())
+                except Exception as exc:          # 워커 프로세스 자체가 죽은 경우
+                    results.append({"ticker": job[0], "name": job[1],
+                                    "error": f"{type(exc).__name__}: {exc}"})
+
+    symbols = [r for r in results if "error" not in r]
+    index = {
+        "generated": datetime.now().isoformat(),
+        "start": min((r["start"] for r in symbols), default=None),
+        "symbols": symbols,
+        "errors": [r for r in results if "error" in r],
+    }
+    if out_dir:
+        write_json(os.path.join(out_dir, "index.json"), index)
+    return index
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Run the dashboard pipeline over a ticker universe")
+    ap.add_argument("--universe", required=True, help="universe file or comma-separated tickers")
+    ap.add_argument("--workers", type=int, default=None, help="analysis processes (default: all cores)")
+    ap.add_argument("--download-workers", type=int, default=4,
+                    help="concurrent download groups (--fixtures; yfinance makes one batched request)")
+    ap.add_argument("--out", default=OUT_DIR, help=f"output directory (default: {OUT_DIR})")
+    ap.add_argument("--cache-dir", default=None, help="per-ticker OHLCV cache directory")
+    ap.add_argument("--no-cache", action="store_true", help="bypass the OHLCV cache")
+    ap.add_argument("--fixtures", default=None, help="read prices from <dir>/<ticker>.csv (offline)")
+    ap.add_argument("--low-memory", action="store_true",
+                    help="hold prices as float32 and round outputs to their display decimals")
+    ap.add_argument("--resamples", type=int, default=RESAMPLES,
+                    help=f"resamples behind each symbol's metrics intervals (default: {RESAMPLES}; 0 = off)")
+    args = ap.parse_args(argv)
+
+    from fetch_data import FETCH_SLACK_DAYS, HISTORY_DAYS
+    from price_cache import CACHE_DIR, FixtureProvider, OHLCVCache, PriceLoader
+
+    universe = load_universe(args.universe)
+    end = datetime.now()
+    # 받는 구간만 벽시계를 따른다 — 종목별 이력/1년 창은 run_symbol 이 마지막 봉에서 잡는다
+    start_full = end - timedelta(days=HISTORY_DAYS + FETCH_SLACK_DAYS)
+
+    loader = PriceLoader(FixtureProvider(args.fixtures) if args.fixtures else None,
+                         None if args.no_cache else OHLCVCache(args.cache_dir or CACHE_DIR),
+                         max_workers=args.download_workers)
+    print(f"Downloading {len(universe)} symbols ({start_full.date()} → {end.date()}) …")
+    t0 = time.perf_counter()
+    frames = loader.fetch([t for t, _ in universe], start_full, end)
+    if args.low_memory:
+        import lowmem
+        # 분석 내내 부모 프로세스가 들고 있는 원시 OHLCV 를 float32 로 (한 종목씩 교체)
+        for t in frames:
+            frames[t] = lowmem.downcast(frames[t])
+        lowmem.release()
+    t1 = time.perf_counter()
+
+    workers = args.workers or os.cpu_count()
+    print(f"Analyzing on {workers} process(es) …")
+    index = run_batch(frames, args.out, workers, dict(universe), args.low_memory, args.resamples)
+    t2 = time.perf_counter()
+
+    for err in index["errors"]:
+        print(f"  {err['ticker']}: {err['error']}")
+    print(f"\n[OK] {args.out}/index.json written: {len(index['symbols'])} symbols, "
+          f"{len(index['errors'])} errors (download {t1 - t0:.1f}s, analysis {t2 - t1:.1f}s, "
+          f"{len(universe) / max(t2 - t1, 1e-9):.1f} symbols/s)")
+
+
+if __name__ == "__main__":
+    main()
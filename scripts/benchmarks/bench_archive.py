@@ -0,0 +1,159 @@
+"""
+Decision history archive (archive.py): daily append cost and query latency.
+
+    python scripts/benchmarks/bench_archive.py [--years 20] [--daily 60]
+
+Simulates `years` of daily snapshots through the real path — indicator
+frame, decide() per day, generate_signals, random 수급 figures, then
+archive.snapshot_row — and checks that an archive built one day at a time
+reads back every value (and that re-appending the last day writes nothing).
+
+Append: per-day cost in the first year of a fresh archive and in the last
+year of a backfilled one (only the current year's partition is rewritten,
+so it should not grow with history), next to rewriting one file holding the
+whole history. Queries: recent/range reads of a few columns, transitions
+and STRONG_SELL outcomes, next to loading every column of every year.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from common import fmt_seconds, synthetic_ohlcv, timeit, with_indicators
+import archive as ar
+import fetch_data as fd
+
+INVESTORS = ["individual", "foreign", "institution", "financialInvestment", "insurance",
+             "investmentTrust", "bank", "otherFinancial", "pension", "otherCorporate"]
+IND_COLS = ["ma5", "ma20", "ma60", "ma120", "ma240", "bb_upper", "bb_middle", "bb_lower",
+            "rsi14", "macd", "macd_signal", "macd_hist", "obv"]
+
+
+def simulate(years, seed=7):
+    """One snapshot_row per trading day over `years` years."""
+    warmup = 250
+    df = with_indicators(synthetic_ohlcv(252 * years + warmup, seed=seed)).iloc[warmup:]
+    dates = df.index.strftime("%Y-%m-%d")
+    signals = fd.generate_signals(df)
+    rng = np.random.default_rng(seed)
+    flows = (rng.standard_normal((len(df), 2, len(INVESTORS))) * 3000).astype(int)
+    rows = []
+    for i, (date, rec) in enumerate(zip(dates, df.to_dict("records"))):
+        sections = {
+            "latest": {"date": date, "close": rec["Close"], "volume": int(rec["Volume"]),
+                       "indicators": {c: fd.safe_float(rec[c]) for c in IND_COLS}},
+            "decisionTree": fd.decide(rec),
+            "signals": [s for s in signals if s["date"] == date],
+        }
+        supply = {mkt: {"latest": dict(zip(INVESTORS, map(int, flows[i, m])))}
+                  for m, mkt in enumerate(("kospi", "kosdaq"))}
+        rows.append(ar.snapshot_row(sections, supply))
+    return rows
+
+
+def check(rows, directory):
+    store = ar.Archive(directory)
+    for row in rows:
+        store.append([row])
+    assert ar.Archive(directory).append([rows[-1]]) == 0, "re-appending the last day wrote a row"
+    try:
+        ar.Archive(directory).append([rows[-2]])
+        raise AssertionError("appending an earlier day was accepted")
+    except ValueError:
+        pass
+    back = ar.Archive(directory).read()
+    assert len(back) == len(rows)
+    for col in back.columns:
+        want = [r.get(col) for r in rows]
+        if col in ar.CATEGORICAL:
+            got = [None if v != v else v for v in back[col].astype(object)]
+            assert got == want, col
+        else:
+            want = np.array([np.nan if v is None else v for v in want], dtype=float)
+            assert np.array_equal(back[col].to_numpy(), want, equal_nan=True), col
+
+
+def per_append(rows, directory):
+    """Seconds per single-row append over `rows` (list)."""
+    store = ar.Archive(directory)
+    times = []
+    for row in rows:
+        t, _ = timeit(store.append, [row], repeat=1)
+        times.append(t)
+    return np.array(times)
+
+
+def monolithic_append(frame, head, count, path):
+    """Per-day cost of one npz holding the whole history (no partitions): load, add a row, rewrite."""
+    arrays = {"date": ar._days(frame.index.to_numpy())}
+    for c in frame.columns:
+        arrays[c] = frame[c].cat.codes.to_numpy() if c in ar.CATEGORICAL else frame[c].to_numpy()
+    np.savez_compressed(path, **{c: a[:head] for c, a in arrays.items()})
+    times = []
+    for i in range(head, head + count):
+        t0 = time.perf_counter()
+        with np.load(path) as old:
+            merged = {c: np.concatenate([old[c], arrays[c][i:i + 1]]) for c in old.files}
+        np.savez_compressed(path, **merged)
+        times.append(time.perf_counter() - t0)
+    return np.array(times)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--years", type=int, default=20)
+    ap.add_argument("--daily", type=int, default=60, help="single-day appends timed per scenario")
+    args = ap.parse_args()
+
+    rows = simulate(args.years)
+    print(f"{len(rows)} simulated days ({rows[0]['date']} → {rows[-1]['date']}), {len(rows[0]) - 1} columns")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        check(rows[:600], os.path.join(tmp, "check"))
+        print("day-by-day archive reads back every value; re-append writes nothing; earlier day rejected\n")
+
+        full = os.path.join(tmp, "full")
+        head = len(rows) - args.daily
+        t_bulk, _ = timeit(ar.Archive(full).append, rows[:head], repeat=1)
+        first = per_append(rows[:args.daily], os.path.join(tmp, "fresh"))
+        last = per_append(rows[head:], full)
+        mono = monolithic_append(ar.Archive(full).read(), head, args.daily, os.path.join(tmp, "mono.npz"))
+        size = sum(os.path.getsize(os.path.join(full, f)) for f in os.listdir(full))
+        print(f"backfill {head} days in one append: {fmt_seconds(t_bulk).strip()}; "
+              f"archive {size // 1024} KB in {len(ar.Archive(full).years())} partitions")
+        print(f"{'append one day':<34}{'median':>12}{'p95':>12}")
+        for label, t in (("year 1 (fresh archive)", first), (f"year {args.years} (partitioned)", last),
+                         (f"year {args.years} (one file, whole history)", mono)):
+            print(f"{label:<34}{fmt_seconds(np.median(t))}{fmt_seconds(np.quantile(t, 0.95))}")
+
+        store = ar.Archive(full)
+        end = rows[-1]["date"]
+        y = int(end[:4])
+        queries = [
+            ("last month: state,close,rsi14", lambda: store.read(["state", "close", "rsi14"], f"{y}-{end[5:7]}-01")),
+            ("one year: state,signal,kospi_foreign",
+             lambda: store.read(["state", "signal", "kospi_foreign"], f"{y - 1}-01-01", f"{y - 1}-12-31")),
+            (f"{args.years} years: state,close", lambda: store.read(["state", "close"])),
+            (f"{args.years} years: all columns", lambda: store.read()),
+            ("transitions (all years)", lambda: store.transitions()),
+            ("STRONG_SELL outcomes, 20d", lambda: store.outcomes("STRONG_SELL", 20, 0.05)),
+        ]
+        t_all, _ = timeit(lambda: ar.Archive(full).read(), repeat=3)
+        print(f"\n{'query':<40}{'archive':>12}{'vs load all':>13}   (load all = {fmt_seconds(t_all).strip()})")
+        for label, fn in queries:
+            t_q, _ = timeit(fn, repeat=5)
+            print(f"{label:<40}{fmt_seconds(t_q)}{t_all / t_q:>12.1f}x")
+
+        counts = store.transitions()
+        _, summary = store.outcomes("STRONG_SELL", 20, 0.05)
+        print(f"\nstate changes: {int(counts.to_numpy().sum() - np.trace(counts.to_numpy()))} "
+              f"of {int(counts.to_numpy().sum())} day pairs")
+        print(f"STRONG_SELL onsets: {summary['occurrences']}, followed by a ≥5% drawdown within 20 days: "
+              f"{summary['followedByDrawdown']} ({(summary['rate'] or 0):.0%})")
+
+
+if __name__ == "__main__":
+    main()
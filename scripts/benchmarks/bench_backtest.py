@@ -0,0 +1,99 @@
+"""
+Parameter-sweep throughput (combos/sec): per-combination Python loop vs
+backtest.sweep on (combinations × time) arrays, by worker count.
+
+    python scripts/benchmarks/bench_backtest.py [--rows 520] [--window 250] [--workers 1,2,4]
+
+A combination is one signal-parameter set × one holding period. The loop
+baseline builds each set's indicator frame and calls signal_codes +
+compute_metrics per holding period; it runs on a sample of --loop-sample
+sets, and its metrics are checked against sweep's (rounded as in
+compute_metrics).
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from common import synthetic_ohlcv
+import backtest as bt
+import fetch_data as fd
+
+GRID = {
+    "rsi_period": [9, 14],
+    "rsi_low": [20, 25, 30, 35],
+    "rsi_high": [65, 70, 75, 80],
+    "ma_fast": [3, 5, 10],
+    "ma_slow": [20, 60],
+    "macd_fast": [8, 12],
+    "macd_slow": [21, 26],
+    "bb_k": [1.5, 2.0, 2.5],
+    "holding_days": [5, 10, 20, 40],
+}
+
+
+def loop_metrics(raw, combo, holdings, start):
+    """One parameter set the straightforward way (pandas frame + generate_signals rules)."""
+    close = raw["Close"]
+    df = raw.copy()
+    df["rsi"] = fd.compute_rsi(close, combo.rsi_period)
+    df["ma_f"] = close.rolling(combo.ma_fast).mean()
+    df["ma_s"] = close.rolling(combo.ma_slow).mean()
+    df["macd"], df["macd_sig"], _ = fd.compute_macd(close, combo.macd_fast, combo.macd_slow, combo.macd_signal)
+    mid, std = close.rolling(combo.bb_period).mean(), close.rolling(combo.bb_period).std()
+    df["bb_u"], df["bb_l"] = mid + combo.bb_k * std, mid - combo.bb_k * std
+    d1 = df[df.index >= start]
+    col = lambda c: d1[c].to_numpy(dtype=float)
+    codes = fd.signal_codes(col("Close"), col("rsi"), col("macd"), col("macd_sig"), col("bb_u"),
+                            col("bb_l"), col("ma_f"), col("ma_s"), combo.rsi_low, combo.rsi_high)
+    hits = np.flatnonzero(codes >= 0)
+    signals = [{"date": d, "type": fd.SIGNAL_RULES[codes[i]][0]}
+               for d, i in zip(d1.index[hits].strftime("%Y-%m-%d"), hits)]
+    return [fd.compute_metrics(d1, signals, h) for h in holdings]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--rows", type=int, default=520)
+    ap.add_argument("--window", type=int, default=250)
+    ap.add_argument("--workers", default="1,2,4,8")
+    ap.add_argument("--loop-sample", type=int, default=60)
+    args = ap.parse_args()
+
+    raw = synthetic_ohlcv(args.rows, seed=7)
+    start = raw.index[-args.window]
+    holdings = GRID["holding_days"]
+    combos = bt.combinations(GRID)
+    total = len(combos) * len(holdings)
+    print(f"{len(combos):,} parameter sets × {len(holdings)} holding periods = {total:,} combos, "
+          f"{args.window} bars, {os.cpu_count()} CPU(s)\n")
+
+    sample = combos.sample(min(args.loop_sample, len(combos)), random_state=0)
+    t0 = time.perf_counter()
+    ref = [loop_metrics(raw, c, holdings, start) for c in sample.itertuples()]
+    loop_rate = len(sample) * len(holdings) / (time.perf_counter() - t0)
+    print(f"{'python loop':<16}{loop_rate:>12,.0f} combos/s   (sample of {len(sample)} sets)")
+
+    result = None
+    for w in [w for w in map(int, args.workers.split(",")) if w <= (os.cpu_count() or 1)]:
+        t0 = time.perf_counter()
+        result = bt.sweep(raw, GRID, start, workers=w)
+        rate = total / (time.perf_counter() - t0)
+        print(f"{f'sweep, {w} proc':<16}{rate:>12,.0f} combos/s   ({rate / loop_rate:,.0f}× loop)")
+
+    # 표본 조합의 지표가 루프 결과와 일치하는지 확인
+    res = result.set_index(bt.SIGNAL_PARAMS + ["holding_days"])
+    digits = {"winRate": 3, "mdd": 3, "sharpeRatio": 3, "avgReturn": 4, "maxReturn": 4, "minReturn": 4}
+    for c, per_h in zip(sample.itertuples(index=False), ref):
+        for h, m in zip(holdings, per_h):
+            row = res.loc[tuple(c) + (h,)]
+            for k, d in digits.items():
+                assert round(float(row[k]), d) == m[k], (c, h, k, row[k], m[k])
+    print("\nsample metrics match the loop baseline")
+
+
+if __name__ == "__main__":
+    main()
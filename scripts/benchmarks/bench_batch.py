@@ -0,0 +1,46 @@
+"""
+Batch engine throughput (symbols/sec) against worker count.
+
+    python scripts/benchmarks/bench_batch.py [--symbols 64] [--rows 360] [--workers 1,2,4,8]
+
+Runs batch.run_batch over synthetic OHLCV frames (~520 calendar days, the
+window fetch_data.py downloads), writing per-symbol files to a temp dir.
+workers=1 is the in-process baseline; counts above os.cpu_count() are skipped.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from common import synthetic_ohlcv
+import batch
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--symbols", type=int, default=64)
+    ap.add_argument("--rows", type=int, default=360)
+    ap.add_argument("--workers", default="1,2,4,8,16")
+    args = ap.parse_args()
+
+    frames = {f"SYM{i:04d}.KS": synthetic_ohlcv(args.rows, seed=i, start="2025-01-02")
+              for i in range(args.symbols)}
+    cpus = os.cpu_count() or 1
+    counts = [w for w in map(int, args.workers.split(",")) if w <= cpus] or [1]
+
+    print(f"{args.symbols} symbols × {args.rows} rows, {cpus} CPU(s)")
+    print(f"{'workers':>8}{'seconds':>10}{'symbols/s':>12}{'speedup':>9}")
+    base = None
+    for w in counts:
+        with tempfile.TemporaryDirectory() as out:
+            t0 = time.perf_counter()
+            index = batch.run_batch(frames, out, workers=w)
+            sec = time.perf_counter() - t0
+        assert not index["errors"], index["errors"][:3]
+        base = base or sec
+        print(f"{w:>8}{sec:>10.2f}{args.symbols / sec:>12.1f}{base / sec:>8.2f}×")
+
+
+if __name__ == "__main__":
+    main()
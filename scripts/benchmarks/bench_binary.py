@@ -0,0 +1,93 @@
+"""
+Round-trip check and load benchmark for the binary sidecar (market_data.bin).
+
+    python scripts/benchmarks/bench_binary.py [--sizes 250,1250,5000]
+
+For public/data/market_data.json and synthetic documents: writes the sidecar,
+asserts binary_artifact.to_document(read_binary(...)) reproduces the document,
+asserts src/utils/binaryData.js decodes the same OHLCV rows (if node is on
+PATH), and compares file size and load time against the JSON file.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+from common import SCRIPTS_DIR, synthetic_document
+import binary_artifact as ba
+
+REPO = os.path.dirname(SCRIPTS_DIR)
+SAMPLE = os.path.join(REPO, "public", "data", "market_data.json")
+
+NODE_BENCH = """
+import { readFileSync } from 'fs'
+import { parseBinaryMarketData, toMarketData } from '%s'
+const [binPath, jsonPath] = process.argv.slice(2)
+const bin = readFileSync(binPath), text = readFileSync(jsonPath, 'utf8')
+const ab = bin.buffer.slice(bin.byteOffset, bin.byteOffset + bin.length)
+let tBin = Infinity, tJson = Infinity
+for (let i = 0; i < 30; i++) {
+  let t0 = performance.now(); toMarketData(parseBinaryMarketData(ab)); tBin = Math.min(tBin, performance.now() - t0)
+  t0 = performance.now(); JSON.parse(text); tJson = Math.min(tJson, performance.now() - t0)
+}
+const same = JSON.stringify(toMarketData(parseBinaryMarketData(ab)).ohlcv) === JSON.stringify(JSON.parse(text).ohlcv)
+console.log(JSON.stringify({ bin: tBin, json: tJson, same }))
+"""
+
+
+def best_of(fn, repeat=10):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1e3
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--sizes", default="250,1250,5000")
+    args = ap.parse_args()
+
+    docs = []
+    if os.path.exists(SAMPLE):
+        with open(SAMPLE, encoding="utf-8") as f:
+            docs.append(("market_data.json", json.load(f)))
+    docs += [(f"synthetic {n}d", synthetic_document(int(n))) for n in args.sizes.split(",")]
+    has_node = shutil.which("node") is not None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        script = os.path.join(tmp, "load.mjs")
+        with open(script, "w") as f:
+            f.write(NODE_BENCH % os.path.join(REPO, "src", "utils", "binaryData.js"))
+
+        print(f"{'document':<18}{'json bytes':>12}{'bin bytes':>12}{'py json':>9}{'py bin':>9}"
+              + (f"{'js json':>9}{'js bin':>9}" if has_node else "") + "   (ms)")
+        for name, doc in docs:
+            bin_path, json_path = os.path.join(tmp, "m.bin"), os.path.join(tmp, "m.json")
+            ba.write_binary(bin_path, doc)
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(doc, f, ensure_ascii=False, separators=(",", ":"))
+            with open(bin_path, "rb") as f:
+                buf = f.read()
+            with open(json_path, encoding="utf-8") as f:
+                text = f.read()
+
+            assert ba.to_document(*ba.read_binary(buf)) == doc, f"{name}: round trip differs"
+            line = (f"{name:<18}{len(text.encode()):>12,}{len(buf):>12,}"
+                    f"{best_of(lambda: json.loads(text)):>9.2f}{best_of(lambda: ba.read_binary(buf)):>9.2f}")
+            if has_node:
+                out = subprocess.run(["node", script, bin_path, json_path],
+                                     capture_output=True, text=True, check=True)
+                res = json.loads(out.stdout)
+                assert res["same"], f"{name}: JS loader rows differ"
+                line += f"{res['json']:>9.2f}{res['bin']:>9.2f}"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
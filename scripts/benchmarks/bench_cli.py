@@ -0,0 +1,83 @@
+"""
+fetch_data.py cold start: import time and end-to-end time per stage selection.
+
+    python scripts/benchmarks/bench_cli.py [--repeat 3]
+
+Import time is `python -X importtime -c "import fetch_data"` (cumulative µs
+of the module), next to the pandas import it now defers. Each stage
+selection then runs as its own `python fetch_data.py ...` process in a temp
+directory with CSV price fixtures, the on-disk caches enabled (like the
+cron job) and naver_stub standing in for NAVER. A full run primes the stage
+cache first; every timed run passes --force so it writes its outputs.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import SCRIPTS_DIR
+from naver_stub import NaverStub
+from suite import write_price_fixtures
+
+FETCH = os.path.join(SCRIPTS_DIR, "fetch_data.py")
+SELECTIONS = [
+    ("all stages", []),
+    ("prices", ["prices"]),
+    ("indicators", ["indicators"]),
+    ("signals output", ["signals", "output"]),
+    ("correlations output", ["correlations", "output"]),
+    ("supply-demand output", ["supply-demand", "output"]),
+    ("supply-demand", ["supply-demand"]),
+    ("output", ["output"]),
+]
+
+
+def import_ms(statement):
+    """Cumulative import time (ms) of the last module imported by `statement`."""
+    res = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], cwd=SCRIPTS_DIR,
+                         capture_output=True, text=True, check=True)
+    last = res.stderr.strip().splitlines()[-1]
+    return int(re.split(r"\s*\|\s*", last)[1]) / 1000
+
+
+def run_ms(argv, cwd, repeat):
+    """Best-of-`repeat` wall time (ms) of `python fetch_data.py argv` in `cwd`."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, FETCH] + argv, cwd=cwd, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    lazy = min(import_ms("import fetch_data") for _ in range(args.repeat))
+    pandas = min(import_ms("import pandas") for _ in range(args.repeat))
+    print(f"import fetch_data: {lazy:7.1f} ms   (pandas, now deferred to the price stages: {pandas:.1f} ms)\n")
+
+    with tempfile.TemporaryDirectory(prefix="kospi-cli-") as tmp, NaverStub() as stub:
+        fixtures = os.path.join(tmp, "fixtures")
+        write_price_fixtures(fixtures)
+        base = ["--fixtures", fixtures, "--naver-base-url", stub.base_url, "--naver-rate", "1000",
+                "--report", "", "--force"]
+        run_ms(base, tmp, 1)                    # 단계 캐시 / OHLCV·NAVER 캐시 채우기
+
+        print(f"{'stages':<24}{'ms':>9}{'vs all':>9}")
+        full = None
+        for name, stages in SELECTIONS:
+            ms = run_ms(stages + base, tmp, args.repeat)
+            full = full or ms
+            print(f"{name:<24}{ms:>9.1f}{full / ms:>8.2f}×")
+
+
+if __name__ == "__main__":
+    main()
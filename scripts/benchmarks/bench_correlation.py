@@ -0,0 +1,80 @@
+"""
+Multi-asset rolling correlation matrix vs a per-pair pandas loop.
+
+    python scripts/benchmarks/bench_correlation.py [--sizes 500,5000] [--assets 7]
+
+The reference aligns the return frame the same way and runs
+Series.rolling(w, min_periods).corr() for every pair and window — what
+compute_correlations does for its two pairs. NaN masks must match exactly;
+reports the worst absolute error and the wall time per series length.
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from common import fmt_seconds, synthetic_ohlcv, timeit
+import correlation as corr
+
+
+def closes(n, assets, seed=0):
+    """{name: close} with foreign-holiday gaps in every asset but the first."""
+    rng = np.random.default_rng(seed)
+    out = {}
+    for k in range(assets):
+        s = synthetic_ohlcv(n, seed=seed + k, s0=100.0 * (k + 1))["Close"]
+        out[f"a{k}"] = s if k == 0 else s[rng.random(n) > 0.04]
+    return out
+
+
+def pandas_pairs(data, windows):
+    dates, names, R = corr.aligned_returns(data)
+    frame = pd.DataFrame(R, index=dates, columns=names)
+    I, J = np.triu_indices(len(names), 1)
+    out = {}
+    for w in windows:
+        mp = max(2, int(np.ceil(w * corr.MIN_COVERAGE)))
+        cols = [frame.iloc[:, i].rolling(w, min_periods=mp).corr(frame.iloc[:, j]) for i, j in zip(I, J)]
+        out[w] = np.column_stack(cols)
+    return out
+
+
+def vectorized(data, windows):
+    _, _, R = corr.aligned_returns(data)
+    sums = corr.pair_sums(R)
+    return {w: corr.rolling_corr_pairs(R, w, sums=sums) for w in windows}
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--sizes", default="500,5000")
+    ap.add_argument("--assets", type=int, default=len(corr.ASSETS))
+    args = ap.parse_args()
+    windows = corr.WINDOWS
+
+    print(f"{args.assets} assets, windows {windows}")
+    print(f"{'rows':>7}{'pandas':>12}{'numpy':>12}{'speedup':>9}{'max |err|':>11}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        data = closes(n, args.assets)
+        t_pd, ref = timeit(pandas_pairs, data, windows, repeat=3)
+        t_np, got = timeit(vectorized, data, windows, repeat=3)
+        err = 0.0
+        for w in windows:
+            a, b = ref[w], got[w]
+            if not np.array_equal(np.isnan(a), np.isnan(b)):
+                raise AssertionError(f"NaN mask differs: n={n} window={w}")
+            m = ~np.isnan(a)
+            if m.any():
+                err = max(err, float(np.abs(a[m] - b[m]).max()))
+        print(f"{n:>7}{fmt_seconds(t_pd)}{fmt_seconds(t_np)}{t_pd / t_np:8.1f}x{err:11.1e}")
+
+    # 출력 섹션 전체 (반올림 + 리스트화 포함)
+    data = closes(500, args.assets)
+    t_sec, section = timeit(corr.correlation_matrix, data, windows, repeat=3)
+    print(f"\ncorrelation_matrix() for 500 rows: {fmt_seconds(t_sec).strip()}, "
+          f"{len(section['pairs'])} pairs × {len(section['dates'])} dates")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Dashboard indicator engine (src/utils/indicatorEngine.js) vs the Python reference.
+
+    python scripts/benchmarks/bench_indicator_engine.py [--sizes 250,1250,5000] [--fixture PATH]
+
+Writes a shared fixture — synthetic OHLCV plus, for several parameter sets,
+the indicators and signals from the Python implementations: MAs and
+Bollinger width from indicator_kernel's rolling_means/rolling_var (what
+compute_indicators runs; pandas' add/remove rolling std drifts by up to
+~1e-9 relative here), compute_rsi / compute_macd / compute_obv and
+signal_codes from fetch_data — and runs indicator_engine_check.mjs on it
+under node. Reports the worst relative error per indicator (NaN masks must
+match exactly), signal mismatches, and the engine's time for a cold compute
+and for one slider change (only the touched indicator is recomputed)
+against a 16.7 ms frame. tests/test_indicator_engine.py runs the same
+check under pytest and fails on any mismatch.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from common import synthetic_ohlcv
+import fetch_data as fd
+import indicator_kernel as ik
+from serialize import nullable
+
+CHECK = os.path.join(os.path.dirname(os.path.abspath(__file__)), "indicator_engine_check.mjs")
+TOLERANCE = 1e-12
+DEFAULTS = {"maPeriods": [5, 20, 60, 120, 240], "bbPeriod": 20, "bbK": 2, "rsiPeriod": 14,
+            "rsiLow": 30, "rsiHigh": 70, "macdFast": 12, "macdSlow": 26, "macdSignal": 9,
+            "crossFast": 5, "crossSlow": 20}
+PARAM_SETS = [
+    {},
+    {"rsiPeriod": 9, "bbK": 2.5},
+    {"bbPeriod": 10, "bbK": 1.5, "rsiLow": 40, "rsiHigh": 60},
+    {"macdFast": 5, "macdSlow": 35, "macdSignal": 5, "crossFast": 10, "crossSlow": 50},
+    {"maPeriods": [3, 7, 200], "rsiPeriod": 2, "bbPeriod": 2},
+]
+
+
+def reference(raw, params):
+    """Indicators and signals for `params` from the Python implementations."""
+    p = {**DEFAULTS, **params}
+    close, volume = raw["Close"], raw["Volume"]
+    c = close.to_numpy(dtype=float)
+    periods = sorted({*p["maPeriods"], p["bbPeriod"], p["crossFast"], p["crossSlow"]})
+    rows = np.empty((len(periods), len(c)))
+    ik.rolling_means(c, periods, rows)
+    ma = {n: pd.Series(row, index=close.index) for n, row in zip(periods, rows)}
+
+    ind = {f"ma{n}": ma[n] for n in p["maPeriods"]}
+    mid = ma[p["bbPeriod"]]
+    sd = np.sqrt(ik.rolling_var(c, p["bbPeriod"]))
+    ind.update(bb_middle=mid, bb_upper=mid + p["bbK"] * sd, bb_lower=mid - p["bbK"] * sd,
+               rsi=fd.compute_rsi(close, p["rsiPeriod"]))
+    ind["macd"], ind["macd_signal"], ind["macd_hist"] = fd.compute_macd(
+        close, p["macdFast"], p["macdSlow"], p["macdSignal"])
+    ind["obv"] = fd.compute_obv(close, volume)
+
+    codes = fd.signal_codes(c, ind["rsi"].to_numpy(), ind["macd"].to_numpy(), ind["macd_signal"].to_numpy(),
+                            ind["bb_upper"].to_numpy(), ind["bb_lower"].to_numpy(),
+                            ma[p["crossFast"]].to_numpy(), ma[p["crossSlow"]].to_numpy(),
+                            p["rsiLow"], p["rsiHigh"])
+    dates = raw.index.strftime("%Y-%m-%d")
+    signals = []
+    for i in np.flatnonzero(codes >= 0):
+        sig_type, reason, strength = fd.SIGNAL_RULES[codes[i]]
+        signals.append({"date": dates[i], "type": sig_type, "reason": reason,
+                        "price": fd.safe_float(c[i]), "strength": strength})
+    return {name: nullable(s.to_numpy(dtype=float)) for name, s in ind.items()}, signals
+
+
+def build_fixture(sizes):
+    cases = []
+    for n in sizes:
+        raw = synthetic_ohlcv(n, seed=n)
+        raw["Close"] = raw["Close"].round(2)          # 대시보드 ohlcv 와 같은 소수 둘째 자리
+        ohlcv = {"dates": list(raw.index.strftime("%Y-%m-%d")),
+                 "close": raw["Close"].tolist(), "volume": raw["Volume"].astype(float).tolist()}
+        for params in PARAM_SETS:
+            indicators, signals = reference(raw, params)
+            cases.append({"n": n, "params": params, **ohlcv,
+                          "expected": {"indicators": indicators, "signals": signals}})
+    return {"tolerance": TOLERANCE, "cases": cases}
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--sizes", default="250,1250,5000")
+    ap.add_argument("--fixture", help="keep the fixture at this path (default: temp file)")
+    args = ap.parse_args()
+
+    node = shutil.which("node")
+    if node is None:
+        raise SystemExit("node not found: the engine check runs the dashboard's JS module under node")
+
+    fixture = build_fixture([int(s) for s in args.sizes.split(",")])
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.fixture or os.path.join(tmp, "indicator_fixture.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(fixture, f, ensure_ascii=False)
+        res = subprocess.run([node, CHECK, path], capture_output=True, text=True, check=True)
+    report = json.loads(res.stdout)
+
+    print(f"max relative error vs Python over {len(fixture['cases'])} cases (NaN masks identical)")
+    for name, err in sorted(report["errors"].items()):
+        print(f"  {name:<12}{err:9.1e}")
+    print(f"signal mismatches: {report['signalMismatches']} of {report['signals']} signals")
+
+    print(f"\n{'rows':>7}{'cold':>10}{'rsi slider':>12}{'bbK slider':>12}{'macd slider':>13}   (ms, frame = 16.7)")
+    for row in report["timings"]:
+        print(f"{row['n']:>7}{row['cold']:>10.3f}{row['rsi']:>12.3f}{row['bbK']:>12.3f}{row['macd']:>13.3f}")
+
+    failed = report["failures"]
+    if failed:
+        raise SystemExit("engine disagrees with the Python reference:\n  " + "\n  ".join(failed[:20]))
+
+
+if __name__ == "__main__":
+    main()
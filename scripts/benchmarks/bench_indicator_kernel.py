@@ -0,0 +1,83 @@
+"""
+Indicator kernel vs the pandas rolling/ewm implementation.
+
+    python scripts/benchmarks/bench_indicator_kernel.py [--sizes 520,5000,20000] [--universe 200]
+
+Reports the worst relative error per indicator (NaN masks must match
+exactly), wall time and peak traced allocations per series length, and a
+universe-sized loop that reuses one output buffer across symbols.
+"""
+
+import argparse
+import tracemalloc
+
+import numpy as np
+
+from common import fmt_seconds, synthetic_ohlcv, timeit
+import fetch_data as fd
+import indicator_kernel as ik
+
+
+def peak_bytes(fn, *args):
+    tracemalloc.start()
+    fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def check_accuracy(sizes, seeds=3):
+    worst = dict.fromkeys(ik.COLUMNS, 0.0)
+    for n in sizes:
+        for seed in range(seeds):
+            raw = synthetic_ohlcv(n, seed=seed)
+            ref = fd.compute_indicators_pandas(raw)
+            out = ik.compute(raw["Close"].to_numpy(), raw["Volume"].to_numpy())
+            for name in ik.COLUMNS:
+                a, b = ref[name].to_numpy(dtype=float), out[ik.ROW[name]]
+                if not np.array_equal(np.isnan(a), np.isnan(b)):
+                    raise AssertionError(f"NaN mask differs: {name} n={n} seed={seed}")
+                m = ~np.isnan(a)
+                if m.any():
+                    scale = np.abs(a[m]).max() or 1.0
+                    worst[name] = max(worst[name], float(np.abs(a[m] - b[m]).max() / scale))
+    return worst
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--sizes", default="520,5000,20000")
+    ap.add_argument("--universe", type=int, default=200, help="symbols in the batch loop")
+    args = ap.parse_args()
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    edge = [1, 2, 14, 15, 19, 20, 21, 239, 240, 241]
+    worst = check_accuracy(edge + sizes)
+    print("max relative error vs pandas (NaN masks identical)")
+    for name, err in worst.items():
+        print(f"  {name:<12}{err:9.1e}")
+
+    print(f"\n{'rows':>7}{'pandas':>12}{'kernel':>12}{'speedup':>9}{'pandas peak':>13}{'kernel peak':>13}")
+    for n in sizes:
+        raw = synthetic_ohlcv(n, seed=1)
+        close, volume = raw["Close"].to_numpy(), raw["Volume"].to_numpy()
+        t_pd, _ = timeit(fd.compute_indicators_pandas, raw, repeat=5)
+        t_k, _ = timeit(ik.compute, close, volume, repeat=5)
+        m_pd = peak_bytes(fd.compute_indicators_pandas, raw)
+        m_k = peak_bytes(ik.compute, close, volume)
+        print(f"{n:>7}{fmt_seconds(t_pd)}{fmt_seconds(t_k)}{t_pd / t_k:8.1f}x"
+              f"{m_pd / 1024:10.0f} KB{m_k / 1024:10.0f} KB")
+
+    # 유니버스 루프: 같은 길이 종목들은 출력 버퍼 하나를 재사용한다
+    n = 520
+    frames = [synthetic_ohlcv(n, seed=s) for s in range(args.universe)]
+    arrays = [(f["Close"].to_numpy(), f["Volume"].to_numpy()) for f in frames]
+    buf = np.empty((len(ik.COLUMNS), n))
+    t_pd, _ = timeit(lambda: [fd.compute_indicators_pandas(f) for f in frames], repeat=1)
+    t_k, _ = timeit(lambda: [ik.compute(c, v, out=buf) for c, v in arrays], repeat=3)
+    print(f"\nuniverse of {args.universe} × {n} rows: pandas {fmt_seconds(t_pd).strip()}, "
+          f"kernel {fmt_seconds(t_k).strip()} ({t_pd / t_k:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
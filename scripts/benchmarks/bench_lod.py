@@ -0,0 +1,60 @@
+"""
+Render-ready payload per lookback: full daily series vs the LOD stage.
+
+    python scripts/benchmarks/bench_lod.py [--years 21.5] [--budget 500]
+
+For 1/5/10/20-year windows of synthetic KOSPI-like data, compares the JSON
+bytes and points per series of daily OHLCV + indicator records (what the
+charts would receive without LOD) against lod.build_lod output, and times
+the LOD stage itself.
+"""
+
+import argparse
+import json
+
+import pandas as pd
+
+from common import fmt_seconds, synthetic_ohlcv, timeit, with_indicators
+import lod
+
+
+def daily_payload(window):
+    dates = window.index.strftime("%Y-%m-%d")
+    ohlcv = [{"date": d, "open": o, "high": h, "low": l, "close": c, "volume": int(v)}
+             for d, o, h, l, c, v in zip(dates, window["Open"], window["High"], window["Low"],
+                                         window["Close"], window["Volume"])]
+    inds = {k: [{"date": d, "value": None if v != v else float(v)} for d, v in zip(dates, window[k])]
+            for k in lod.INDICATORS}
+    return {"ohlcv": ohlcv, "indicators": inds}
+
+
+def nbytes(obj):
+    return len(json.dumps(obj, separators=(",", ":")).encode())
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--years", type=float, default=21.5)
+    ap.add_argument("--budget", type=int, default=lod.POINT_BUDGET)
+    args = ap.parse_args()
+
+    df = with_indicators(synthetic_ohlcv(int(args.years * 252)))
+    end = df.index[-1]
+    lookbacks = {"1y": 1, **lod.LOOKBACKS}
+    sec, sections = timeit(lod.build_lod, df, end, lookbacks, args.budget)
+    print(f"{len(df)} daily rows, budget {args.budget} points/series, build_lod {fmt_seconds(sec).strip()}\n")
+
+    print(f"{'lookback':<9}{'daily bars':>11}{'daily bytes':>13}{'lod':>9}{'bars':>6}"
+          f"{'line pts':>10}{'lod bytes':>12}{'ratio':>8}")
+    for name, years in lookbacks.items():
+        window = df[df.index >= end - pd.DateOffset(years=years)]
+        raw = nbytes(daily_payload(window))
+        entry = sections[name]
+        small = nbytes(entry)
+        pts = max(len(v) for v in entry["indicators"].values())
+        print(f"{name:<9}{len(window):>11,}{raw:>13,}{entry['resolution']:>9}{len(entry['ohlcv']):>6}"
+              f"{pts:>10}{small:>12,}{raw / small:>7.1f}×")
+
+
+if __name__ == "__main__":
+    main()
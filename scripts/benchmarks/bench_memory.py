@@ -0,0 +1,131 @@
+"""
+Peak memory of the per-symbol pipeline with and without --low-memory.
+
+    python scripts/benchmarks/bench_memory.py [--symbols 300] [--rows 5000] [--history 80000]
+
+Each mode runs in a fresh subprocess (peak RSS = ru_maxrss, minus the RSS
+after imports) over two scenarios, with prices quoted to 2 decimals:
+  - universe: `symbols` synthetic frames (downcast as each one arrives in
+    low-memory mode) held while batch.run_batch (workers=1) analyzes them
+    one by one, like batch.py;
+  - history : one `history`-row frame through compute_indicators +
+    analyze_symbol + write_json, like fetch_data.py with a long download.
+
+The low-memory ohlcv/indicator records are then compared with the default
+ones rounded (np.round) to lowmem.DECIMALS; any difference is a mismatch.
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from common import synthetic_ohlcv
+
+
+def _rss_mb():
+    # 현재 RSS (/proc) — 없으면 0
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except OSError:
+        return 0.0
+
+
+def _quoted(df):
+    # 실제 지수처럼 가격을 소수 둘째 자리로 호가
+    return df.round({c: 2 for c in ("Open", "High", "Low", "Close")})
+
+
+def child(scenario, lean, args, out):
+    import batch
+    import fetch_data as fd
+    import lowmem
+    from serialize import write_json
+
+    base = _rss_mb()
+    if scenario == "universe":
+        frames = {}
+        for i in range(args.symbols):
+            df = _quoted(synthetic_ohlcv(args.rows, seed=i, start="2000-01-03"))
+            frames[f"SYM{i:04d}.KS"] = lowmem.downcast(df) if lean else df
+        index = batch.run_batch(frames, out, workers=1, low_memory=lean)
+        assert not index["errors"], index["errors"][:3]
+    else:
+        ohlcv = _quoted(synthetic_ohlcv(args.history, seed=7, start="1700-01-01"))
+        start_1y = ohlcv.index[-1] - pd.Timedelta(days=365)
+        df = fd.compute_indicators(ohlcv, low_memory=lean)
+        del ohlcv
+        if lean:
+            lowmem.release()
+        sections = fd.analyze_symbol(df, start_1y, lean)
+        write_json(os.path.join(out, "history.json"), sections, consume=lean)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024      # Linux: KB
+    print(json.dumps({"peakMB": peak - base}))
+
+
+def _run(scenario, lean, args, out):
+    cmd = [sys.executable, __file__, "--child", scenario, "--symbols", str(args.symbols),
+           "--rows", str(args.rows), "--history", str(args.history), "--out", out]
+    if lean:
+        cmd.append("--lean")
+    res = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    return json.loads(res.stdout.strip().splitlines()[-1])["peakMB"]
+
+
+def _mismatches(ref_dir, lean_dir):
+    """(values compared, values differing) over every numeric record field."""
+    from lowmem import DECIMALS
+
+    keys = {"open": "Open", "high": "High", "low": "Low", "close": "Close"}
+    total = diff = 0
+    for name in os.listdir(ref_dir):
+        if not name.endswith(".json") or name == "index.json":
+            continue
+        with open(os.path.join(ref_dir, name), encoding="utf-8") as f:
+            a = json.load(f)
+        with open(os.path.join(lean_dir, name), encoding="utf-8") as f:
+            b = json.load(f)
+        pairs = [(keys[k], ra[k], rb[k]) for ra, rb in zip(a["ohlcv"], b["ohlcv"]) for k in keys]
+        pairs += [(col, ra["value"], rb["value"]) for col in a["indicators"]
+                  for ra, rb in zip(a["indicators"][col], b["indicators"][col])]
+        for col, x, y in pairs:
+            if x is None:
+                continue
+            total += 1
+            diff += float(np.round(x, DECIMALS[col])) != y if col in DECIMALS else x != y
+    return total, diff
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--symbols", type=int, default=300)
+    ap.add_argument("--rows", type=int, default=5000)
+    ap.add_argument("--history", type=int, default=80000)
+    ap.add_argument("--child", choices=["universe", "history"], default=None)
+    ap.add_argument("--lean", action="store_true")
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args()
+
+    if args.child:
+        child(args.child, args.lean, args, args.out)
+        return
+
+    print(f"universe: {args.symbols} symbols × {args.rows} rows; history: {args.history} rows")
+    print(f"{'scenario':<10}{'default MB':>12}{'low-mem MB':>12}{'saved':>8}{'mismatch':>16}")
+    for scenario in ("universe", "history"):
+        with tempfile.TemporaryDirectory() as ref, tempfile.TemporaryDirectory() as lean:
+            full = _run(scenario, False, args, ref)
+            low = _run(scenario, True, args, lean)
+            total, diff = _mismatches(ref, lean)
+        print(f"{scenario:<10}{full:>12.1f}{low:>12.1f}{1 - low / full:>7.0%}{diff:>8}/{total}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Micro-benchmark: naver_parser.iter_rows against the previous decode +
+11-group ROW_PAT findall, on stand-in investorDealTrendDay pages.
+
+    python scripts/benchmarks/bench_naver_parser.py [--fixtures DIR] [--number 200]
+
+--fixtures reads recorded <sosok>_p<page>.html files; without it the stand-in's
+synthetic pages are used. Cases: a full page, stopping after the first row
+(daily run hitting the cache), and a page whose rows are truncated mid-cell.
+"""
+
+import argparse
+import glob
+import os
+import re
+import timeit
+from datetime import datetime
+
+from common import SCRIPTS_DIR  # noqa: F401  (sys.path setup)
+from naver_stub import render_page, synthetic_rows
+import naver_parser
+
+# fetch_supply_demand()의 이전 패턴 그대로
+ROW_PAT = (
+    r'<td class="date2">(\d{2}\.\d{2}\.\d{2})</td>'
+    + r'\s*<td[^>]*>([\d,\-]+)</td>' * 10
+)
+
+
+def _parse(s):
+    s = s.replace(",", "").strip()
+    try:
+        return int(s)
+    except ValueError:
+        return 0
+
+
+def old_matches(content):
+    return re.findall(ROW_PAT, content.decode("euc-kr", errors="replace"))
+
+
+def old_parse(content):
+    """Previous page loop body: findall, then strptime + three int columns."""
+    rows = []
+    for m in old_matches(content):
+        try:
+            dt = datetime.strptime("20" + m[0], "%Y.%m.%d")
+        except ValueError:
+            continue
+        rows.append({"date": dt.strftime("%Y-%m-%d"), "individual": _parse(m[1]),
+                     "foreign": _parse(m[2]), "institution": _parse(m[3])})
+    return rows
+
+
+def old_first(content):
+    return old_parse(content)[:1]
+
+
+def new_first(content):
+    return next(naver_parser.iter_rows(content), None)
+
+
+def load_pages(fixtures):
+    if fixtures:
+        pages = []
+        for path in sorted(glob.glob(os.path.join(fixtures, "*.html"))):
+            with open(path, "rb") as f:
+                pages.append(f.read())
+        return pages
+    rows = synthetic_rows(340, seed=7)
+    return [render_page(rows[i:i + 10]) for i in range(0, len(rows), 10)]
+
+
+def truncate_cells(page):
+    # 각 행의 마지막 셀 닫는 태그를 깨뜨린다 → 정규식은 행마다 되추적
+    return re.sub(rb"(</td>\n)(</tr>)", rb"\2", page)
+
+
+def check(pages):
+    for page in pages:
+        old = [(f"20{m[0].replace('.', '-')}", [int(v.replace(",", "")) for v in m[1:]])
+               for m in old_matches(page)]
+        new = [(r["date"], [r[k] for k in naver_parser.INVESTOR_KEYS])
+               for r in naver_parser.iter_rows(page)]
+        assert old == new, "parsers disagree"
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--fixtures", default=None)
+    ap.add_argument("--number", type=int, default=200)
+    args = ap.parse_args()
+
+    pages = load_pages(args.fixtures)
+    broken = [truncate_cells(p) for p in pages]
+    check(pages)
+    check(broken)
+
+    cases = [
+        ("full page", pages, old_parse, naver_parser.parse_page),
+        ("first row only", pages, old_first, new_first),
+        ("truncated rows", broken, old_parse, naver_parser.parse_page),
+    ]
+    print(f"{len(pages)} pages, {sum(map(len, pages)) // len(pages)} bytes/page")
+    print(f"{'case':<18}{'ROW_PAT':>12}{'iter_rows':>12}{'speedup':>9}   (µs/page)")
+    for name, data, old, new in cases:
+        t_old = min(timeit.repeat(lambda: [old(p) for p in data], number=args.number, repeat=3))
+        t_new = min(timeit.repeat(lambda: [new(p) for p in data], number=args.number, repeat=3))
+        per = 1e6 / (args.number * len(data))
+        print(f"{name:<18}{t_old * per:12.1f}{t_new * per:12.1f}{t_old / t_new:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
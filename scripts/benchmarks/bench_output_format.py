@@ -0,0 +1,113 @@
+"""
+Benchmark: market_data.json size and parse time, row format vs columnar.
+
+    python scripts/benchmarks/bench_output_format.py [--sizes 250,1250,5000]
+
+Uses public/data/market_data.json plus synthetic documents of the given
+lengths. Reports raw/gzip bytes, Python json.loads (+ columnar decode) and,
+if node is on PATH, browser-engine JSON.parse (+ src/utils/columnar.js decode).
+"""
+
+import argparse
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+from common import SCRIPTS_DIR, synthetic_document
+import columnar
+
+REPO = os.path.dirname(SCRIPTS_DIR)
+SAMPLE = os.path.join(REPO, "public", "data", "market_data.json")
+
+VARIANTS = [
+    ("rows", lambda d: d),
+    ("columnar", lambda d: columnar.to_columnar(d)),
+    ("columnar+delta", lambda d: columnar.to_columnar(d, delta_dates=True)),
+    ("columnar+delta+p4", lambda d: columnar.to_columnar(d, precision=4, delta_dates=True)),
+]
+
+NODE_BENCH = """
+import { readFileSync } from 'fs'
+import { normalizeMarketData } from '%s'
+const text = readFileSync(process.argv[2], 'utf8')
+const N = 30
+let best = Infinity, bestDecode = Infinity
+for (let i = 0; i < N; i++) {
+  const t0 = performance.now()
+  const json = JSON.parse(text)
+  const t1 = performance.now()
+  normalizeMarketData(json)
+  const t2 = performance.now()
+  best = Math.min(best, t1 - t0)
+  bestDecode = Math.min(bestDecode, t2 - t0)
+}
+console.log(JSON.stringify({ parse: best, total: bestDecode }))
+"""
+
+
+def dumps(doc):
+    return json.dumps(doc, ensure_ascii=False, separators=(",", ":"))
+
+
+def py_parse(text, repeat=10):
+    best, best_total = float("inf"), float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        doc = json.loads(text)
+        t1 = time.perf_counter()
+        if doc.get("schemaVersion") == columnar.SCHEMA_VERSION:
+            columnar.from_columnar(doc)
+        t2 = time.perf_counter()
+        best, best_total = min(best, t1 - t0), min(best_total, t2 - t0)
+    return best * 1e3, best_total * 1e3
+
+
+def node_parse(path, script):
+    out = subprocess.run(["node", script, path], capture_output=True, text=True, check=True)
+    res = json.loads(out.stdout)
+    return res["parse"], res["total"]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--sizes", default="250,1250,5000")
+    args = ap.parse_args()
+
+    docs = []
+    if os.path.exists(SAMPLE):
+        with open(SAMPLE, encoding="utf-8") as f:
+            docs.append(("market_data.json", json.load(f)))
+    docs += [(f"synthetic {n}d", synthetic_document(int(n))) for n in args.sizes.split(",")]
+
+    has_node = shutil.which("node") is not None
+    with tempfile.TemporaryDirectory() as tmp:
+        script = os.path.join(tmp, "parse.mjs")
+        with open(script, "w") as f:
+            f.write(NODE_BENCH % os.path.join(REPO, "src", "utils", "columnar.js"))
+
+        print(f"{'document':<18}{'variant':<20}{'bytes':>11}{'gzip':>10}"
+              f"{'py parse':>10}{'+decode':>9}" + (f"{'js parse':>10}{'+decode':>9}" if has_node else "")
+              + "   (ms)")
+        for name, doc in docs:
+            for label, enc in VARIANTS:
+                encoded = enc(doc)
+                text = dumps(encoded)
+                if label != "rows" and "+p" not in label:
+                    assert columnar.from_columnar(json.loads(text)) == doc, f"{label}: round trip differs"
+                raw = text.encode("utf-8")
+                line = f"{name:<18}{label:<20}{len(raw):>11,}{len(gzip.compress(raw)):>10,}"
+                line += "{:>10.2f}{:>9.2f}".format(*py_parse(text))
+                if has_node:
+                    path = os.path.join(tmp, "doc.json")
+                    with open(path, "wb") as f:
+                        f.write(raw)
+                    line += "{:>10.2f}{:>9.2f}".format(*node_parse(path, script))
+                print(line)
+
+
+if __name__ == "__main__":
+    main()
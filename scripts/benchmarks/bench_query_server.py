@@ -0,0 +1,130 @@
+"""
+Load test for query_server.py: requests/sec and latency percentiles.
+
+    python scripts/benchmarks/bench_query_server.py [--days 2500] [--requests 4000] [--connections 16]
+
+Serves a synthetic market_data document (`days` trading days) from a
+query_server subprocess and drives it from keep-alive asyncio connections,
+one scenario at a time:
+
+    range miss   random from/to windows on /indicators/<name> (mostly cache misses)
+    range hit    the same 20 queries over and over (LRU response cache)
+    revalidate   If-None-Match with the current ETag → 304, no body
+    last week    /ohlcv?last=5 (the "only the last week" client)
+    full gzip    the whole ohlcv table, Accept-Encoding: gzip
+
+Bytes/request are compared with the full document a static client fetches.
+Client and server share the machine, so absolute numbers are a lower bound.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from common import SCRIPTS_DIR, synthetic_document
+from serialize import write_json
+
+SERVER = os.path.join(SCRIPTS_DIR, "query_server.py")
+INDICATORS = ["rsi14", "macd", "ma20", "bb_upper", "obv"]
+
+
+async def fetch(reader, writer, target, headers=()):
+    """One keep-alive GET → (status, headers dict, body bytes)."""
+    req = f"GET {target} HTTP/1.1\r\nHost: bench\r\n" + "".join(f"{k}: {v}\r\n" for k, v in headers) + "\r\n"
+    writer.write(req.encode("latin-1"))
+    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+    status = int(head[0].split(" ", 2)[1])
+    hdrs = {k.lower(): v.strip() for k, _, v in (line.partition(":") for line in head[1:] if line)}
+    body = await reader.readexactly(int(hdrs.get("content-length", 0)))
+    return status, hdrs, body
+
+
+async def load(port, targets, connections, headers=()):
+    """Spread `targets` over keep-alive connections; returns (seconds, latencies, bytes)."""
+    queue = list(reversed(targets))
+    latencies, sizes = [], []
+
+    async def worker():
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            while queue:
+                target = queue.pop()
+                t0 = time.perf_counter()
+                status, _, body = await fetch(reader, writer, target, headers)
+                latencies.append(time.perf_counter() - t0)
+                sizes.append(len(body))
+                assert status in (200, 304), (status, target, body[:200])
+        finally:
+            writer.close()
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(connections)))
+    return time.perf_counter() - t0, np.array(latencies), sum(sizes)
+
+
+def random_ranges(dates, n, rng):
+    out = []
+    for _ in range(n):
+        i, j = sorted(rng.sample(range(len(dates)), 2))
+        out.append(f"/indicators/{rng.choice(INDICATORS)}?from={dates[i]}&to={dates[j]}")
+    return out
+
+
+async def scenarios(port, dates, args):
+    rng = random.Random(0)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    _, hdrs, _ = await fetch(reader, writer, "/ohlcv")
+    etag = hdrs["etag"]
+    writer.close()
+
+    n = args.requests
+    hot = random_ranges(dates, 20, rng)
+    yield "range miss", await load(port, random_ranges(dates, n, rng), args.connections)
+    yield "range hit", await load(port, [hot[i % len(hot)] for i in range(n)], args.connections)
+    yield "revalidate", await load(port, ["/ohlcv"] * n, args.connections, [("If-None-Match", etag)])
+    yield "last week", await load(port, ["/ohlcv?last=5"] * n, args.connections)
+    yield "full gzip", await load(port, ["/ohlcv"] * n, args.connections, [("Accept-Encoding", "gzip")])
+
+
+async def run(port, dates, args, full_bytes):
+    print(f"{'scenario':<12}{'req/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'B/req':>9}{'vs full doc':>13}")
+    async for name, (sec, lat, size) in scenarios(port, dates, args):
+        per = size / len(lat)
+        print(f"{name:<12}{len(lat) / sec:>9.0f}{np.percentile(lat, 50) * 1e3:>9.2f}"
+              f"{np.percentile(lat, 99) * 1e3:>9.2f}{per:>9.0f}{per / full_bytes:>12.2%}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--days", type=int, default=2500)
+    ap.add_argument("--requests", type=int, default=4000)
+    ap.add_argument("--connections", type=int, default=16)
+    args = ap.parse_args()
+
+    doc = synthetic_document(args.days)
+    dates = [r["date"] for r in doc["ohlcv"]]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "market_data.json")
+        full_bytes = write_json(path, doc)
+        proc = subprocess.Popen([sys.executable, SERVER, "--data", path, "--port", "0"],
+                                stdout=subprocess.PIPE, text=True)
+        try:
+            port = int(re.search(r":(\d+)/", proc.stdout.readline()).group(1))
+            print(f"{args.days} days, document {full_bytes // 1024} KB, "
+                  f"{args.requests} requests × scenario on {args.connections} connections")
+            asyncio.run(run(port, dates, args, full_bytes))
+        finally:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
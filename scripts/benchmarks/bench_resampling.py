@@ -0,0 +1,89 @@
+"""
+Resampled metric intervals: vectorized index matrix vs a loop per resample.
+
+    python scripts/benchmarks/bench_resampling.py [--trades 10,20,50] [--resamples 10000,100000]
+
+Checks that trade_metrics reproduces compute_metrics on the observed trades
+and, row by row, on a sample of bootstrap resamples (same index matrix
+through compute_metrics' own arithmetic), then reports resamples/sec for
+bootstrap() and permutation() per trade count next to the per-resample
+Python loop (timed on --loop-sample resamples and extrapolated).
+"""
+
+import argparse
+
+import numpy as np
+
+from common import fmt_seconds, synthetic_ohlcv, timeit, with_indicators
+import fetch_data as fd
+import resampling as rs
+
+
+def loop_metrics(r, holding_days=20):
+    """compute_metrics' arithmetic for one trade path."""
+    win = sum(1 for x in r if x > 0) / len(r)
+    cum = np.cumprod([1 + x for x in r])
+    mdd = float(np.min((cum - np.maximum.accumulate(cum)) / np.maximum.accumulate(cum)))
+    avg = float(np.mean(r))
+    std = float(np.std(r, ddof=1))
+    sharpe = (avg - rs.RISK_FREE / (252 / holding_days)) / std * np.sqrt(252 / holding_days) \
+        if std > 0 and max(r) > min(r) else 0
+    return {"winRate": win, "mdd": mdd, "sharpeRatio": sharpe, "avgReturn": avg}
+
+
+def loop_bootstrap(returns, resamples, rng):
+    k = len(returns)
+    return [loop_metrics(returns[rng.integers(0, k, size=k)]) for _ in range(resamples)]
+
+
+def check(sample=500):
+    raw = synthetic_ohlcv(520, seed=3)
+    d1 = with_indicators(raw).iloc[-252:]
+    signals = fd.generate_signals(d1)
+    metrics = fd.compute_metrics(d1, signals)
+    pos = {d: i for i, d in enumerate(d1.index.strftime("%Y-%m-%d"))}
+    entries = [pos[s["date"]] for s in signals if s["type"] == "BUY"]
+    returns = rs.forward_returns(d1["Close"].to_numpy(), 20)[entries]
+
+    observed = rs.trade_metrics(returns)
+    for m in rs.METRICS:
+        assert round(float(observed[m][0]), rs.DECIMALS[m]) == metrics[m], (m, observed[m], metrics[m])
+
+    idx = np.random.default_rng(1).integers(0, len(returns), size=(sample, len(returns)))
+    vec = rs.trade_metrics(returns[idx])
+    worst = 0.0
+    for i, row in enumerate(idx):
+        ref = loop_metrics(returns[row])
+        for m in rs.METRICS:
+            worst = max(worst, abs(vec[m][i] - ref[m]) / max(abs(ref[m]), 1.0))
+    return len(returns), sample, worst
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--trades", default="10,20,50")
+    ap.add_argument("--resamples", default="10000,100000")
+    ap.add_argument("--loop-sample", type=int, default=2000)
+    args = ap.parse_args()
+
+    k, sample, worst = check()
+    print(f"trade_metrics == compute_metrics on {k} observed trades; "
+          f"{sample} bootstrap rows vs loop: max error {worst:.1e}\n")
+
+    fwd = rs.forward_returns(synthetic_ohlcv(252, seed=5)["Close"].to_numpy(), 20)
+    print(f"{'trades':>7}{'resamples':>11}{'bootstrap':>12}{'resamples/s':>14}"
+          f"{'permutation':>13}{'resamples/s':>14}{'loop/s':>10}{'speedup':>9}")
+    for k in (int(x) for x in args.trades.split(",")):
+        returns = np.random.default_rng(k).normal(0.004, 0.05, k)
+        observed = {m: v[0] for m, v in rs.trade_metrics(returns).items()}
+        t_loop, _ = timeit(loop_bootstrap, returns, args.loop_sample, np.random.default_rng(0), repeat=1)
+        loop_rate = args.loop_sample / t_loop
+        for n in (int(x) for x in args.resamples.split(",")):
+            t_b, _ = timeit(rs.bootstrap, returns, 20, n, rng=np.random.default_rng(0))
+            t_p, _ = timeit(rs.permutation, fwd, observed, k, 20, n, rng=np.random.default_rng(0))
+            print(f"{k:>7}{n:>11}{fmt_seconds(t_b)}{n / t_b:>14,.0f}{fmt_seconds(t_p)}"
+                  f"{n / t_p:>14,.0f}{loop_rate:>10,.0f}{n / t_b / loop_rate:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Output building + JSON writing: per-row reference vs the serialize layer.
+
+    python scripts/benchmarks/bench_serialize.py [--sizes 10000,1000000]
+
+For synthetic KOSPI/QQQ/SOX frames of each size, builds the ohlcv,
+indicator, comparison and rolling60 record lists the old way (iterrows,
+per-element safe_float/strftime, json.dump to the file) and through the
+vectorized builders + serialize.write_json with each available backend.
+Every written file must be byte-identical to the reference. Sections are
+built and written one at a time so the 1M-row run fits in a few GB.
+"""
+
+import argparse
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+
+from common import fmt_seconds, synthetic_ohlcv, timeit, with_indicators
+import fetch_data as fd
+import reference
+import serialize
+
+
+def frames(n):
+    # 로그 드리프트 0 (mu = sigma²/2) — 100만 봉(≈4000년)에서도 가격이 현실적인 범위에 머문다
+    kospi = with_indicators(synthetic_ohlcv(n, seed=0, mu=0.02))
+    # 거래일이 다른 해외 지수 — 날짜 일부를 빼 rolling60 의 누락 키 경로도 탄다
+    rng = np.random.default_rng(1)
+    qqq = synthetic_ohlcv(n, seed=1, s0=400.0, mu=0.02)
+    sox = synthetic_ohlcv(n, seed=2, s0=3000.0, mu=0.02)
+    qqq = qqq[rng.random(n) > 0.03]
+    sox = sox[rng.random(n) > 0.05]
+    return kospi, qqq, sox
+
+
+def rolling_pairs(kospi, qqq, sox, window=60):
+    kr = kospi["Close"].pct_change().dropna()
+    out = {}
+    for name, ext in [("kospi_qqq", qqq), ("kospi_sox", sox)]:
+        er = ext["Close"].pct_change().dropna()
+        common = kr.index.intersection(er.index)
+        out[name] = kr.loc[common].rolling(window).corr(er.loc[common])
+    return out
+
+
+def sections(kospi, qqq, sox):
+    """[(name, reference builder, serialize builder)] of the big record lists."""
+    rolling = rolling_pairs(kospi, qqq, sox)
+    out = [("ohlcv", lambda: reference.ohlcv_records(kospi), lambda: fd.ohlcv_records(kospi))]
+    for col in fd.INDICATOR_COLUMNS:
+        s = kospi[col]
+        out.append((col, lambda s=s: reference.value_records(s), lambda s=s: serialize.series_records(s)))
+    for name, df in [("kospi", kospi), ("qqq", qqq), ("sox", sox)]:
+        s = df["Close"] / df["Close"].iloc[0] * 100
+        out.append((f"{name}_normalized", lambda s=s: reference.value_records(s),
+                    lambda s=s: serialize.series_records(s)))
+    out.append(("rolling60", lambda: reference.rolling_records(rolling),
+                lambda: fd.rolling_records(rolling)))
+    return out
+
+
+def digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest(), os.path.getsize(path)
+
+
+def run(n, tmp, backends):
+    kospi, qqq, sox = frames(n)
+    t = {"ref_build": 0.0, "ref_write": 0.0, "build": 0.0, **{b: 0.0 for b in backends}}
+    size = 0
+    path = os.path.join(tmp, "out.json")
+    for name, ref_builder, fast_builder in sections(kospi, qqq, sox):
+        sec, doc = timeit(ref_builder, repeat=1)
+        t["ref_build"] += sec
+        sec, _ = timeit(reference.write_json, path, {name: doc}, repeat=1)
+        t["ref_write"] += sec
+        expected, nbytes = digest(path)
+        size += nbytes
+        del doc
+
+        sec, doc = timeit(fast_builder, repeat=1)
+        t["build"] += sec
+        for backend in backends:
+            sec, _ = timeit(serialize.write_json, path, {name: doc}, backend, repeat=1)
+            t[backend] += sec
+            if digest(path)[0] != expected:
+                raise AssertionError(f"{backend}: {name} differs from json.dump at n={n}")
+        del doc
+    os.remove(path)
+    return t, size
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--sizes", default="10000,1000000")
+    args = ap.parse_args()
+    backends = ["json"] + (["orjson"] if serialize.orjson is not None else [])
+
+    tmp = tempfile.mkdtemp()
+    for n in (int(s) for s in args.sizes.split(",")):
+        t, size = run(n, tmp, backends)
+        print(f"{n} rows, {size / 2**20:.1f} MB of JSON (all sections byte-identical)")
+        print(f"  build    reference {fmt_seconds(t['ref_build'])}   serialize {fmt_seconds(t['build'])}"
+              f"   {t['ref_build'] / t['build']:6.1f}x")
+        for backend in backends:
+            print(f"  write    json.dump {fmt_seconds(t['ref_write'])}   {backend:<9} {fmt_seconds(t[backend])}"
+                  f"   {t['ref_write'] / t[backend]:6.1f}x")
+        total_ref = t["ref_build"] + t["ref_write"]
+        total = t["build"] + min(t[b] for b in backends)
+        print(f"  total    {fmt_seconds(total_ref).strip()} → {fmt_seconds(total).strip()}"
+              f" ({total_ref / total:.1f}x)\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Intraday streaming: online indicator updates vs recomputing per minute bar.
+
+    python scripts/benchmarks/bench_streaming.py [--history 500] [--days 3]
+
+Replays synthetic 1-minute KRX sessions (390 bars, 09:00-15:29) after a
+daily history. The provisional row at the end of each replayed day must
+match compute_indicators() over the history plus the aggregated daily bars;
+reports the worst relative error and the per-bar cost of
+IntradaySession.update against re-running compute_indicators +
+compute_decision on the full daily frame for every bar.
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from common import fmt_seconds, synthetic_ohlcv, timeit
+import fetch_data as fd
+import streaming
+
+MINUTES = 390
+
+
+def minute_bars(days, last_close, seed=0):
+    """[(datetime, o, h, l, c, v)] for `days` consecutive business days."""
+    rng = np.random.default_rng(seed)
+    out, price = [], last_close
+    for day in days:
+        t0 = datetime.combine(day, datetime.min.time()) + timedelta(hours=9)
+        steps = price * np.exp(np.cumsum(rng.standard_normal(MINUTES) * 0.0006))
+        opens = np.concatenate([[price], steps[:-1]])
+        for k in range(MINUTES):
+            o, c = opens[k], steps[k]
+            wick = abs(rng.standard_normal()) * 0.0003 * c
+            out.append((t0 + timedelta(minutes=k), o, max(o, c) + wick, min(o, c) - wick, c,
+                        float(rng.integers(200, 2000))))
+        price = steps[-1]
+    return out
+
+
+def write_replay(path, bars):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["Datetime", "Open", "High", "Low", "Close", "Volume"])
+        for t, *vals in bars:
+            w.writerow([t.isoformat()] + [repr(float(v)) for v in vals])
+
+
+def daily_of(bars):
+    df = pd.DataFrame(bars, columns=["t", "Open", "High", "Low", "Close", "Volume"])
+    g = df.groupby(df["t"].dt.normalize())
+    return pd.DataFrame({"Open": g["Open"].first(), "High": g["High"].max(), "Low": g["Low"].min(),
+                         "Close": g["Close"].last(), "Volume": g["Volume"].sum()})
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--history", type=int, default=500, help="daily bars before the replay")
+    ap.add_argument("--days", type=int, default=3, help="replayed sessions")
+    args = ap.parse_args()
+
+    hist = synthetic_ohlcv(args.history, seed=3)
+    days = pd.bdate_range(hist.index[-1] + pd.offsets.BDay(1), periods=args.days)
+    bars = minute_bars([d.date() for d in days], hist["Close"].iloc[-1])
+    expected = fd.compute_indicators(pd.concat([hist, daily_of(bars)]))
+
+    tmp = tempfile.mkdtemp()
+    replay = os.path.join(tmp, "minutes.csv")
+    write_replay(replay, bars)
+    path = os.path.join(tmp, "intraday.json")
+
+    # 정확도: 각 세션 마지막 분봉 시점의 잠정 지표 == 일봉 전체로 다시 계산한 값
+    session = streaming.IntradaySession(hist, path, interval=0.0)
+    rows = {}
+    for bar in streaming.ReplaySource(replay):
+        session.update(bar)
+        rows[bar.time.date()] = dict(session.row)
+    session.close_session()
+    worst = 0.0
+    for day, row in rows.items():
+        ref = expected.loc[pd.Timestamp(day)]
+        for col, v in row.items():
+            r = float(ref[col])
+            if np.isnan(r) != np.isnan(v):
+                raise AssertionError(f"NaN mismatch: {col} on {day}")
+            if not np.isnan(r):
+                worst = max(worst, abs(v - r) / max(abs(r), 1.0))
+    print(f"{args.days} sessions × {MINUTES} bars after {args.history} daily bars: "
+          f"max relative error {worst:.1e}, {session.snapshots} snapshots")
+
+    # 분봉당 비용
+    day_bars = [streaming.Bar(t, o, h, l, c, v, True) for t, o, h, l, c, v in bars[:MINUTES]]
+
+    def online():
+        s = streaming.IntradaySession(hist, path, interval=3600.0)
+        s._start_day(day_bars[0].time.date())
+        t0 = pd.Timestamp.now()
+        for b in day_bars:
+            s.update(b)
+        return (pd.Timestamp.now() - t0).total_seconds()
+
+    def recompute():
+        agg = None
+        for b in day_bars[:60]:             # 60분만 — 매 분봉 전체 재계산은 느리다
+            agg = (b.open, max(b.high, agg[1]) if agg else b.high, min(b.low, agg[2]) if agg else b.low,
+                   b.close, b.volume + (agg[4] if agg else 0.0))
+            today = pd.DataFrame([agg], columns=["Open", "High", "Low", "Close", "Volume"],
+                                 index=[pd.Timestamp(b.time.date())])
+            df = fd.compute_indicators(pd.concat([hist, today]))
+            fd.compute_decision(df)
+            fd.generate_signals(df.iloc[-2:])
+
+    t_on = min(online() for _ in range(3)) / MINUTES
+    t_re, _ = timeit(recompute, repeat=3)
+    t_re /= 60
+    print(f"per minute bar: recompute {fmt_seconds(t_re).strip()}, online {fmt_seconds(t_on).strip()}"
+          f" ({t_re / t_on:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark: NAVER supply/demand scraping against the local stand-in.
+
+    python scripts/benchmarks/bench_supply_demand.py [--latency 0.15]
+
+Compares the original sequential scraper (0.25 s sleep between pages, markets
+in series) with supply_demand.fetch_supply_demand cold (empty row cache) and
+warm (next-day run: only the newest rows are missing from the cache).
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import timedelta
+
+from common import SCRIPTS_DIR  # noqa: F401  (sys.path setup)
+from naver_stub import NaverStub, synthetic_rows
+import reference as ref
+import supply_demand as sd
+
+
+def run(label, fn, stub):
+    hits0 = stub.hits
+    t0 = time.perf_counter()
+    out = fn()
+    dt = time.perf_counter() - t0
+    print(f"{label:<34}{dt:8.2f} s  {stub.hits - hits0:4d} requests")
+    return out
+
+
+def series_of(result, keys=("date", "individual", "foreign", "institution")):
+    """Comparable view: the original scraper only kept these columns."""
+    return {m: [{k: r[k] for k in keys} for r in v["series"]] for m, v in result.items()}
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--latency", type=float, default=0.15, help="simulated server latency (s)")
+    ap.add_argument("--concurrency", type=int, default=4)
+    ap.add_argument("--rate", type=float, default=8.0)
+    args = ap.parse_args()
+
+    rows = {"01": synthetic_rows(seed=1), "02": synthetic_rows(seed=2)}
+    now = rows["01"][0][0]
+    with NaverStub(rows, latency=args.latency) as stub, tempfile.TemporaryDirectory() as cache:
+        old = run("sequential (original)",
+                  lambda: ref.fetch_supply_demand(stub.base_url, now=now), stub)
+        new = run(f"concurrent x{args.concurrency}, cold cache",
+                  lambda: sd.fetch_supply_demand(stub.base_url, args.concurrency, args.rate,
+                                                 cache_dir=cache, now=now), stub)
+        assert series_of(old) == series_of(new), "concurrent scraper output differs"
+
+        # 다음 거래일: 새 행 하나가 맨 앞에 추가된다
+        nxt = now + timedelta(days=1 if now.weekday() < 4 else 3)
+        stub.rows_by_sosok = {k: [(nxt, v[0][1])] + v for k, v in rows.items()}
+        warm = run("concurrent, warm cache (next day)",
+                   lambda: sd.fetch_supply_demand(stub.base_url, args.concurrency, args.rate,
+                                                  cache_dir=cache, now=nxt), stub)
+        fresh = sd.fetch_supply_demand(stub.base_url, args.concurrency, args.rate,
+                                       cache_dir=None, now=nxt)
+        assert series_of(warm, keys=warm["kospi"]["series"][0].keys()) == \
+            series_of(fresh, keys=warm["kospi"]["series"][0].keys()), "cached scraper output differs"
+
+
+if __name__ == "__main__":
+    main()
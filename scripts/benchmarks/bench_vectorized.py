@@ -0,0 +1,63 @@
+"""
+Benchmark: vectorized compute_obv / generate_signals / find_support_resistance
+against the original row-by-row implementations (benchmarks/reference.py).
+
+    python scripts/benchmarks/bench_vectorized.py [--sizes 1000,10000,1000000]
+
+Every case asserts that both versions return identical output before timing
+is reported. The reference loops take minutes at 1M rows; pass
+--max-reference-rows to skip them above a size.
+"""
+
+import argparse
+
+import numpy as np
+
+from common import fmt_seconds, synthetic_ohlcv, timeit, with_indicators
+import fetch_data as fd
+import reference as ref
+
+
+CASES = [
+    ("compute_obv",
+     lambda df: (df["Close"], df["Volume"]), ref.compute_obv, fd.compute_obv),
+    ("generate_signals",
+     lambda df: (df,), ref.generate_signals, fd.generate_signals),
+    ("find_support_resistance",
+     lambda df: (df,), ref.find_support_resistance, fd.find_support_resistance),
+]
+
+
+def same(a, b):
+    if hasattr(a, "to_numpy"):
+        return np.array_equal(a.to_numpy(), b.to_numpy(), equal_nan=True) and a.index.equals(b.index)
+    return a == b
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--sizes", default="1000,10000,1000000")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--max-reference-rows", type=int, default=None)
+    args = ap.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    print(f"{'function':<26}{'rows':>9}  {'reference':>11}  {'vectorized':>11}  {'speedup':>8}")
+    for n in sizes:
+        df = with_indicators(synthetic_ohlcv(n, seed=n))
+        run_ref = args.max_reference_rows is None or n <= args.max_reference_rows
+        for name, make_args, old, new in CASES:
+            fn_args = make_args(df)
+            t_new, out_new = timeit(new, *fn_args, repeat=args.repeat)
+            if run_ref:
+                t_old, out_old = timeit(old, *fn_args, repeat=1)
+                assert same(out_old, out_new), f"{name}: output differs at n={n}"
+                speed = f"{t_old / t_new:7.1f}x"
+                old_txt = fmt_seconds(t_old)
+            else:
+                speed, old_txt = "     —", "    skipped"
+            print(f"{name:<26}{n:>9}  {old_txt:>11}  {fmt_seconds(t_new):>11}  {speed:>8}")
+
+
+if __name__ == "__main__":
+    main()
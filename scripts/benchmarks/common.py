@@ -0,0 +1,92 @@
+"""
+Shared helpers for the benchmark scripts: import path setup, synthetic market
+data and a small timing harness.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+
+def synthetic_ohlcv(n, seed=0, start="2000-01-03", s0=2500.0, mu=0.05, sigma=0.2):
+    """Deterministic GBM daily OHLCV (business-day index)."""
+    rng = np.random.default_rng(seed)
+    dt = 1 / 252
+    ret = (mu - 0.5 * sigma ** 2) * dt + sigma * np.sqrt(dt) * rng.standard_normal(n)
+    close = s0 * np.exp(np.cumsum(ret))
+    open_ = np.concatenate([[s0], close[:-1]]) * (1 + 0.002 * rng.standard_normal(n))
+    spread = np.abs(rng.standard_normal(n)) * sigma * np.sqrt(dt) * close
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    volume = rng.lognormal(mean=np.log(4e5), sigma=0.35, size=n).astype(np.int64)
+    # 보합(종가 동일) 구간도 섞어 둔다 — OBV/크로스 경계 조건 확인용
+    flat = rng.random(n) < 0.01
+    close[1:][flat[1:]] = close[:-1][flat[1:]]
+    index = pd.bdate_range(start=start, periods=n)
+    return pd.DataFrame({"Open": open_, "High": high, "Low": low,
+                         "Close": close, "Volume": volume}, index=index)
+
+
+def with_indicators(df):
+    """Attach the indicator columns generate_signals expects."""
+    import fetch_data as fd
+    return fd.compute_indicators(df)
+
+
+def timeit(fn, *args, repeat=3, **kwargs):
+    """Best-of-`repeat` wall time in seconds and the last result."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(*args, **kwargs)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def fmt_seconds(sec):
+    if sec < 1e-3:
+        return f"{sec * 1e6:8.1f} µs"
+    if sec < 1:
+        return f"{sec * 1e3:8.2f} ms"
+    return f"{sec:8.3f} s "
+
+
+def synthetic_document(n, seed=0):
+    """Row-format market_data document with `n` trading days per series."""
+    import fetch_data as fd
+
+    warmup = 250
+    df = with_indicators(synthetic_ohlcv(n + warmup, seed=seed))
+    ext = synthetic_ohlcv(n + warmup, seed=seed + 1)
+    d1 = df.iloc[warmup:]
+    dates = d1.index.strftime("%Y-%m-%d")
+
+    def records(series):
+        return [{"date": d, "value": fd.safe_float(v)} for d, v in zip(dates, series)]
+
+    ind_cols = ["ma5", "ma20", "ma60", "ma120", "ma240", "bb_upper", "bb_middle", "bb_lower",
+                "rsi14", "macd", "macd_signal", "macd_hist", "obv"]
+    corr = fd.compute_correlations(df, ext, ext, start_1y=d1.index[0])
+    rng = np.random.default_rng(seed)
+    flows = (rng.standard_normal((n, 3)) * [4000, 3500, 2500]).astype(int)
+    series = [{"date": d, "individual": int(a), "foreign": int(b), "institution": int(c)}
+              for d, (a, b, c) in zip(dates, flows)]
+    return {
+        "metadata": {"lastUpdated": "2026-01-01T00:00:00", "dataStart": dates[0],
+                     "dataEnd": dates[-1], "totalDays": n},
+        "ohlcv": [{"date": d, "open": fd.safe_float(r.Open), "high": fd.safe_float(r.High),
+                   "low": fd.safe_float(r.Low), "close": fd.safe_float(r.Close),
+                   "volume": int(r.Volume)} for d, r in zip(dates, d1.itertuples())],
+        "indicators": {c: records(d1[c]) for c in ind_cols} | {"vkospi": []},
+        "signals": fd.generate_signals(d1),
+        "correlations": corr,
+        "comparison": {"kospi_normalized": records(d1["Close"] / d1["Close"].iloc[0] * 100)},
+        "supplyDemand": {"kospi": {"lastDate": dates[-1], "series": series, "unit": "억원"}},
+    }
@@ -0,0 +1,74 @@
+// bench_indicator_engine.py 가 만든 fixture 로 src/utils/indicatorEngine.js 를 검사한다.
+//   node scripts/benchmarks/indicator_engine_check.mjs fixture.json  → stdout 에 JSON 보고서
+import { readFileSync } from 'node:fs'
+import { IndicatorEngine } from '../../src/utils/indicatorEngine.js'
+
+const fixture = JSON.parse(readFileSync(process.argv[2], 'utf8'))
+const errors = {}
+const failures = []
+let signals = 0
+let signalMismatches = 0
+
+const sameSignal = (a, b) => a && b && a.date === b.date && a.type === b.type &&
+  a.reason === b.reason && a.strength === b.strength && a.price === b.price
+
+for (const c of fixture.cases) {
+  const tag = `n=${c.n} params=${JSON.stringify(c.params)}`
+  const engine = new IndicatorEngine(c.dates, Float64Array.from(c.close), Float64Array.from(c.volume))
+  const out = engine.compute(c.params)
+
+  for (const [name, want] of Object.entries(c.expected.indicators)) {
+    const got = out.indicators[name]
+    if (!got || got.length !== want.length) {
+      failures.push(`${tag}: ${name} missing or wrong length`)
+      continue
+    }
+    let scale = 0, worst = 0
+    for (let i = 0; i < want.length; i++) {
+      if ((want[i] === null) !== Number.isNaN(got[i])) {
+        failures.push(`${tag}: ${name} NaN mask differs at ${i}`)
+        break
+      }
+      if (want[i] !== null) {
+        scale = Math.max(scale, Math.abs(want[i]))
+        worst = Math.max(worst, Math.abs(want[i] - got[i]))
+      }
+    }
+    const rel = worst / (scale || 1)
+    errors[name] = Math.max(errors[name] ?? 0, rel)
+    if (rel > fixture.tolerance) failures.push(`${tag}: ${name} relative error ${rel.toExponential(1)}`)
+  }
+
+  const want = c.expected.signals
+  signals += want.length
+  const bad = Math.max(want.length, out.signals.length) -
+    want.filter((s, i) => sameSignal(s, out.signals[i])).length
+  if (bad) failures.push(`${tag}: ${bad} signals differ`)
+  signalMismatches += bad
+}
+
+// 슬라이더 한 칸: 캐시가 찬 엔진에서 파라미터 하나만 바꿔 다시 계산
+function median(fn, repeat = 21) {
+  const t = []
+  for (let r = 0; r < repeat; r++) {
+    const t0 = performance.now()
+    fn(r)
+    t.push(performance.now() - t0)
+  }
+  return t.sort((a, b) => a - b)[repeat >> 1]
+}
+
+const timings = []
+for (const c of fixture.cases.filter(c => Object.keys(c.params).length === 0)) {
+  const arrays = [c.dates, Float64Array.from(c.close), Float64Array.from(c.volume)]
+  const cold = median(() => new IndicatorEngine(...arrays).compute())
+  const engine = new IndicatorEngine(...arrays)
+  engine.compute()
+  // 매번 캐시에 없는 값으로 바꾼다 (r 마다 다른 파라미터)
+  const rsi = median(r => engine.compute({ rsiPeriod: 100 + r }))
+  const bbK = median(r => engine.compute({ bbK: 1 + r / 100 }))
+  const macd = median(r => engine.compute({ macdSignal: 100 + r }))
+  timings.push({ n: c.n, cold, rsi, bbK, macd })
+}
+
+process.stdout.write(JSON.stringify({ errors, signals, signalMismatches, failures, timings }))
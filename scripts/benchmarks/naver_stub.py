@@ -0,0 +1,156 @@
+"""
+Local HTTP stand-in for NAVER Finance investorDealTrendDay pages.
+
+Serves EUC-KR pages in NAVER's markup, either recorded HTML files
+(<dir>/<sosok>_p<page>.html) or deterministic synthetic rows, so the
+supply/demand scraper can be exercised and benchmarked offline:
+
+    python scripts/benchmarks/naver_stub.py --port 8765 [--fixtures DIR] [--latency 0.2]
+    python scripts/benchmarks/naver_stub.py --write-fixtures DIR   # dump synthetic pages
+"""
+
+import argparse
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+ROWS_PER_PAGE = 10
+COLUMNS = ["개인", "외국인", "기관계", "금융투자", "보험", "투신(사모)",
+           "은행", "기타금융", "연기금등", "기타법인"]
+
+PAGE_HEAD = (
+    '<html lang="ko"><head><meta http-equiv="Content-Type" content="text/html; charset=euc-kr">'
+    "<title>투자자별 매매동향 : 네이버 금융</title></head><body>\n"
+    '<table summary="일별 투자자별 매매동향" class="type_1" cellspacing="0">\n'
+    "<tr>\n\t<th>날짜</th>" + "".join(f"<th>{c}</th>" for c in COLUMNS) + "\n</tr>\n"
+    '<tr><td colspan="11" class="blank_07"></td></tr>\n'
+)
+PAGE_TAIL = "</table>\n</body></html>\n"
+
+
+def synthetic_rows(days=400, end=None, seed=0):
+    """Newest-first (date, [10 ints]) rows for business days up to `end`."""
+    rng = np.random.default_rng(seed)
+    end = end or datetime.now()
+    rows, d = [], end
+    while len(rows) < days:
+        if d.weekday() < 5:
+            vals = (rng.standard_normal(10) * [4000, 3500, 2500, 1500, 200, 300, 100, 80, 600, 700]).astype(int)
+            rows.append((d, vals.tolist()))
+        d -= timedelta(days=1)
+    return rows
+
+
+def _cell(v):
+    cls = "rate_up3" if v > 0 else "rate_down3" if v < 0 else "rate_noc"
+    return f'\t<td class="{cls}">{v:,}</td>\n'
+
+
+def render_page(rows):
+    """One page of rows as NAVER-style EUC-KR bytes."""
+    parts = [PAGE_HEAD]
+    for i, (d, vals) in enumerate(rows):
+        parts.append('<tr>\n\t<td class="date2">' + d.strftime("%y.%m.%d") + "</td>\n")
+        parts.extend(_cell(v) for v in vals)
+        parts.append("</tr>\n")
+        if i % 5 == 4:
+            parts.append('<tr><td colspan="11" class="blank_08"></td></tr>\n')
+    parts.append(PAGE_TAIL)
+    return "".join(parts).encode("euc-kr")
+
+
+class NaverStub:
+    """Threaded local server; use as a context manager and read `.base_url`."""
+
+    def __init__(self, rows_by_sosok=None, fixtures=None, latency=0.0, port=0):
+        self.rows_by_sosok = rows_by_sosok or {
+            "01": synthetic_rows(seed=1), "02": synthetic_rows(seed=2)}
+        self.fixtures = fixtures
+        self.latency = latency
+        self.hits = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self.server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def page(self, sosok, page):
+        if self.fixtures:
+            path = os.path.join(self.fixtures, f"{sosok}_p{page}.html")
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    return f.read()
+            return render_page([])
+        rows = self.rows_by_sosok.get(sosok, [])
+        return render_page(rows[(page - 1) * ROWS_PER_PAGE : page * ROWS_PER_PAGE])
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path != "/sise/investorDealTrendDay.naver":
+                    self.send_error(404)
+                    return
+                q = parse_qs(url.query)
+                with stub._lock:
+                    stub.hits += 1
+                if stub.latency:
+                    time.sleep(stub.latency)
+                body = stub.page(q.get("sosok", ["01"])[0], int(q.get("page", ["1"])[0]))
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=euc-kr")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def write_fixtures(directory, pages=35):
+    os.makedirs(directory, exist_ok=True)
+    stub = NaverStub()
+    for sosok in stub.rows_by_sosok:
+        for p in range(1, pages + 1):
+            with open(os.path.join(directory, f"{sosok}_p{p}.html"), "wb") as f:
+                f.write(stub.page(sosok, p))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Local NAVER investorDealTrendDay stand-in")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--fixtures", default=None, help="serve recorded <sosok>_p<page>.html files")
+    ap.add_argument("--latency", type=float, default=0.0, help="seconds added per request")
+    ap.add_argument("--write-fixtures", metavar="DIR", help="write synthetic pages and exit")
+    args = ap.parse_args()
+
+    if args.write_fixtures:
+        write_fixtures(args.write_fixtures)
+        return
+    with NaverStub(fixtures=args.fixtures, latency=args.latency, port=args.port) as stub:
+        print(f"Serving on {stub.base_url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+Row-by-row reference implementations kept from the original fetch_data.py.
+The vectorized versions in fetch_data.py must reproduce these exactly; the
+benchmarks use them both as the timing baseline and as the equality oracle.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from common import SCRIPTS_DIR  # noqa: F401  (sys.path setup)
+from fetch_data import safe_float
+
+
+def compute_obv(close, volume):
+    obv = np.zeros(len(close))
+    for i in range(1, len(close)):
+        if close.iloc[i] > close.iloc[i - 1]:
+            obv[i] = obv[i - 1] + volume.iloc[i]
+        elif close.iloc[i] < close.iloc[i - 1]:
+            obv[i] = obv[i - 1] - volume.iloc[i]
+        else:
+            obv[i] = obv[i - 1]
+    return pd.Series(obv, index=close.index)
+
+
+def find_support_resistance(df, window=15, min_count=2, tolerance=0.005):
+    highs = df["High"]
+    lows = df["Low"]
+    current = float(df["Close"].iloc[-1])
+
+    peaks, troughs = [], []
+    for i in range(window, len(df) - window):
+        if highs.iloc[i] == highs.iloc[i - window : i + window + 1].max():
+            peaks.append(float(highs.iloc[i]))
+        if lows.iloc[i] == lows.iloc[i - window : i + window + 1].min():
+            troughs.append(float(lows.iloc[i]))
+
+    all_levels = sorted(peaks + troughs)
+    if not all_levels:
+        return []
+
+    clusters, cur = [], [all_levels[0]]
+    for lvl in all_levels[1:]:
+        if (lvl - cur[0]) / cur[0] < tolerance:
+            cur.append(lvl)
+        else:
+            clusters.append(cur)
+            cur = [lvl]
+    clusters.append(cur)
+
+    result = []
+    for c in clusters:
+        if len(c) >= min_count:
+            avg = float(np.mean(c))
+            result.append({
+                "level": round(avg, 2),
+                "type": "SUPPORT" if avg < current else "RESISTANCE",
+                "strength": len(c),
+            })
+
+    result.sort(key=lambda x: x["strength"], reverse=True)
+    return result[:8]
+
+
+def generate_signals(df):
+    signals = []
+    rsi = df["rsi14"]
+    macd = df["macd"]
+    macd_sig = df["macd_signal"]
+    close = df["Close"]
+    bb_u = df["bb_upper"]
+    bb_l = df["bb_lower"]
+    ma5 = df["ma5"]
+    ma20 = df["ma20"]
+
+    for i in range(1, len(df)):
+        date = df.index[i].strftime("%Y-%m-%d")
+        c, c_prev = close.iloc[i], close.iloc[i - 1]
+        r, r_prev = rsi.iloc[i], rsi.iloc[i - 1]
+        m, m_prev = macd.iloc[i], macd.iloc[i - 1]
+        ms, ms_prev = macd_sig.iloc[i], macd_sig.iloc[i - 1]
+        m5, m5_prev = ma5.iloc[i], ma5.iloc[i - 1]
+        m20, m20_prev = ma20.iloc[i], ma20.iloc[i - 1]
+
+        if pd.isna(r) or pd.isna(m):
+            continue
+
+        if c <= bb_l.iloc[i] and r < 30 and r > r_prev:
+            signals.append({"date": date, "type": "BUY", "reason": "BB하단+RSI과매도반등",
+                            "price": safe_float(c), "strength": "STRONG"})
+        elif c >= bb_u.iloc[i] and r > 70 and r < r_prev:
+            signals.append({"date": date, "type": "SELL", "reason": "BB상단+RSI과매수",
+                            "price": safe_float(c), "strength": "STRONG"})
+        elif m5 > m20 and m5_prev <= m20_prev:
+            signals.append({"date": date, "type": "BUY", "reason": "골든크로스(MA5/MA20)",
+                            "price": safe_float(c), "strength": "MODERATE"})
+        elif m5 < m20 and m5_prev >= m20_prev:
+            signals.append({"date": date, "type": "SELL", "reason": "데드크로스(MA5/MA20)",
+                            "price": safe_float(c), "strength": "MODERATE"})
+        elif m > ms and m_prev <= ms_prev:
+            signals.append({"date": date, "type": "BUY", "reason": "MACD골든크로스",
+                            "price": safe_float(c), "strength": "WEAK"})
+        elif m < ms and m_prev >= ms_prev:
+            signals.append({"date": date, "type": "SELL", "reason": "MACD데드크로스",
+                            "price": safe_float(c), "strength": "WEAK"})
+
+    return signals
+
+
+def fetch_supply_demand(base_url="https://finance.naver.com", sleep=0.25, now=None):
+    """코스피/코스닥 투자자별 순매수 데이터 수집
+    KRX API는 국내 IP 제한이 있으므로 NAVER Finance HTML을 사용합니다.
+    단위: 억원 (NAVER 기준)
+
+    Original sequential scraper; `base_url`/`sleep`/`now` added for the stub.
+    """
+    import re as _re
+    import time as _time
+    import requests as _req
+
+    session = _req.Session()
+    session.headers.update({
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/120.0.0.0 Safari/537.36"
+        ),
+        "Accept-Language": "ko-KR,ko;q=0.9",
+        "Referer": "https://finance.naver.com/sise/sise_trans_style.naver",
+    })
+
+    today    = now or datetime.now()
+    cutoff   = today - timedelta(days=400)          # 1년 + 버퍼
+    bizdate  = today.strftime("%Y%m%d")
+
+    # 날짜 + 10개 컬럼 (개인, 외국인, 기관계, 금융투자, 보험, 투신, 은행, 기타금융, 연기금, 기타법인)
+    ROW_PAT = (
+        r'<td class="date2">(\d{2}\.\d{2}\.\d{2})</td>'
+        + r'\s*<td[^>]*>([\d,\-]+)</td>' * 10
+    )
+
+    def _parse(s: str) -> int:
+        s = s.replace(",", "").strip()
+        try:
+            return int(s)
+        except ValueError:
+            return 0
+
+    result = {}
+    market_map = [
+        ("kospi",  "01"),   # sosok=01 → 코스피
+        ("kosdaq", "02"),   # sosok=02 → 코스닥
+    ]
+
+    for market_name, sosok in market_map:
+        series = []
+        try:
+            for page in range(1, 35):           # 페이지당 10행 × 34 = 340일 최대
+                url = (
+                    f"{base_url}/sise/investorDealTrendDay.naver"
+                    f"?bizdate={bizdate}&sosok={sosok}&page={page}"
+                )
+                resp = session.get(url, timeout=20)
+                if resp.status_code != 200:
+                    print(f"  [{market_name}] p{page}: HTTP {resp.status_code}")
+                    break
+
+                content = resp.content.decode("euc-kr", errors="replace")
+                matches = _re.findall(ROW_PAT, content)
+                if not matches:
+                    break
+
+                stop = False
+                for m in matches:
+                    try:
+                        dt = datetime.strptime("20" + m[0], "%Y.%m.%d")
+                    except ValueError:
+                        continue
+                    if dt < cutoff:
+                        stop = True
+                        break
+
+                    series.append({
+                        "date":        dt.strftime("%Y-%m-%d"),
+                        "individual":  _parse(m[1]),   # 개인
+                        "foreign":     _parse(m[2]),   # 외국인
+                        "institution": _parse(m[3]),   # 기관계
+                    })
+
+                if stop:
+                    break
+                _time.sleep(sleep)          # 과도한 요청 방지
+
+        except Exception as exc:
+            print(f"  Supply/Demand {market_name}: error → {exc}")
+            continue
+
+        if not series:
+            print(f"  Supply/Demand {market_name}: no data collected")
+            continue
+
+        # 날짜 오름차순 정렬
+        series.sort(key=lambda x: x["date"])
+        result[market_name] = {
+            "lastDate": series[-1]["date"],
+            "latest": {k: series[-1][k] for k in ["foreign", "institution", "individual"]},
+            "series": series,
+            "unit": "억원",
+        }
+        latest = series[-1]
+        print(
+            f"  Supply/Demand {market_name}: {len(series)} days, "
+            f"latest={latest['date']}, "
+            f"외국인={latest['foreign']:,} / 기관={latest['institution']:,} / "
+            f"개인={latest['individual']:,} 억원"
+        )
+
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Output builders (per-row strftime/safe_float + json.dump) — bench_serialize.py
+# ---------------------------------------------------------------------------
+
+def value_records(series):
+    return [{"date": d.strftime("%Y-%m-%d"), "value": safe_float(v)} for d, v in series.items()]
+
+
+def ohlcv_records(df1y):
+    return [
+        {
+            "date": d.strftime("%Y-%m-%d"),
+            "open": safe_float(r["Open"]),
+            "high": safe_float(r["High"]),
+            "low": safe_float(r["Low"]),
+            "close": safe_float(r["Close"]),
+            "volume": int(r["Volume"]) if not pd.isna(r["Volume"]) else 0,
+        }
+        for d, r in df1y.iterrows()
+    ]
+
+
+def rolling_records(rolling, start_1y=None):
+    out = []
+    dates = rolling[list(rolling.keys())[0]].index
+    if start_1y:
+        dates = dates[dates >= start_1y]
+    for d in dates:
+        entry = {"date": d.strftime("%Y-%m-%d")}
+        for name, roll in rolling.items():
+            if d in roll.index:
+                entry[name] = safe_float(roll.loc[d])
+        out.append(entry)
+    return out
+
+
+def write_json(path, doc):
+    import json
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(doc, f, ensure_ascii=False, separators=(",", ":"))
@@ -0,0 +1,294 @@
+"""
+Offline benchmark + regression suite for the fetch pipeline.
+
+    python scripts/benchmarks/suite.py                      # run, compare with the baseline
+    python scripts/benchmarks/suite.py --update             # run and (re)write the baseline
+    python scripts/benchmarks/suite.py --sizes 520 --only indicators,e2e
+
+Times every public function of fetch_data.py (and the hot-path modules it
+calls) on deterministic GBM frames at each size, then the whole main() end
+to end with yfinance swapped for CSV fixtures (FixtureProvider) and NAVER for
+naver_stub serving recorded pages (--naver-pages DIR, or synthetic pages
+written to a temp dir). A second end-to-end run exercises --incremental.
+
+Each case stores its best-of-N wall time and a fingerprint of its output
+(floats at 10 significant digits). Against the baseline a case fails when it
+got slower than --threshold (ratio) by more than --min-delta seconds, or when
+its output fingerprint changed. Exit status 1 on any failure.
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from common import synthetic_ohlcv, timeit, with_indicators
+from naver_stub import NaverStub, render_page, synthetic_rows, write_fixtures
+import correlation
+import fetch_data as fd
+import indicator_kernel
+import lod
+import naver_parser
+import resampling
+import serialize
+from columnar import to_columnar
+
+BASELINE = ".cache/bench/baseline.json"
+NAVER_PAGE = render_page(synthetic_rows(days=10, end=datetime(2026, 1, 2)))
+THRESHOLD = 1.25            # 기준 대비 이 배수보다 느려지면 회귀
+MIN_DELTA = 0.002           # 초 — 이보다 작은 차이는 측정 잡음으로 본다
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+class Market:
+    """Synthetic KOSPI (+ indicators), QQQ and SOX frames of `n` business days."""
+
+    def __init__(self, n):
+        end = pd.Timestamp("2026-01-02")
+        start = end - pd.offsets.BDay(n - 1)
+        self.raw = synthetic_ohlcv(n, seed=0, start=start)
+        self.kospi = with_indicators(self.raw)
+        # 해외 지수는 거래일 일부가 빠진다
+        rng = np.random.default_rng(7)
+        self.qqq = synthetic_ohlcv(n, seed=1, s0=400.0, start=start)[rng.random(n) > 0.03]
+        self.sox = synthetic_ohlcv(n, seed=2, s0=3000.0, start=start)[rng.random(n) > 0.05]
+        # 1년 구간 = 마지막 252 거래일 (작은 크기에서는 전체의 절반)
+        self.start_1y = self.kospi.index[-min(252, n // 2)]
+        self.df1y = self.kospi[self.kospi.index >= self.start_1y]
+        self.signals = fd.generate_signals(self.df1y)
+        kr = self.kospi["Close"].pct_change().dropna()
+        qr = self.qqq["Close"].pct_change().dropna()
+        common = kr.index.intersection(qr.index)
+        self.rolling = {"kospi_qqq": kr.loc[common].rolling(60).corr(qr.loc[common])}
+        self.doc = fd.analyze_symbol(self.kospi, self.start_1y)
+        self.doc["metadata"]["lastUpdated"] = "2026-01-02T00:00:00"      # 직렬화 지문 고정
+        self.doc["correlations"] = fd.compute_correlations(self.kospi, self.qqq, self.sox,
+                                                           start_1y=self.start_1y)
+
+
+def buy_entries(df, signals):
+    """Row positions of the BUY signals (compute_metrics' trade entries)."""
+    pos = {d: i for i, d in enumerate(df.index.strftime("%Y-%m-%d"))}
+    return [pos[s["date"]] for s in signals if s["type"] == "BUY"]
+
+
+# (name, function, args builder) — args builder receives a Market
+CASES = [
+    ("compute_rsi", fd.compute_rsi, lambda m: (m.raw["Close"],)),
+    ("compute_macd", fd.compute_macd, lambda m: (m.raw["Close"],)),
+    ("compute_obv", fd.compute_obv, lambda m: (m.raw["Close"], m.raw["Volume"])),
+    ("compute_indicators_pandas", fd.compute_indicators_pandas, lambda m: (m.raw,)),
+    ("compute_indicators", fd.compute_indicators, lambda m: (m.raw,)),
+    ("indicator_kernel.compute", indicator_kernel.compute,
+     lambda m: (m.raw["Close"].to_numpy(), m.raw["Volume"].to_numpy())),
+    ("find_support_resistance", fd.find_support_resistance, lambda m: (m.df1y,)),
+    ("generate_signals", fd.generate_signals, lambda m: (m.kospi,)),
+    ("compute_metrics", fd.compute_metrics, lambda m: (m.df1y, m.signals)),
+    ("resampling.metric_intervals", resampling.metric_intervals,
+     lambda m: (m.df1y["Close"].to_numpy(), buy_entries(m.df1y, m.signals))),
+    ("compute_decision", fd.compute_decision, lambda m: (m.df1y,)),
+    ("compute_correlations", fd.compute_correlations,
+     lambda m: (m.kospi, m.qqq, m.sox, 60, m.start_1y)),
+    ("rolling_records", fd.rolling_records, lambda m: (m.rolling,)),
+    ("compute_comparison", fd.compute_comparison, lambda m: (m.df1y, m.qqq, m.sox, m.start_1y)),
+    ("ohlcv_records", fd.ohlcv_records, lambda m: (m.kospi,)),
+    ("series_sections", fd.series_sections, lambda m: (m.kospi,)),
+    ("analyze_symbol", fd.analyze_symbol, lambda m: (m.kospi, m.start_1y)),
+    ("correlation_matrix", correlation.correlation_matrix,
+     lambda m: ({"kospi": m.kospi["Close"], "qqq": m.qqq["Close"], "sox": m.sox["Close"]},)),
+    ("lod.build_lod", lod.build_lod, lambda m: (m.kospi, m.kospi.index[-1])),
+    ("to_columnar", to_columnar, lambda m: (m.doc,)),
+    ("serialize.dumps", serialize.dumps, lambda m: (m.doc,)),
+    ("naver_parser.parse_page", naver_parser.parse_page, lambda m: (NAVER_PAGE,)),
+]
+
+
+# ---------------------------------------------------------------------------
+# Fingerprints
+# ---------------------------------------------------------------------------
+
+VOLATILE_KEYS = {"lastUpdated"}
+
+
+def _canonical(obj):
+    """JSON-able view of a result with floats as 10-significant-digit strings."""
+    if isinstance(obj, pd.DataFrame):
+        return {"index": serialize.date_strings(obj.index) if isinstance(obj.index, pd.DatetimeIndex)
+                else obj.index.tolist(), **{str(c): _canonical(obj[c]) for c in obj.columns}}
+    if isinstance(obj, pd.Series):
+        return _canonical(obj.to_numpy())
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind == "f":
+            return np.char.mod("%.10g", obj).tolist()
+        return obj.tolist()
+    if isinstance(obj, dict):
+        return {str(k): _canonical(v) for k, v in obj.items() if k not in VOLATILE_KEYS}
+    if isinstance(obj, (list, tuple)):
+        return [_canonical(v) for v in obj]
+    if isinstance(obj, (float, np.floating)):
+        return "%.10g" % obj
+    if isinstance(obj, bytes):
+        return hashlib.sha256(obj).hexdigest()
+    if isinstance(obj, np.integer):
+        return int(obj)
+    return obj
+
+
+def fingerprint(obj):
+    text = json.dumps(_canonical(obj), ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+# ---------------------------------------------------------------------------
+# End-to-end (main() with local stand-ins)
+# ---------------------------------------------------------------------------
+
+def write_price_fixtures(directory, days=400):
+    """CSV fixtures for every fetch_data ticker, ending today."""
+    os.makedirs(directory, exist_ok=True)
+    start = pd.Timestamp(datetime.now().date()) - pd.offsets.BDay(days)
+    for i, ticker in enumerate(fd.TICKERS.values()):
+        df = synthetic_ohlcv(days, seed=100 + i, s0=[2500.0, 400.0, 3000.0, 20.0][i % 4], start=start)
+        df.index.name = "Date"
+        df.to_csv(os.path.join(directory, ticker.replace("^", "_") + ".csv"))
+
+
+def run_main(workdir, argv):
+    """fetch_data.main(argv) inside `workdir` with stdout silenced; returns the run report."""
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            fd.main(argv + ["--report", "report.json"])
+        with open("report.json", encoding="utf-8") as f:
+            return json.load(f)
+    finally:
+        os.chdir(cwd)
+
+
+def e2e_cases(naver_pages, repeat):
+    """[(name, seconds, stage summary)] for a full and an incremental run."""
+    tmp = tempfile.mkdtemp(prefix="kospi-bench-")
+    try:
+        fixtures = os.path.join(tmp, "fixtures")
+        write_price_fixtures(fixtures)
+        pages = naver_pages
+        if pages is None:
+            pages = os.path.join(tmp, "naver")
+            write_fixtures(pages)
+        out = []
+        with NaverStub(fixtures=pages) as stub:
+            base = ["--fixtures", fixtures, "--no-cache", "--naver-base-url", stub.base_url,
+                    "--naver-rate", "1000", "--state", os.path.join(tmp, "state.npz"), "--force"]
+            for name, extra in [("e2e.full", ["--shards", "--corr-matrix"]), ("e2e.incremental", ["--incremental"])]:
+                sec, report = timeit(run_main, tmp, base + extra, repeat=repeat)
+                out.append((name, sec, {k: v["wall"] for k, v in report["summary"].items()}))
+        return out
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def selected(name, only):
+    return not only or any(o in name for o in only)
+
+
+def run_suite(sizes, repeat, only, naver_pages):
+    results = {}
+    for n in sizes:
+        market = Market(n)
+        for name, fn, build in CASES:
+            if not selected(name, only):
+                continue
+            args = build(market)
+            out = fn(*args)                  # 첫 호출(지연 import, 캐시 워밍)은 재지 않는다
+            sec, _ = timeit(fn, *args, repeat=repeat)
+            results[f"{name}@{n}"] = {"seconds": sec, "fingerprint": fingerprint(out)}
+            print(f"  {name + '@' + str(n):<40}{sec * 1e3:10.2f} ms", flush=True)
+    if selected("e2e", only):
+        for name, sec, stages in e2e_cases(naver_pages, max(1, repeat // 3)):
+            # 출력에 실행 시각이 들어가므로 지문 대신 단계별 시간을 남긴다
+            results[name] = {"seconds": sec, "fingerprint": None, "stages": stages}
+            print(f"  {name:<40}{sec * 1e3:10.2f} ms", flush=True)
+    return results
+
+
+def compare(results, baseline, threshold, min_delta):
+    """[(case, message)] failures against the baseline cases."""
+    failures = []
+    print(f"\n{'case':<40}{'baseline':>12}{'now':>12}{'ratio':>8}  status")
+    for case, cur in results.items():
+        ref = baseline.get(case)
+        if ref is None:
+            print(f"{case:<40}{'—':>12}{cur['seconds'] * 1e3:9.2f} ms{'':>8}  new")
+            continue
+        ratio = cur["seconds"] / ref["seconds"] if ref["seconds"] else 1.0
+        status = "ok"
+        if ratio > threshold and cur["seconds"] - ref["seconds"] > min_delta:
+            status = "SLOWER"
+            failures.append((case, f"{ratio:.2f}x slower than baseline"))
+        if ref.get("fingerprint") and cur["fingerprint"] and ref["fingerprint"] != cur["fingerprint"]:
+            status = "OUTPUT CHANGED" if status == "ok" else status + ", OUTPUT CHANGED"
+            failures.append((case, "output fingerprint changed"))
+        print(f"{case:<40}{ref['seconds'] * 1e3:9.2f} ms{cur['seconds'] * 1e3:9.2f} ms{ratio:7.2f}x  {status}")
+    return failures
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--sizes", default="520,5000")
+    ap.add_argument("--repeat", type=int, default=5, help="best-of-N timing")
+    ap.add_argument("--only", default="", help="comma-separated case name substrings")
+    ap.add_argument("--baseline", default=BASELINE, help=f"baseline JSON (default: {BASELINE})")
+    ap.add_argument("--update", action="store_true", help="write the results as the new baseline")
+    ap.add_argument("--threshold", type=float, default=THRESHOLD,
+                    help=f"fail when now / baseline exceeds this (default: {THRESHOLD})")
+    ap.add_argument("--min-delta", type=float, default=MIN_DELTA,
+                    help=f"ignore slowdowns smaller than this many seconds (default: {MIN_DELTA})")
+    ap.add_argument("--naver-pages", default=None,
+                    help="recorded <sosok>_p<page>.html pages to serve (default: synthetic)")
+    args = ap.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    only = [o for o in args.only.split(",") if o]
+    print(f"Running suite: sizes {sizes}, best of {args.repeat}")
+    results = run_suite(sizes, args.repeat, only, args.naver_pages)
+
+    if args.update or not os.path.exists(args.baseline):
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        doc = {"createdAt": datetime.now().isoformat(timespec="seconds"),
+               "machine": platform.platform(), "python": sys.version.split()[0],
+               "numpy": np.__version__, "pandas": pd.__version__, "cases": results}
+        serialize.write_json(args.baseline, doc)
+        print(f"\n[OK] baseline written to {args.baseline} ({len(results)} cases)")
+        return
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    failures = compare(results, baseline["cases"], args.threshold, args.min_delta)
+    if failures:
+        print(f"\n{len(failures)} regression(s):")
+        for case, msg in failures:
+            print(f"  {case}: {msg}")
+        sys.exit(1)
+    print(f"\nno regressions vs {args.baseline} ({baseline.get('createdAt', '?')})")
+
+
+if __name__ == "__main__":
+    main()
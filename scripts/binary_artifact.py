@@ -0,0 +1,133 @@
+"""
+KOSPI Strategy Dashboard - Binary sidecar (public/data/market_data.bin)
+Typed-array artifact the dashboard can wrap with Float64Array views without
+copying or per-element object allocation. src/utils/binaryData.js reads it.
+
+Layout (all integers little-endian):
+
+    offset  size  field
+    0       4     magic b"KDB1"
+    4       2     format version (uint16, currently 1)
+    6       2     reserved (0)
+    8       4     header length H in bytes (uint32)
+    12      H     UTF-8 JSON header, space-padded so 12 + H is a multiple of 8
+    12 + H  ...   column buffers, back to back, each 8-byte aligned
+
+Header JSON:
+    {"rows": n,
+     "columns": [{"name": "date", "dtype": "int64", "offset": o, "length": n,
+                  "unit": "days since 1970-01-01"}, ...],
+     "document": {...every market_data.json section except ohlcv/indicators}}
+
+Columns: date (int64), open/high/low/close (float64), volume (int64), then one
+float64 column per indicator series (length 0 when the series is empty).
+null is stored as NaN.
+"""
+
+import json
+import os
+import struct
+from datetime import date
+
+import numpy as np
+
+MAGIC = b"KDB1"
+VERSION = 1
+PREFIX = struct.Struct("<4sHHI")
+EPOCH = date(1970, 1, 1).toordinal()
+
+OHLCV_FIELDS = [("open", "float64"), ("high", "float64"), ("low", "float64"),
+                ("close", "float64"), ("volume", "int64")]
+
+
+def _float_array(values):
+    return np.array([np.nan if v is None else v for v in values], dtype="<f8")
+
+
+def document_columns(doc):
+    """Row-format document → ({name: (dtype, ndarray)}, remaining document)."""
+    rows = doc.get("ohlcv", [])
+    dates = [r["date"] for r in rows]
+    cols = {"date": ("int64", np.array([date.fromisoformat(d).toordinal() - EPOCH for d in dates],
+                                       dtype="<i8"))}
+    for name, dtype in OHLCV_FIELDS:
+        vals = [r.get(name) for r in rows]
+        cols[name] = (dtype, _float_array(vals) if dtype == "float64"
+                      else np.array([v or 0 for v in vals], dtype="<i8"))
+
+    for name, series in doc.get("indicators", {}).items():
+        if not series:                       # 예: VKOSPI 미수집 → 길이 0 컬럼
+            cols[name] = ("float64", np.empty(0, dtype="<f8"))
+            continue
+        by_date = {r["date"]: r["value"] for r in series}
+        cols[name] = ("float64", _float_array([by_date.get(d) for d in dates]))
+
+    rest = {k: v for k, v in doc.items() if k not in ("ohlcv", "indicators")}
+    return cols, rest
+
+
+def write_binary(path, doc):
+    """Write the sidecar for a row-format document; returns the byte size."""
+    cols, rest = document_columns(doc)
+    n = len(cols["date"][1])
+    specs = []
+    for name, (dtype, arr) in cols.items():
+        spec = {"name": name, "dtype": dtype, "offset": 0, "length": len(arr)}
+        if name == "date":
+            spec["unit"] = "days since 1970-01-01"
+        specs.append(spec)
+
+    # 헤더 길이가 오프셋에 영향을 주므로 고정점이 될 때까지 반복 (보통 2회)
+    header = b""
+    while True:
+        data_start = PREFIX.size + len(header)
+        data_start += -data_start % 8
+        offset = data_start
+        for spec in specs:
+            spec["offset"] = offset
+            offset += spec["length"] * 8
+        encoded = json.dumps({"rows": n, "columns": specs, "document": rest},
+                             ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        padded = encoded + b" " * (-(PREFIX.size + len(encoded)) % 8)
+        stable = len(padded) == len(header)
+        header = padded
+        if stable:
+            break
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(PREFIX.pack(MAGIC, VERSION, 0, len(header)))
+        f.write(header)
+        for _, arr in cols.values():
+            f.write(arr.tobytes())
+    os.replace(tmp, path)
+    return os.path.getsize(path)
+
+
+def read_binary(buf):
+    """(header, {name: ndarray view}) from sidecar bytes; arrays share `buf`."""
+    magic, version, _, hlen = PREFIX.unpack_from(buf, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"not a KDB{VERSION} artifact")
+    header = json.loads(bytes(buf[PREFIX.size:PREFIX.size + hlen]))
+    cols = {}
+    for c in header["columns"]:
+        dtype = "<f8" if c["dtype"] == "float64" else "<i8"
+        cols[c["name"]] = np.frombuffer(buf, dtype=dtype, count=c["length"], offset=c["offset"])
+    return header, cols
+
+
+def to_document(header, cols):
+    """Rebuild the row-format document (inverse of write_binary)."""
+    def val(x):
+        return None if np.isnan(x) else float(x)
+
+    dates = [date.fromordinal(int(d) + EPOCH).isoformat() for d in cols["date"]]
+    ohlcv = [{"date": d, **{name: (val(cols[name][i]) if dtype == "float64" else int(cols[name][i]))
+                            for name, dtype in OHLCV_FIELDS}}
+             for i, d in enumerate(dates)]
+    base = {"date", *(name for name, _ in OHLCV_FIELDS)}
+    indicators = {c["name"]: [{"date": d, "value": val(v)} for d, v in zip(dates, cols[c["name"]])]
+                  for c in header["columns"] if c["name"] not in base}
+    return {**header["document"], "ohlcv": ohlcv, "indicators": indicators}
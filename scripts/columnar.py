@@ -0,0 +1,140 @@
+"""
+KOSPI Strategy Dashboard - Columnar output schema (schemaVersion 2)
+Re-encodes the per-day record arrays of market_data.json as parallel arrays.
+Series on the KOSPI trading calendar share one top-level "dates" axis; series
+on another calendar (QQQ/SOX comparison, rolling correlations, 수급) carry
+their own "dates". src/utils/columnar.js decodes it back to the row layout.
+
+Layout differences from the row format:
+  ohlcv                      {"open": [...], "high": [...], ..., "volume": [...]}
+  indicators.<name>          [...] aligned to "dates"
+  comparison.<x>_normalized  [...] aligned, or {"dates": ..., "values": [...]}
+  correlations.rolling60     {"dates": ..., "kospi_qqq": [...], ...}
+  supplyDemand.<mkt>.series  {"dates": ..., "individual": [...], ...}
+
+Dates are ISO strings, or with delta encoding {"start": "YYYY-MM-DD",
+"deltas": [days since previous date, ...]}. Missing values are null.
+"""
+
+from datetime import date, timedelta
+
+SCHEMA_VERSION = 2
+
+
+# ---------------------------------------------------------------------------
+# Date axis
+# ---------------------------------------------------------------------------
+
+def encode_dates(dates, delta=False):
+    if not delta or not dates:
+        return list(dates)
+    ords = [date.fromisoformat(d).toordinal() for d in dates]
+    return {"start": dates[0], "deltas": [b - a for a, b in zip(ords, ords[1:])]}
+
+
+def decode_dates(enc):
+    if isinstance(enc, list):
+        return enc
+    cur = date.fromisoformat(enc["start"])
+    out = [enc["start"]]
+    for step in enc["deltas"]:
+        cur += timedelta(days=step)
+        out.append(cur.isoformat())
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Encode
+# ---------------------------------------------------------------------------
+
+def _rounder(precision):
+    if precision is None:
+        return lambda v: v
+    return lambda v: round(v, precision) if isinstance(v, float) else v
+
+
+def _table(records, axis, fmt, delta):
+    """Record list → {"dates"?: ..., field: [...]} ("dates" omitted if == axis)."""
+    fields = []
+    for r in records:
+        for k in r:
+            if k != "date" and k not in fields:
+                fields.append(k)
+    dates = [r["date"] for r in records]
+    out = {} if dates == axis else {"dates": encode_dates(dates, delta)}
+    for k in fields:
+        out[k] = [fmt(r.get(k)) for r in records]
+    return out
+
+
+def _values(records, axis, fmt, delta):
+    """[{date, value}] → aligned value array, or {"dates", "values"} if off-axis."""
+    if not records:
+        return []
+    table = _table(records, axis, fmt, delta)
+    if "dates" not in table:
+        return table.get("value", [None] * len(records))
+    return {"dates": table["dates"], "values": table.get("value", [None] * len(records))}
+
+
+def to_columnar(doc, precision=None, delta_dates=False):
+    """Columnar copy of a row-format market_data document."""
+    fmt = _rounder(precision)
+    axis = [r["date"] for r in doc.get("ohlcv", [])]
+    out = {"schemaVersion": SCHEMA_VERSION, "dates": encode_dates(axis, delta_dates)}
+
+    for key, val in doc.items():
+        if key == "ohlcv":
+            out[key] = _table(val, axis, fmt, delta_dates)
+        elif key == "indicators":
+            out[key] = {k: _values(v, axis, fmt, delta_dates) for k, v in val.items()}
+        elif key == "comparison":
+            out[key] = {k: (_values(v, axis, fmt, delta_dates) if k.endswith("_normalized") else v)
+                        for k, v in val.items()}
+        elif key == "correlations":
+            out[key] = {**val, "rolling60": _table(val.get("rolling60", []), axis, fmt, delta_dates)}
+        elif key == "supplyDemand":
+            out[key] = {m: {**d, "series": _table(d.get("series", []), axis, lambda v: v, delta_dates)}
+                        for m, d in val.items()}
+        else:
+            out[key] = val
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Decode (Python mirror of src/utils/columnar.js, used for round-trip checks)
+# ---------------------------------------------------------------------------
+
+def _rows(table, axis):
+    dates = decode_dates(table["dates"]) if "dates" in table else axis
+    fields = [k for k in table if k != "dates"]
+    return [{"date": d, **{k: table[k][i] for k in fields}} for i, d in enumerate(dates)]
+
+
+def _value_rows(val, axis):
+    if isinstance(val, list):
+        return [{"date": d, "value": v} for d, v in zip(axis, val)] if val else []
+    return [{"date": d, "value": v} for d, v in zip(decode_dates(val["dates"]), val["values"])]
+
+
+def from_columnar(doc):
+    """Row-format document from a schemaVersion 2 document."""
+    axis = decode_dates(doc["dates"])
+    out = {}
+    for key, val in doc.items():
+        if key in ("schemaVersion", "dates"):
+            continue
+        if key == "ohlcv":
+            out[key] = _rows(val, axis)
+        elif key == "indicators":
+            out[key] = {k: _value_rows(v, axis) for k, v in val.items()}
+        elif key == "comparison":
+            out[key] = {k: (_value_rows(v, axis) if k.endswith("_normalized") else v)
+                        for k, v in val.items()}
+        elif key == "correlations":
+            out[key] = {**val, "rolling60": _rows(val["rolling60"], axis)}
+        elif key == "supplyDemand":
+            out[key] = {m: {**d, "series": _rows(d["series"], axis)} for m, d in val.items()}
+        else:
+            out[key] = val
+    return out
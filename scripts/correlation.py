@@ -0,0 +1,141 @@
+"""
+KOSPI Strategy Dashboard - Multi-asset rolling correlation matrix
+Rolling Pearson correlation of daily returns for every pair of a basket of
+assets (KOSPI, KOSDAQ, QQQ, SOX, S&P500, USD/KRW, VKOSPI …) at several
+windows. Returns are aligned on the KOSPI trading calendar into one (T × N)
+array; each asset's return is taken on its own calendar first, so a day
+missing for an asset (foreign holiday) is simply absent for its pairs.
+
+For the P = N(N-1)/2 pairs the six per-pair running sums — count, Σx, Σy,
+Σx², Σy², Σxy over the days both assets traded — come from one prefix sum
+over a (6, T, P) array, so every window is a difference of two rows: O(T·N²)
+with no per-date pandas lookups. With full data this equals
+Series.rolling(w).corr(); with gaps it matches pandas' pairwise-complete
+rolling(w, min_periods).corr() on the aligned frame.
+
+Document section (compact: upper-triangle pairs, one row per date):
+    "correlationMatrix": {
+        "assets": ["kospi", "kosdaq", ...],
+        "pairs": [[0, 1], [0, 2], ...],              # indices into assets
+        "windows": [20, 60, 120],
+        "dates": ["YYYY-MM-DD", ...],
+        "series": {"60": [[ρ01, ρ02, ...], ...]},     # per date, per pair
+        "latest": {"60": [[1.0, ρ01, ...], ...]}      # full N×N, last date
+    }
+Values are rounded to DECIMALS; windows with too few common days are null.
+"""
+
+import numpy as np
+import pandas as pd
+
+from serialize import date_strings
+
+ASSETS = {
+    "kospi": "^KS11",
+    "kosdaq": "^KQ11",
+    "qqq": "QQQ",
+    "sox": "^SOX",
+    "spx": "^GSPC",
+    "usdkrw": "KRW=X",
+    "vkospi": "^VKOSPI",
+}
+WINDOWS = [20, 60, 120]
+MIN_COVERAGE = 0.8       # 창 안에서 두 자산이 함께 거래한 날이 이 비율 이상이어야 값을 낸다
+DECIMALS = 4
+
+
+def aligned_returns(closes, calendar=None):
+    """(dates, names, R) with R[t, i] the return of asset i on dates[t] (NaN if absent).
+
+    `closes` is {name: close Series}; empty series are dropped. The calendar
+    defaults to the first asset's return dates.
+    """
+    rets = {k: s.astype(float).pct_change().dropna() for k, s in closes.items() if s is not None and len(s) > 1}
+    if not rets:
+        return pd.DatetimeIndex([]), [], np.empty((0, 0))
+    dates = calendar if calendar is not None else next(iter(rets.values())).index
+    names = list(rets)
+    R = np.column_stack([rets[k].reindex(dates).to_numpy(dtype=float) for k in names])
+    return dates, names, R
+
+
+def pair_sums(R):
+    """(6, T+1, P) prefix sums of n, Σx, Σy, Σx², Σy², Σxy per upper-triangle pair.
+
+    Window-independent — compute once and pass to rolling_corr_pairs() for
+    every window.
+    """
+    T, N = R.shape
+    I, J = np.triu_indices(N, 1)
+    valid = np.isfinite(R)
+    x = np.where(valid, R, 0.0)
+    mi, mj = valid[:, I], valid[:, J]
+    xi, xj = x[:, I], x[:, J]
+
+    # 쌍별 누적합 6종: n, Σx, Σy, Σx², Σy², Σxy (둘 다 거래한 날만)
+    terms = np.empty((6, T + 1, len(I)))
+    terms[:, 0] = 0.0
+    np.cumsum(mi & mj, axis=0, out=terms[0, 1:])
+    np.cumsum(xi * mj, axis=0, out=terms[1, 1:])
+    np.cumsum(xj * mi, axis=0, out=terms[2, 1:])
+    np.cumsum(xi * xi * mj, axis=0, out=terms[3, 1:])
+    np.cumsum(xj * xj * mi, axis=0, out=terms[4, 1:])
+    np.cumsum(xi * xj, axis=0, out=terms[5, 1:])
+    return terms
+
+
+def rolling_corr_pairs(R, window, min_periods=None, sums=None):
+    """(T, P) rolling correlations of the upper-triangle pairs of R's columns."""
+    terms = pair_sums(R) if sums is None else sums
+    T = terms.shape[1] - 1
+    if min_periods is None:
+        min_periods = max(2, int(np.ceil(window * MIN_COVERAGE)))
+
+    # 행 t 의 창 = (t-window, t] — 앞부분은 짧은 창이고 min_periods 로 거른다
+    diff = terms[:, 1:].copy()
+    if T > window:
+        diff[:, window:] -= terms[:, 1:T + 1 - window]
+    n, sx, sy, sxx, syy, sxy = diff
+    cov = n * sxy - sx * sy
+    var_x = n * sxx - sx * sx
+    var_y = n * syy - sy * sy
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rho = cov / np.sqrt(var_x * var_y)
+    ok = (n >= min_periods) & (var_x > 0) & (var_y > 0)
+    return np.where(ok, np.clip(rho, -1.0, 1.0), np.nan)
+
+
+def _full_matrix(row, N, I, J):
+    m = np.eye(N)
+    m[I, J] = m[J, I] = row
+    return m
+
+
+def _rounded(arr):
+    out = np.round(arr, DECIMALS).astype(object)
+    out[~np.isfinite(arr)] = None
+    return out.tolist()
+
+
+def correlation_matrix(closes, windows=WINDOWS, start=None, calendar=None):
+    """correlationMatrix section from {name: close Series}; None if < 2 assets have data."""
+    dates, names, R = aligned_returns(closes, calendar)
+    N = len(names)
+    if N < 2:
+        return None
+    I, J = np.triu_indices(N, 1)
+    keep = np.ones(len(dates), dtype=bool) if start is None else np.asarray(dates >= pd.Timestamp(start))
+    section = {
+        "assets": names,
+        "pairs": np.column_stack([I, J]).tolist(),
+        "windows": list(windows),
+        "dates": date_strings(dates[keep]),
+        "series": {},
+        "latest": {},
+    }
+    sums = pair_sums(R)
+    for w in windows:
+        rho = rolling_corr_pairs(R, w, sums=sums)
+        section["series"][str(w)] = _rounded(rho[keep])
+        section["latest"][str(w)] = _rounded(_full_matrix(rho[-1], N, I, J)) if len(rho) else []
+    return section
@@ -4,15 +4,36 @@ Fetches market data, technical indicators, and investor supply/demand.
 Outputs to public/data/market_data.json
 """
 
-import json
+import importlib.util
 import os
 import sys
-import numpy as np
-import pandas as pd
-import yfinance as yf
 from datetime import datetime, timedelta
 
 
+def _lazy_import(name):
+    """`name` registered as a module that executes on first attribute access."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# pandas(+yfinance) 임포트가 기동 시간의 대부분 — 가격 단계가 처음 쓸 때 로드된다
+pd = _lazy_import("pandas")
+import numpy as np
+
+import lowmem
+import profiling
+import publish
+import resampling
+from profiling import stage, timed
+from serialize import BACKENDS, date_strings, nullable, series_records, value_records, write_json
+
+
 # ---------------------------------------------------------------------------
 # Utility helpers
 # ---------------------------------------------------------------------------
@@ -27,12 +48,24 @@ def safe_float(val):
         return None
 
 
-def download(ticker, start, end):
-    """Download OHLCV from yfinance, flatten MultiIndex columns."""
-    df = yf.download(ticker, start=start, end=end, progress=False, auto_adjust=True)
-    if isinstance(df.columns, pd.MultiIndex):
-        df.columns = df.columns.droplevel(1)
-    return df.dropna(subset=["Close"])
+# 가격 다운로드 계층 (price_cache.PriceLoader) — 첫 다운로드 때 PRICE_OPTIONS(CLI)로 만든다
+PRICE_LOADER = None
+PRICE_OPTIONS = None
+
+
+def price_loader():
+    global PRICE_LOADER
+    if PRICE_LOADER is None:
+        PRICE_LOADER = make_price_loader(PRICE_OPTIONS)
+    return PRICE_LOADER
+
+
+def download(ticker, start, end, refresh=False):
+    """Download OHLCV for one ticker through the shared price loader (refresh: bypass cached bars)."""
+    df = price_loader().fetch([ticker], start, end, refresh=refresh)[ticker]
+    if df.empty:
+        raise ValueError(f"no data for {ticker}")
+    return df
 
 
 # ---------------------------------------------------------------------------
@@ -58,34 +91,92 @@ def compute_macd(series, fast=12, slow=26, signal=9):
 
 
 def compute_obv(close, volume):
-    obv = np.zeros(len(close))
-    for i in range(1, len(close)):
-        if close.iloc[i] > close.iloc[i - 1]:
-            obv[i] = obv[i - 1] + volume.iloc[i]
-        elif close.iloc[i] < close.iloc[i - 1]:
-            obv[i] = obv[i - 1] - volume.iloc[i]
+    """On-balance volume: cumulative sum of volume signed by the close-to-close move."""
+    c = close.to_numpy(dtype=float)
+    v = volume.to_numpy(dtype=float)
+    step = np.zeros(len(c))
+    if len(c) > 1:
+        direction = np.sign(np.diff(c))
+        # 종가가 NaN 인 날(과 그 다음 날)은 보합처럼 직전 OBV 를 유지한다
+        step[1:] = np.where(np.isfinite(direction) & (direction != 0), direction * v[1:], 0.0)
+    return pd.Series(np.cumsum(step), index=close.index)
+
+
+def compute_indicators_pandas(ohlcv):
+    """Indicator columns via pandas rolling/ewm; handles NaN gaps in the input."""
+    df = ohlcv.copy()
+    for p in [5, 20, 60, 120, 240]:
+        df[f"ma{p}"] = df["Close"].rolling(p).mean()
+
+    df["bb_middle"] = df["Close"].rolling(20).mean()
+    bb_std = df["Close"].rolling(20).std()
+    df["bb_upper"] = df["bb_middle"] + 2 * bb_std
+    df["bb_lower"] = df["bb_middle"] - 2 * bb_std
+
+    df["rsi14"] = compute_rsi(df["Close"])
+    df["macd"], df["macd_signal"], df["macd_hist"] = compute_macd(df["Close"])
+    df["obv"] = compute_obv(df["Close"], df["Volume"])
+    return df
+
+
+@timed()
+def compute_indicators(ohlcv, vkospi=None, low_memory=False):
+    """Return a copy of `ohlcv` with every indicator column used downstream.
+
+    Complete price/volume arrays go through the single-pass indicator_kernel;
+    anything with NaN/inf gaps falls back to the pandas implementation.
+    low_memory=True stores price-like columns as float32 (lowmem.downcast)
+    and assembles the frame column by column instead of concatenating.
+    """
+    import indicator_kernel
+
+    close = lowmem.restore("Close", ohlcv["Close"].to_numpy())
+    volume = ohlcv["Volume"].to_numpy(dtype=float)
+    if np.isfinite(close).all() and np.isfinite(volume).all():
+        values = indicator_kernel.compute(close, volume)
+        if low_memory:
+            cols = {c: lowmem.column(c, ohlcv[c].to_numpy()) for c in ohlcv.columns}
+            for name, row in zip(indicator_kernel.COLUMNS, values):
+                lean = lowmem.column(name, row)
+                # 64비트로 남는 행(obv 등)은 복사해 (13, n) 버퍼 전체가 붙잡히지 않게 한다
+                cols[name] = lean if lean is not row else row.copy()
+            del values
+            df = lowmem.frame(cols, ohlcv.index)
+        else:
+            df = pd.concat([ohlcv, pd.DataFrame(values.T, index=ohlcv.index, columns=indicator_kernel.COLUMNS)],
+                           axis=1)
+    else:
+        if low_memory:
+            df = lowmem.downcast(compute_indicators_pandas(lowmem.widen(ohlcv)))
         else:
-            obv[i] = obv[i - 1]
-    return pd.Series(obv, index=close.index)
+            df = compute_indicators_pandas(ohlcv)
+
+    if vkospi is not None and not vkospi.empty:
+        vk = vkospi["Close"].reindex(df.index, method="ffill")
+        df["vkospi"] = lowmem.column("vkospi", vk.to_numpy(dtype=float)) if low_memory else vk
+    return df
 
 
 # ---------------------------------------------------------------------------
 # Support / Resistance detection
 # ---------------------------------------------------------------------------
 
+@timed()
 def find_support_resistance(df, window=15, min_count=2, tolerance=0.005):
     highs = df["High"]
     lows = df["Low"]
     current = float(df["Close"].iloc[-1])
 
-    peaks, troughs = [], []
-    for i in range(window, len(df) - window):
-        if highs.iloc[i] == highs.iloc[i - window : i + window + 1].max():
-            peaks.append(float(highs.iloc[i]))
-        if lows.iloc[i] == lows.iloc[i - window : i + window + 1].min():
-            troughs.append(float(lows.iloc[i]))
+    # 중심 이동창(2*window+1) 극값과 같은 봉 = 고점/저점 (양 끝 window 봉 제외)
+    span = 2 * window + 1
+    inner = np.zeros(len(df), dtype=bool)
+    inner[window : len(df) - window] = True
+    roll_max = highs.rolling(span, center=True, min_periods=1).max()
+    roll_min = lows.rolling(span, center=True, min_periods=1).min()
+    peaks = highs.to_numpy(dtype=float)[inner & (highs == roll_max).to_numpy()]
+    troughs = lows.to_numpy(dtype=float)[inner & (lows == roll_min).to_numpy()]
 
-    all_levels = sorted(peaks + troughs)
+    all_levels = sorted(peaks.tolist() + troughs.tolist())
     if not all_levels:
         return []
 
@@ -116,48 +207,65 @@ def find_support_resistance(df, window=15, min_count=2, tolerance=0.005):
 # Signal generation
 # ---------------------------------------------------------------------------
 
+# 우선순위 순서 — 같은 날 여러 조건이 겹치면 앞의 규칙이 채택된다
+SIGNAL_RULES = [
+    ("BUY",  "BB하단+RSI과매도반등", "STRONG"),
+    ("SELL", "BB상단+RSI과매수",     "STRONG"),
+    ("BUY",  "골든크로스(MA5/MA20)", "MODERATE"),
+    ("SELL", "데드크로스(MA5/MA20)", "MODERATE"),
+    ("BUY",  "MACD골든크로스",       "WEAK"),
+    ("SELL", "MACD데드크로스",       "WEAK"),
+]
+
+
+def signal_codes(close, rsi, macd, macd_sig, bb_u, bb_l, ma5, ma20, rsi_low=30, rsi_high=70):
+    """Index into SIGNAL_RULES for every bar (-1 = no signal).
+
+    Inputs are aligned float arrays; the first bar and bars with NaN RSI/MACD
+    never signal, matching the row-by-row rules in generate_signals. 2-D
+    inputs (parameter sets × time) are evaluated row-wise; rsi_low/rsi_high
+    may then be (n, 1) columns (backtest.py).
+    """
+    def prev(a):
+        out = np.empty_like(a)
+        out[..., 0] = np.nan
+        out[..., 1:] = a[..., :-1]
+        return out
+
+    r_prev, m_prev, ms_prev = prev(rsi), prev(macd), prev(macd_sig)
+    m5_prev, m20_prev = prev(ma5), prev(ma20)
+
+    with np.errstate(invalid="ignore"):
+        conds = [
+            (close <= bb_l) & (rsi < rsi_low) & (rsi > r_prev),
+            (close >= bb_u) & (rsi > rsi_high) & (rsi < r_prev),
+            (ma5 > ma20) & (m5_prev <= m20_prev),
+            (ma5 < ma20) & (m5_prev >= m20_prev),
+            (macd > macd_sig) & (m_prev <= ms_prev),
+            (macd < macd_sig) & (m_prev >= ms_prev),
+        ]
+    codes = np.select(conds, np.arange(len(conds)), default=-1)
+    codes[np.isnan(rsi) | np.isnan(macd)] = -1
+    codes[..., 0] = -1
+    return codes
+
+
+@timed()
 def generate_signals(df):
-    signals = []
-    rsi = df["rsi14"]
-    macd = df["macd"]
-    macd_sig = df["macd_signal"]
-    close = df["Close"]
-    bb_u = df["bb_upper"]
-    bb_l = df["bb_lower"]
-    ma5 = df["ma5"]
-    ma20 = df["ma20"]
-
-    for i in range(1, len(df)):
-        date = df.index[i].strftime("%Y-%m-%d")
-        c, c_prev = close.iloc[i], close.iloc[i - 1]
-        r, r_prev = rsi.iloc[i], rsi.iloc[i - 1]
-        m, m_prev = macd.iloc[i], macd.iloc[i - 1]
-        ms, ms_prev = macd_sig.iloc[i], macd_sig.iloc[i - 1]
-        m5, m5_prev = ma5.iloc[i], ma5.iloc[i - 1]
-        m20, m20_prev = ma20.iloc[i], ma20.iloc[i - 1]
-
-        if pd.isna(r) or pd.isna(m):
-            continue
+    def col(name):
+        return df[name].to_numpy(dtype=float)
 
-        if c <= bb_l.iloc[i] and r < 30 and r > r_prev:
-            signals.append({"date": date, "type": "BUY", "reason": "BB하단+RSI과매도반등",
-                            "price": safe_float(c), "strength": "STRONG"})
-        elif c >= bb_u.iloc[i] and r > 70 and r < r_prev:
-            signals.append({"date": date, "type": "SELL", "reason": "BB상단+RSI과매수",
-                            "price": safe_float(c), "strength": "STRONG"})
-        elif m5 > m20 and m5_prev <= m20_prev:
-            signals.append({"date": date, "type": "BUY", "reason": "골든크로스(MA5/MA20)",
-                            "price": safe_float(c), "strength": "MODERATE"})
-        elif m5 < m20 and m5_prev >= m20_prev:
-            signals.append({"date": date, "type": "SELL", "reason": "데드크로스(MA5/MA20)",
-                            "price": safe_float(c), "strength": "MODERATE"})
-        elif m > ms and m_prev <= ms_prev:
-            signals.append({"date": date, "type": "BUY", "reason": "MACD골든크로스",
-                            "price": safe_float(c), "strength": "WEAK"})
-        elif m < ms and m_prev >= ms_prev:
-            signals.append({"date": date, "type": "SELL", "reason": "MACD데드크로스",
-                            "price": safe_float(c), "strength": "WEAK"})
+    close = col("Close")
+    codes = signal_codes(close, col("rsi14"), col("macd"), col("macd_signal"),
+                         col("bb_upper"), col("bb_lower"), col("ma5"), col("ma20"))
 
+    hits = np.flatnonzero(codes >= 0)
+    dates = df.index[hits].strftime("%Y-%m-%d")
+    signals = []
+    for date, i in zip(dates, hits):
+        sig_type, reason, strength = SIGNAL_RULES[codes[i]]
+        signals.append({"date": date, "type": sig_type, "reason": reason,
+                        "price": safe_float(close[i]), "strength": strength})
     return signals
 
 
@@ -165,10 +273,16 @@ def generate_signals(df):
 # Performance metrics
 # ---------------------------------------------------------------------------
 
-def compute_metrics(df, signals, holding_days=20):
+@timed()
+def compute_metrics(df, signals, holding_days=20, resamples=0):
+    """winRate / MDD / Sharpe / return stats of holding every BUY signal `holding_days` bars.
+
+    resamples > 0 adds resampling.metric_intervals(): bootstrap confidence
+    intervals ("intervals") and random-entry p-values ("permutation").
+    """
     close = df["Close"]
     date_idx = {d.strftime("%Y-%m-%d"): i for i, d in enumerate(df.index)}
-    returns = []
+    returns, entries = [], []
 
     for sig in signals:
         if sig["type"] != "BUY":
@@ -179,6 +293,7 @@ def compute_metrics(df, signals, holding_days=20):
         exit_idx = min(idx + holding_days, len(close) - 1)
         ret = (float(close.iloc[exit_idx]) - float(close.iloc[idx])) / float(close.iloc[idx])
         returns.append(ret)
+        entries.append(idx)
 
     if not returns:
         return {"winRate": 0, "mdd": 0, "sharpeRatio": 0,
@@ -206,6 +321,7 @@ def compute_metrics(df, signals, holding_days=20):
         "avgReturn": round(avg_ret, 4),
         "maxReturn": round(float(max(returns)), 4),
         "minReturn": round(float(min(returns)), 4),
+        **resampling.metric_intervals(close.to_numpy(dtype=float), entries, holding_days, resamples),
     }
 
 
@@ -214,8 +330,11 @@ def compute_metrics(df, signals, holding_days=20):
 # ---------------------------------------------------------------------------
 
 def compute_decision(df):
-    row = df.iloc[-1]
+    return decide(df.iloc[-1])
 
+
+def decide(row):
+    """compute_decision for one indicator row (Series or dict; streaming.py)."""
     def g(col, default=0):
         v = row.get(col, default)
         return default if pd.isna(v) else float(v)
@@ -305,8 +424,26 @@ def compute_decision(df):
 # Correlations
 # ---------------------------------------------------------------------------
 
+def rolling_records(rolling, start_1y=None):
+    """[{date, <pair>: corr}] on the first pair's dates (pairs missing a date omit their key)."""
+    dates = next(iter(rolling.values())).index
+    if start_1y:
+        dates = dates[dates >= start_1y]
+    columns = [(name, dates.isin(roll.index).tolist(), nullable(roll.reindex(dates)))
+               for name, roll in rolling.items()]
+    out = []
+    for i, d in enumerate(date_strings(dates)):
+        entry = {"date": d}
+        for name, present, vals in columns:
+            if present[i]:
+                entry[name] = vals[i]
+        out.append(entry)
+    return out
+
+
+@timed()
 def compute_correlations(kospi_df, qqq_df, sox_df, window=60, start_1y=None):
-    kr = kospi_df["Close"].pct_change().dropna()
+    kr = kospi_df["Close"].astype(float).pct_change().dropna()
     result = {"current": {"kospi_qqq": None, "kospi_sox": None}, "rolling60": []}
 
     rolling = {}
@@ -322,248 +459,237 @@ def compute_correlations(kospi_df, qqq_df, sox_df, window=60, start_1y=None):
         rolling[name] = roll
 
     if rolling:
-        ref_key = list(rolling.keys())[0]
-        dates = rolling[ref_key].index
-        if start_1y:
-            dates = dates[dates >= start_1y]
-        for d in dates:
-            entry = {"date": d.strftime("%Y-%m-%d")}
-            for name, roll in rolling.items():
-                if d in roll.index:
-                    entry[name] = safe_float(roll.loc[d])
-            result["rolling60"].append(entry)
+        result["rolling60"] = rolling_records(rolling, start_1y)
 
     return result
 
 
 # ---------------------------------------------------------------------------
-# 수급현황: 투자자별 순매수 (NAVER Finance 스크래핑 — 글로벌 IP 호환)
+# 비교 수익률
 # ---------------------------------------------------------------------------
 
-def fetch_supply_demand():
-    """코스피/코스닥 투자자별 순매수 데이터 수집
-    KRX API는 국내 IP 제한이 있으므로 NAVER Finance HTML을 사용합니다.
-    단위: 억원 (NAVER 기준)
-    """
-    import re as _re
-    import time as _time
-    import requests as _req
-
-    session = _req.Session()
-    session.headers.update({
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Accept-Language": "ko-KR,ko;q=0.9",
-        "Referer": "https://finance.naver.com/sise/sise_trans_style.naver",
-    })
-
-    today    = datetime.now()
-    cutoff   = today - timedelta(days=400)          # 1년 + 버퍼
-    bizdate  = today.strftime("%Y%m%d")
-
-    # 날짜 + 10개 컬럼 (개인, 외국인, 기관계, 금융투자, 보험, 투신, 은행, 기타금융, 연기금, 기타법인)
-    ROW_PAT = (
-        r'<td class="date2">(\d{2}\.\d{2}\.\d{2})</td>'
-        + r'\s*<td[^>]*>([\d,\-]+)</td>' * 10
-    )
-
-    def _parse(s: str) -> int:
-        s = s.replace(",", "").strip()
-        try:
-            return int(s)
-        except ValueError:
-            return 0
-
-    result = {}
-    market_map = [
-        ("kospi",  "01"),   # sosok=01 → 코스피
-        ("kosdaq", "02"),   # sosok=02 → 코스닥
-    ]
+@timed()
+def compute_comparison(df1y, qqq, sox, start_1y):
+    """KOSPI vs QQQ/SOX rebased to 100 at the start of the 1-year window."""
+    comp = {}
+    def norm(s):
+        base = s.iloc[0]
+        return ((s / base) * 100) if base != 0 else s
 
-    for market_name, sosok in market_map:
-        series = []
-        try:
-            for page in range(1, 35):           # 페이지당 10행 × 34 = 340일 최대
-                url = (
-                    "https://finance.naver.com/sise/investorDealTrendDay.naver"
-                    f"?bizdate={bizdate}&sosok={sosok}&page={page}"
-                )
-                resp = session.get(url, timeout=20)
-                if resp.status_code != 200:
-                    print(f"  [{market_name}] p{page}: HTTP {resp.status_code}")
-                    break
-
-                content = resp.content.decode("euc-kr", errors="replace")
-                matches = _re.findall(ROW_PAT, content)
-                if not matches:
-                    break
-
-                stop = False
-                for m in matches:
-                    try:
-                        dt = datetime.strptime("20" + m[0], "%Y.%m.%d")
-                    except ValueError:
-                        continue
-                    if dt < cutoff:
-                        stop = True
-                        break
-
-                    series.append({
-                        "date":        dt.strftime("%Y-%m-%d"),
-                        "individual":  _parse(m[1]),   # 개인
-                        "foreign":     _parse(m[2]),   # 외국인
-                        "institution": _parse(m[3]),   # 기관계
-                    })
-
-                if stop:
-                    break
-                _time.sleep(0.25)           # 과도한 요청 방지
-
-        except Exception as exc:
-            print(f"  Supply/Demand {market_name}: error → {exc}")
-            continue
+    kn = norm(df1y["Close"])
+    comp["kospi_normalized"] = series_records(kn)
+    comp["kospi_current"] = safe_float(df1y["Close"].iloc[-1])
+    comp["kospi_return"]  = safe_float((df1y["Close"].iloc[-1] / df1y["Close"].iloc[0] - 1) * 100)
 
-        if not series:
-            print(f"  Supply/Demand {market_name}: no data collected")
+    for name, ext_df in [("qqq", qqq), ("sox", sox)]:
+        if ext_df.empty:
+            continue
+        s = ext_df[ext_df.index >= start_1y]["Close"]
+        if s.empty:
             continue
+        sn = norm(s)
+        comp[f"{name}_normalized"] = series_records(sn)
+        comp[f"{name}_current"] = safe_float(s.iloc[-1])
+        comp[f"{name}_return"]  = safe_float((s.iloc[-1] / s.iloc[0] - 1) * 100)
+    return comp
 
-        # 날짜 오름차순 정렬
-        series.sort(key=lambda x: x["date"])
-        result[market_name] = {
-            "lastDate": series[-1]["date"],
-            "latest": {k: series[-1][k] for k in ["foreign", "institution", "individual"]},
-            "series": series,
-            "unit": "억원",
-        }
-        latest = series[-1]
-        print(
-            f"  Supply/Demand {market_name}: {len(series)} days, "
-            f"latest={latest['date']}, "
-            f"외국인={latest['foreign']:,} / 기관={latest['institution']:,} / "
-            f"개인={latest['individual']:,} 억원"
-        )
 
-    return result
+# ---------------------------------------------------------------------------
+# 수급현황: 투자자별 순매수 (NAVER Finance 스크래핑 — 글로벌 IP 호환)
+# ---------------------------------------------------------------------------
+
+@timed()
+def fetch_supply_demand(base_url=None, concurrency=4, rate=4.0, use_cache=True):
+    """코스피/코스닥 투자자별 순매수 — 병렬 스크래퍼/캐시는 supply_demand.py 참고."""
+    import supply_demand as sd
+
+    return sd.fetch_supply_demand(base_url=base_url or sd.NAVER_BASE,
+                                  concurrency=concurrency, rate=rate,
+                                  cache_dir=sd.CACHE_DIR if use_cache else None)
 
 
 # ---------------------------------------------------------------------------
-# Main
+# Price download
 # ---------------------------------------------------------------------------
 
-def main():
-    end = datetime.now()
-    start_full = end - timedelta(days=520)
-    start_1y = end - timedelta(days=365)
+TICKERS = {"kospi": "^KS11", "qqq": "QQQ", "sox": "^SOX", "vkospi": "^VKOSPI"}
+OPTIONAL_TICKERS = {"sox", "vkospi"}
 
-    print(f"Fetching market data ({start_full.date()} → {end.date()}) …")
 
-    kospi = download("^KS11", start_full, end)
-    print(f"  KOSPI: {len(kospi)} rows")
+def fetch_prices(start, end, tickers=TICKERS, refresh=False):
+    """KOSPI, QQQ, SOX, VKOSPI through the cached PriceLoader (optional ones → empty frame)."""
+    frames = price_loader().fetch(list(tickers.values()), start, end, refresh=refresh)
+    out = {}
+    for name, ticker in tickers.items():
+        df = frames[ticker]
+        if df.empty and name not in OPTIONAL_TICKERS:
+            raise RuntimeError(f"{ticker}: no data downloaded")
+        print(f"  {name.upper():<6}: " + (f"{len(df)} rows" if not df.empty else "skipped (no data)"))
+        out[name] = df
+    return out["kospi"], out["qqq"], out["sox"], out["vkospi"]
 
-    qqq = download("QQQ", start_full, end)
-    print(f"  QQQ  : {len(qqq)} rows")
 
-    try:
-        sox = download("^SOX", start_full, end)
-        print(f"  SOX  : {len(sox)} rows")
-    except Exception as e:
-        print(f"  SOX  : skipped ({e})")
-        sox = pd.DataFrame()
+HISTORY_DAYS = 520       # 지표 워밍업을 포함한 전체 이력 (달력일)
+WINDOW_DAYS = 365        # 대시보드 1년 구간 (달력일)
+FETCH_SLACK_DAYS = 14    # 연휴로 마지막 봉이 오늘보다 이를 수 있는 만큼 더 받는다
 
-    try:
-        vkospi = download("^VKOSPI", start_full, end)
-        print(f"  VKOSPI: {len(vkospi)} rows")
-    except Exception as e:
-        print(f"  VKOSPI: skipped ({e})")
-        vkospi = pd.DataFrame()
 
-    # ── 기술 지표 계산 ──────────────────────────────────────
-    df = kospi.copy()
-    for p in [5, 20, 60, 120, 240]:
-        df[f"ma{p}"] = df["Close"].rolling(p).mean()
+def window_start(last, days):
+    """First date of the `days` calendar days ending at bar `last`.
 
-    df["bb_middle"] = df["Close"].rolling(20).mean()
-    bb_std = df["Close"].rolling(20).std()
-    df["bb_upper"] = df["bb_middle"] + 2 * bb_std
-    df["bb_lower"] = df["bb_middle"] - 2 * bb_std
+    Windows follow the data, not datetime.now(): a run on a non-trading day
+    slices exactly the rows of the previous run, so its content hash matches.
+    """
+    return pd.Timestamp(last).normalize() - timedelta(days=days - 1)
 
-    df["rsi14"] = compute_rsi(df["Close"])
-    df["macd"], df["macd_signal"], df["macd_hist"] = compute_macd(df["Close"])
-    df["obv"] = compute_obv(df["Close"], df["Volume"])
 
+def anchor_history(kospi, *others):
+    """Frames cut to the HISTORY_DAYS ending at KOSPI's last bar (the fetch range follows the clock)."""
+    start = window_start(kospi.index[-1], HISTORY_DAYS)
+    return (kospi[kospi.index >= start],) + tuple(f[f.index >= start] if not f.empty else f for f in others)
+
+
+# ---------------------------------------------------------------------------
+# Incremental update (persisted OHLCV + indicator state)
+# ---------------------------------------------------------------------------
+
+STATE_PATH = ".cache/market_state.npz"
+OVERLAP_DAYS = 10        # 신규 다운로드와 저장 이력이 겹치는 구간 (정합성 확인용)
+
+
+def update_incremental(start_full, end, path=STATE_PATH):
+    """Extend the stored history by the bars since the last run.
+
+    Returns (df, qqq, sox, vkospi) like the full path. Only the missing bars
+    are downloaded; the indicators and state are recomputed from the stored
+    bars of the trimmed window (a few ms), so EWM warm-up and the OBV base
+    start where a full run starts and the output is identical. Falls back to
+    a full rebuild when no usable store exists or the stored KOSPI closes
+    disagree with a fresh download (e.g. auto_adjust revised past prices).
+    """
+    import state_store as ss
+
+    stored = ss.load_store(path)
+    frames, state = stored if stored else ({}, None)
+    hist = frames.get("kospi", pd.DataFrame())
+
+    new, revised = None, False
+    if state is not None and not hist.empty and hist.index[-1] >= start_full:
+        fresh = download("^KS11", hist.index[-1] - timedelta(days=OVERLAP_DAYS), end)
+        if ss.overlaps_agree(hist, fresh):
+            _, new = ss.append_bars(hist, fresh)
+        else:
+            print("  KOSPI: stored history differs from download → full rebuild")
+            revised = True
+
+    if new is None:
+        print("  Incremental: full rebuild")
+        # 재조정이 감지되면 OHLCV 캐시도 믿을 수 없다 — 전 구간을 새로 받는다
+        kospi, qqq, sox, vkospi = anchor_history(*fetch_prices(start_full, end, refresh=revised))
+        hist, state = ss.build_state(kospi)
+        others = {"qqq": qqq, "sox": sox, "vkospi": vkospi}
+    else:
+        print(f"  KOSPI: +{len(new)} new rows")
+        # 창 시작이 옮겨지면 OBV 기준점과 EWM 워밍업도 따라 옮겨야 한다 — 이어 붙인 값
+        # (state.extend) 은 옛 시작에서 출발하고 합산 순서도 달라 full 실행과 어긋난다
+        raw = pd.concat([hist[ss.OHLCV_COLS], new[ss.OHLCV_COLS]])
+        hist, state = ss.build_state(raw[raw.index >= window_start(raw.index[-1], HISTORY_DAYS)])
+        others = {}
+        for name, ticker in [("qqq", "QQQ"), ("sox", "^SOX"), ("vkospi", "^VKOSPI")]:
+            others[name] = _extend_raw(frames.get(name, pd.DataFrame()), ticker, start_full, end)
+
+    keep_from = window_start(hist.index[-1], HISTORY_DAYS)
+    hist = hist[hist.index >= keep_from]
+    others = {k: (v[v.index >= keep_from] if not v.empty else v) for k, v in others.items()}
+    ss.save_store(path, {"kospi": hist, **others}, state)
+
+    df = hist
+    vkospi = others["vkospi"]
     if not vkospi.empty:
         df["vkospi"] = vkospi["Close"].reindex(df.index, method="ffill")
+    return df, others["qqq"], others["sox"], vkospi
 
-    df1y = df[df.index >= start_1y].copy()
-    print(f"  1Y slice: {len(df1y)} rows")
 
-    def to_list(series, key="value"):
-        out = []
-        for d, v in series.items():
-            if d >= start_1y:
-                out.append({"date": d.strftime("%Y-%m-%d"), key: safe_float(v)})
-        return out
+def _extend_raw(hist, ticker, start_full, end):
+    """Raw OHLCV history for `ticker`, fetching only what is missing."""
+    import state_store as ss
+
+    try:
+        refresh = False
+        if not hist.empty and hist.index[-1] >= start_full:
+            fresh = download(ticker, hist.index[-1] - timedelta(days=OVERLAP_DAYS), end)
+            if ss.overlaps_agree(hist, fresh):
+                merged, new = ss.append_bars(hist, fresh)
+                print(f"  {ticker}: +{len(new)} new rows")
+                return merged
+            print(f"  {ticker}: stored history differs from download → refetch")
+            refresh = True
+        df = download(ticker, start_full, end, refresh=refresh)
+        print(f"  {ticker}: {len(df)} rows")
+        return df
+    except Exception as e:
+        print(f"  {ticker}: skipped ({e})")
+        return pd.DataFrame()
+
+
+# ---------------------------------------------------------------------------
+# Per-symbol pipeline
+# ---------------------------------------------------------------------------
+
+INDICATOR_COLUMNS = ["ma5", "ma20", "ma60", "ma120", "ma240", "bb_upper", "bb_middle", "bb_lower",
+                     "rsi14", "macd", "macd_signal", "macd_hist", "obv"]
 
-    ohlcv = [
-        {
-            "date": d.strftime("%Y-%m-%d"),
-            "open": safe_float(r["Open"]),
-            "high": safe_float(r["High"]),
-            "low": safe_float(r["Low"]),
-            "close": safe_float(r["Close"]),
-            "volume": int(r["Volume"]) if not pd.isna(r["Volume"]) else 0,
-        }
-        for d, r in df1y.iterrows()
+
+def ohlcv_records(df, dates=None):
+    """[{date, open, high, low, close, volume}] with NaN prices → None, NaN volume → 0."""
+    dates = date_strings(df.index) if dates is None else dates
+
+    # 컬럼 단위 변환 (safe_float 과 같은 값: NaN/inf → None)
+    def values(col):
+        return nullable(df[col].to_numpy(dtype=float))
+
+    volume = df["Volume"].to_numpy(dtype=float)
+    return [
+        {"date": d, "open": o, "high": h, "low": l, "close": c,
+         "volume": int(v) if not np.isnan(v) else 0}
+        for d, o, h, l, c, v in zip(dates, values("Open"), values("High"), values("Low"),
+                                    values("Close"), volume)
     ]
 
-    indicators = {
-        "ma5": to_list(df["ma5"]), "ma20": to_list(df["ma20"]),
-        "ma60": to_list(df["ma60"]), "ma120": to_list(df["ma120"]),
-        "ma240": to_list(df["ma240"]),
-        "bb_upper": to_list(df["bb_upper"]),
-        "bb_middle": to_list(df["bb_middle"]),
-        "bb_lower": to_list(df["bb_lower"]),
-        "rsi14": to_list(df["rsi14"]),
-        "macd": to_list(df["macd"]),
-        "macd_signal": to_list(df["macd_signal"]),
-        "macd_hist": to_list(df["macd_hist"]),
-        "obv": to_list(df["obv"]),
-        "vkospi": to_list(df["vkospi"]) if "vkospi" in df.columns else [],
-    }
 
-    signals  = generate_signals(df1y)
-    metrics  = compute_metrics(df1y, signals)
-    sr       = find_support_resistance(df1y)
-    decision = compute_decision(df1y)
-    correlations = compute_correlations(
-        df, qqq if not qqq.empty else None,
-        sox if not sox.empty else None, start_1y=start_1y
-    )
+@timed()
+def series_sections(df1y):
+    """(ohlcv, indicators) record lists of a compute_indicators() frame."""
+    dates = date_strings(df1y.index)
 
-    # 비교 수익률
-    comp = {}
-    def norm(s):
-        base = s.iloc[0]
-        return ((s / base) * 100) if base != 0 else s
+    def to_list(col):
+        return value_records(dates, df1y[col].to_numpy(dtype=float))
 
-    kn = norm(df1y["Close"])
-    comp["kospi_normalized"] = [{"date": d.strftime("%Y-%m-%d"), "value": safe_float(v)} for d, v in kn.items()]
-    comp["kospi_current"] = safe_float(df1y["Close"].iloc[-1])
-    comp["kospi_return"]  = safe_float((df1y["Close"].iloc[-1] / df1y["Close"].iloc[0] - 1) * 100)
+    ohlcv = ohlcv_records(df1y, dates)
+    indicators = {k: to_list(k) for k in INDICATOR_COLUMNS}
+    indicators["vkospi"] = to_list("vkospi") if "vkospi" in df1y.columns else []
+    return ohlcv, indicators
 
-    for name, ext_df in [("qqq", qqq), ("sox", sox)]:
-        if ext_df.empty:
-            continue
-        s = ext_df[ext_df.index >= start_1y]["Close"]
-        if s.empty:
-            continue
-        sn = norm(s)
-        comp[f"{name}_normalized"] = [{"date": d.strftime("%Y-%m-%d"), "value": safe_float(v)} for d, v in sn.items()]
-        comp[f"{name}_current"] = safe_float(s.iloc[-1])
-        comp[f"{name}_return"]  = safe_float((s.iloc[-1] / s.iloc[0] - 1) * 100)
+
+def one_year(df, start_1y, low_memory=False):
+    """Rows dated >= start_1y as a view (float64 rounded to DECIMALS when low_memory)."""
+    df1y = df.iloc[df.index.searchsorted(pd.Timestamp(start_1y)):]
+    if low_memory:
+        df1y = lowmem.widen(df1y)
+    return df1y
+
+
+def analyze_symbol(df, start_1y, low_memory=False, resamples=resampling.RESAMPLES):
+    """Dashboard sections for one symbol from its compute_indicators() frame.
+
+    Returns metadata, latest, ohlcv, indicators, signals, supportResistance,
+    metrics, decisionTree and range52w for the rows dated >= start_1y. Used
+    for ^KS11 by main() and for every ticker by batch.py. `resamples` goes to
+    compute_metrics (0 = point estimates only).
+    """
+    df1y = one_year(df, start_1y, low_memory)
+    ohlcv, indicators = series_sections(df1y)
+    signals = generate_signals(df1y)
 
     # 52주 레인지
     hi52 = safe_float(df1y["High"].max())
@@ -571,35 +697,356 @@ def main():
     cur  = safe_float(df1y["Close"].iloc[-1])
     pos52 = round((cur - lo52) / (hi52 - lo52) * 100, 1) if hi52 and lo52 and hi52 != lo52 else 50
 
-    # ── 수급현황 ──────────────────────────────────────────
-    print("Fetching supply/demand data (pykrx) …")
-    supply_demand = fetch_supply_demand()
-
-    output = {
+    return {
         "metadata": {
             "lastUpdated": datetime.now().isoformat(),
             "dataStart": df1y.index[0].strftime("%Y-%m-%d"),
             "dataEnd": df1y.index[-1].strftime("%Y-%m-%d"),
             "totalDays": len(df1y),
         },
+        # 첫 화면용 최신값 (summary shard 에 포함)
+        "latest": {
+            "date": ohlcv[-1]["date"],
+            "close": ohlcv[-1]["close"],
+            "prevClose": ohlcv[-2]["close"] if len(ohlcv) > 1 else None,
+            "volume": ohlcv[-1]["volume"],
+            "indicators": {k: v[-1]["value"] for k, v in indicators.items() if v},
+        },
         "ohlcv": ohlcv,
         "indicators": indicators,
         "signals": signals,
-        "supportResistance": sr,
-        "metrics": metrics,
-        "correlations": correlations,
-        "comparison": comp,
-        "decisionTree": decision,
+        "supportResistance": find_support_resistance(df1y),
+        "metrics": compute_metrics(df1y, signals, resamples=resamples),
+        "decisionTree": compute_decision(df1y),
         "range52w": {"high": hi52, "low": lo52, "current": cur, "position": pos52},
-        "supplyDemand": supply_demand,
     }
 
-    os.makedirs("public/data", exist_ok=True)
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+REPORT_PATH = ".cache/run_report.json"     # 실행마다 바뀌므로 배포 데이터(public/data) 밖에 둔다
+
+
+def parse_args(argv=None):
+    import argparse
+
+    ap = argparse.ArgumentParser(
+        description="Fetch market data and write public/data/market_data.json",
+        epilog="Stages run in pipeline order; skipped ones are read from the stage cache, e.g. "
+               "`fetch_data.py supply-demand output` refreshes 수급 only and "
+               "`fetch_data.py signals output` recomputes the decision tree from cached indicators.")
+    ap.add_argument("stages", nargs="*", metavar="STAGE",
+                    help=f"stages to run (default: all): {', '.join(STAGES)}")
+    ap.add_argument("--stage-dir", default=None,
+                    help="cache of per-stage results for partial runs (default: .cache/stages)")
+    ap.add_argument("--incremental", action="store_true",
+                    help="reuse the persisted history/indicator state and fetch only new bars")
+    ap.add_argument("--state", default=STATE_PATH, help=f"state store path (default: {STATE_PATH})")
+    ap.add_argument("--workers", type=int, default=4,
+                    help="concurrent download workers (--fixtures; yfinance makes one batched request)")
+    ap.add_argument("--cache-dir", default=None,
+                    help="per-ticker OHLCV cache directory (default: .cache/ohlcv)")
+    ap.add_argument("--cache-ttl", type=float, default=None,
+                    help="seconds before cached recent bars are refreshed (default: 6h)")
+    ap.add_argument("--no-cache", action="store_true", help="bypass the OHLCV cache")
+    ap.add_argument("--fixtures", default=None,
+                    help="read prices from <dir>/<ticker>.csv instead of yfinance (offline)")
+    ap.add_argument("--naver-concurrency", type=int, default=4,
+                    help="parallel NAVER page requests (shared by KOSPI/KOSDAQ)")
+    ap.add_argument("--naver-rate", type=float, default=4.0, help="NAVER requests per second")
+    ap.add_argument("--naver-base-url", default=None, help="NAVER host override (local stand-in)")
+    ap.add_argument("--format", choices=["rows", "columnar"], default="rows",
+                    help="market_data.json layout: per-day records or columnar (schemaVersion 2)")
+    ap.add_argument("--precision", type=int, default=None,
+                    help="columnar: round series values to N decimals")
+    ap.add_argument("--delta-dates", action="store_true",
+                    help="columnar: encode date axes as start + day deltas")
+    ap.add_argument("--binary", action="store_true",
+                    help="also write public/data/market_data.bin (typed-array sidecar)")
+    ap.add_argument("--lod", action="store_true",
+                    help="add weekly/monthly OHLCV + LTTB indicator lines for 5/10/20-year views")
+    ap.add_argument("--lod-points", type=int, default=None,
+                    help="LOD point budget per series (default: 500)")
+    ap.add_argument("--shards", action="store_true",
+                    help="also write public/data/manifest.json + per-panel shards (lazy loading)")
+    ap.add_argument("--json-backend", choices=BACKENDS, default="auto",
+                    help="JSON encoder: orjson when installed (auto), or force json/orjson; same bytes")
+    ap.add_argument("--corr-matrix", action="store_true",
+                    help="add the multi-asset rolling correlation matrix (correlationMatrix)")
+    ap.add_argument("--corr-windows", default=None,
+                    help="comma-separated correlation windows in trading days (default: 20,60,120)")
+    ap.add_argument("--stream", metavar="SOURCE", default=None,
+                    help="intraday mode: online indicators from minute bars, "
+                         "SOURCE = replay:<minute bars csv> or yfinance[:<ticker>]")
+    ap.add_argument("--stream-interval", type=float, default=None,
+                    help="minimum seconds between intraday snapshots (default: 5)")
+    ap.add_argument("--replay-speed", type=float, default=0.0,
+                    help="replay pacing multiplier for replay: sources (0 = as fast as possible)")
+    ap.add_argument("--low-memory", action="store_true",
+                    help="float32 price/indicator columns, outputs rounded to their display "
+                         "decimals, intermediates freed between stages")
+    ap.add_argument("--resamples", type=int, default=resampling.RESAMPLES,
+                    help=f"bootstrap/permutation resamples behind the metrics intervals "
+                         f"(default: {resampling.RESAMPLES}; 0 = point estimates only)")
+    ap.add_argument("--archive-dir", default=None,
+                    help="decision history archive for the archive stage (default: public/data/archive)")
+    ap.add_argument("--force", action="store_true",
+                    help=f"write outputs even when the content hash is unchanged "
+                         f"(otherwise exit {publish.EXIT_UNCHANGED} without writing)")
+    ap.add_argument("--precompress", action="store_true",
+                    help="also write .gz (and .br with brotli installed) next to each output file")
+    ap.add_argument("--report", default=REPORT_PATH,
+                    help=f"run report path: stage timings, memory, request counts (default: {REPORT_PATH}; '' = off)")
+    ap.add_argument("--trace-memory", action="store_true",
+                    help="record per-stage tracemalloc peaks in the run report (slower)")
+    ap.add_argument("--profile", nargs="?", const="fetch_data.prof", default=None, metavar="PATH",
+                    help="cProfile the run (main thread) and dump stats to PATH (default: fetch_data.prof)")
+    args = ap.parse_args(argv)
+    unknown = [s for s in args.stages if s not in STAGES]
+    if unknown:
+        ap.error(f"unknown stage(s) {', '.join(unknown)} (choose from {', '.join(STAGES)})")
+    return args
+
+
+def make_price_loader(args=None):
+    """PriceLoader for the CLI options (None → yfinance, default cache)."""
+    from price_cache import CACHE_DIR, CACHE_TTL, FixtureProvider, OHLCVCache, PriceLoader
+
+    if args is None:
+        return PriceLoader()
+    provider = FixtureProvider(args.fixtures) if args.fixtures else None
+    cache = None
+    if not args.no_cache:
+        cache = OHLCVCache(args.cache_dir or CACHE_DIR,
+                           CACHE_TTL if args.cache_ttl is None else args.cache_ttl)
+    return PriceLoader(provider, cache, max_workers=args.workers)
+
+
+def configure_prices(args):
+    """Select the CLI's price options; the loader (and pandas) is built on first use."""
+    global PRICE_LOADER, PRICE_OPTIONS
+    PRICE_LOADER, PRICE_OPTIONS = None, args
+
+
+def build_correlation_matrix(have, windows, start_full, end, start_1y):
+    """correlationMatrix section, reusing the frames in `have` and fetching the rest."""
+    from correlation import ASSETS, WINDOWS, correlation_matrix
+
+    print("Building multi-asset correlation matrix …")
+    windows = [int(w) for w in windows.split(",")] if windows else WINDOWS
+    # 이미 받은 종목은 재사용하고 나머지만 한 번에 받는다
+    missing = [t for k, t in ASSETS.items() if k not in have]
+    frames = price_loader().fetch(missing, start_full, end) if missing else {}
+    closes = {}
+    for name, ticker in ASSETS.items():
+        frame = have[name] if name in have else frames.get(ticker, pd.DataFrame())
+        if frame is not None and not frame.empty:
+            closes[name] = frame["Close"]
+    matrix = correlation_matrix(closes, windows, start=start_1y)
+    if matrix is not None:
+        print(f"  {len(matrix['assets'])} assets × windows {matrix['windows']}: {', '.join(matrix['assets'])}")
+    else:
+        print("  correlation matrix: skipped (fewer than 2 assets)")
+    return matrix
+
+
+# 단계 이름 (실행 순서) — 건너뛴 단계의 결과는 stage_cache 에서 다시 읽는다
+STAGES = ("prices", "indicators", "signals", "correlations", "supply-demand", "output", "archive")
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def stage_result(ctx, name):
+    """Result of stage `name` from this run, else from the stage cache."""
+    if name not in ctx:
+        cache = ctx["cache"]
+        data = cache.load_frames(name) if name in ("prices", "indicators") else cache.load_section(name)
+        if data is None:
+            raise RuntimeError(f"no cached '{name}' results in {cache.directory}: run the {name} stage first")
+        print(f"  {name}: reusing cached results")
+        ctx[name] = data
+    return ctx[name]
+
+
+def stage_prices(args, ctx):
+    """KOSPI/QQQ/SOX/VKOSPI OHLCV (incremental: also the extended indicator frame)."""
+    print(f"Fetching market data ({ctx['start_full'].date()} → {ctx['end'].date()}) …")
+    if args.incremental:
+        df, qqq, sox, vkospi = update_incremental(ctx["start_full"], ctx["end"], args.state)
+        ctx["indicators"] = {"kospi": df}
+        kospi = df[[c for c in PRICE_COLUMNS if c in df.columns]]
+    else:
+        kospi, qqq, sox, vkospi = anchor_history(*fetch_prices(ctx["start_full"], ctx["end"]))
+    ctx["prices"] = {"kospi": kospi, "qqq": qqq, "sox": sox, "vkospi": vkospi}
+    ctx["cache"].save_frames("prices", ctx["prices"])
+
+
+def build_lod_section(end, budget):
+    """LOD section of the long KOSPI history fetched up to `end`.
+
+    The download range follows the clock; the history start (indicator
+    seeds) and the 5/10/20-year windows follow the last bar, like
+    window_start, so a non-trading-day rerun builds the same section.
+    """
+    from lod import anchor_history as anchor_long, build_lod, history_start
+
+    raw = download(TICKERS["kospi"], history_start(end) - timedelta(days=FETCH_SLACK_DAYS), end)
+    # LOD 는 20년치 전체를 리샘플하므로 float64 로 계산하고 바로 놓는다
+    long_df = compute_indicators(anchor_long(raw))
+    del raw
+    return build_lod(long_df, long_df.index[-1], budget=budget)
+
+
+def stage_indicators(args, ctx):
+    """KOSPI indicator frame, plus the LOD section with --lod."""
+    lean = args.low_memory
+    if "indicators" not in ctx:
+        prices = stage_result(ctx, "prices")
+        ctx["indicators"] = {"kospi": compute_indicators(prices["kospi"], prices["vkospi"], low_memory=lean)}
+    elif lean:
+        ctx["indicators"]["kospi"] = lowmem.downcast(ctx["indicators"]["kospi"])
+    ctx["cache"].save_frames("indicators", ctx["indicators"])
+
+    # ── 장기 조회용 LOD (5/10/20년) ───────────────────────
+    if args.lod:
+        from lod import POINT_BUDGET
+        print("Building long-lookback LOD series …")
+        lod_section = {}
+        try:
+            with stage("lod"):
+                lod_section = build_lod_section(ctx["end"], args.lod_points or POINT_BUDGET)
+            for name, entry in lod_section.items():
+                print(f"  LOD {name}: {len(entry['ohlcv'])} {entry['resolution']} bars from {entry['start']}")
+        except Exception as e:
+            print(f"  LOD: skipped ({e})")
+        ctx["lod"] = lod_section
+        ctx["cache"].save_section("lod", lod_section)
+    if lean:
+        lowmem.release()
+
+
+def stage_signals(args, ctx):
+    """analyze_symbol() sections: series, signals, S/R, metrics, decision tree, 52w range."""
+    df = stage_result(ctx, "indicators")["kospi"]
+    with stage("analyze_symbol"):
+        sections = analyze_symbol(df, window_start(df.index[-1], WINDOW_DAYS), args.low_memory, args.resamples)
+    print(f"  1Y slice: {sections['metadata']['totalDays']} rows")
+    ctx["signals"] = sections
+    ctx["cache"].save_section("signals", sections)
+
+
+def stage_correlations(args, ctx):
+    """KOSPI vs QQQ/SOX correlations and comparison, plus the matrix with --corr-matrix."""
+    df = stage_result(ctx, "indicators")["kospi"]
+    prices = stage_result(ctx, "prices")
+    qqq, sox, vkospi = prices["qqq"], prices["sox"], prices["vkospi"]
+    start_1y = window_start(df.index[-1], WINDOW_DAYS)
+    section = {
+        "correlations": compute_correlations(df, qqq if not qqq.empty else None,
+                                             sox if not sox.empty else None, start_1y=start_1y),
+        "comparison": compute_comparison(one_year(df, start_1y, args.low_memory), qqq, sox, start_1y),
+    }
+
+    # ── 다자산 상관행렬 ──────────────────────────────────
+    if args.corr_matrix:
+        with stage("correlation_matrix"):
+            matrix = build_correlation_matrix({"kospi": df, "qqq": qqq, "sox": sox, "vkospi": vkospi},
+                                              args.corr_windows, ctx["start_full"], ctx["end"], start_1y)
+        if matrix is not None:
+            section["correlationMatrix"] = matrix
+    ctx["correlations"] = section
+    ctx["cache"].save_section("correlations", section)
+
+
+def stage_supply_demand(args, ctx):
+    """수급현황 (NAVER)."""
+    print("Fetching supply/demand data (NAVER) …")
+    ctx["supply-demand"] = fetch_supply_demand(args.naver_base_url, args.naver_concurrency,
+                                               args.naver_rate, use_cache=not args.no_cache)
+    ctx["cache"].save_section("supply-demand", ctx["supply-demand"])
+
+
+def stage_output(args, ctx):
+    """Assemble market_data.json (+ binary/shards/variants); EXIT_UNCHANGED if nothing changed."""
+    lean = args.low_memory
+    sections = stage_result(ctx, "signals")
+    corr = stage_result(ctx, "correlations")
+    supply_demand = stage_result(ctx, "supply-demand")
+    lod_section = (stage_result(ctx, "lod") or None) if args.lod else None
+    signals, metrics, decision = sections["signals"], sections["metrics"], sections["decisionTree"]
+
+    output = {
+        **{k: sections[k] for k in ("metadata", "latest", "ohlcv", "indicators",
+                                    "signals", "supportResistance", "metrics")},
+        "correlations": corr["correlations"],
+        "comparison": corr["comparison"],
+        "decisionTree": decision,
+        "range52w": sections["range52w"],
+        "supplyDemand": supply_demand,
+    }
+    # 캐시된 섹션을 다시 쓰더라도 갱신 시각은 이번 실행
+    output["metadata"] = {**output["metadata"], "lastUpdated": datetime.now().isoformat()}
+    if args.corr_matrix and corr.get("correlationMatrix"):
+        output["correlationMatrix"] = corr["correlationMatrix"]
+    # shard 를 쓰면 lod-<기간> shard 로만 내보내 market_data.json 은 1년치 크기를 유지한다
+    if lod_section and not args.shards:
+        output["lod"] = lod_section
+
+    # ── 변경 감지: 거래일이 없으면(휴장일 등) 아무것도 쓰지 않는다 ──────
+    published = {**output, "lod": lod_section} if lod_section else output
     path = "public/data/market_data.json"
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False, separators=(",", ":"))
+    outputs = ([path] + (["public/data/market_data.bin"] if args.binary else [])
+               + (["public/data/manifest.json"] if args.shards else []))
+    options = {"format": args.format, "precision": args.precision, "deltaDates": args.delta_dates,
+               "binary": args.binary, "shards": args.shards}
+    with stage("content_hash"):
+        digest = publish.content_hash(published, options, args.json_backend)
+    if not args.force and publish.unchanged(digest, outputs):
+        print(f"\n[SKIP] market content unchanged (sha256 {digest[:12]}): outputs kept")
+        return publish.EXIT_UNCHANGED
 
-    print(f"\n[OK] {path} written ({os.path.getsize(path) // 1024} KB)")
+    os.makedirs("public/data", exist_ok=True)
+    if args.binary:
+        from binary_artifact import write_binary
+        with stage("write_binary"):
+            size = write_binary("public/data/market_data.bin", output)
+        print(f"[OK] public/data/market_data.bin written ({size // 1024} KB)")
+
+    encode = None
+    if args.format == "columnar":
+        from columnar import to_columnar
+        encode = lambda doc: to_columnar(doc, precision=args.precision, delta_dates=args.delta_dates)
+
+    if args.shards:
+        from shards import write_shards
+        with stage("write_shards"):
+            manifest = write_shards("public/data", published, encode, args.json_backend)
+        outputs += [os.path.join("public/data", s["file"]) for s in manifest["shards"].values()]
+        sizes = ", ".join(f"{k} {v['bytes'] // 1024}KB" for k, v in manifest["shards"].items())
+        print(f"[OK] public/data/manifest.json written ({sizes})")
+
+    if lean:
+        # 이후로는 output 만 필요 — 프레임/섹션을 놓고, 쓰는 동안 섹션을 하나씩 해제한다
+        # (archive 단계는 stage_cache 에서 다시 읽는다)
+        del sections, corr, published
+        for name in STAGES:
+            ctx.pop(name, None)
+        ctx.pop("lod", None)
+        lowmem.release()
+    with stage("write_json", backend=args.json_backend, format=args.format) as rec:
+        if encode:
+            output = encode(output)
+        size = rec["bytes"] = write_json(path, output, args.json_backend, consume=lean)
+    publish.record(digest)
+
+    print(f"\n[OK] {path} written ({size // 1024} KB, sha256 {digest[:12]})")
+    if args.precompress:
+        with stage("precompress"):
+            publish.prune_variants("public/data")
+            variants = publish.precompress(outputs)
+        print(f"[OK] {len(variants)} precompressed variants written "
+              f"({', '.join(sorted({os.path.splitext(p)[1] for p in variants}))})")
     print(f"    Signals : {len(signals)}  (Buy: {metrics['buySignals']})")
     print(f"    Decision: {decision['stateLabel']}  (Cash: {decision['cashRatio']}%)")
     if supply_demand:
@@ -608,5 +1055,88 @@ def main():
             print(f"    {mkt.upper()} 수급: 외국인={latest.get('foreign',0):,}  기관={latest.get('institution',0):,}  개인={latest.get('individual',0):,}")
 
 
+def stage_archive(args, ctx):
+    """Append today's decision/indicator/수급 row to the history archive; 0 if a row was written."""
+    import archive
+
+    sections = stage_result(ctx, "signals")
+    row = archive.snapshot_row(sections, stage_result(ctx, "supply-demand"))
+    store = archive.Archive(args.archive_dir or archive.ARCHIVE_DIR)
+    written = store.append([row])
+    if not written:
+        print(f"[SKIP] {store.directory}: {row['date']} already archived")
+        return None
+    print(f"[OK] {store.directory}: {row['date']} archived ({row['state']}, {len(row) - 1} columns)")
+    # 시장 출력이 그대로여도 새 행은 커밋되어야 하므로 EXIT_UNCHANGED 를 덮어쓴다
+    return 0
+
+
+STAGE_FUNCS = {
+    "prices": stage_prices,
+    "indicators": stage_indicators,
+    "signals": stage_signals,
+    "correlations": stage_correlations,
+    "supply-demand": stage_supply_demand,
+    "output": stage_output,
+    "archive": stage_archive,
+}
+
+
+def run(args):
+    """The selected stages in pipeline order, each inside a profiling stage."""
+    from stage_cache import STAGE_DIR, StageCache
+
+    # 가져올 범위만 벽시계 기준 — 이력/1년 구간은 마지막 봉에서 잘라낸다 (window_start)
+    end = datetime.now()
+    ctx = {"end": end, "start_full": end - timedelta(days=HISTORY_DAYS + FETCH_SLACK_DAYS),
+           "cache": StageCache(args.stage_dir or STAGE_DIR)}
+    selected = set(args.stages or STAGES)
+    code = None
+    for name in STAGES:
+        if name in selected:
+            with stage(name):
+                result = STAGE_FUNCS[name](args, ctx)
+            code = result if result is not None else code
+    return code
+
+
+def run_stream(args):
+    """Intraday mode: daily KOSPI history, then streaming.run over the minute bars."""
+    import streaming
+
+    source = streaming.open_source(args.stream, speed=args.replay_speed)
+    end = datetime.now() + timedelta(days=1)
+    print(f"Streaming {args.stream} → {streaming.INTRADAY_PATH} …")
+    with stage("prices"):
+        # 오늘(진행 중) 일봉은 세션에서 분봉으로 다시 만든다 — IntradaySession 이 세션일 이전만 쓴다
+        daily = download(TICKERS["kospi"], end - timedelta(days=HISTORY_DAYS), end)
+    os.makedirs(os.path.dirname(streaming.INTRADAY_PATH), exist_ok=True)
+    with stage("stream"):
+        session = streaming.run(daily, source, interval=args.stream_interval or streaming.SNAPSHOT_INTERVAL)
+    print(f"[OK] {streaming.INTRADAY_PATH}: {session.snapshots} snapshots")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    configure_prices(args)
+    recorder = profiling.start(trace_memory=args.trace_memory)
+    status, code = "error", None
+    try:
+        with profiling.profiled(args.profile):
+            code = run_stream(args) if args.stream else run(args)
+        status = "unchanged" if code == publish.EXIT_UNCHANGED else "ok"
+    finally:
+        # 실패한 실행도 어느 단계에서 멈췄는지 남도록 finally 에서 쓴다
+        if args.report:
+            os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+            write_json(args.report, recorder.report(status=status, profile=args.profile))
+            slowest = sorted(recorder.summary().items(), key=lambda kv: -kv[1]["wall"])[:3]
+            print(f"[OK] {args.report} written (" +
+                  ", ".join(f"{k} {v['wall']:.2f}s" for k, v in slowest) + ")")
+        profiling.stop()
+    if code:
+        sys.exit(code)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,133 @@
+"""
+KOSPI Strategy Dashboard - Level-of-detail series for long lookbacks
+Multi-year views would push thousands of daily points per series into the
+charts. For each lookback this stage emits OHLCV at the finest resolution
+(daily → weekly → monthly) that fits the point budget, resampled properly
+(first open, max high, min low, last close, summed volume), plus indicator
+lines downsampled with LTTB (Largest-Triangle-Three-Buckets) to the same
+budget. Indicators are computed on daily bars first, so a downsampled MA240
+is still the daily MA240, not an MA of weekly closes.
+
+Document section:
+    "lod": {"5y": {"resolution": "weekly", "start": "YYYY-MM-DD", "budget": 500,
+                   "ohlcv": [{date, open, high, low, close, volume}, ...],
+                   "indicators": {name: [{date, value}, ...]}}, ...}
+
+Resampled bars are dated by the last trading day in their period.
+"""
+
+import numpy as np
+import pandas as pd
+
+LOOKBACKS = {"5y": 5, "10y": 10, "20y": 20}     # 이름 → 연수
+POINT_BUDGET = 500
+WARMUP_YEARS = 1.5                              # MA240 워밍업용 추가 이력
+
+# 고해상도부터 — 예산 안에 들어오는 첫 해상도를 쓴다
+RESOLUTIONS = [("daily", None), ("weekly", "W-FRI"), ("monthly", "ME")]
+
+INDICATORS = ["ma5", "ma20", "ma60", "ma120", "ma240", "bb_upper", "bb_middle", "bb_lower",
+              "rsi14", "macd", "macd_signal", "macd_hist", "obv"]
+
+
+def _num(v):
+    return float(v) if np.isfinite(v) else None
+
+
+def resample_ohlcv(df, rule):
+    """Aggregate daily OHLCV to `rule` periods, labelled by their last trading day."""
+    g = df[["Open", "High", "Low", "Close", "Volume"]].resample(rule)
+    out = pd.DataFrame({
+        "Open": g["Open"].first(),
+        "High": g["High"].max(),
+        "Low": g["Low"].min(),
+        "Close": g["Close"].last(),
+        "Volume": g["Volume"].sum(),
+    })
+    out.index = pd.DatetimeIndex(df.index.to_series().resample(rule).last())
+    return out[out["Close"].notna()]
+
+
+def lttb(x, y, n):
+    """Indices of the `n` points LTTB keeps from (x, y); all indices if n >= len."""
+    size = len(x)
+    if n >= size or n < 3:
+        return np.arange(size)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # 첫/끝 점은 고정, 나머지를 n-2 개 버킷으로 나눈다
+    every = (size - 2) / (n - 2)
+    edges = np.append((np.arange(n - 1) * every).astype(np.int64) + 1, size)
+    keep = np.empty(n, dtype=np.int64)
+    keep[0], keep[-1] = 0, size - 1
+
+    # 다음 버킷 평균점은 선택 결과와 무관하므로 한 번에 계산
+    counts = np.diff(edges[1:])
+    cx = np.add.reduceat(x, edges[1:-1]) / counts
+    cy = np.add.reduceat(y, edges[1:-1]) / counts
+
+    a = 0
+    for i in range(n - 2):
+        lo, hi = edges[i], edges[i + 1]
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - cx[i]) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (cy[i] - ay))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def downsample(series, budget=POINT_BUDGET):
+    """[{date, value}] of the finite points of `series`, LTTB-reduced to `budget`."""
+    s = series[np.isfinite(series.to_numpy(dtype=float))]
+    if s.empty:
+        return []
+    x = s.index.to_numpy(dtype="datetime64[D]").astype(np.int64)
+    idx = lttb(x, s.to_numpy(dtype=float), budget)
+    dates = s.index[idx].strftime("%Y-%m-%d")
+    return [{"date": d, "value": _num(v)} for d, v in zip(dates, s.to_numpy(dtype=float)[idx])]
+
+
+def _ohlcv_rows(bars):
+    return [
+        {"date": d, "open": _num(o), "high": _num(h), "low": _num(l), "close": _num(c),
+         "volume": int(v) if np.isfinite(v) else 0}
+        for d, o, h, l, c, v in zip(bars.index.strftime("%Y-%m-%d"),
+                                    *(bars[k].to_numpy(dtype=float)
+                                      for k in ("Open", "High", "Low", "Close", "Volume")))
+    ]
+
+
+def build_lod(df, end, lookbacks=LOOKBACKS, budget=POINT_BUDGET):
+    """LOD section from a long daily frame with compute_indicators() columns.
+
+    Windows reach back from `end` — pass the last bar (df.index[-1]), not
+    the clock, so a rerun on a non-trading day builds the same section.
+    """
+    out = {}
+    for name, years in lookbacks.items():
+        window = df[df.index >= pd.Timestamp(end) - pd.DateOffset(years=years)]
+        if window.empty:
+            continue
+        for resolution, rule in RESOLUTIONS:
+            bars = window if rule is None else resample_ohlcv(window, rule)
+            if len(bars) <= budget:
+                break
+        out[name] = {
+            "resolution": resolution,
+            "start": window.index[0].strftime("%Y-%m-%d"),
+            "budget": budget,
+            "ohlcv": _ohlcv_rows(bars),
+            "indicators": {k: downsample(window[k], budget) for k in INDICATORS if k in window},
+        }
+    return out
+
+
+def history_start(end, lookbacks=LOOKBACKS):
+    """Download start that covers the longest lookback plus indicator warm-up."""
+    return pd.Timestamp(end) - pd.DateOffset(days=int(365.25 * (max(lookbacks.values()) + WARMUP_YEARS)))
+
+
+def anchor_history(df, lookbacks=LOOKBACKS):
+    """Rows from history_start(last bar) — the download range follows the clock, the indicator seeds the data."""
+    return df[df.index >= history_start(df.index[-1].normalize(), lookbacks)]
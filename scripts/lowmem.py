@@ -0,0 +1,89 @@
+"""
+KOSPI Strategy Dashboard - Low-memory mode
+Helpers behind --low-memory (fetch_data.py, batch.py) for universe-scale runs
+on small CI runners:
+
+- DECIMALS is the output precision of every price-like column; downcast()
+  stores a column rounded to it as float32 when float32's rounding error
+  (|x|·2⁻²⁴) stays under a quarter of that last decimal, so rounding the
+  float32 value again recovers it exactly. OBV and Volume (large integers)
+  always stay 64-bit.
+- frame() assembles a DataFrame from existing arrays without copying them
+  (pandas keeps one block per column instead of consolidating).
+- restore() / widen() turn float32 data back into float64 rounded to
+  DECIMALS: prices before they feed the indicator kernel (exact for prices
+  quoted to PRICE_DECIMALS) and the small 1-year slice before the dashboard
+  sections are derived from it.
+- release() drops freed intermediates between pipeline stages.
+
+Values written in this mode are the float64 results rounded to DECIMALS
+(np.round, half-to-even on the scaled value); downstream sections (signals,
+metrics, 52-week range) are derived from those rounded values, so a result
+that sits on a threshold may differ from the default mode. See
+benchmarks/bench_memory.py for the mismatch count.
+"""
+
+import gc
+
+import numpy as np
+
+PRICE_DECIMALS = 2
+DECIMALS = {
+    **{c: PRICE_DECIMALS for c in ("Open", "High", "Low", "Close", "vkospi")},
+    **{f"ma{p}": PRICE_DECIMALS for p in (5, 20, 60, 120, 240)},
+    **{c: PRICE_DECIMALS for c in ("bb_middle", "bb_upper", "bb_lower")},
+    "rsi14": 2,
+    **{c: 4 for c in ("macd", "macd_signal", "macd_hist")},
+}
+_F32_REL = 2.0 ** -24                        # float32 반올림 상대 오차 상한
+
+
+def fits_float32(values, decimals):
+    """True if float32 keeps `values` well within `decimals` places."""
+    arr = np.asarray(values)
+    finite = arr[np.isfinite(arr)]
+    if finite.size == 0:
+        return True
+    return float(np.abs(finite).max()) * _F32_REL < 0.25 * 10.0 ** -decimals
+
+
+def frame(columns, index):
+    """DataFrame over {name: array} without copying the arrays."""
+    import pandas as pd
+
+    return pd.DataFrame(columns, index=index, copy=False)
+
+
+def column(name, values, decimals=DECIMALS):
+    """float32 copy of `values` rounded to decimals[name] when the column fits, else `values`."""
+    if name in decimals and values.dtype == np.float64 and fits_float32(values, decimals[name]):
+        # 먼저 반올림해 두면 restore()/widen() 의 재반올림이 같은 값을 정확히 돌려준다
+        return np.round(values, decimals[name]).astype(np.float32)
+    return values
+
+
+def downcast(df, decimals=DECIMALS):
+    """`df` with every DECIMALS column that fits stored as float32 (others shared)."""
+    return frame({name: column(name, df[name].to_numpy(), decimals) for name in df.columns}, df.index)
+
+
+def restore(name, values, decimals=DECIMALS):
+    """float64 `values`, rounded back to decimals[name] when stored as float32."""
+    out = np.asarray(values, dtype=np.float64)
+    return np.round(out, decimals[name]) if values.dtype == np.float32 else out
+
+
+def widen(df, decimals=DECIMALS):
+    """float64 copy of `df` with every DECIMALS column rounded to its decimals."""
+    cols = {}
+    for name in df.columns:
+        values = df[name].to_numpy()
+        if name in decimals and values.dtype.kind == "f":
+            values = np.round(values.astype(np.float64), decimals[name])
+        cols[name] = values
+    return frame(cols, df.index)
+
+
+def release():
+    """Collect the intermediates a finished stage left behind."""
+    gc.collect()
@@ -0,0 +1,62 @@
+"""
+KOSPI Strategy Dashboard - NAVER investorDealTrendDay page parser
+Parses the EUC-KR response bytes directly (all markup the parser needs is
+ASCII), with patterns compiled once at import. Rows are yielded lazily so the
+caller can stop at its cutoff date without scanning the rest of the page.
+
+The row pattern uses possessive quantifiers, so a malformed row fails at the
+broken cell instead of backtracking through every earlier cell.
+"""
+
+import re
+from datetime import date
+
+# (키, NAVER 컬럼명) — 페이지의 숫자 컬럼 순서
+INVESTOR_COLUMNS = [
+    ("individual",          "개인"),
+    ("foreign",             "외국인"),
+    ("institution",         "기관계"),
+    ("financialInvestment", "금융투자"),
+    ("insurance",           "보험"),
+    ("investmentTrust",     "투신(사모)"),
+    ("bank",                "은행"),
+    ("otherFinancial",      "기타금융"),
+    ("pension",             "연기금등"),
+    ("otherCorporate",      "기타법인"),
+]
+INVESTOR_KEYS = [k for k, _ in INVESTOR_COLUMNS]
+
+# 소유 수량자(*+, ++)로 셀 경계 밖 되추적을 막는다 (Python 3.11+)
+ROW_RE = re.compile(
+    rb'<td class="date2">(\d{2})\.(\d{2})\.(\d{2})</td>'
+    + rb'\s*+<td[^>]*+>([\d,\-]++)</td>' * len(INVESTOR_COLUMNS)
+)
+
+
+def _to_int(raw):
+    try:
+        return int(raw.replace(b",", b""))
+    except ValueError:
+        return 0
+
+
+def iter_rows(content):
+    """Yield {"date": "YYYY-MM-DD", <investor key>: 억원, ...} newest first.
+
+    Rows whose date is invalid or that lack any of the ten numeric cells are
+    skipped, as the previous regex did.
+    """
+    for m in ROW_RE.finditer(content):
+        yy, mm, dd, *cells = m.groups()
+        try:
+            day = date(2000 + int(yy), int(mm), int(dd))
+        except ValueError:
+            continue
+        row = {"date": day.isoformat()}
+        row.update(zip(INVESTOR_KEYS, map(_to_int, cells)))
+        yield row
+
+
+def parse_page(content):
+    """All rows of one page as a list (newest first)."""
+    return list(iter_rows(content))
@@ -0,0 +1,302 @@
+"""
+KOSPI Strategy Dashboard - Price download layer
+Fetches OHLCV for a list of tickers concurrently through a pluggable provider,
+with an on-disk per-ticker cache in front so overlapping date ranges are never
+downloaded twice.
+
+Providers implement ``fetch(tickers, start, end) -> {ticker: DataFrame}``:
+  - YFinanceProvider: one batched multi-ticker yf.download call
+  - FixtureProvider : CSV files from a local directory (offline runs/tests)
+A provider that must not be called from several threads at once sets
+``concurrent = False``; PriceLoader then makes one batched request for the
+union of the missing ranges instead of one request per range in a pool.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from profiling import count, stage
+from state_store import frame_from_npz, frame_to_arrays
+
+CACHE_DIR = ".cache/ohlcv"
+CACHE_TTL = 6 * 3600        # 초 — 이보다 오래된 캐시는 최근 구간을 다시 받는다
+REFRESH_DAYS = 7            # TTL 만료 시 재다운로드하는 최근 구간 (잠정치 수정 반영)
+REVISION_RTOL = 1e-6        # 다시 받은 구간의 가격이 이보다 다르면 과거 전체가 재조정된 것으로 본다
+PRICE_COLUMNS = ["Open", "High", "Low", "Close"]
+
+
+def _clean(df):
+    if df is None or df.empty or "Close" not in df.columns:
+        return pd.DataFrame()
+    df = df.dropna(subset=["Close"])
+    df.index = pd.DatetimeIndex(df.index).tz_localize(None)
+    return df
+
+
+# ---------------------------------------------------------------------------
+# Providers
+# ---------------------------------------------------------------------------
+
+class YFinanceProvider:
+    """Batched yfinance backend (auto_adjust=True, like the original download())."""
+
+    # yf.download 는 결과·오류를 모듈 전역(shared._DFS / _ERRORS)에 모은다 — 동시에 부르면
+    # 서로의 프레임을 지우거나 섞으므로 요청은 한 번에 하나 (티커 병렬화는 threads=True 가 한다)
+    concurrent = False
+
+    def fetch(self, tickers, start, end):
+        import yfinance as yf
+
+        raw = yf.download(list(tickers), start=start, end=end, progress=False,
+                          auto_adjust=True, group_by="ticker", threads=True)
+        out = {}
+        for t in tickers:
+            if isinstance(raw.columns, pd.MultiIndex):
+                df = raw[t] if t in raw.columns.get_level_values(0) else pd.DataFrame()
+            else:
+                df = raw
+            out[t] = _clean(df.copy())
+        return out
+
+
+class FixtureProvider:
+    """Serves `<directory>/<ticker>.csv` (Date index + OHLCV columns) offline."""
+
+    concurrent = True
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.calls = 0
+
+    def path(self, ticker):
+        return os.path.join(self.directory, ticker.replace("^", "_") + ".csv")
+
+    def fetch(self, tickers, start, end):
+        self.calls += 1
+        out = {}
+        for t in tickers:
+            if not os.path.exists(self.path(t)):
+                out[t] = pd.DataFrame()
+                continue
+            df = pd.read_csv(self.path(t), index_col=0, parse_dates=True)
+            out[t] = _clean(df[(df.index >= pd.Timestamp(start)) & (df.index < pd.Timestamp(end))])
+        return out
+
+
+# ---------------------------------------------------------------------------
+# On-disk cache
+# ---------------------------------------------------------------------------
+
+class OHLCVCache:
+    """Per-ticker npz files remembering the requested range they cover."""
+
+    def __init__(self, directory=CACHE_DIR, ttl=CACHE_TTL):
+        self.directory = directory
+        self.ttl = ttl
+
+    def path(self, ticker):
+        return os.path.join(self.directory, ticker.replace("^", "_") + ".npz")
+
+    def load(self, ticker):
+        """(DataFrame, meta) or (None, None) when nothing usable is cached."""
+        p = self.path(ticker)
+        if not os.path.exists(p):
+            return None, None
+        try:
+            with np.load(p) as npz:
+                meta = json.loads(npz["meta"].tobytes().decode("utf-8"))
+                df = frame_from_npz(npz, "ohlcv") if "ohlcv/index" in npz.files else pd.DataFrame()
+        except (OSError, ValueError, KeyError):
+            return None, None
+        return df, meta
+
+    def store(self, ticker, df, start, end, fetched_at=None):
+        """Cache `df` as covering [start, end) — one contiguous range, fetched at `fetched_at`."""
+        arrays = frame_to_arrays("ohlcv", df) if not df.empty else {}
+        meta = {"start": pd.Timestamp(start).isoformat(), "end": pd.Timestamp(end).isoformat(),
+                "fetchedAt": time.time() if fetched_at is None else fetched_at}
+        arrays["meta"] = np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8)
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = self.path(ticker) + ".tmp.npz"
+        np.savez_compressed(tmp, **arrays)
+        os.replace(tmp, self.path(ticker))
+
+    def missing(self, meta, start, end):
+        """Sub-ranges of [start, end) that the cached entry does not cover."""
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        if meta is None:
+            return [(start, end)]
+        c_start, c_end = pd.Timestamp(meta["start"]), pd.Timestamp(meta["end"])
+        gaps = []
+        if start < c_start:
+            gaps.append((start, min(c_start, end)))
+        stale = time.time() - meta["fetchedAt"] > self.ttl
+        tail_from = c_end - timedelta(days=REFRESH_DAYS) if stale else c_end
+        if end > tail_from and (end > c_end or stale):
+            gaps.append((max(tail_from, start), end))
+        return gaps
+
+
+def coverage(meta, start, end, gaps):
+    """(start, end, fetchedAt) the cache covers after fetching `gaps` of [start, end).
+
+    The cached range is only extended when the request overlaps or touches
+    it (missing() then fetched everything in between); a disjoint request
+    replaces it, so a hole between the two is never recorded as covered.
+    fetchedAt moves only when a gap reached the end of the covered range —
+    a head-only gap does not make stale recent bars fresh.
+    """
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    if meta is None:
+        return start, end, time.time()
+    c_start, c_end = pd.Timestamp(meta["start"]), pd.Timestamp(meta["end"])
+    if start > c_end or end < c_start:
+        return start, end, time.time()
+    c_start, c_end = min(start, c_start), max(end, c_end)
+    tail_fetched = any(pd.Timestamp(e) >= c_end for _, e in gaps)
+    return c_start, c_end, time.time() if tail_fetched else meta["fetchedAt"]
+
+
+def revised(cached, fresh):
+    """True if re-downloaded bars disagree with the cached ones (auto_adjust revision).
+
+    The last cached bar is left out — it may be a provisional intraday bar,
+    which is what the TTL refresh is there to correct.
+    """
+    if cached is None or cached.empty or len(cached) < 2:
+        return False
+    older = cached.iloc[:-1]
+    for df in fresh:
+        common = older.index.intersection(df.index)
+        cols = [c for c in PRICE_COLUMNS if c in older.columns and c in df.columns]
+        if len(common) and cols:
+            a = older.loc[common, cols].to_numpy(dtype=float)
+            b = df.loc[common, cols].to_numpy(dtype=float)
+            if not np.allclose(a, b, rtol=REVISION_RTOL, atol=0.0, equal_nan=True):
+                return True
+    return False
+
+
+def _merge(*frames):
+    frames = [f for f in frames if f is not None and not f.empty]
+    if not frames:
+        return pd.DataFrame()
+    df = pd.concat(frames)
+    return df[~df.index.duplicated(keep="last")].sort_index()
+
+
+# ---------------------------------------------------------------------------
+# Loader
+# ---------------------------------------------------------------------------
+
+class PriceLoader:
+    """Concurrent, cached OHLCV downloads for a configurable ticker list."""
+
+    def __init__(self, provider=None, cache=None, max_workers=4):
+        self.provider = provider or YFinanceProvider()
+        self.cache = cache
+        self.max_workers = max_workers
+
+    def _download(self, tickers, start, end):
+        # provider 호출 한 번 = 요청 한 번 (yfinance 는 여러 티커를 한 번에 받는다)
+        count("prices.requests")
+        with stage("download", tickers=list(tickers), range=[str(start.date()), str(end.date())]) as rec:
+            frames = self.provider.fetch(tickers, start, end)
+            rec["rows"] = {t: len(df) for t, df in frames.items()}
+        return frames
+
+    def _fetch_gaps(self, gaps):
+        """{ticker: [frames]}, {ticker: error} for {ticker: [(start, end), ...]}."""
+        if not getattr(self.provider, "concurrent", True):
+            return self._fetch_union(gaps)
+
+        # 같은 구간이 빠진 티커끼리 묶어 한 번에 요청
+        groups = {}
+        for t, ranges in gaps.items():
+            for rng in ranges:
+                groups.setdefault(rng, []).append(t)
+
+        fetched = {t: [] for t in gaps}
+        errors = {}
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as pool:
+            futures = {pool.submit(self._download, ts, s, e): ts for (s, e), ts in groups.items()}
+            for fut, ts in futures.items():
+                try:
+                    for t, df in fut.result().items():
+                        fetched[t].append(df)
+                except Exception as exc:
+                    for t in ts:
+                        errors[t] = exc
+        return fetched, errors
+
+    def _fetch_union(self, gaps):
+        """_fetch_gaps in one request: the union range for every ticker with a gap, sliced per gap."""
+        tickers = [t for t, ranges in gaps.items() if ranges]
+        fetched = {t: [] for t in gaps}
+        if not tickers:
+            return fetched, {}
+        start = min(s for t in tickers for s, _ in gaps[t])
+        end = max(e for t in tickers for _, e in gaps[t])
+        try:
+            frames = self._download(tickers, start, end)
+        except Exception as exc:
+            return fetched, {t: exc for t in tickers}
+        for t in tickers:
+            df = frames.get(t, pd.DataFrame())
+            # 빠진 구간만 넘겨 구간별 요청과 같은 결과가 되게 한다 (캐시와 겹치는 봉은 버린다)
+            fetched[t] = [df[(df.index >= s) & (df.index < e)] for s, e in gaps[t]] if not df.empty else [df]
+        return fetched, {}
+
+    def fetch(self, tickers, start, end, refresh=False):
+        """{ticker: DataFrame} for [start, end); failed tickers map to an empty frame.
+
+        refresh=True ignores the cached bars: [start, end) is downloaded again
+        and replaces the cache entry (full rebuilds after a detected revision).
+        """
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        cached, metas, gaps = {}, {}, {}
+        for t in tickers:
+            if self.cache is not None and not refresh:
+                cached[t], metas[t] = self.cache.load(t)
+                gaps[t] = self.cache.missing(metas[t], start, end)
+            else:
+                cached[t], metas[t] = None, None
+                gaps[t] = [(start, end)]
+
+        count("prices.cacheHits", sum(1 for t in tickers if not gaps[t]))
+        fetched, errors = self._fetch_gaps(gaps)
+
+        # 다시 받은 최근 구간이 캐시와 다르면 (배당/분할 auto_adjust) 과거 전체를 새로 받는다 —
+        # 최근 구간만 덮어쓰면 재조정된 가격이 낡은 과거 가격에 이어 붙는다
+        redo = {}
+        for t in tickers:
+            if t not in errors and revised(cached[t], fetched[t]):
+                meta = metas[t]
+                redo[t] = [(min(start, pd.Timestamp(meta["start"])), max(end, pd.Timestamp(meta["end"])))]
+        if redo:
+            print(f"  {', '.join(redo)}: cached prices revised upstream → full refetch")
+            count("prices.revisions", len(redo))
+            refetched, redo_errors = self._fetch_gaps(redo)
+            for t in redo:
+                cached[t], metas[t], gaps[t] = None, None, redo[t]
+                fetched[t] = refetched[t]
+                if t in redo_errors:
+                    errors[t] = redo_errors[t]
+
+        out = {}
+        for t in tickers:
+            merged = _merge(cached[t], *fetched[t])
+            if self.cache is not None and gaps[t] and t not in errors and not merged.empty:
+                c_start, c_end, fetched_at = coverage(metas[t], start, end, gaps[t])
+                covered = merged[(merged.index >= c_start) & (merged.index < c_end)]
+                self.cache.store(t, covered, c_start, c_end, fetched_at)
+            if t in errors and merged.empty:
+                print(f"  {t}: download failed ({errors[t]})")
+            out[t] = merged[(merged.index >= start) & (merged.index < end)] if not merged.empty else merged
+        return out
@@ -0,0 +1,218 @@
+"""
+KOSPI Strategy Dashboard - Run instrumentation
+Stage timers and counters for the fetch pipeline, collected into a
+machine-readable run report (.cache/run_report.json by default):
+
+- stage(name, **attrs) is a context manager, timed(name) the decorator form.
+  Each stage records wall/CPU time, the thread it ran on, resident memory at
+  exit and — when tracemalloc is on (--trace-memory) — the peak traced
+  allocation while it was open. Stages nest ("prices/download") and may
+  overlap across threads.
+- count(name, n) bumps a counter (HTTP requests, bytes, cache hits …).
+- profiled(path) wraps a block in cProfile and dumps the stats.
+
+Nothing is recorded until main() installs a Recorder with start(); without
+one stage() is a shared no-op context, so library callers (batch.py, the
+benchmarks) pay only a global lookup. cProfile sees the main thread only;
+downloads and NAVER pages running on pools show up in the stage records.
+"""
+
+import contextlib
+import functools
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:                          # Windows — 최대 RSS 는 기록하지 않는다
+    resource = None
+
+RECORDER = None
+
+
+class _NoStage:
+    """Context returned by stage() when nothing is recording."""
+
+    def __enter__(self):
+        return {}                            # 호출자가 속성을 써도 버려지는 빈 레코드
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _NoStage()
+
+
+# ---------------------------------------------------------------------------
+# Memory probes
+# ---------------------------------------------------------------------------
+
+def rss_bytes():
+    """Current resident set size (Linux /proc), else None."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def max_rss_bytes():
+    """Peak resident set size of the process so far, else None."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024      # Linux 는 KB 단위
+
+
+# ---------------------------------------------------------------------------
+# Recorder
+# ---------------------------------------------------------------------------
+
+class Recorder:
+    """Collects stage records and counters for one run (thread-safe)."""
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.started = time.perf_counter()
+        self.started_at = datetime.now()
+        self.stages = []
+        self.counters = {}
+        self._open = []                      # tracemalloc 최대치를 나눠 받을 열린 stage 들
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _fold_peak(self):
+        # 전역 최대치를 열린 stage 모두에 반영한 뒤 리셋 — 중첩/동시 stage 가 서로의 값을 지우지 않는다
+        peak = tracemalloc.get_traced_memory()[1]
+        for rec in self._open:
+            rec["tracemallocPeak"] = max(rec["tracemallocPeak"], peak)
+        tracemalloc.reset_peak()
+
+    @contextlib.contextmanager
+    def stage(self, name, **attrs):
+        stack = self._local.__dict__.setdefault("stack", [])
+        path = "/".join(stack + [name])
+        rec = {"stage": path, "thread": threading.current_thread().name, **attrs}
+        if self.trace_memory:
+            with self._lock:
+                self._fold_peak()
+                rec["tracemallocPeak"] = tracemalloc.get_traced_memory()[0]
+                self._open.append(rec)
+        stack.append(name)
+        t0, c0 = time.perf_counter(), time.thread_time()
+        try:
+            yield rec                        # 호출자가 rows/bytes 등 결과 속성을 덧붙일 수 있다
+        finally:
+            wall, cpu = time.perf_counter() - t0, time.thread_time() - c0
+            stack.pop()
+            rec.update(start=round(t0 - self.started, 6), wall=round(wall, 6), cpu=round(cpu, 6),
+                       rss=rss_bytes())
+            with self._lock:
+                if self.trace_memory:
+                    self._fold_peak()
+                    self._open.remove(rec)
+                self.stages.append(rec)
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def summary(self):
+        """{stage: {calls, wall, cpu, maxWall}} totals in first-seen order."""
+        out = {}
+        for rec in sorted(self.stages, key=lambda r: r["start"]):
+            s = out.setdefault(rec["stage"], {"calls": 0, "wall": 0.0, "cpu": 0.0, "maxWall": 0.0})
+            s["calls"] += 1
+            s["wall"] += rec["wall"]
+            s["cpu"] += rec["cpu"]
+            s["maxWall"] = max(s["maxWall"], rec["wall"])
+        for s in out.values():
+            s["wall"], s["cpu"] = round(s["wall"], 6), round(s["cpu"], 6)
+        return out
+
+    def report(self, **extra):
+        report = {
+            "startedAt": self.started_at.isoformat(timespec="seconds"),
+            "wall": round(time.perf_counter() - self.started, 6),
+            "argv": sys.argv[1:],
+            "python": sys.version.split()[0],
+            "maxRss": max_rss_bytes(),
+            "counters": {k: round(v, 6) if isinstance(v, float) else v for k, v in sorted(self.counters.items())},
+            "summary": self.summary(),
+            "stages": sorted(self.stages, key=lambda r: r["start"]),
+            **extra,
+        }
+        if self.trace_memory:
+            report["tracemallocPeak"] = max((r["tracemallocPeak"] for r in self.stages), default=0)
+        return report
+
+
+# ---------------------------------------------------------------------------
+# Module-level API (no-op until start())
+# ---------------------------------------------------------------------------
+
+def start(trace_memory=False):
+    """Install and return a fresh Recorder for this process."""
+    global RECORDER
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    RECORDER = Recorder(trace_memory)
+    return RECORDER
+
+
+def stop():
+    """Uninstall the Recorder (and tracemalloc, if start() turned it on)."""
+    global RECORDER
+    if RECORDER is not None and RECORDER.trace_memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    RECORDER = None
+
+
+def stage(name, **attrs):
+    rec = RECORDER
+    return _NOOP if rec is None else rec.stage(name, **attrs)
+
+
+def count(name, n=1):
+    rec = RECORDER
+    if rec is not None:
+        rec.count(name, n)
+
+
+def timed(name=None):
+    """Decorator: run the function inside stage(name or func.__name__)."""
+    def wrap(fn):
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            if RECORDER is None:
+                return fn(*args, **kwargs)
+            with RECORDER.stage(label):
+                return fn(*args, **kwargs)
+        return inner
+    return wrap
+
+
+@contextlib.contextmanager
+def profiled(path, top=25):
+    """cProfile the block; dump stats to `path` and print the top entries."""
+    if not path:
+        yield
+        return
+    import cProfile
+    import pstats
+
+    prof = cProfile.Profile()
+    prof.enable()
+    try:
+        yield
+    finally:
+        prof.disable()
+        prof.dump_stats(path)
+        print(f"\n[profile] {path} written — top {top} by cumulative time:")
+        pstats.Stats(prof).sort_stats("cumulative").print_stats(top)
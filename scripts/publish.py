@@ -0,0 +1,148 @@
+"""
+KOSPI Strategy Dashboard - Output publishing
+Decides whether a run has anything new to publish and prepares the static
+files for the host:
+
+- content_hash() is a sha256 over the encoded document with the volatile
+  members (metadata.lastUpdated, manifest "generated") left out, plus the
+  options that change the written bytes. It is kept in HASH_PATH next to
+  the data; when a run produces the same hash and every output file still
+  exists, fetch_data.py writes nothing and exits with EXIT_UNCHANGED, so the
+  cron workflow skips its commit and the deploy it would trigger.
+- precompress() writes <file>.gz (and <file>.br when the optional brotli
+  package is installed) next to each output for hosts that serve
+  precompressed variants (nginx gzip_static/brotli_static, Netlify, S3 +
+  CloudFront). The gzip header carries no name or mtime, so unchanged
+  content gives byte-identical variants.
+
+Every file goes through a temp file + os.replace(), so readers never see a
+partial write.
+
+    python scripts/publish.py --precompress dist/data   # variants for a built site
+"""
+
+import argparse
+import gzip
+import hashlib
+import os
+
+from serialize import iter_encode
+
+try:
+    import brotli
+except ImportError:                          # 선택 의존성 — 없으면 .gz 만 만든다
+    brotli = None
+
+HASH_PATH = "public/data/content.sha256"
+EXIT_UNCHANGED = 3          # 1 = 예외, 2 = argparse 사용법 오류
+# 실행마다 달라지는 멤버 (경로) — 해시에서 뺀다
+VOLATILE = [("metadata", "lastUpdated"), ("generated",)]
+VARIANTS = (".gz", ".br")
+COMPRESSIBLE = (".json", ".bin")
+
+
+# ---------------------------------------------------------------------------
+# Change detection
+# ---------------------------------------------------------------------------
+
+def _without(doc, path):
+    if not isinstance(doc, dict) or path[0] not in doc:
+        return doc
+    if len(path) == 1:
+        return {k: v for k, v in doc.items() if k != path[0]}
+    return {**doc, path[0]: _without(doc[path[0]], path[1:])}
+
+
+def stable_view(doc, volatile=VOLATILE):
+    """`doc` without its volatile members (shallow copies; `doc` is untouched)."""
+    for path in volatile:
+        doc = _without(doc, path)
+    return doc
+
+
+def content_hash(doc, options=None, backend="auto"):
+    """sha256 hex of the stable content of `doc` and the write `options`."""
+    h = hashlib.sha256()
+    for piece in iter_encode({"options": options or {}, "document": stable_view(doc)}, backend):
+        h.update(piece)
+    return h.hexdigest()
+
+
+def _atomic(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def unchanged(digest, outputs, path=HASH_PATH):
+    """True if `digest` is the recorded hash and every file in `outputs` exists."""
+    try:
+        with open(path, encoding="ascii") as f:
+            recorded = f.read().strip()
+    except OSError:
+        return False
+    return recorded == digest and all(os.path.exists(p) for p in outputs)
+
+
+def record(digest, path=HASH_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    _atomic(path, (digest + "\n").encode("ascii"))
+
+
+# ---------------------------------------------------------------------------
+# Precompressed variants
+# ---------------------------------------------------------------------------
+
+def precompress(paths, level=9):
+    """Write .gz (and .br) next to each file; returns {variant path: bytes}."""
+    written = {}
+    for path in paths:
+        with open(path, "rb") as f:
+            data = f.read()
+        # mtime=0, 파일명 없음 → 같은 내용이면 같은 바이트 (git 에 변경이 생기지 않는다)
+        variants = {path + ".gz": gzip.compress(data, compresslevel=level, mtime=0)}
+        if brotli is not None:
+            variants[path + ".br"] = brotli.compress(data, quality=11 if level >= 9 else 5)
+        for out, blob in variants.items():
+            _atomic(out, blob)
+            written[out] = len(blob)
+    return written
+
+
+def prune_variants(directory):
+    """Delete .gz/.br files whose source file no longer exists; returns their paths."""
+    removed = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            base, ext = os.path.splitext(name)
+            if ext in VARIANTS and base not in files:
+                os.remove(os.path.join(root, name))
+                removed.append(os.path.join(root, name))
+    return removed
+
+
+def compressible(directory):
+    """Every .json/.bin file under `directory`."""
+    return sorted(os.path.join(root, name) for root, _, files in os.walk(directory)
+                  for name in files if name.endswith(COMPRESSIBLE))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Write precompressed .gz/.br variants of the data files")
+    ap.add_argument("--precompress", required=True, metavar="DIR",
+                    help="directory to scan for .json/.bin files (e.g. dist/data)")
+    ap.add_argument("--level", type=int, default=9, help="gzip level (default: 9)")
+    args = ap.parse_args(argv)
+
+    prune_variants(args.precompress)
+    paths = compressible(args.precompress)
+    written = precompress(paths, args.level)
+    raw = sum(os.path.getsize(p) for p in paths)
+    gz = sum(n for p, n in written.items() if p.endswith(".gz"))
+    print(f"[OK] {len(paths)} files precompressed: {raw // 1024} KB → gzip {gz // 1024} KB"
+          + ("" if brotli is not None else " (brotli not installed: .br skipped)"))
+
+
+if __name__ == "__main__":
+    main()
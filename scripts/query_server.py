@@ -0,0 +1,397 @@
+"""
+KOSPI Strategy Dashboard - Local query server
+Optional asyncio HTTP service over the computed market_data.json for clients
+that need a slice of it (the last week, one indicator) instead of the whole
+year. Standard library only:
+
+    python scripts/query_server.py [--data public/data/market_data.json] [--port 8787]
+
+The document (row or columnar layout) is loaded once into Tables: a sorted
+datetime64[D] index plus one array per field (float64 with NaN for null,
+int64, or a plain list for text). Queries slice with np.searchsorted on the
+index, so a range costs O(log n + rows returned).
+
+    GET /                                  tables, fields, date ranges, sections
+    GET /<table>[/<field>]?from=&to=&last=&fields=
+        tables: ohlcv, indicators, signals, correlations/rolling60,
+                comparison/<name>, supplyDemand/<market>
+        e.g. /indicators/rsi14?from=2026-06-01&to=2026-06-30
+             /ohlcv?last=5&fields=close,volume
+    GET /sections/<key>                    a whole non-series section
+                                           (latest, decisionTree, metrics, …)
+
+Responses are columnar JSON ({"table", "count", "dates", <field>: [...]}).
+Each carries a strong ETag (sha1 of the body); If-None-Match → 304. Bodies of
+GZIP_MIN bytes or more are gzip-encoded for clients that accept it. Encoded
+responses are kept in an LRU cache keyed by path + normalized query, so a
+repeated or revalidated query does no slicing or encoding.
+
+A watcher task stats the data file every --reload-interval seconds. When it
+changes (fetch_data.py replaces it atomically), the new document is loaded
+in a worker thread and swapped in with a fresh response cache; a file that
+fails to parse keeps the previous data.
+"""
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import numpy as np
+
+from serialize import dumps, nullable
+
+DATA_PATH = "public/data/market_data.json"
+HOST = "127.0.0.1"
+PORT = 8787
+RELOAD_INTERVAL = 2.0       # 초
+CACHE_SIZE = 1024           # LRU 응답 캐시 항목 수
+GZIP_MIN = 1024             # 바이트 — 이보다 작은 응답은 압축하지 않는다
+MAX_HEADER = 16 * 1024
+
+REASONS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 500: "Internal Server Error"}
+
+
+# ---------------------------------------------------------------------------
+# In-memory tables
+# ---------------------------------------------------------------------------
+
+def _column(values):
+    """float64 (NaN = null) / int64 array for numeric values, else the list itself."""
+    present = [v for v in values if v is not None]
+    if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+        return list(values)
+    if len(present) == len(values) and all(isinstance(v, int) for v in present):
+        return np.asarray(values, dtype=np.int64)
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+
+def _export(col, lo, hi):
+    part = col[lo:hi]
+    if isinstance(part, list):
+        return part
+    return nullable(part) if part.dtype.kind == "f" else part.tolist()
+
+
+class Table:
+    """Date-indexed columns built from [{"date", <field>: value, …}] records."""
+
+    def __init__(self, name, records):
+        records = sorted(records, key=lambda r: r["date"])
+        self.name = name
+        self.date_strs = [r["date"] for r in records]
+        self.index = np.array(self.date_strs, dtype="datetime64[D]")
+        fields = []
+        for r in records:
+            fields.extend(k for k in r if k != "date" and k not in fields)
+        self.columns = {f: _column([r.get(f) for r in records]) for f in fields}
+
+    def bounds(self, start=None, end=None, last=None):
+        """[lo, hi) rows dated start..end (inclusive), then at most the `last` ones."""
+        lo = int(np.searchsorted(self.index, start, "left")) if start is not None else 0
+        hi = int(np.searchsorted(self.index, end, "right")) if end is not None else len(self.index)
+        if last is not None:
+            lo = max(lo, hi - last)
+        return lo, max(lo, hi)
+
+    def query(self, fields=None, start=None, end=None, last=None):
+        unknown = [f for f in fields or () if f not in self.columns]
+        if unknown:
+            raise KeyError(f"unknown field(s) for {self.name}: {', '.join(unknown)}")
+        lo, hi = self.bounds(start, end, last)
+        out = {"table": self.name, "count": hi - lo, "dates": self.date_strs[lo:hi]}
+        for f in fields or self.columns:
+            out[f] = _export(self.columns[f], lo, hi)
+        return out
+
+    def describe(self):
+        return {"rows": len(self.index), "from": self.date_strs[0] if self.date_strs else None,
+                "to": self.date_strs[-1] if self.date_strs else None, "fields": list(self.columns)}
+
+
+class DataStore:
+    """Tables + static sections of one market_data document."""
+
+    def __init__(self, doc, source=None):
+        if doc.get("schemaVersion") == 2:
+            from columnar import from_columnar
+            doc = from_columnar(doc)
+        self.source = source
+        self.loaded_at = time.time()
+        self.tables = {}
+        self.sections = {}
+
+        self._add("ohlcv", doc.get("ohlcv"))
+        indicators = doc.get("indicators") or {}
+        # 지표는 ohlcv 와 같은 날짜축 — 한 테이블의 필드로 합친다
+        merged = {}
+        for name, series in indicators.items():
+            for r in series:
+                merged.setdefault(r["date"], {"date": r["date"]})[name] = r["value"]
+        self._add("indicators", list(merged.values()))
+        self._add("signals", doc.get("signals"))
+        corr = doc.get("correlations") or {}
+        self._add("correlations/rolling60", corr.get("rolling60"))
+        for key, val in (doc.get("comparison") or {}).items():
+            if key.endswith("_normalized"):
+                self._add(f"comparison/{key}", [{"date": r["date"], "value": r["value"]} for r in val])
+        for market, data in (doc.get("supplyDemand") or {}).items():
+            self._add(f"supplyDemand/{market}", data.get("series"))
+
+        for key, val in doc.items():
+            if key not in ("ohlcv", "indicators", "signals"):
+                self.sections[key] = val
+
+    def _add(self, name, records):
+        if records:
+            self.tables[name] = Table(name, records)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls(json.loads(f.read()), source=path)
+
+    def index(self):
+        return {"source": self.source, "loadedAt": self.loaded_at,
+                "tables": {k: t.describe() for k, t in self.tables.items()},
+                "sections": list(self.sections)}
+
+
+# ---------------------------------------------------------------------------
+# Request handling
+# ---------------------------------------------------------------------------
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _date(params, key):
+    val = params.get(key)
+    if val is None:
+        return None
+    try:
+        return np.datetime64(val, "D")
+    except ValueError:
+        raise HTTPError(400, f"bad {key} date {val!r} (expected YYYY-MM-DD)") from None
+
+
+def _params(query):
+    params = {k: v[-1] for k, v in parse_qs(query, keep_blank_values=True).items()}
+    fields = [f for f in params.get("fields", "").split(",") if f] or None
+    last = params.get("last")
+    if last is not None:
+        if not last.isdigit():
+            raise HTTPError(400, f"bad last {last!r} (expected a row count)")
+        last = int(last)
+    return fields, _date(params, "from"), _date(params, "to"), last
+
+
+def resolve(store, target):
+    """JSON-ready body for a request target (path + query)."""
+    parts = urlsplit(target)
+    path = unquote(parts.path).strip("/")
+    if path == "":
+        return store.index()
+    if path.startswith("sections/"):
+        key = path.split("/", 1)[1]
+        if key not in store.sections:
+            raise HTTPError(404, f"no section {key!r}")
+        return {key: store.sections[key]}
+
+    fields, start, end, last = _params(parts.query)
+    name, field = path, None
+    if name not in store.tables and "/" in name:
+        name, field = name.rsplit("/", 1)      # /indicators/rsi14 → 테이블 indicators, 필드 rsi14
+    table = store.tables.get(name)
+    if table is None:
+        raise HTTPError(404, f"no table {path!r} (see / for the list)")
+    if field is not None:
+        if fields:
+            raise HTTPError(400, "use either /<table>/<field> or ?fields=, not both")
+        fields = [field]
+    try:
+        return table.query(fields, start, end, last)
+    except KeyError as exc:
+        raise HTTPError(404, exc.args[0]) from None
+
+
+def _cache_key(target):
+    parts = urlsplit(target)
+    query = sorted(parse_qs(parts.query, keep_blank_values=True).items())
+    return unquote(parts.path).rstrip("/") or "/", tuple((k, v[-1]) for k, v in query)
+
+
+class Response:
+    """Encoded body with its ETag and (lazily) its gzip variant."""
+
+    __slots__ = ("status", "body", "etag", "_gzipped")
+
+    def __init__(self, status, doc):
+        self.status = status
+        self.body = dumps(doc)
+        self.etag = '"' + hashlib.sha1(self.body).hexdigest() + '"'
+        self._gzipped = None
+
+    def gzipped(self):
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, compresslevel=6, mtime=0)
+        return self._gzipped
+
+
+class QueryServer:
+    """asyncio HTTP/1.1 server (keep-alive, GET/HEAD) over a hot-reloaded DataStore."""
+
+    def __init__(self, path=DATA_PATH, reload_interval=RELOAD_INTERVAL, cache_size=CACHE_SIZE):
+        self.path = path
+        self.reload_interval = reload_interval
+        self.cache_size = cache_size
+        self.store = DataStore.load(path)
+        self.signature = self._stat()
+        self.cache = OrderedDict()
+        self.reloads = 0
+        self.requests = 0
+
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    async def watch(self):
+        """Reload the store whenever the data file is replaced."""
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            await self.reload_if_changed()
+
+    async def reload_if_changed(self):
+        sig = self._stat()
+        if sig is None or sig == self.signature:
+            return False
+        try:
+            store = await asyncio.to_thread(DataStore.load, self.path)
+        except (OSError, ValueError, KeyError) as exc:
+            print(f"  reload failed ({exc}); keeping the previous data")
+            self.signature = sig
+            return False
+        # 교체는 이벤트 루프 안에서 한 번에 — 진행 중인 요청은 이전 store 로 끝난다
+        self.store, self.signature = store, sig
+        self.cache.clear()
+        self.reloads += 1
+        print(f"  reloaded {self.path} ({len(store.tables)} tables)")
+        return True
+
+    def respond(self, target):
+        key = _cache_key(target)
+        resp = self.cache.get(key)
+        if resp is not None:
+            self.cache.move_to_end(key)
+            return resp
+        try:
+            resp = Response(200, resolve(self.store, target))
+        except HTTPError as exc:
+            return Response(exc.status, {"error": str(exc)})
+        self.cache[key] = resp
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return resp
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    writer.write(self._head(400, {"Content-Length": "0", "Connection": "close"}))
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        k, v = line.split(":", 1)
+                        headers[k.strip().lower()] = v.strip()
+                conn = headers.get("connection", "").lower()
+                keep = conn != "close" if version == "HTTP/1.1" else conn == "keep-alive"
+
+                self.requests += 1
+                writer.write(self._reply(method, target, headers, keep))
+                await writer.drain()
+                if not keep:
+                    break
+        finally:
+            writer.close()
+
+    def _head(self, status, headers):
+        lines = [f"HTTP/1.1 {status} {REASONS.get(status, '')}"]
+        lines += [f"{k}: {v}" for k, v in headers.items()]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    def _reply(self, method, target, headers, keep):
+        base = {"Access-Control-Allow-Origin": "*", "Connection": "keep-alive" if keep else "close"}
+        if method not in ("GET", "HEAD"):
+            return self._head(405, {**base, "Allow": "GET, HEAD", "Content-Length": "0"})
+        resp = self.respond(target)
+        base.update({"Content-Type": "application/json; charset=utf-8", "Vary": "Accept-Encoding"})
+        if resp.status != 200:
+            return self._head(resp.status, {**base, "Content-Length": str(len(resp.body))}) + \
+                (resp.body if method == "GET" else b"")
+
+        base.update({"ETag": resp.etag, "Cache-Control": "no-cache"})
+        inm = headers.get("if-none-match")
+        if inm and (inm.strip() == "*" or resp.etag in (t.strip() for t in inm.split(","))):
+            return self._head(304, {**base, "Content-Length": "0"})
+        body = resp.body
+        if len(body) >= GZIP_MIN and "gzip" in headers.get("accept-encoding", ""):
+            body = resp.gzipped()
+            base["Content-Encoding"] = "gzip"
+        return self._head(200, {**base, "Content-Length": str(len(body))}) + \
+            (body if method == "GET" else b"")
+
+    async def serve(self, host=HOST, port=PORT, ready=None):
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER)
+        watcher = asyncio.create_task(self.watch())
+        if ready is not None:
+            ready(server.sockets[0].getsockname()[1])
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            watcher.cancel()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Serve range/field queries over market_data.json")
+    ap.add_argument("--data", default=DATA_PATH, help=f"market_data.json to serve (default: {DATA_PATH})")
+    ap.add_argument("--host", default=HOST)
+    ap.add_argument("--port", type=int, default=PORT)
+    ap.add_argument("--reload-interval", type=float, default=RELOAD_INTERVAL,
+                    help="seconds between checks for a new data file")
+    ap.add_argument("--cache-size", type=int, default=CACHE_SIZE, help="cached responses (LRU)")
+    args = ap.parse_args(argv)
+
+    server = QueryServer(args.data, args.reload_interval, args.cache_size)
+    tables = ", ".join(server.store.tables)
+
+    def ready(port):                         # --port 0 → 실제로 열린 포트를 알린다
+        print(f"Serving {args.data} on http://{args.host}:{port}/  ({tables})", flush=True)
+
+    try:
+        asyncio.run(server.serve(args.host, args.port, ready))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
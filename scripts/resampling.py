@@ -0,0 +1,115 @@
+"""
+KOSPI Strategy Dashboard - Resampled metric intervals
+compute_metrics' winRate / MDD / Sharpe / avgReturn come from a year of BUY
+signals, often fewer than 20 trades. This puts error bars on them:
+
+- bootstrap(): percentile confidence intervals from resampling the trade
+  returns with replacement (each resample is a reshuffled trade path, so
+  MDD varies too);
+- permutation(): one-sided p-values of the observed metrics against the
+  same number of entries on random days of the window (sorted by date),
+  i.e. "does the signal beat picking days at random?".
+
+All resamples are one (resamples × trades) index matrix, reduced along
+axis 1 — no Python loop per resample; CHUNK caps the rows held at once.
+A fixed seed keeps the published numbers, and so publish.content_hash,
+stable between runs on the same data.
+"""
+
+import numpy as np
+
+RESAMPLES = 10_000
+LEVEL = 0.95
+SEED = 0
+CHUNK = 20_000          # 청크당 리샘플 수 — (리샘플 × 거래) 행렬 메모리 상한
+RISK_FREE = 0.03
+METRICS = ["winRate", "mdd", "sharpeRatio", "avgReturn"]
+DECIMALS = {"winRate": 3, "mdd": 3, "sharpeRatio": 3, "avgReturn": 4}    # compute_metrics 와 같은 자리수
+
+
+# ---------------------------------------------------------------------------
+# Metrics over a (resamples × trades) matrix
+# ---------------------------------------------------------------------------
+
+def forward_returns(close, holding_days=20):
+    """Return of entering at each bar and exiting `holding_days` later (clipped to the last bar)."""
+    close = np.asarray(close, dtype=float)
+    exit_idx = np.minimum(np.arange(len(close)) + holding_days, len(close) - 1)
+    return (close[exit_idx] - close) / close
+
+
+def trade_metrics(returns, holding_days=20):
+    """compute_metrics' winRate/mdd/sharpeRatio/avgReturn for every row of `returns`."""
+    r = np.atleast_2d(np.asarray(returns, dtype=float))
+    avg = r.mean(axis=1)
+    cum = np.cumprod(1.0 + r, axis=1)
+    peak = np.maximum.accumulate(cum, axis=1)
+    out = {"winRate": (r > 0).mean(axis=1), "mdd": ((cum - peak) / peak).min(axis=1), "avgReturn": avg}
+
+    sharpe = np.zeros(len(r))
+    if r.shape[1] > 1:
+        std = r.std(axis=1, ddof=1)
+        # 같은 거래만 뽑힌 행은 std 가 반올림 잡음(~1e-17)이라 0 으로 본다
+        live = (r.max(axis=1) > r.min(axis=1)) & (std > 0)
+        scale = np.sqrt(252 / holding_days)
+        sharpe[live] = (avg[live] - RISK_FREE / (252 / holding_days)) / std[live] * scale
+    out["sharpeRatio"] = sharpe
+    return out
+
+
+def _resampled(draw, values, resamples, holding_days):
+    """Metric arrays (length `resamples`) of values[draw(m)] over chunks of m rows."""
+    parts = {m: [] for m in METRICS}
+    for start in range(0, resamples, CHUNK):
+        stats = trade_metrics(values[draw(min(CHUNK, resamples - start))], holding_days)
+        for m in METRICS:
+            parts[m].append(stats[m])
+    return {m: np.concatenate(parts[m]) for m in METRICS}
+
+
+# ---------------------------------------------------------------------------
+# Bootstrap / permutation
+# ---------------------------------------------------------------------------
+
+def bootstrap(returns, holding_days=20, resamples=RESAMPLES, level=LEVEL, rng=None):
+    """{metric: (low, high)} percentile intervals at `level`."""
+    rng = rng if rng is not None else np.random.default_rng(SEED)
+    returns = np.asarray(returns, dtype=float)
+    k = len(returns)
+    dist = _resampled(lambda m: rng.integers(0, k, size=(m, k)), returns, resamples, holding_days)
+    tail = (1 - level) / 2
+    return {m: tuple(np.quantile(dist[m], [tail, 1 - tail])) for m in METRICS}
+
+
+def permutation(fwd, observed, n_trades, holding_days=20, resamples=RESAMPLES, rng=None):
+    """{metric: p} — share of random-entry resamples at least as good as `observed`.
+
+    Entries are drawn uniformly from the bars of `fwd` (forward_returns) and
+    sorted, so each resample is a chronological trade path like the real one.
+    p = (1 + #{null ≥ observed}) / (resamples + 1); higher is better for
+    every metric (MDD is ≤ 0).
+    """
+    rng = rng if rng is not None else np.random.default_rng(SEED)
+    fwd = np.asarray(fwd, dtype=float)
+    null = _resampled(lambda m: np.sort(rng.integers(0, len(fwd), size=(m, n_trades)), axis=1),
+                      fwd, resamples, holding_days)
+    return {m: (1 + int(np.count_nonzero(null[m] >= observed[m]))) / (resamples + 1) for m in METRICS}
+
+
+def metric_intervals(close, entries, holding_days=20, resamples=RESAMPLES, level=LEVEL, seed=SEED):
+    """compute_metrics additions: {"intervals": {...}, "permutation": {...}} ({} below 2 trades)."""
+    entries = np.asarray(entries, dtype=np.intp)
+    if len(entries) < 2 or resamples <= 0:
+        return {}
+    fwd = forward_returns(close, holding_days)
+    returns = fwd[entries]
+    observed = {m: v[0] for m, v in trade_metrics(returns, holding_days).items()}
+    rng = np.random.default_rng(seed)
+    ci = bootstrap(returns, holding_days, resamples, level, rng)
+    pv = permutation(fwd, observed, len(entries), holding_days, resamples, rng)
+    return {
+        "intervals": {"level": level, "resamples": resamples,
+                      **{m: [round(float(lo), DECIMALS[m]), round(float(hi), DECIMALS[m])]
+                         for m, (lo, hi) in ci.items()}},
+        "permutation": {"resamples": resamples, **{m: round(p, 4) for m, p in pv.items()}},
+    }
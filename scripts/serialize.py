@@ -0,0 +1,167 @@
+"""
+KOSPI Strategy Dashboard - JSON serialization layer
+Builds the per-day record lists and writes the output documents without the
+per-element safe_float()/strftime() calls and the pure-Python encoder that
+json.dump(f) falls back to:
+
+- date_strings() formats a DatetimeIndex once ("YYYY-MM-DD");
+- nullable() turns a float column into a list with NaN/inf → None using one
+  vectorized mask (same values as safe_float);
+- dumps()/write_json() encode dict members and list chunks piece by piece
+  (C encoder or orjson) and stream them to a temp file that is then
+  os.replace()d into place, so the whole text never sits in memory.
+
+The bytes are identical to json.dump(doc, f, ensure_ascii=False,
+separators=(",", ":")). orjson (optional) spells floats below 1e-4 and from
+1e16 up differently from Python's repr (e.g. 1e-05 vs 1e-5), so any piece
+whose orjson output contains such a number — or that orjson rejects (big
+ints, non-str keys, numpy scalars) — goes through the stdlib encoder instead.
+Non-finite floats must already be None — the stdlib would write the
+non-JSON tokens NaN/Infinity.
+"""
+
+import json
+import os
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:                          # 선택 의존성 — 없으면 표준 json
+    orjson = None
+
+BACKENDS = ("auto", "json", "orjson")
+_CHUNK = 256                                 # 리스트를 나눠 쓰는 단위 (원소 수)
+
+_stdlib = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+# orjson 과 repr 의 표기가 갈리는 숫자: 지수 표기(e-7, e16, e87 …) 또는 0.0000… (|v| < 1e-4).
+# 문자열 안의 같은 패턴은 표준 json 으로 한 번 더 쓰일 뿐이라 느슨한 검사로 충분하다
+_AFTER_E = np.zeros(256, dtype=bool)
+_AFTER_E[list(b"+-0123456789")] = True
+
+
+def _unsafe(data):
+    if b"0.0000" in data:
+        return True
+    buf = np.frombuffer(data, dtype=np.uint8)
+    e = np.flatnonzero(buf[:-1] == ord("e"))
+    return bool(_AFTER_E[buf[e + 1]].any())
+
+
+# 표준 json 이 못 쓰는 타입(datetime, dataclass …)을 orjson 이 대신 써 버리지 않도록
+_ORJSON_OPTS = 0 if orjson is None else (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+                                         | orjson.OPT_PASSTHROUGH_SUBCLASS)
+
+
+# ---------------------------------------------------------------------------
+# Column → list helpers
+# ---------------------------------------------------------------------------
+
+def date_strings(index):
+    """["YYYY-MM-DD", ...] for a DatetimeIndex, formatted in one pass."""
+    if getattr(index, "tz", None) is not None:
+        return index.strftime("%Y-%m-%d").tolist()
+    return np.datetime_as_string(np.asarray(index, dtype="datetime64[D]"), unit="D").tolist()
+
+
+def nullable(values, decimals=None):
+    """Python floats with NaN/inf → None (vectorized safe_float), optionally rounded."""
+    arr = np.asarray(values, dtype=float)
+    if decimals is not None:
+        arr = np.round(arr, decimals)
+    out = arr.astype(object)
+    out[~np.isfinite(arr)] = None
+    return out.tolist()
+
+
+def value_records(dates, values, decimals=None):
+    """[{"date", "value"}] from a date list and a float column."""
+    return [{"date": d, "value": v} for d, v in zip(dates, nullable(values, decimals))]
+
+
+def series_records(series, decimals=None):
+    """value_records() of a date-indexed Series."""
+    return value_records(date_strings(series.index), series.to_numpy(dtype=float), decimals)
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+def _backend(name):
+    if name not in BACKENDS:
+        raise ValueError(f"unknown JSON backend {name!r} (expected one of {BACKENDS})")
+    if name == "orjson" and orjson is None:
+        raise ImportError("orjson is not installed")
+    return "orjson" if name != "json" and orjson is not None else "json"
+
+
+def _leaf(obj, backend):
+    if backend == "orjson":
+        try:
+            data = orjson.dumps(obj, option=_ORJSON_OPTS)
+        except TypeError:                        # orjson.JSONEncodeError 포함
+            data = None
+        if data is not None and not _unsafe(data):
+            return data
+    return _stdlib.encode(obj).encode("utf-8")
+
+
+def _pieces(obj, backend):
+    # dict 멤버와 리스트 조각 단위로 나눠 쓴다 — 메모리에는 조각 하나씩만, 걸린 조각만 표준 json 으로
+    if isinstance(obj, dict) and obj and all(isinstance(k, str) for k in obj):
+        sep = b"{"
+        for key, val in obj.items():
+            yield sep + _stdlib.encode(key).encode("utf-8") + b":"
+            yield from _pieces(val, backend)
+            sep = b","
+        yield b"}"
+    elif isinstance(obj, list) and len(obj) > _CHUNK:
+        yield b"["
+        for i in range(0, len(obj), _CHUNK):
+            yield (b"," if i else b"") + _leaf(obj[i:i + _CHUNK], backend)[1:-1]
+        yield b"]"
+    else:
+        yield _leaf(obj, backend)
+
+
+def _consume(doc, backend):
+    # 최상위 멤버를 쓰는 즉시 dict 에서 빼 — 섹션 하나를 쓴 뒤 그 객체들이 해제된다
+    sep = b"{"
+    while doc:
+        key = next(iter(doc))
+        val = doc.pop(key)
+        yield sep + _stdlib.encode(key).encode("utf-8") + b":"
+        yield from _pieces(val, backend)
+        del val
+        sep = b","
+    yield b"}" if sep == b"," else b"{}"
+
+
+def iter_encode(doc, backend="auto", consume=False):
+    """UTF-8 pieces of `doc` (dict members, list chunks of _CHUNK items).
+
+    consume=True empties a str-keyed dict `doc` member by member as it is
+    encoded (low-memory mode); the bytes are the same.
+    """
+    backend = _backend(backend)
+    if consume and isinstance(doc, dict) and all(isinstance(k, str) for k in doc):
+        return _consume(doc, backend)
+    return _pieces(doc, backend)
+
+
+def dumps(doc, backend="auto"):
+    """UTF-8 bytes of `doc`, identical to the compact ensure_ascii=False dump."""
+    return b"".join(iter_encode(doc, backend))
+
+
+def write_json(path, doc, backend="auto", consume=False):
+    """Stream `doc` to `path` through a temp file; returns the byte count."""
+    tmp = path + ".tmp"
+    size = 0
+    with open(tmp, "wb") as f:
+        for piece in iter_encode(doc, backend, consume):
+            f.write(piece)
+            size += len(piece)
+    os.replace(tmp, path)
+    return size
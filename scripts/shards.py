@@ -0,0 +1,102 @@
+"""
+KOSPI Strategy Dashboard - Lazily loaded data shards
+Splits the market_data document into a small "summary" shard for first
+paint plus one file per dashboard panel, and writes a manifest that names
+each shard by content hash so unchanged shards stay browser-cached across
+daily deploys. src/utils/shards.js loads them.
+
+    public/data/manifest.json              (always refetched; tiny)
+    public/data/shards/<name>.<hash>.json  (immutable, cache forever)
+
+Manifest:
+    {"version": 1, "generated": ISO,
+     "shards": {name: {"file": "shards/summary.1a2b3c4d5e6f.json",
+                       "sha256": hex, "bytes": n, "keys": [...]}}}
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+
+from serialize import dumps
+
+MANIFEST_VERSION = 1
+HASH_LEN = 12
+
+# shard 이름 → 문서 최상위 키 (summary 는 첫 화면용)
+SHARDS = {
+    "summary":      ["metadata", "latest", "decisionTree", "range52w", "metrics"],
+    "signals":      ["signals", "supportResistance"],
+    "chart":        ["ohlcv", "indicators"],
+    "correlations": ["correlations", "comparison"],
+    "supplyDemand": ["supplyDemand"],
+}
+# 하위 키마다 별도 shard 로 나누는 섹션 — 예: lod.5y → "lod-5y" = {"lod": {"5y": ...}}
+NESTED = {"lod"}
+
+
+def split_document(doc):
+    """{shard name: sub-document}; keys not listed in SHARDS get their own shard."""
+    assigned = {k for keys in SHARDS.values() for k in keys}
+    parts = {name: {k: doc[k] for k in keys if k in doc} for name, keys in SHARDS.items()}
+    for key, val in doc.items():
+        if key in NESTED:
+            parts.update({f"{key}-{child}": {key: {child: sub}} for child, sub in val.items()})
+        elif key not in assigned:
+            parts[key] = {key: val}
+    return {name: part for name, part in parts.items() if part}
+
+
+def _write_atomic(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _manifest_files(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return {s["file"] for s in json.load(f).get("shards", {}).values()}
+    except (OSError, ValueError, AttributeError):
+        return set()
+
+
+def write_shards(directory, doc, encode=None, backend="auto"):
+    """Write shards + manifest.json under `directory`; returns the manifest.
+
+    `encode` (e.g. columnar.to_columnar) is applied to each shard before
+    serialization; the client normalizes each shard like market_data.json.
+    Shard files referenced by neither the new nor the previous manifest are
+    deleted, so clients holding yesterday's manifest can still finish
+    loading while the deploy rolls over. `backend` picks the JSON encoder
+    (serialize.BACKENDS); the bytes, and so the hashes, do not depend on it.
+    """
+    shard_dir = os.path.join(directory, "shards")
+    os.makedirs(shard_dir, exist_ok=True)
+    manifest_path = os.path.join(directory, "manifest.json")
+    previous = _manifest_files(manifest_path)
+
+    shards = {}
+    for name, part in split_document(doc).items():
+        data = dumps(encode(part) if encode else part, backend)
+        digest = hashlib.sha256(data).hexdigest()
+        rel = f"shards/{name}.{digest[:HASH_LEN]}.json"
+        path = os.path.join(directory, rel)
+        if not os.path.exists(path):            # 같은 해시 = 같은 내용
+            _write_atomic(path, data)
+        shards[name] = {"file": rel, "sha256": digest, "bytes": len(data), "keys": list(part)}
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "generated": datetime.now().isoformat(),
+        "shards": shards,
+    }
+    _write_atomic(manifest_path, dumps(manifest))
+
+    keep = previous | {s["file"] for s in shards.values()}
+    for fname in os.listdir(shard_dir):
+        if f"shards/{fname}" not in keep and fname.endswith(".json"):
+            os.remove(os.path.join(shard_dir, fname))
+    return manifest
@@ -0,0 +1,76 @@
+"""
+KOSPI Strategy Dashboard - Stage cache
+Results of each fetch_data.py stage, kept under STAGE_DIR so a partial run
+(e.g. `fetch_data.py supply-demand output`) reuses what the stages it skips
+produced last time:
+
+    prices.npz         raw OHLCV: kospi, qqq, sox, vkospi
+    indicators.npz     KOSPI compute_indicators() frame
+    <section>.json     document sections (signals, correlations, supply-demand, lod)
+
+Frames use state_store's npz layout (written to a temp file, then
+os.replace()d); sections go through serialize.write_json. numpy/pandas are
+imported only by the frame methods, so JSON-only runs stay light.
+"""
+
+import json
+import os
+
+STAGE_DIR = ".cache/stages"
+CACHE_VERSION = 1
+
+
+class StageCache:
+    """npz frames and JSON sections by stage name under `directory`."""
+
+    def __init__(self, directory=STAGE_DIR):
+        self.directory = directory
+
+    def path(self, name, ext):
+        return os.path.join(self.directory, f"{name}.{ext}")
+
+    def save_frames(self, name, frames):
+        """Store {key: DataFrame}; empty frames come back as empty frames."""
+        import numpy as np
+        from state_store import frame_to_arrays
+
+        arrays = {}
+        for key, df in frames.items():
+            if df is not None and not df.empty:
+                arrays.update(frame_to_arrays(key, df))
+        meta = {"version": CACHE_VERSION, "frames": list(frames)}
+        arrays["meta"] = np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8)
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = self.path(name, "tmp.npz")
+        np.savez(tmp, **arrays)
+        os.replace(tmp, self.path(name, "npz"))
+
+    def load_frames(self, name):
+        """{key: DataFrame} saved by save_frames, or None."""
+        import numpy as np
+        import pandas as pd
+        from state_store import frame_from_npz
+
+        try:
+            with np.load(self.path(name, "npz")) as npz:
+                meta = json.loads(npz["meta"].tobytes().decode("utf-8"))
+                if meta.get("version") != CACHE_VERSION:
+                    return None
+                return {key: frame_from_npz(npz, key) if f"{key}/index" in npz.files else pd.DataFrame()
+                        for key in meta["frames"]}
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def save_section(self, name, doc):
+        from serialize import write_json
+
+        os.makedirs(self.directory, exist_ok=True)
+        write_json(self.path(name, "json"), doc)
+
+    def load_section(self, name):
+        """Section saved by save_section, or None."""
+        try:
+            with open(self.path(name, "json"), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
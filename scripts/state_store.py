@@ -0,0 +1,266 @@
+"""
+KOSPI Strategy Dashboard - Incremental indicator state store
+Persists the raw OHLCV history plus the running indicator state so a daily run
+only has to download the bars added since the previous run. The indicators are
+recomputed over the stored window so they start where a full run starts; the
+state carries the last bar forward for intraday previews (streaming.py).
+
+On-disk format: one compressed .npz per store, holding the date index, the
+OHLCV / indicator columns and a small JSON blob with the EWM accumulators,
+rolling-window buffers and last OBV value.
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+STATE_VERSION = 1
+
+OHLCV_COLS = ["Open", "High", "Low", "Close", "Volume"]
+MA_PERIODS = [5, 20, 60, 120, 240]
+BB_PERIOD = 20
+BUFFER_LEN = max(MA_PERIODS + [BB_PERIOD]) - 1
+
+
+# ---------------------------------------------------------------------------
+# Running EWM (same recurrence as pandas' ewm kernel, ignore_na=False)
+# ---------------------------------------------------------------------------
+
+class EwmState:
+    """Online exponentially weighted mean matching ``Series.ewm(...).mean()``."""
+
+    __slots__ = ("alpha", "adjust", "min_periods", "weighted", "old_wt", "nobs")
+
+    def __init__(self, alpha, adjust=True, min_periods=0,
+                 weighted=float("nan"), old_wt=1.0, nobs=0):
+        self.alpha = alpha
+        self.adjust = adjust
+        self.min_periods = min_periods
+        self.weighted = weighted
+        self.old_wt = old_wt
+        self.nobs = nobs
+
+    @classmethod
+    def from_com(cls, com, **kw):
+        return cls(1.0 / (1.0 + com), **kw)
+
+    @classmethod
+    def from_span(cls, span, **kw):
+        return cls(2.0 / (span + 1.0), **kw)
+
+    def update(self, x):
+        new_wt = 1.0 if self.adjust else self.alpha
+        is_obs = x == x
+        self.nobs += int(is_obs)
+        if self.weighted == self.weighted:
+            self.old_wt *= 1.0 - self.alpha
+            if is_obs:
+                if self.weighted != x:
+                    self.weighted = ((self.old_wt * self.weighted) + (new_wt * x)) / (self.old_wt + new_wt)
+                self.old_wt = self.old_wt + new_wt if self.adjust else 1.0
+        elif is_obs:
+            self.weighted = x
+        return self.weighted if self.nobs >= max(self.min_periods, 1) else float("nan")
+
+    def copy(self):
+        return EwmState(self.alpha, self.adjust, self.min_periods, self.weighted, self.old_wt, self.nobs)
+
+    def to_dict(self):
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(**d)
+
+
+# ---------------------------------------------------------------------------
+# Indicator state
+# ---------------------------------------------------------------------------
+
+class IndicatorState:
+    """Everything needed to extend compute_indicators() by new bars."""
+
+    EWMS = ("rsi_gain", "rsi_loss", "ema_fast", "ema_slow", "ema_signal")
+
+    def __init__(self, rsi_period=14, fast=12, slow=26, signal=9):
+        self.rsi_gain = EwmState.from_com(rsi_period - 1, min_periods=rsi_period)
+        self.rsi_loss = EwmState.from_com(rsi_period - 1, min_periods=rsi_period)
+        self.ema_fast = EwmState.from_span(fast, adjust=False)
+        self.ema_slow = EwmState.from_span(slow, adjust=False)
+        self.ema_signal = EwmState.from_span(signal, adjust=False)
+        self.closes = np.empty(0)         # 마지막 BUFFER_LEN개 종가 (이동평균/BB용)
+        self.last_close = float("nan")
+        self.last_obv = 0.0
+
+    def _step_ewm(self, close):
+        delta = close - self.last_close
+        gain = max(delta, 0.0) if delta == delta else delta
+        loss = -min(delta, 0.0) if delta == delta else delta
+        avg_gain = self.rsi_gain.update(gain)
+        avg_loss = self.rsi_loss.update(loss)
+        rs = avg_gain / (avg_loss if avg_loss != 0 else np.finfo(float).eps)
+        rsi = 100 - (100 / (1 + rs))
+
+        fast = self.ema_fast.update(close)
+        slow = self.ema_slow.update(close)
+        macd = fast - slow
+        sig = self.ema_signal.update(macd)
+        return rsi, macd, sig
+
+    def peek(self, close):
+        """(rsi, macd, signal) the next bar would get at `close`; the state is left as is."""
+        saved = {name: getattr(self, name).copy() for name in self.EWMS}
+        try:
+            return self._step_ewm(close)
+        finally:
+            for name, ewm in saved.items():
+                setattr(self, name, ewm)
+
+    def advance(self, close, volume):
+        """Append one bar in O(1) without building indicator columns (streaming.py)."""
+        self._step_ewm(close)
+        if close > self.last_close:
+            self.last_obv += volume
+        elif close < self.last_close:
+            self.last_obv -= volume
+        self.last_close = close
+        self.closes = np.append(self.closes[-(BUFFER_LEN - 1):], close)
+
+    def extend(self, ohlcv):
+        """Indicator columns for `ohlcv` (new bars only), advancing the state."""
+        df = ohlcv[OHLCV_COLS].copy()
+        close = df["Close"].to_numpy(dtype=float)
+        volume = df["Volume"].to_numpy(dtype=float)
+
+        # 이동평균·볼린저: 버퍼 + 신규 봉에 대해서만 rolling
+        window = pd.Series(np.concatenate([self.closes, close]))
+        k = len(close)
+        for p in MA_PERIODS:
+            df[f"ma{p}"] = window.rolling(p).mean().to_numpy()[-k:]
+        bb_mid = window.rolling(BB_PERIOD).mean().to_numpy()[-k:]
+        bb_std = window.rolling(BB_PERIOD).std().to_numpy()[-k:]
+        df["bb_middle"] = bb_mid
+        df["bb_upper"] = bb_mid + 2 * bb_std
+        df["bb_lower"] = bb_mid - 2 * bb_std
+
+        rsi, macd, sig, obv = (np.empty(k) for _ in range(4))
+        for i, (c, v) in enumerate(zip(close, volume)):
+            rsi[i], macd[i], sig[i] = self._step_ewm(c)
+            if c > self.last_close:
+                self.last_obv += v
+            elif c < self.last_close:
+                self.last_obv -= v
+            obv[i] = self.last_obv
+            self.last_close = c
+
+        df["rsi14"] = rsi
+        df["macd"] = macd
+        df["macd_signal"] = sig
+        df["macd_hist"] = macd - sig
+        df["obv"] = obv
+        self.closes = window.to_numpy()[-BUFFER_LEN:]
+        return df
+
+    def to_dict(self):
+        return {
+            **{name: getattr(self, name).to_dict() for name in self.EWMS},
+            "closes": self.closes.tolist(), "last_close": self.last_close,
+            "last_obv": self.last_obv,
+        }
+
+    @classmethod
+    def from_dict(cls, d):
+        st = cls()
+        for name in cls.EWMS:
+            setattr(st, name, EwmState.from_dict(d[name]))
+        st.closes = np.asarray(d["closes"], dtype=float)
+        st.last_close = d["last_close"]
+        st.last_obv = d["last_obv"]
+        return st
+
+
+def build_state(df):
+    """Full rebuild: indicators via fetch_data.compute_indicators, state by replay."""
+    from fetch_data import compute_indicators
+
+    state = IndicatorState()
+    state.extend(df)
+    return compute_indicators(df), state
+
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+def frame_to_arrays(prefix, df):
+    """npz-ready arrays for `df`: "<prefix>/index" (int64 ns) + one per column."""
+    arrays = {f"{prefix}/index": df.index.to_numpy(dtype="datetime64[ns]").astype(np.int64)}
+    for col in df.columns:
+        arrays[f"{prefix}/{col}"] = df[col].to_numpy(dtype=float)
+    return arrays
+
+
+def frame_from_npz(npz, prefix):
+    """Inverse of frame_to_arrays."""
+    cols = [k.split("/", 1)[1] for k in npz.files
+            if k.startswith(prefix + "/") and k != f"{prefix}/index"]
+    index = pd.DatetimeIndex(npz[f"{prefix}/index"].astype("datetime64[ns]"))
+    return pd.DataFrame({c: npz[f"{prefix}/{c}"] for c in cols}, index=index)
+
+
+def save_store(path, frames, state):
+    """Write {name: DataFrame} plus the KOSPI indicator state atomically."""
+    arrays = {}
+    for name, df in frames.items():
+        if df is not None and not df.empty:
+            arrays.update(frame_to_arrays(name, df))
+    meta = {"version": STATE_VERSION, "frames": list(frames), "state": state.to_dict()}
+    arrays["meta"] = np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp.npz"
+    np.savez_compressed(tmp, **arrays)
+    os.replace(tmp, path)
+
+
+def load_store(path):
+    """Return ({name: DataFrame}, IndicatorState) or None if absent/incompatible."""
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path) as npz:
+            meta = json.loads(npz["meta"].tobytes().decode("utf-8"))
+            if meta.get("version") != STATE_VERSION:
+                return None
+            frames = {name: (frame_from_npz(npz, name) if f"{name}/index" in npz.files else pd.DataFrame())
+                      for name in meta["frames"]}
+    except (OSError, ValueError, KeyError) as exc:
+        print(f"  State store unreadable ({exc}) → full rebuild")
+        return None
+    return frames, IndicatorState.from_dict(meta["state"])
+
+
+# ---------------------------------------------------------------------------
+# Merge helpers
+# ---------------------------------------------------------------------------
+
+def overlaps_agree(stored, fresh, rtol=1e-6):
+    """True when the bars both frames contain have the same closes.
+
+    A mismatch means the history was revised (e.g. auto_adjust after a
+    dividend) and everything derived from it must be rebuilt.
+    """
+    common = stored.index.intersection(fresh.index)
+    if len(common) == 0:
+        return False
+    a = stored.loc[common, "Close"].to_numpy(dtype=float)
+    b = fresh.loc[common, "Close"].to_numpy(dtype=float)
+    return bool(np.allclose(a, b, rtol=rtol, atol=0))
+
+
+def append_bars(stored, fresh):
+    """Rows of `fresh` after the last stored date, appended to `stored`."""
+    new = fresh[fresh.index > stored.index[-1]]
+    return pd.concat([stored, new]) if not new.empty else stored, new
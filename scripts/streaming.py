@@ -0,0 +1,312 @@
+"""
+KOSPI Strategy Dashboard - Intraday streaming mode
+Keeps the daily dashboard state live during the KRX session (09:00-15:30
+KST): minute bars from a pluggable source build today's forming daily bar,
+and every update re-derives today's indicators from yesterday's state in
+O(1) — no rolling/ewm pass over the history:
+
+- RSI / MACD: IndicatorState.peek() steps copies of the EWM accumulators
+  (same recurrence as compute_rsi/compute_macd) with today's close;
+- MAs / Bollinger: running sums of the last p-1 completed closes (Bollinger
+  shifted by yesterday's close to avoid cancellation) plus today's close;
+- OBV: yesterday's OBV ± today's cumulative volume.
+
+On each completed minute bar compute_decision and the SIGNAL_RULES are
+re-evaluated against yesterday's row; snapshots of the result go to
+INTRADAY_PATH through serialize.write_json (temp file + os.replace), at most
+once per `interval` seconds plus once at the end of each session. A replay
+spanning several days commits each finished session into the state, so the
+last snapshot of a day equals compute_indicators() over the daily bars.
+
+The dashboard polls the snapshot during the session (useIntraday in
+src/hooks/useMarketData.js) when it is served from this checkout, e.g. by
+`npm run dev`. While the snapshot's session is newer than the daily data,
+its bar and decision replace the header price and the decision card. The
+file is git-ignored. The scheduled workflows never stream, so the deployed
+site shows the daily data only.
+
+Sources yield Bar tuples; `final=False` marks a minute still forming:
+  - ReplaySource       : CSV of minute bars (Datetime,Open,High,Low,Close,Volume)
+  - YFinanceMinuteSource: polls yfinance 1-minute bars until the close
+"""
+
+import csv
+import math
+import time
+from collections import namedtuple
+from datetime import datetime
+from datetime import time as clock_time
+
+import numpy as np
+import pandas as pd
+
+from profiling import count
+from serialize import write_json
+from state_store import BB_PERIOD, MA_PERIODS, build_state
+
+INTRADAY_PATH = "public/data/intraday.json"
+SNAPSHOT_INTERVAL = 5.0     # 초 — 스냅샷 최소 간격
+SESSION_CLOSE = clock_time(15, 30)
+BB_K = 2.0
+
+Bar = namedtuple("Bar", "time open high low close volume final")
+
+
+# ---------------------------------------------------------------------------
+# Sources
+# ---------------------------------------------------------------------------
+
+class ReplaySource:
+    """Minute bars from a CSV file, as fast as possible or paced by `speed`×."""
+
+    def __init__(self, path, speed=0.0):
+        self.path = path
+        self.speed = speed
+
+    def __iter__(self):
+        prev = None
+        with open(self.path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                t = datetime.fromisoformat(row.get("Datetime") or row["Date"])
+                if self.speed > 0 and prev is not None:
+                    time.sleep(max((t - prev).total_seconds(), 0.0) / self.speed)
+                prev = t
+                yield Bar(t, float(row["Open"]), float(row["High"]), float(row["Low"]),
+                          float(row["Close"]), float(row["Volume"] or 0), True)
+
+
+class YFinanceMinuteSource:
+    """Polls today's 1-minute bars; the newest minute is yielded as forming."""
+
+    def __init__(self, ticker="^KS11", poll=30.0, tz="Asia/Seoul", close=SESSION_CLOSE):
+        self.ticker = ticker
+        self.poll = poll
+        self.tz = tz
+        self.close = close
+
+    def _bars(self):
+        import yfinance as yf
+
+        raw = yf.download(self.ticker, period="1d", interval="1m", progress=False, auto_adjust=True)
+        if raw is None or raw.empty:
+            return pd.DataFrame()
+        if isinstance(raw.columns, pd.MultiIndex):
+            raw.columns = raw.columns.get_level_values(0)
+        raw = raw.dropna(subset=["Close"])
+        idx = pd.DatetimeIndex(raw.index)
+        raw.index = (idx.tz_convert(self.tz) if idx.tz is not None else idx).tz_localize(None)
+        return raw
+
+    def __iter__(self):
+        done_until = None                    # 마지막으로 확정(final)해 보낸 분봉 시각
+        while True:
+            df = self._bars()
+            now = pd.Timestamp.now(tz=self.tz).tz_localize(None)
+            closed = now.time() >= self.close
+            if done_until is not None:
+                df = df[df.index > done_until]
+            for i, (t, r) in enumerate(df.iterrows()):
+                final = closed or i < len(df) - 1
+                yield Bar(t.to_pydatetime(), float(r["Open"]), float(r["High"]), float(r["Low"]),
+                          float(r["Close"]), float(r["Volume"]), final)
+                if final:
+                    done_until = t
+            if closed:
+                return
+            time.sleep(self.poll)
+
+
+def open_source(spec, speed=0.0):
+    """'replay:<csv>' or 'yfinance[:<ticker>]' → source."""
+    kind, _, arg = spec.partition(":")
+    if kind == "replay" and arg:
+        return ReplaySource(arg, speed)
+    if kind == "yfinance":
+        return YFinanceMinuteSource(arg or "^KS11")
+    raise ValueError(f"unknown stream source {spec!r} (expected replay:<csv> or yfinance[:<ticker>])")
+
+
+# ---------------------------------------------------------------------------
+# Online indicators
+# ---------------------------------------------------------------------------
+
+class OnlineIndicators:
+    """Today's indicator row from yesterday's IndicatorState, O(1) per update."""
+
+    def __init__(self, state, prev_row):
+        self.state = state
+        self.prev = prev_row                 # 어제 지표 행 (시그널 교차 판정용)
+        self._resum()
+
+    def _resum(self):
+        # 하루에 한 번: 완성된 종가들의 부분합을 정확히 다시 구한다 (누적 오차 없음)
+        closes = self.state.closes
+        self.sums = {p: math.fsum(closes[-(p - 1):]) if len(closes) >= p - 1 else None
+                     for p in MA_PERIODS}
+        n = BB_PERIOD - 1
+        if len(closes) >= n:
+            self.ref = float(closes[-1])
+            d = closes[-n:] - self.ref
+            self.bb_sum, self.bb_sq = math.fsum(d), math.fsum(d * d)
+        else:
+            self.bb_sum = None
+
+    def row(self, close, volume):
+        """Indicator values today would have if it closed at `close` with `volume`."""
+        out = {"Close": close}
+        for p in MA_PERIODS:
+            s = self.sums[p]
+            out[f"ma{p}"] = (s + close) / p if s is not None else float("nan")
+
+        mid = out[f"ma{BB_PERIOD}"]
+        if self.bb_sum is not None:
+            d = close - self.ref
+            s, q = self.bb_sum + d, self.bb_sq + d * d
+            std = math.sqrt(max(q - s * s / BB_PERIOD, 0.0) / (BB_PERIOD - 1))
+        else:
+            std = float("nan")
+        out.update(bb_middle=mid, bb_upper=mid + BB_K * std, bb_lower=mid - BB_K * std)
+
+        rsi, macd, sig = self.state.peek(close)
+        last = self.state.last_close
+        obv = self.state.last_obv + (volume if close > last else -volume if close < last else 0.0)
+        out.update(rsi14=rsi, macd=macd, macd_signal=sig, macd_hist=macd - sig, obv=obv)
+        return out
+
+    def commit(self, close, volume, row):
+        """Fold a finished session into the state (start of the next one)."""
+        self.state.advance(close, volume)
+        self.prev = row
+        self._resum()
+
+
+# ---------------------------------------------------------------------------
+# Session driver
+# ---------------------------------------------------------------------------
+
+def _clean(v):
+    return None if v is None or not math.isfinite(v) else float(v)
+
+
+class IntradaySession:
+    """Aggregates minute bars into today's bar and writes throttled snapshots."""
+
+    def __init__(self, daily, path=INTRADAY_PATH, interval=SNAPSHOT_INTERVAL, clock=time.monotonic):
+        self.daily = daily                   # 일봉 OHLCV — 첫 세션일 이전 행으로 상태를 만든다
+        self.path = path
+        self.interval = interval
+        self.clock = clock
+        self.engine = None
+        self.day = None
+        self.last_write = None
+        self.snapshots = 0
+
+    def _start_day(self, day):
+        hist = self.daily[self.daily.index < pd.Timestamp(day)]
+        if self.engine is None:
+            ind, state = build_state(hist)
+            self.engine = OnlineIndicators(state, ind.iloc[-1].to_dict() if len(ind) else {})
+        self.day = day
+        self.bar = None                      # 확정된 분봉까지의 오늘 OHLCV
+        self.forming = None
+        self.minutes = 0
+        self.signals = []
+        self.last_code = -1
+        self.row = None
+        self.decision = None
+        self.current = None
+
+    def _today(self):
+        bars = [b for b in (self.bar, self.forming) if b is not None]
+        first, last = bars[0], bars[-1]
+        return Bar(last.time, first.open, max(b.high for b in bars), min(b.low for b in bars),
+                   last.close, sum(b.volume for b in bars), last.final)
+
+    def _evaluate(self, today):
+        from fetch_data import SIGNAL_RULES, decide, signal_codes
+
+        row, prev = self.row, self.engine.prev
+        self.decision = decide(row)
+        cols = ["Close", "rsi14", "macd", "macd_signal", "bb_upper", "bb_lower", "ma5", "ma20"]
+        pair = [np.array([prev.get(c, np.nan), row[c]], dtype=float) for c in cols]
+        code = int(signal_codes(*pair)[1])
+        self.current = None
+        if code >= 0:
+            sig_type, reason, strength = SIGNAL_RULES[code]
+            self.current = {"time": today.time.isoformat(timespec="minutes"), "type": sig_type,
+                            "reason": reason, "price": _clean(today.close), "strength": strength}
+            if code != self.last_code:       # 조건이 새로 성립한 분봉만 기록
+                self.signals.append(self.current)
+        self.last_code = code
+
+    def update(self, bar):
+        """Feed one minute bar (O(1) in the history length)."""
+        day = bar.time.date()
+        if self.day != day:
+            if self.day is not None:
+                self.close_session()
+            self._start_day(day)
+        count("stream.ticks")
+        if bar.final:
+            self.bar = bar if self.bar is None else self._today_with(bar)
+            self.forming = None
+            self.minutes += 1
+        else:
+            self.forming = bar
+        today = self._today()
+        self.row = self.engine.row(today.close, today.volume)
+        if bar.final:
+            self._evaluate(today)
+            now = self.clock()
+            if self.last_write is None or now - self.last_write >= self.interval:
+                self.snapshot()
+
+    def _today_with(self, bar):
+        b = self.bar
+        return Bar(bar.time, b.open, max(b.high, bar.high), min(b.low, bar.low),
+                   bar.close, b.volume + bar.volume, True)
+
+    def close_session(self):
+        """Final snapshot of the day, then commit its bar into the state."""
+        if self.day is None or self.row is None:
+            return
+        if self.decision is None:
+            self._evaluate(self._today())
+        self.snapshot(final=True)
+        today = self._today()
+        self.engine.commit(today.close, today.volume, self.row)
+        self.day = None
+
+    def document(self, final=False):
+        today = self._today()
+        prev_close = self.engine.prev.get("Close")
+        return {
+            "asOf": today.time.isoformat(timespec="minutes"),
+            "session": self.day.isoformat(),
+            "final": final,
+            "minutes": self.minutes,
+            "bar": {"date": self.day.isoformat(), "open": _clean(today.open), "high": _clean(today.high),
+                    "low": _clean(today.low), "close": _clean(today.close), "volume": int(today.volume)},
+            "prevClose": _clean(prev_close),
+            "indicators": {k: _clean(v) for k, v in self.row.items() if k != "Close"},
+            "decisionTree": self.decision,
+            "signal": self.current,
+            "signals": self.signals,
+        }
+
+    def snapshot(self, final=False):
+        write_json(self.path, self.document(final))
+        self.last_write = self.clock()
+        self.snapshots += 1
+        count("stream.snapshots")
+
+
+def run(daily, source, path=INTRADAY_PATH, interval=SNAPSHOT_INTERVAL, max_bars=None):
+    """Drive an IntradaySession from `source` until it ends; returns the session."""
+    session = IntradaySession(daily, path, interval)
+    for i, bar in enumerate(source):
+        if max_bars is not None and i >= max_bars:
+            break
+        session.update(bar)
+    session.close_session()
+    return session
@@ -0,0 +1,251 @@
+"""
+KOSPI Strategy Dashboard - 수급현황 scraper (NAVER Finance investorDealTrendDay)
+Fetches KOSPI and KOSDAQ investor net-buy pages concurrently on a bounded
+thread pool, paced by a token-bucket rate limiter. Parsed rows for past
+trading days never change, so they are cached on disk; a daily run normally
+needs only page 1 per market.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from naver_parser import INVESTOR_KEYS, iter_rows
+from profiling import count, stage
+
+NAVER_BASE = "https://finance.naver.com"
+CACHE_DIR = ".cache/naver"
+CACHE_VERSION = 2
+MAX_PAGES = 34              # 페이지당 10행 × 34 = 340일 최대
+LOOKBACK_DAYS = 400         # 1년 + 버퍼
+HOLIDAY_SLACK_DAYS = 14     # 연휴로 마지막 거래일이 오늘보다 이를 수 있는 만큼 더 받는다
+
+MARKETS = [
+    ("kospi",  "01"),       # sosok=01 → 코스피
+    ("kosdaq", "02"),       # sosok=02 → 코스닥
+]
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "ko-KR,ko;q=0.9",
+    "Referer": "https://finance.naver.com/sise/sise_trans_style.naver",
+}
+
+# ---------------------------------------------------------------------------
+# Rate limiting / HTTP
+# ---------------------------------------------------------------------------
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` requests/sec with bursts up to `burst`."""
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class PageFetcher:
+    """GETs investorDealTrendDay pages with one requests.Session per thread."""
+
+    def __init__(self, base_url=NAVER_BASE, bizdate=None, limiter=None, timeout=20):
+        self.base_url = base_url.rstrip("/")
+        self.bizdate = bizdate or datetime.now().strftime("%Y%m%d")
+        self.limiter = limiter
+        self.timeout = timeout
+        self.requests = 0
+        self._count_lock = threading.Lock()
+        self._local = threading.local()
+
+    def _session(self):
+        if not hasattr(self._local, "session"):
+            import requests
+
+            self._local.session = requests.Session()
+            self._local.session.headers.update(HEADERS)
+        return self._local.session
+
+    def __call__(self, market_name, sosok, page):
+        """Raw page bytes, or None on a non-200 response."""
+        if self.limiter is not None:
+            t0 = time.perf_counter()
+            self.limiter.acquire()
+            count("naver.rateLimitWait", time.perf_counter() - t0)
+        url = (f"{self.base_url}/sise/investorDealTrendDay.naver"
+               f"?bizdate={self.bizdate}&sosok={sosok}&page={page}")
+        with self._count_lock:
+            self.requests += 1
+        count("http.naver")
+        with stage("naver.page", market=market_name, page=page) as rec:
+            resp = self._session().get(url, timeout=self.timeout)
+            rec["status"], rec["bytes"] = resp.status_code, len(resp.content)
+        count("http.naver.bytes", len(resp.content))
+        if resp.status_code != 200:
+            print(f"  [{market_name}] p{page}: HTTP {resp.status_code}")
+            return None
+        return resp.content
+
+
+# ---------------------------------------------------------------------------
+# Parsed-row cache
+# ---------------------------------------------------------------------------
+
+class RowCache:
+    """Per-market JSON file of parsed rows for a contiguous range of past days."""
+
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = directory
+
+    def path(self, market):
+        return os.path.join(self.directory, f"{market}.json")
+
+    def load(self, market):
+        try:
+            with open(self.path(market), encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data if data.get("version") == CACHE_VERSION and data.get("rows") else None
+
+    def save(self, market, rows, covers_from):
+        """`covers_from`: every trading day from this date on is in `rows`."""
+        if not rows:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        data = {"version": CACHE_VERSION, "coversFrom": covers_from,
+                "newest": rows[-1]["date"], "rows": rows}
+        tmp = self.path(market) + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, self.path(market))
+
+
+# ---------------------------------------------------------------------------
+# Scraper
+# ---------------------------------------------------------------------------
+
+def _scrape_market(market_name, sosok, fetch, pool, concurrency, keep_from, today, cache):
+    """Ascending rows dated >= keep_from, fetching pages in waves of `concurrency`."""
+    cached = cache.load(market_name) if cache else None
+    # 캐시가 keep_from까지 연속으로 덮고 있을 때만 겹치는 지점에서 멈출 수 있다
+    usable = cached is not None and cached["coversFrom"] <= keep_from
+    rows, page = {}, 1
+    reached_cutoff = reached_cache = done = False
+
+    while not done and page <= MAX_PAGES:
+        # 캐시가 있으면 보통 1페이지로 끝나므로 첫 요청은 1페이지만 보낸다
+        width = 1 if usable and page == 1 else concurrency
+        batch = list(range(page, min(page + width, MAX_PAGES + 1)))
+        futures = [pool.submit(fetch, market_name, sosok, p) for p in batch]
+        for fut in futures:
+            if done:
+                fut.cancel()
+                continue
+            content = fut.result()
+            seen = False
+            # 행 단위 지연 파싱 — 기준일/캐시 경계에 닿으면 나머지는 읽지 않는다
+            for r in iter_rows(content) if content else ():
+                seen = True
+                if r["date"] < keep_from:
+                    reached_cutoff = done = True
+                    break
+                if usable and r["date"] <= cached["newest"]:
+                    reached_cache = done = True
+                    break
+                rows[r["date"]] = r
+            if not seen:
+                done = True
+        page += len(batch)
+
+    if reached_cache:
+        merged = {r["date"]: r for r in cached["rows"] if r["date"] >= keep_from}
+        merged.update(rows)
+        rows = merged
+    series = sorted(rows.values(), key=lambda x: x["date"])
+
+    # 당일 행은 장중/잠정치일 수 있으므로 캐시하지 않는다
+    if cache is not None and (reached_cache or reached_cutoff):
+        covers_from = keep_from if reached_cutoff else cached["coversFrom"]
+        cache.save(market_name, [r for r in series if r["date"] < today], covers_from)
+    return series
+
+
+def window_start(last_date):
+    """First ISO date of the LOOKBACK_DAYS window ending at trading date `last_date`."""
+    last = datetime.strptime(last_date, "%Y-%m-%d")
+    return (last - timedelta(days=LOOKBACK_DAYS - 1)).strftime("%Y-%m-%d")
+
+
+def fetch_supply_demand(base_url=NAVER_BASE, concurrency=4, rate=4.0,
+                        cache_dir=CACHE_DIR, now=None):
+    """코스피/코스닥 투자자별 순매수 데이터 수집
+    KRX API는 국내 IP 제한이 있으므로 NAVER Finance HTML을 사용합니다.
+    단위: 억원 (NAVER 기준). cache_dir=None이면 캐시를 쓰지 않습니다.
+    """
+    now = now or datetime.now()
+    # 수집 범위 — 마지막 거래일 기준 창(window_start)을 연휴 뒤 실행에서도 덮도록 여유를 둔다
+    cutoff = now - timedelta(days=LOOKBACK_DAYS + HOLIDAY_SLACK_DAYS)
+    # cutoff 이전(자정 기준)의 날짜는 제외 → 남기는 첫 날짜
+    keep_from = (cutoff if cutoff.time() == datetime.min.time()
+                 else cutoff + timedelta(days=1)).strftime("%Y-%m-%d")
+    today = now.strftime("%Y-%m-%d")
+    fetch = PageFetcher(base_url, now.strftime("%Y%m%d"), TokenBucket(rate))
+    cache = RowCache(cache_dir) if cache_dir else None
+
+    result = {}
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool, \
+            ThreadPoolExecutor(max_workers=len(MARKETS)) as drivers:
+        jobs = {name: drivers.submit(_scrape_market, name, sosok, fetch, pool,
+                                     concurrency, keep_from, today, cache)
+                for name, sosok in MARKETS}
+
+        for market_name, job in jobs.items():
+            try:
+                series = job.result()
+            except Exception as exc:
+                print(f"  Supply/Demand {market_name}: error → {exc}")
+                continue
+
+            if not series:
+                print(f"  Supply/Demand {market_name}: no data collected")
+                continue
+            # keep_from(벽시계)은 수집 범위일 뿐 — 내보내는 창은 마지막 거래일에서 잘라 휴장일 실행도 같은 행을 낸다
+            first = window_start(series[-1]["date"])
+            series = [r for r in series if r["date"] >= first]
+
+            result[market_name] = {
+                "lastDate": series[-1]["date"],
+                "latest": {k: series[-1][k] for k in INVESTOR_KEYS},
+                "series": series,
+                "unit": "억원",
+            }
+            latest = series[-1]
+            print(
+                f"  Supply/Demand {market_name}: {len(series)} days, "
+                f"latest={latest['date']}, "
+                f"외국인={latest['foreign']:,} / 기관={latest['institution']:,} / "
+                f"개인={latest['individual']:,} 억원"
+            )
+
+    print(f"  Supply/Demand: {fetch.requests} page requests")
+    return result
@@ -1,5 +1,11 @@
-import { useMarketData } from './hooks/useMarketData'
-import { fmtNumber, fmtPct, fmtDateTime } from './utils/formatters'
+import { useCallback, useMemo, useState } from 'react'
+import LookbackChart from './components/LookbackChart'
+import { useIntraday, useMarketData, useShard } from './hooks/useMarketData'
+import { useIndicatorEngine } from './hooks/useIndicatorEngine'
+import { DEFAULT_PARAMS } from './utils/indicatorEngine'
+import { LOD_LOOKBACKS, lodShardName, lookbackSeries, pickLookback } from './utils/lod'
+import { latestOf } from './utils/shards'
+import { fmtNumber, fmtPct, fmtDateTime, fmtInterval } from './utils/formatters'
 
 // ── 공통 카드 래퍼 ─────────────────────────────────────
 function Card({ children, className = '' }) {
@@ -74,6 +80,46 @@ function Range52W({ range52w }) {
   )
 }
 
+// ── 전략 성과 (부트스트랩 신뢰구간 · 무작위 진입 대비 p-value, scripts/resampling.py) ──
+const METRIC_ROWS = [
+  { key: 'winRate',     label: '승률',      fmt: v => `${(v * 100).toFixed(1)}%` },
+  { key: 'avgReturn',   label: '평균 수익', fmt: v => fmtPct(v * 100) },
+  { key: 'mdd',         label: 'MDD',       fmt: v => `${(v * 100).toFixed(1)}%` },
+  { key: 'sharpeRatio', label: '샤프',      fmt: v => v.toFixed(2) },
+]
+
+// 무작위 진입보다 나은 경우가 드물수록(p 가 작을수록) 신호의 우위가 뚜렷하다
+const pClass = p => (p < 0.05 ? 'text-accent-green' : p < 0.2 ? 'text-accent-amber' : 'text-accent-red')
+
+function StrategyMetrics({ metrics }) {
+  if (!metrics) return null
+  // --resamples 0 으로 만든 파일에는 intervals / permutation 이 없다 — 점추정만 보인다
+  const ci = metrics.intervals
+  const perm = metrics.permutation
+  return (
+    <Card>
+      <SectionLabel>전략 성과 (1Y){ci ? ` · ${Math.round(ci.level * 100)}% 신뢰구간` : ''}</SectionLabel>
+      {METRIC_ROWS.map(({ key, label, fmt }) => {
+        const interval = fmtInterval(ci?.[key], fmt)
+        return (
+          <div key={key} className="flex items-center justify-between py-1 border-b border-bg-border last:border-0 text-xs font-mono">
+            <span className="text-slate-500">{label}</span>
+            <span className="flex items-center gap-2">
+              <span className="text-slate-300">{metrics[key] == null ? '—' : fmt(metrics[key])}</span>
+              {interval && <span className="text-slate-500">[{interval}]</span>}
+              {perm?.[key] != null && <span className={pClass(perm[key])}>p {perm[key].toFixed(2)}</span>}
+            </span>
+          </div>
+        )
+      })}
+      <p className="text-xs text-slate-600 font-mono mt-2">
+        매수 {metrics.buySignals ?? 0}건 · 20일 보유
+        {ci && ` · 부트스트랩 ${ci.resamples.toLocaleString()}회 · p = 무작위 진입일 대비`}
+      </p>
+    </Card>
+  )
+}
+
 // ── 기술 지표 상태 배지 ────────────────────────────
 function IndBadge({ label, value, signal, unit = '' }) {
   const colorMap = {
@@ -403,7 +449,7 @@ function SupplyDemand({ supplyDemand }) {
 }
 
 // ── 최근 매매 신호 타임라인 ──────────────────────────
-function SignalTimeline({ signals }) {
+function SignalTimeline({ signals = [] }) {
   const recent = [...signals].reverse().slice(0, 8)
   const strengthLabel = { STRONG: '강', MODERATE: '중', WEAK: '약' }
   return (
@@ -528,11 +574,10 @@ function CorrelationInfo({ correlations, comparison }) {
 }
 
 // ── 헤더 ─────────────────────────────────────────────
-function Header({ ohlcv, metadata }) {
-  const latest = ohlcv?.[ohlcv.length - 1]
-  const prev   = ohlcv?.[ohlcv.length - 2]
-  const change    = latest && prev ? latest.close - prev.close : null
-  const changePct = latest && prev && prev.close ? (change / prev.close) * 100 : null
+function Header({ latest, metadata, asOf }) {
+  const prevClose = latest?.prevClose
+  const change    = latest && prevClose != null ? latest.close - prevClose : null
+  const changePct = latest && prevClose ? (change / prevClose) * 100 : null
   const isUp = (change ?? 0) >= 0
 
   return (
@@ -567,25 +612,248 @@ function Header({ ohlcv, metadata }) {
 
         {/* 업데이트 시간 */}
         <p className="text-xs text-slate-600 font-mono hidden sm:block">
-          {metadata?.lastUpdated ? fmtDateTime(metadata.lastUpdated) : ''} 기준
+          {asOf ? `장중 ${asOf.slice(11, 16)}` : metadata?.lastUpdated ? fmtDateTime(metadata.lastUpdated) : ''} 기준
         </p>
       </div>
     </header>
   )
 }
 
+// ── 다자산 상관행렬 (scripts/correlation.py) ────────────
+const ASSET_LABELS = {
+  kospi: 'KOSPI', kosdaq: 'KOSDAQ', qqq: 'QQQ', sox: 'SOX',
+  spx: 'S&P500', usdkrw: 'USD/KRW', vkospi: 'VKOSPI',
+}
+
+function CorrelationMatrix({ matrix }) {
+  const windows = matrix?.windows ?? []
+  const [picked, setPicked] = useState(null)
+  if (!matrix || !windows.length) return null
+
+  const win = picked ?? (windows.includes(60) ? 60 : windows[0])
+  const grid = matrix.latest?.[win] ?? []
+  const labels = matrix.assets.map(a => ASSET_LABELS[a] || a.toUpperCase())
+  const cellStyle = (v) => {
+    if (v == null) return { background: 'transparent' }
+    const alpha = Math.round(Math.min(Math.abs(v), 1) * 200).toString(16).padStart(2, '0')
+    return { background: `${v >= 0 ? '#00ff88' : '#ff3366'}${alpha}` }
+  }
+
+  return (
+    <Card>
+      <div className="flex items-center justify-between mb-2">
+        <SectionLabel>상관행렬 · {matrix.dates?.[matrix.dates.length - 1] ?? ''}</SectionLabel>
+        <div className="flex gap-1">
+          {windows.map(w => (
+            <button
+              key={w}
+              onClick={() => setPicked(w)}
+              className={`px-2 py-0.5 text-xs font-mono rounded border
+                ${w === win ? 'border-accent-cyan text-accent-cyan' : 'border-bg-border text-slate-500'}`}
+            >
+              {w}D
+            </button>
+          ))}
+        </div>
+      </div>
+      <div className="overflow-x-auto">
+        <table className="text-xs font-mono border-separate border-spacing-0.5">
+          <thead>
+            <tr>
+              <th />
+              {labels.map(l => <th key={l} className="px-1 text-slate-500 font-normal">{l}</th>)}
+            </tr>
+          </thead>
+          <tbody>
+            {grid.map((row, i) => (
+              <tr key={labels[i]}>
+                <th className="pr-2 text-left text-slate-500 font-normal">{labels[i]}</th>
+                {row.map((v, j) => (
+                  <td key={j} className="w-14 text-center py-1 rounded text-slate-200" style={cellStyle(i === j ? null : v)}>
+                    {i === j ? '—' : v == null ? '' : v.toFixed(2)}
+                  </td>
+                ))}
+              </tr>
+            ))}
+          </tbody>
+        </table>
+      </div>
+    </Card>
+  )
+}
+
+// ── 사용자 파라미터 지표 (Web Worker 재계산) ─────────────
+const PARAM_SLIDERS = [
+  { key: 'rsiPeriod',  label: 'RSI 기간',   min: 2,  max: 50,  step: 1 },
+  { key: 'rsiLow',     label: 'RSI 과매도', min: 5,  max: 50,  step: 1 },
+  { key: 'rsiHigh',    label: 'RSI 과매수', min: 50, max: 95,  step: 1 },
+  { key: 'bbPeriod',   label: 'BB 기간',    min: 5,  max: 60,  step: 1 },
+  { key: 'bbK',        label: 'BB 배수',    min: 1,  max: 3.5, step: 0.1 },
+  { key: 'macdFast',   label: 'MACD 단기',  min: 2,  max: 30,  step: 1 },
+  { key: 'macdSlow',   label: 'MACD 장기',  min: 10, max: 60,  step: 1 },
+  { key: 'macdSignal', label: 'MACD 시그널', min: 2, max: 30,  step: 1 },
+]
+
+const lastOf = arr => {
+  const v = arr?.[arr.length - 1]
+  return v == null || Number.isNaN(v) ? null : v
+}
+
+function CustomIndicators({ ohlcv }) {
+  const [params, setParams] = useState(DEFAULT_PARAMS)
+  const result = useIndicatorEngine(ohlcv, params)
+  const ind = result?.indicators
+  const latest = [
+    { label: `RSI(${params.rsiPeriod})`, value: lastOf(ind?.rsi) },
+    { label: `BB 상단(${params.bbPeriod}, ${params.bbK})`, value: lastOf(ind?.bb_upper) },
+    { label: `BB 하단(${params.bbPeriod}, ${params.bbK})`, value: lastOf(ind?.bb_lower) },
+    { label: `MACD(${params.macdFast}, ${params.macdSlow})`, value: lastOf(ind?.macd) },
+    { label: `시그널(${params.macdSignal})`, value: lastOf(ind?.macd_signal) },
+  ]
+
+  return (
+    <div className="grid grid-cols-1 lg:grid-cols-2 gap-3">
+      <Card>
+        <div className="flex items-center justify-between mb-2">
+          <SectionLabel>지표 파라미터</SectionLabel>
+          <button
+            onClick={() => setParams(DEFAULT_PARAMS)}
+            className="px-2 py-0.5 text-xs font-mono rounded border border-bg-border text-slate-500"
+          >
+            기본값
+          </button>
+        </div>
+        <div className="grid grid-cols-2 gap-x-4 gap-y-1.5">
+          {PARAM_SLIDERS.map(({ key, label, min, max, step }) => (
+            <label key={key} className="text-xs font-mono text-slate-500">
+              <span className="flex justify-between">
+                <span>{label}</span>
+                <span className="text-slate-300">{params[key]}</span>
+              </span>
+              <input
+                type="range" min={min} max={max} step={step} value={params[key]}
+                onChange={e => setParams({ ...params, [key]: Number(e.target.value) })}
+                className="w-full" style={{ accentColor: '#00d4ff' }}
+              />
+            </label>
+          ))}
+        </div>
+        <div className="mt-3">
+          {latest.map(l => (
+            <div key={l.label} className="flex justify-between py-1 border-b border-bg-border last:border-0 text-xs font-mono">
+              <span className="text-slate-500">{l.label}</span>
+              <span className="text-slate-300">{fmtNumber(l.value, 2)}</span>
+            </div>
+          ))}
+        </div>
+        {result && (
+          <p className="text-xs text-slate-600 font-mono mt-2">
+            {ohlcv.length}봉 · 신호 {result.signals.length}건 · {result.ms.toFixed(1)} ms
+          </p>
+        )}
+      </Card>
+      <SignalTimeline signals={result?.signals} />
+    </div>
+  )
+}
+
+// ── shard 단위 패널 (summary 이후 지연 로딩) ────────────
+function SupplyDemandPanel({ loadShard }) {
+  const shard = useShard(loadShard, 'supplyDemand')
+  return <SupplyDemand supplyDemand={shard?.supplyDemand} />
+}
+
+function SignalTimelinePanel({ loadShard }) {
+  const shard = useShard(loadShard, 'signals')
+  return <SignalTimeline signals={shard?.signals} />
+}
+
+function CorrelationInfoPanel({ loadShard }) {
+  const shard = useShard(loadShard, 'correlations')
+  return <CorrelationInfo correlations={shard?.correlations} comparison={shard?.comparison} />
+}
+
+function CustomIndicatorsPanel({ loadShard }) {
+  const shard = useShard(loadShard, 'chart')
+  return <CustomIndicators ohlcv={shard?.ohlcv} />
+}
+
+function CorrelationMatrixPanel({ loadShard }) {
+  const shard = useShard(loadShard, 'correlationMatrix')
+  return <CorrelationMatrix matrix={shard?.correlationMatrix} />
+}
+
+// ── 장기 조회 (1Y = chart shard 일봉, 5/10/20Y = lod-<기간> shard) ──
+const RESOLUTION_LABELS = { daily: '일봉', weekly: '주봉', monthly: '월봉' }
+
+// lookback 마다 key 로 다시 마운트 — shard 가 null(로딩 중)에서 시작해 이전 기간의 shard 를 그리지 않는다
+function LookbackView({ loadShard, lookback, range, onZoom }) {
+  const shard = useShard(loadShard, lodShardName(lookback))
+  const series = useMemo(() => lookbackSeries(shard, lookback), [shard, lookback])
+  if (!series) {
+    return (
+      <p className="text-xs text-slate-600 font-mono py-10 text-center">
+        {shard ? `${lookback.toUpperCase()} 데이터 없음` : '불러오는 중…'}
+      </p>
+    )
+  }
+  return (
+    <>
+      <LookbackChart series={series} range={range} onZoom={onZoom} />
+      <p className="text-xs text-slate-600 font-mono mt-1">
+        {RESOLUTION_LABELS[series.resolution] ?? series.resolution} · {series.cols.x.length}봉
+      </p>
+    </>
+  )
+}
+
+function LookbackPanel({ loadShard }) {
+  // 버튼은 기간을 고르고, 확대하면 그 구간을 덮는 가장 짧은(해상도가 높은) lookback 으로 바꾼다
+  const [view, setView] = useState({ days: LOD_LOOKBACKS[0].days, range: null })
+  const lookback = pickLookback(view.days)
+  const onZoom = useCallback((range, days) =>
+    setView(v => (range ? { days, range } : { ...v, range: null })), [])
+
+  return (
+    <Card>
+      <div className="flex items-center justify-between mb-2">
+        <SectionLabel>KOSPI 장기 조회</SectionLabel>
+        <div className="flex gap-1">
+          {LOD_LOOKBACKS.map(l => (
+            <button
+              key={l.key}
+              onClick={() => setView({ days: l.days, range: null })}
+              className={`px-2 py-0.5 text-xs font-mono rounded border
+                ${l.key === lookback ? 'border-accent-cyan text-accent-cyan' : 'border-bg-border text-slate-500'}`}
+            >
+              {l.key.toUpperCase()}
+            </button>
+          ))}
+        </div>
+      </div>
+      <LookbackView key={lookback} loadShard={loadShard} lookback={lookback} range={view.range} onZoom={onZoom} />
+    </Card>
+  )
+}
+
 // ── 메인 App ─────────────────────────────────────────
 export default function App() {
-  const { data, loading, error } = useMarketData()
+  const { data, loading, error, loadShard } = useMarketData()
+  // 장중(fetch_data.py --stream 실행 중)에는 오늘 형성 중인 봉과 그 결정이 일봉 값을 대신한다
+  const intraday = useIntraday(data ? latestOf(data)?.date : null)
 
   if (loading || error) return <LoadingScreen error={error} />
 
-  const { metadata, ohlcv, signals, correlations, comparison, decisionTree, range52w, supplyDemand } = data
-  const latestPrice = ohlcv?.[ohlcv.length - 1]?.close
+  const { metadata, range52w, metrics } = data
+  const latest = intraday
+    ? { date: intraday.session, close: intraday.bar.close, prevClose: intraday.prevClose, volume: intraday.bar.volume }
+    : latestOf(data)
+  const decisionTree = intraday?.decisionTree ?? data.decisionTree
+  const latestPrice = latest?.close
 
   return (
     <div className="min-h-screen bg-bg-primary text-slate-200 animate-fade-in">
-      <Header ohlcv={ohlcv} metadata={metadata} />
+      <Header latest={latest} metadata={metadata} asOf={intraday?.asOf} />
 
       <main className="px-4 pb-10 space-y-3 max-w-[1400px] mx-auto">
 
@@ -597,18 +865,32 @@ export default function App() {
           <SupportResistance decisionTree={decisionTree} currentPrice={latestPrice} />
         </div>
 
-        {/* ② 52주 레인지 */}
-        <Range52W range52w={range52w} />
+        {/* ② 52주 레인지 + 전략 성과 (신뢰구간) */}
+        <div className="grid grid-cols-1 lg:grid-cols-3 gap-3">
+          <div className="lg:col-span-2">
+            <Range52W range52w={range52w} />
+          </div>
+          <StrategyMetrics metrics={metrics} />
+        </div>
 
         {/* ③ 코스피/코스닥 수급현황 */}
-        <SupplyDemand supplyDemand={supplyDemand} />
+        <SupplyDemandPanel loadShard={loadShard} />
 
         {/* ④ 매매 신호 + 상관관계 */}
         <div className="grid grid-cols-1 lg:grid-cols-2 gap-3">
-          <SignalTimeline signals={signals} />
-          <CorrelationInfo correlations={correlations} comparison={comparison} />
+          <SignalTimelinePanel loadShard={loadShard} />
+          <CorrelationInfoPanel loadShard={loadShard} />
         </div>
 
+        {/* ⑤ 다자산 상관행렬 */}
+        <CorrelationMatrixPanel loadShard={loadShard} />
+
+        {/* ⑥ 사용자 파라미터 지표 · 신호 */}
+        <CustomIndicatorsPanel loadShard={loadShard} />
+
+        {/* ⑦ 장기 조회 (1/5/10/20년) */}
+        <LookbackPanel loadShard={loadShard} />
+
       </main>
     </div>
   )
@@ -1,4 +1,4 @@
-import { fmtNumber, fmtPct } from '../utils/formatters'
+import { fmtNumber, fmtPct, fmtInterval } from '../utils/formatters'
 import { COLORS } from '../constants/chartTheme'
 
 const SIGNAL_COLOR = {
@@ -41,6 +41,29 @@ function LevelRow({ item, type }) {
   )
 }
 
+// metrics.intervals 키 → 표시 (scripts/resampling.py)
+const INTERVAL_ROWS = [
+  { key: 'winRate',     label: '승률',      fmt: v => `${(v * 100).toFixed(1)}%` },
+  { key: 'avgReturn',   label: '평균 수익', fmt: v => fmtPct(v * 100) },
+  { key: 'mdd',         label: 'MDD',       fmt: v => `${(v * 100).toFixed(1)}%` },
+  { key: 'sharpeRatio', label: '샤프',      fmt: v => v.toFixed(2) },
+]
+
+function IntervalRow({ label, value, interval, p, fmt }) {
+  // 무작위 진입보다 나은 경우가 드물수록(p 가 작을수록) 신호의 우위가 뚜렷하다
+  const col = p == null ? COLORS.amber : p < 0.05 ? COLORS.green : p < 0.2 ? COLORS.amber : COLORS.red
+  return (
+    <div className="flex items-center justify-between py-1.5 border-b border-bg-border last:border-0 text-xs">
+      <span className="text-slate-400">{label}</span>
+      <div className="flex items-center gap-2 font-mono">
+        <span className="text-slate-300">{fmt(value ?? 0)}</span>
+        <span className="text-slate-500">[{fmtInterval(interval, fmt)}]</span>
+        {p != null && <span style={{ color: col }}>p {p.toFixed(2)}</span>}
+      </div>
+    </div>
+  )
+}
+
 export default function DecisionSidebar({ decisionTree: dt, range52w, metrics }) {
   if (!dt) return null
 
@@ -163,6 +186,29 @@ export default function DecisionSidebar({ decisionTree: dt, range52w, metrics })
         />
       </div>
 
+      {/* ── Metric confidence intervals ──────────────────────── */}
+      {metrics?.intervals && (
+        <div className="card">
+          <span className="stat-label block mb-1">
+            전략 성과 {Math.round(metrics.intervals.level * 100)}% 신뢰구간
+          </span>
+          {INTERVAL_ROWS.map(r => (
+            <IntervalRow
+              key={r.key}
+              label={r.label}
+              value={metrics[r.key]}
+              interval={metrics.intervals[r.key]}
+              p={metrics.permutation?.[r.key]}
+              fmt={r.fmt}
+            />
+          ))}
+          <div className="text-[10px] text-slate-600 mt-1.5">
+            매수 {metrics.buySignals}건 부트스트랩 · p = 무작위 진입일 대비
+            ({metrics.intervals.resamples.toLocaleString()}회)
+          </div>
+        </div>
+      )}
+
       {/* ── Support / Resistance ─────────────────────────────── */}
       <div className="card">
         <span className="stat-label block mb-2">지지 / 저항</span>
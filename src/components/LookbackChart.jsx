@@ -0,0 +1,91 @@
+import ReactApexChart from 'react-apexcharts'
+import { useMemo } from 'react'
+import { APEX_BASE, COLORS, MA_META } from '../constants/chartTheme'
+import { candleTuples, isoDate, pointPairs } from '../utils/chartData'
+
+const DAY_MS = 86_400_000
+
+// series: lookbackSeries() 결과 — 캔들은 봉 날짜(cols.x), 이동평균은 선마다 자체 날짜(LTTB)로 그린다
+// range: [min, max] 확대 구간 (null = 전체)
+// onZoom(range, days): 확대 시 구간과 그 시작부터 마지막 봉까지의 일수 (lookback 은 마지막 봉에서 거꾸로 잰다),
+//                      리셋 시 onZoom(null)
+export default function LookbackChart({ series, range, onZoom }) {
+  const { chartSeries, options } = useMemo(() => {
+    const { cols, lines } = series
+    const mas = MA_META.filter(m => lines[m.key])
+
+    const seriesArr = [
+      { name: 'KOSPI', type: 'candlestick', data: candleTuples(cols) },
+      ...mas.map(m => ({ name: m.label, type: 'line', data: pointPairs(lines[m.key], lines[m.key].y) })),
+    ]
+
+    const opts = {
+      ...APEX_BASE,
+      chart: {
+        ...APEX_BASE.chart,
+        id: 'kospi-lookback',
+        height: 360,
+        type: 'candlestick',
+        events: {
+          zoomed: (_, { xaxis }) => {
+            if (xaxis?.min == null || xaxis?.max == null) return onZoom(null)
+            onZoom([xaxis.min, xaxis.max], (cols.x[cols.x.length - 1] - xaxis.min) / DAY_MS)
+          },
+          beforeResetZoom: () => { onZoom(null) },
+        },
+      },
+      plotOptions: {
+        candlestick: {
+          colors: { upward: COLORS.up, downward: COLORS.down },
+          wick: { useFillColor: true },
+        },
+      },
+      stroke: {
+        width: [0, ...mas.map(m => m.width)],
+        dashArray: [0, ...mas.map(m => m.dashArray)],
+        curve: 'straight',
+      },
+      colors: [COLORS.up, ...mas.map(m => m.color)],
+      legend: { ...APEX_BASE.legend, show: true },
+      xaxis: { ...APEX_BASE.xaxis, min: range?.[0], max: range?.[1] },
+      yaxis: {
+        ...APEX_BASE.yaxis,
+        labels: {
+          ...APEX_BASE.yaxis.labels,
+          formatter: v => v ? v.toLocaleString('ko-KR', { maximumFractionDigits: 0 }) : '',
+        },
+      },
+      responsive: [{
+        breakpoint: 640,
+        options: {
+          chart: { height: 240, toolbar: { show: false } },
+          legend: { show: false },
+        },
+      }],
+      tooltip: {
+        ...APEX_BASE.tooltip,
+        shared: false,
+        custom({ seriesIndex, dataPointIndex }) {
+          if (seriesIndex !== 0 || !(dataPointIndex < cols.x.length)) return ''
+          const i = dataPointIndex
+          const color = cols.close[i] >= cols.open[i] ? COLORS.up : COLORS.down
+          const num = v => (Number.isNaN(v) ? '—' : v.toLocaleString('ko-KR'))
+          return `
+            <div style="padding:10px;font-family:'JetBrains Mono',monospace;font-size:11px;min-width:160px">
+              <div style="color:#00d4ff;margin-bottom:6px;font-size:12px">${isoDate(cols.x[i])}</div>
+              <div style="display:grid;grid-template-columns:1fr 1fr;gap:2px">
+                <span style="color:#64748b">시가</span><span style="color:${color}">${num(cols.open[i])}</span>
+                <span style="color:#64748b">고가</span><span style="color:${COLORS.up}">${num(cols.high[i])}</span>
+                <span style="color:#64748b">저가</span><span style="color:${COLORS.down}">${num(cols.low[i])}</span>
+                <span style="color:#64748b">종가</span><span style="color:${color};font-weight:600">${num(cols.close[i])}</span>
+              </div>
+            </div>`
+        },
+      },
+    }
+
+    return { chartSeries: seriesArr, options: opts }
+  }, [series, range, onZoom])
+
+  return <ReactApexChart options={options} series={chartSeries} type="candlestick" height={360} />
+}
@@ -1,25 +1,16 @@
 import ReactApexChart from 'react-apexcharts'
 import { useMemo } from 'react'
 import { APEX_BASE, COLORS } from '../constants/chartTheme'
-import { toTs } from '../utils/formatters'
+import { chartLabels, chartValues, indicatorColumn, ohlcvColumns } from '../utils/chartData'
 
+// ohlcv: 행 배열 또는 바이너리 columns — 시리즈는 공유 labels(x) + 값 배열
 export default function MACDChart({ ohlcv, indicators }) {
   const { series, options } = useMemo(() => {
-    const dateSet = new Set(ohlcv.map(c => c.date))
-
-    const filter = arr =>
-      (arr || []).filter(d => dateSet.has(d.date))
-
-    const macdArr = filter(indicators.macd)
-    const sigArr = filter(indicators.macd_signal)
-    const histArr = filter(indicators.macd_hist)
-
-    // Color histogram bars
-    const histData = histArr.map(d => ({
-      x: toTs(d.date),
-      y: d.value,
-      fillColor: d.value >= 0 ? COLORS.up : COLORS.down,
-    }))
+    const cols = ohlcvColumns(ohlcv)
+    const macdData = chartValues(indicatorColumn(cols, indicators.macd))
+    const sigData = chartValues(indicatorColumn(cols, indicators.macd_signal))
+    // 히스토그램 색은 plotOptions.bar.colors.ranges (0 기준) 가 정한다
+    const histData = chartValues(indicatorColumn(cols, indicators.macd_hist))
 
     const seriesArr = [
       {
@@ -30,17 +21,18 @@ export default function MACDChart({ ohlcv, indicators }) {
       {
         name: 'MACD',
         type: 'line',
-        data: macdArr.map(d => ({ x: toTs(d.date), y: d.value })),
+        data: macdData,
       },
       {
         name: '시그널',
         type: 'line',
-        data: sigArr.map(d => ({ x: toTs(d.date), y: d.value })),
+        data: sigData,
       },
     ]
 
     const opts = {
       ...APEX_BASE,
+      labels: chartLabels(cols),
       chart: {
         ...APEX_BASE.chart,
         id: 'kospi-macd',
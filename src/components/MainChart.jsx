@@ -1,37 +1,38 @@
 import ReactApexChart from 'react-apexcharts'
 import { useMemo } from 'react'
 import { APEX_BASE, COLORS, MA_META } from '../constants/chartTheme'
-import { toTs, alignToOHLCV } from '../utils/formatters'
+import { toTs } from '../utils/formatters'
+import { candleTuples, indicatorColumn, isoDate, ohlcvColumns, pointPairs } from '../utils/chartData'
 
+// ohlcv: 행 배열 또는 바이너리 아티팩트의 columns (data.columns) — 행 객체를 만들지 않고 그린다
 export default function MainChart({ ohlcv, indicators, signals, supportResistance }) {
   const { series, options } = useMemo(() => {
+    const cols = ohlcvColumns(ohlcv)
+
     // ── Candlestick series ────────────────────────────────────────────────
     const candleSeries = {
       name: 'KOSPI',
       type: 'candlestick',
-      data: ohlcv.map(c => ({
-        x: toTs(c.date),
-        y: [c.open, c.high, c.low, c.close].map(v => v ?? null),
-      })),
+      data: candleTuples(cols),
     }
 
     // ── MA series ─────────────────────────────────────────────────────────
     const maSeries = MA_META.map(m => ({
       name: m.label,
       type: 'line',
-      data: alignToOHLCV(ohlcv, indicators[m.key]),
+      data: pointPairs(cols, indicatorColumn(cols, indicators[m.key])),
     }))
 
     // ── Bollinger Band series ─────────────────────────────────────────────
     const bbUpper = {
       name: 'BB상단',
       type: 'line',
-      data: alignToOHLCV(ohlcv, indicators.bb_upper),
+      data: pointPairs(cols, indicatorColumn(cols, indicators.bb_upper)),
     }
     const bbLower = {
       name: 'BB하단',
       type: 'line',
-      data: alignToOHLCV(ohlcv, indicators.bb_lower),
+      data: pointPairs(cols, indicatorColumn(cols, indicators.bb_lower)),
     }
 
     const seriesArr = [candleSeries, ...maSeries, bbUpper, bbLower]
@@ -139,9 +140,12 @@ export default function MainChart({ ohlcv, indicators, signals, supportResistanc
       tooltip: {
         ...APEX_BASE.tooltip,
         custom({ seriesIndex, dataPointIndex, w }) {
-          if (seriesIndex !== 0) return ''
-          const d = ohlcv[dataPointIndex]
-          if (!d) return ''
+          if (seriesIndex !== 0 || !(dataPointIndex < cols.x.length)) return ''
+          const i = dataPointIndex
+          const d = {
+            date: isoDate(cols.x[i]), open: cols.open[i], high: cols.high[i],
+            low: cols.low[i], close: cols.close[i], volume: cols.volume[i],
+          }
           const sig = signals.find(s => s.date === d.date)
           const color = d.close >= d.open ? COLORS.up : COLORS.down
           const sigHtml = sig
@@ -1,4 +1,4 @@
-import { fmtPct } from '../utils/formatters'
+import { fmtPct, fmtInterval } from '../utils/formatters'
 import { COLORS } from '../constants/chartTheme'
 
 function Card({ label, value, sub, color, icon, tooltip }) {
@@ -27,6 +27,18 @@ export default function MetricsCards({ metrics, signals }) {
   const sharpe = metrics?.sharpeRatio ?? 0
   const avgRet = metrics?.avgReturn ?? 0
 
+  // 부트스트랩 신뢰구간 / 무작위 진입 대비 p-value (scripts/resampling.py) — 없으면 표시하지 않는다
+  const ci = metrics?.intervals
+  const perm = metrics?.permutation
+  const level = ci ? `${Math.round(ci.level * 100)}% CI ` : ''
+  const pct = v => `${(v * 100).toFixed(1)}%`
+  const ciNote = (key, fmt) => {
+    const text = fmtInterval(ci?.[key], fmt)
+    if (!text) return ''
+    const p = perm?.[key] != null ? ` · 무작위 진입 대비 p=${perm[key].toFixed(3)}` : ''
+    return `\n${level}${text}${p} (${ci.resamples.toLocaleString()}회 리샘플)`
+  }
+
   // Win rate color
   const wrColor = winRate >= 0.6 ? COLORS.green : winRate >= 0.5 ? COLORS.amber : COLORS.red
   // Sharpe color
@@ -39,26 +51,41 @@ export default function MetricsCards({ metrics, signals }) {
       <Card
         label="전략 승률 (1Y)"
         value={`${(winRate * 100).toFixed(1)}%`}
-        sub={`수익 ${metrics?.profitableSignals ?? 0} / ${metrics?.buySignals ?? 0} 매수 시그널`}
+        sub={
+          <span>
+            수익 {metrics?.profitableSignals ?? 0} / {metrics?.buySignals ?? 0} 매수 시그널
+            {ci?.winRate && <span className="block text-slate-600">{level}{fmtInterval(ci.winRate, pct)}</span>}
+          </span>
+        }
         color={wrColor}
         icon="🎯"
-        tooltip="BB하단+RSI 등 매수 시그널 후 20일 홀딩 기준 양수 수익률 비율"
+        tooltip={"BB하단+RSI 등 매수 시그널 후 20일 홀딩 기준 양수 수익률 비율" + ciNote('winRate', pct)}
       />
       <Card
         label="최대 낙폭 MDD"
         value={`${(mdd * 100).toFixed(1)}%`}
-        sub={`평균 수익: ${fmtPct(avgRet * 100)} / 트레이드`}
+        sub={
+          <span>
+            평균 수익: {fmtPct(avgRet * 100)} / 트레이드
+            {ci?.mdd && <span className="block text-slate-600">{level}{fmtInterval(ci.mdd, pct)}</span>}
+          </span>
+        }
         color={mddColor}
         icon="📉"
-        tooltip="전략 실행 시 누적 수익 기준 최대 낙폭"
+        tooltip={"전략 실행 시 누적 수익 기준 최대 낙폭" + ciNote('mdd', pct) + ciNote('avgReturn', pct)}
       />
       <Card
         label="샤프 비율"
         value={sharpe.toFixed(2)}
-        sub={`RF 3% 기준 / 연환산`}
+        sub={
+          <span>
+            RF 3% 기준 / 연환산
+            {ci?.sharpeRatio && <span className="block text-slate-600">{level}{fmtInterval(ci.sharpeRatio)}</span>}
+          </span>
+        }
         color={shColor}
         icon="⚡"
-        tooltip="(평균수익 - 무위험수익) / 표준편차 × √(252/20)"
+        tooltip={"(평균수익 - 무위험수익) / 표준편차 × √(252/20)" + ciNote('sharpeRatio')}
       />
       <Card
         label="시그널 현황 (1Y)"
@@ -1,21 +1,23 @@
 import ReactApexChart from 'react-apexcharts'
 import { useMemo } from 'react'
 import { APEX_BASE, COLORS } from '../constants/chartTheme'
-import { alignToOHLCV } from '../utils/formatters'
+import { chartLabels, chartValues, hasValues, indicatorColumn, ohlcvColumns } from '../utils/chartData'
 
+// ohlcv: 행 배열 또는 바이너리 columns — 시리즈는 공유 labels(x) + 값 배열
 export default function RSIChart({ ohlcv, indicators }) {
   const { series, options } = useMemo(() => {
-    const rsiData = alignToOHLCV(ohlcv, indicators.rsi14)
-    const vkospiData = alignToOHLCV(ohlcv, indicators.vkospi)
-    const hasVkospi = vkospiData.some(d => d.y !== null)
+    const cols = ohlcvColumns(ohlcv)
+    const vkospi = indicatorColumn(cols, indicators.vkospi)
+    const hasVkospi = hasValues(vkospi)
 
     const seriesArr = [
-      { name: 'RSI(14)', type: 'line', data: rsiData },
-      ...(hasVkospi ? [{ name: 'VKOSPI', type: 'line', data: vkospiData }] : []),
+      { name: 'RSI(14)', type: 'line', data: chartValues(indicatorColumn(cols, indicators.rsi14)) },
+      ...(hasVkospi ? [{ name: 'VKOSPI', type: 'line', data: chartValues(vkospi) }] : []),
     ]
 
     const opts = {
       ...APEX_BASE,
+      labels: chartLabels(cols),
       chart: {
         ...APEX_BASE.chart,
         id: 'kospi-rsi',
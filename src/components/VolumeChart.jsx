@@ -1,34 +1,33 @@
 import ReactApexChart from 'react-apexcharts'
 import { useMemo } from 'react'
 import { APEX_BASE, COLORS } from '../constants/chartTheme'
-import { toTs, alignToOHLCV } from '../utils/formatters'
+import { chartLabels, chartValues, indicatorColumn, ohlcvColumns } from '../utils/chartData'
 
+function absMax(arr) {
+  let m = 0
+  for (let i = 0; i < arr.length; i++) if (Math.abs(arr[i]) > m) m = Math.abs(arr[i])   // NaN 은 건너뛴다
+  return m
+}
+
+// ohlcv: 행 배열 또는 바이너리 columns — 시리즈는 공유 labels(x) + 값 배열
 export default function VolumeChart({ ohlcv, indicators }) {
   const { series, options } = useMemo(() => {
-    // Volume bars with up/down coloring
-    const volData = ohlcv.map(c => ({
-      x: toTs(c.date),
-      y: c.volume,
-      fillColor: c.close >= c.open ? COLORS.up : COLORS.down,
-      strokeColor: c.close >= c.open ? COLORS.up : COLORS.down,
-    }))
+    const cols = ohlcvColumns(ohlcv)
+    // 상승/하락 색은 점마다 객체를 두지 않고 colors 함수가 종가/시가 컬럼에서 고른다
+    const barColor = ({ dataPointIndex: i }) => (cols.close[i] >= cols.open[i] ? COLORS.up : COLORS.down)
 
     // OBV (normalize to millions for readability)
-    const obvRaw = alignToOHLCV(ohlcv, indicators.obv)
-    const obvMax = Math.max(...obvRaw.map(d => Math.abs(d.y ?? 0)))
-    const obvScale = obvMax > 0 ? obvMax : 1
-    const obvData = obvRaw.map(d => ({
-      x: d.x,
-      y: d.y !== null ? (d.y / obvScale) * Math.max(...ohlcv.map(c => c.volume)) * 0.8 : null,
-    }))
+    const obv = indicatorColumn(cols, indicators.obv)
+    const obvScale = absMax(obv) || 1
 
     const seriesArr = [
-      { name: '거래량', type: 'bar', data: volData },
-      { name: 'OBV(정규화)', type: 'line', data: obvData },
+      { name: '거래량', type: 'bar', data: chartValues(cols.volume) },
+      { name: 'OBV(정규화)', type: 'line', data: chartValues(obv, (absMax(cols.volume) * 0.8) / obvScale) },
     ]
 
     const opts = {
       ...APEX_BASE,
+      labels: chartLabels(cols),
       chart: {
         ...APEX_BASE.chart,
         id: 'kospi-volume',
@@ -41,16 +40,10 @@ export default function VolumeChart({ ohlcv, indicators }) {
         dashArray: [0, 0],
         curve: 'smooth',
       },
-      colors: [COLORS.up, COLORS.cyan],
+      colors: [barColor, COLORS.cyan],
       plotOptions: {
         bar: {
           columnWidth: '85%',
-          colors: {
-            ranges: [
-              { from: -Infinity, to: 0, color: COLORS.down },
-              { from: 0, to: Infinity, color: COLORS.up },
-            ],
-          },
         },
       },
       dataLabels: { enabled: false },
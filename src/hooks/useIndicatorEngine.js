@@ -0,0 +1,63 @@
+import { useState, useEffect, useRef } from 'react'
+import { ohlcvArrays } from '../utils/indicatorEngine'
+
+/**
+ * ohlcv 행 배열 + 사용자 파라미터 → { indicators, signals, ms } (계산 전에는 null).
+ * 계산은 Web Worker 에서 하고, 요청은 한 번에 하나만 보낸다 — 응답을 기다리는 동안
+ * 들어온 파라미터는 마지막 것만 남겨 두었다가 보내므로 슬라이더를 끌어도 밀리지 않는다.
+ */
+export function useIndicatorEngine(ohlcv, params) {
+  const [result, setResult] = useState(null)
+  const ref = useRef(null)
+
+  useEffect(() => {
+    const worker = new Worker(new URL('../workers/indicatorWorker.js', import.meta.url), { type: 'module' })
+    const st = { worker, gen: 0, busy: false, pending: null, arrays: {} }
+    st.send = p => {
+      st.busy = true
+      st.last = p
+      worker.postMessage({ type: 'compute', gen: st.gen, params: p })
+    }
+    worker.onmessage = ({ data: msg }) => {
+      st.busy = false
+      if (msg.gen === st.gen) {
+        // 바뀐 지표만 온다 — 나머지는 직전 배열을 그대로 쓴다
+        Object.assign(st.arrays, msg.changed)
+        const indicators = Object.fromEntries(msg.names.map(name => [name, st.arrays[name]]))
+        setResult({ indicators, signals: msg.signals, ms: msg.ms })
+      }
+      if (st.pending) {
+        const p = st.pending
+        st.pending = null
+        st.send(p)
+      }
+    }
+    worker.onerror = err => console.error('Indicator worker failed:', err.message)
+    ref.current = st
+    return () => {
+      worker.terminate()
+      ref.current = null
+    }
+  }, [])
+
+  useEffect(() => {
+    const st = ref.current
+    if (!st || !ohlcv?.length) return
+    // 새 시계열: 세대를 올려 이전 시계열에 대한 응답은 버린다
+    st.gen += 1
+    st.arrays = {}
+    const { dates, close, volume } = ohlcvArrays(ohlcv)
+    st.worker.postMessage({ type: 'load', gen: st.gen, dates, close, volume }, [close.buffer, volume.buffer])
+    st.pending = null
+    st.send(params)
+  }, [ohlcv])
+
+  useEffect(() => {
+    const st = ref.current
+    if (!st || !st.gen || params === st.last) return
+    if (st.busy) st.pending = params
+    else st.send(params)
+  }, [params])
+
+  return result
+}
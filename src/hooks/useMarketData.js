@@ -1,18 +1,57 @@
 import { useState, useEffect } from 'react'
+import { normalizeMarketData } from '../utils/columnar'
+import { loadBinaryMarketData, toMarketData } from '../utils/binaryData'
+import { loadManifest, createShardLoader, wholeDocumentLoader } from '../utils/shards'
 
+const INTRADAY_POLL_MS = 15_000           // streaming.py 스냅샷 간격(기본 5초)보다 길게
+const KST_OFFSET_MS = 9 * 3_600_000
+
+async function loadJson(base) {
+  const res = await fetch(`${base}data/market_data.json`)
+  if (!res.ok) throw new Error(`HTTP ${res.status}: ${res.statusText}`)
+  const json = await res.json()
+  return normalizeMarketData(json)   // 행 형식 / columnar(v2) 모두 지원
+}
+
+// 단일 파일: 바이너리 아티팩트(fetch_data.py --binary)가 있으면 우선 사용, 없으면 JSON
+async function loadWhole(base) {
+  try {
+    return toMarketData(await loadBinaryMarketData(`${base}data/market_data.bin`))
+  } catch (binErr) {
+    console.info('market_data.bin unavailable, using JSON:', binErr.message)
+    return loadJson(base)
+  }
+}
+
+/**
+ * 첫 화면 데이터. manifest.json(fetch_data.py --shards)이 있으면 summary shard 만 받고,
+ * 나머지 패널 데이터는 useShard(loadShard, name) 로 필요할 때 받는다.
+ */
 export function useMarketData() {
   const [data, setData] = useState(null)
+  const [loadShard, setLoadShard] = useState(null)
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState(null)
 
   useEffect(() => {
     const fetchData = async () => {
+      const base = import.meta.env.BASE_URL
       try {
-        const url = `${import.meta.env.BASE_URL}data/market_data.json`
-        const res = await fetch(url)
-        if (!res.ok) throw new Error(`HTTP ${res.status}: ${res.statusText}`)
-        const json = await res.json()
-        setData(json)
+        let manifest = null
+        try {
+          manifest = await loadManifest(base)
+        } catch (err) {
+          console.info('manifest.json unavailable, loading the whole document:', err.message)
+        }
+        if (manifest) {
+          const loader = createShardLoader(base, manifest)
+          setData(await loader('summary'))
+          setLoadShard(() => loader)
+        } else {
+          const doc = await loadWhole(base)
+          setData(doc)
+          setLoadShard(() => wholeDocumentLoader(doc))
+        }
       } catch (err) {
         console.error('Failed to load market data:', err)
         setError(err.message)
@@ -23,5 +62,61 @@ export function useMarketData() {
     fetchData()
   }, [])
 
-  return { data, loading, error }
+  return { data, loading, error, loadShard }
+}
+
+/** 패널이 마운트될 때 해당 shard 를 받아온다 (받기 전에는 null) */
+export function useShard(loadShard, name) {
+  const [shard, setShard] = useState(null)
+
+  useEffect(() => {
+    if (!loadShard) return
+    let alive = true
+    loadShard(name)
+      .then(doc => { if (alive) setShard(doc) })
+      .catch(err => console.error(`Failed to load shard ${name}:`, err))
+    return () => { alive = false }
+  }, [loadShard, name])
+
+  return shard
+}
+
+/** KRX 정규장(평일 09:00–15:30 KST) 중인지 */
+function inSession(now = Date.now()) {
+  const kst = new Date(now + KST_OFFSET_MS)
+  const day = kst.getUTCDay()
+  const minute = kst.getUTCHours() * 60 + kst.getUTCMinutes()
+  return day >= 1 && day <= 5 && minute >= 9 * 60 && minute <= 15 * 60 + 30
+}
+
+/**
+ * 장중 스냅샷 (fetch_data.py --stream 이 쓰는 data/intraday.json). 마운트 때 한 번 받고,
+ * 장중에는 INTRADAY_POLL_MS 마다 다시 받는다. 파일이 없으면(정적 배포 등) null.
+ * 일봉 데이터(lastDate)에 이미 들어간 세션의 스냅샷은 버린다.
+ */
+export function useIntraday(lastDate) {
+  const [snapshot, setSnapshot] = useState(null)
+
+  useEffect(() => {
+    const url = `${import.meta.env.BASE_URL}data/intraday.json`
+    let alive = true
+    const load = async () => {
+      try {
+        const res = await fetch(url, { cache: 'no-store' })
+        if (!res.ok) return
+        const doc = await res.json()
+        if (alive) setSnapshot(doc)
+      } catch (err) {
+        console.info('intraday.json unavailable:', err.message)
+      }
+    }
+    load()
+    const timer = setInterval(() => { if (inSession()) load() }, INTRADAY_POLL_MS)
+    return () => {
+      alive = false
+      clearInterval(timer)
+    }
+  }, [])
+
+  return snapshot && lastDate && snapshot.session > lastDate ? snapshot : null
 }
@@ -0,0 +1,73 @@
+// market_data.bin (KDB1) 로더 — 레이아웃은 scripts/binary_artifact.py 참고
+// 컬럼 버퍼 위에 Float64Array/BigInt64Array 뷰만 씌우므로 복사·행 객체 할당이 없다
+
+const MAGIC = 'KDB1'
+const VERSION = 1
+const PREFIX_BYTES = 12
+const DAY_MS = 86_400_000
+const OHLCV_KEYS = ['date', 'open', 'high', 'low', 'close', 'volume']
+
+const LITTLE_ENDIAN = new Uint8Array(new Uint16Array([1]).buffer)[0] === 1
+
+/** ArrayBuffer → { header, columns: { name: TypedArray } } */
+export function parseBinaryMarketData(buf) {
+  if (!LITTLE_ENDIAN) throw new Error('big-endian platform: binary artifact unsupported')
+  const view = new DataView(buf)
+  const magic = String.fromCharCode(...new Uint8Array(buf, 0, 4))
+  if (magic !== MAGIC || view.getUint16(4, true) !== VERSION) {
+    throw new Error('not a KDB1 market data artifact')
+  }
+  const headerLen = view.getUint32(8, true)
+  const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buf, PREFIX_BYTES, headerLen)))
+  const columns = {}
+  for (const c of header.columns) {
+    const Ctor = c.dtype === 'float64' ? Float64Array : BigInt64Array
+    columns[c.name] = new Ctor(buf, c.offset, c.length)
+  }
+  return { header, columns }
+}
+
+export async function loadBinaryMarketData(url) {
+  const res = await fetch(url)
+  if (!res.ok) throw new Error(`HTTP ${res.status}: ${res.statusText}`)
+  return parseBinaryMarketData(await res.arrayBuffer())
+}
+
+const num = v => (Number.isNaN(v) ? null : v)
+
+/** 일자 컬럼(1970-01-01 기준 일수) → ms 타임스탬프 (차트 x축용) */
+export function dateTimestamps(columns) {
+  return Float64Array.from(columns.date, d => Number(d) * DAY_MS)
+}
+
+/**
+ * 파싱 결과를 컴포넌트가 쓰는 문서 형태로 변환.
+ * indicators 는 ohlcv 와 같은 길이의 Float64Array (NaN = 결측). 차트에는 data.columns 를
+ * 그대로 넘긴다 (utils/chartData.js) — ohlcv 행 배열은 다른 곳에서 처음 접근할 때만 만든다.
+ */
+export function toMarketData({ header, columns }) {
+  const indicators = {}
+  for (const [name, arr] of Object.entries(columns)) {
+    if (!OHLCV_KEYS.includes(name)) indicators[name] = arr
+  }
+  const data = { ...header.document, columns, indicators }
+  let rows = null
+  Object.defineProperty(data, 'ohlcv', {
+    enumerable: true,
+    get() {
+      if (!rows) {
+        const { date, open, high, low, close, volume } = columns
+        rows = new Array(date.length)
+        for (let i = 0; i < date.length; i++) {
+          rows[i] = {
+            date: new Date(Number(date[i]) * DAY_MS).toISOString().slice(0, 10),
+            open: num(open[i]), high: num(high[i]), low: num(low[i]), close: num(close[i]),
+            volume: Number(volume[i]),
+          }
+        }
+      }
+      return rows
+    },
+  })
+  return data
+}
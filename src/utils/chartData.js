@@ -0,0 +1,146 @@
+// 차트 입력 — ohlcv 행 배열과 바이너리 컬럼(market_data.bin) 모두 평행 배열로 바꾼다.
+// 점마다 {x, y} 객체를 만들지 않는다: x 는 타임스탬프 한 벌을 모든 시리즈가 labels 로 공유하고,
+// 시리즈마다 값 배열 하나만 만든다 (ApexCharts 는 TypedArray 를 받지 않으므로 null 결측의 일반 배열).
+
+const DAY_MS = 86_400_000
+const FIELDS = ['open', 'high', 'low', 'close', 'volume']
+
+const rowColumns = new WeakMap()      // 행 배열 → 컬럼 (같은 입력은 한 번만 변환)
+const binaryColumns = new WeakMap()   // 바이너리 컬럼 객체 → 컬럼
+const aligned = new WeakMap()         // 지표 행 배열 → (x → Float64Array)
+const ownAxis = new WeakMap()         // 자체 날짜 {date, value} 행 배열 → { x, y }
+const candles = new WeakMap()         // 컬럼 → [x, o, h, l, c] 배열
+const pairs = new WeakMap()           // Float64Array → (x → [x, y] 배열)
+
+const nullable = v => (Number.isNaN(v) ? null : v)
+
+function memo(cache, key, x, build) {
+  let byAxis = cache.get(key)
+  if (!byAxis) {
+    byAxis = new WeakMap()
+    cache.set(key, byAxis)
+  }
+  let out = byAxis.get(x)
+  if (!out) {
+    out = build()
+    byAxis.set(x, out)
+  }
+  return out
+}
+
+/**
+ * ohlcv → { x, open, high, low, close, volume } (Float64Array, NaN = 결측, x = UTC 자정 ms).
+ * 입력은 ohlcv 행 배열 또는 toMarketData 의 columns — 후자는 가격 컬럼을 복사 없이 그대로 쓴다.
+ */
+export function ohlcvColumns(ohlcv) {
+  if (!ohlcv) return null
+  if (ArrayBuffer.isView(ohlcv.date)) {
+    let cols = binaryColumns.get(ohlcv)
+    if (!cols) {
+      const { date, open, high, low, close, volume } = ohlcv
+      cols = {
+        x: Float64Array.from(date, d => Number(d) * DAY_MS),
+        open, high, low, close,
+        volume: volume instanceof Float64Array ? volume : Float64Array.from(volume, Number),
+      }
+      binaryColumns.set(ohlcv, cols)
+    }
+    return cols
+  }
+  let cols = rowColumns.get(ohlcv)
+  if (!cols) {
+    const n = ohlcv.length
+    cols = { x: new Float64Array(n) }
+    for (const f of FIELDS) cols[f] = new Float64Array(n)
+    for (let i = 0; i < n; i++) {
+      const r = ohlcv[i]
+      cols.x[i] = Date.parse(r.date)
+      for (const f of FIELDS) cols[f][i] = r[f] ?? NaN
+    }
+    rowColumns.set(ohlcv, cols)
+  }
+  return cols
+}
+
+/** 지표 → cols.x 축의 Float64Array. 바이너리 컬럼(같은 축)은 그대로, {date, value} 행은 날짜로 정렬 */
+export function indicatorColumn(cols, series) {
+  const n = cols.x.length
+  if (ArrayBuffer.isView(series)) {
+    if (series.length === n) return series
+    const out = new Float64Array(n).fill(NaN)      // 빈 컬럼(예: VKOSPI 미수집)
+    out.set(series.subarray(0, n))
+    return out
+  }
+  if (!Array.isArray(series) || series.length === 0) return new Float64Array(n).fill(NaN)
+  return memo(aligned, series, cols.x, () => {
+    const value = new Map()
+    for (const item of series) value.set(Date.parse(item.date), item.value)
+    const out = new Float64Array(n)
+    for (let i = 0; i < n; i++) out[i] = value.get(cols.x[i]) ?? NaN
+    return out
+  })
+}
+
+/** 자체 날짜를 가진 {date, value} 행 (예: LTTB 로 줄인 LOD 지표) → { x, y } Float64Array 한 쌍 */
+export function valueColumns(series) {
+  let out = ownAxis.get(series)
+  if (!out) {
+    const n = series.length
+    out = { x: new Float64Array(n), y: new Float64Array(n) }
+    for (let i = 0; i < n; i++) {
+      out.x[i] = Date.parse(series[i].date)
+      out.y[i] = series[i].value ?? NaN
+    }
+    ownAxis.set(series, out)
+  }
+  return out
+}
+
+/** Float64Array → ApexCharts 값 배열 (NaN → null 로 선을 끊는다) */
+export function chartValues(arr, scale = 1) {
+  const out = new Array(arr.length)
+  for (let i = 0; i < arr.length; i++) out[i] = Number.isNaN(arr[i]) ? null : arr[i] * scale
+  return out
+}
+
+/** 공유 x 축 (labels) — 시리즈마다 만들지 않는다 */
+export function chartLabels(cols) {
+  return Array.from(cols.x)
+}
+
+/** x 타임스탬프 → 'YYYY-MM-DD' (툴팁에서 한 점에 대해서만 만든다) */
+export function isoDate(ts) {
+  return new Date(ts).toISOString().slice(0, 10)
+}
+
+/** 값 배열 중 유한한 값이 하나라도 있는지 */
+export function hasValues(arr) {
+  for (let i = 0; i < arr.length; i++) if (!Number.isNaN(arr[i])) return true
+  return false
+}
+
+// ── 캔들 차트 ─────────────────────────────────────────
+// ApexCharts 의 candlestick 은 봉마다 [x, o, h, l, c] 만 받고, 시리즈 형식은 첫 시리즈로 차트 전체가
+// 정해지므로 같은 차트의 선도 [x, y] 쌍이어야 한다. 데이터셋당 한 번만 만들어 재렌더링에서 재사용한다.
+// pointPairs 의 cols 는 x 만 쓰므로 valueColumns 결과({ x, y })도 그대로 넘길 수 있다.
+
+export function candleTuples(cols) {
+  let out = candles.get(cols)
+  if (!out) {
+    const { x, open, high, low, close } = cols
+    out = new Array(x.length)
+    for (let i = 0; i < x.length; i++) {
+      out[i] = [x[i], nullable(open[i]), nullable(high[i]), nullable(low[i]), nullable(close[i])]
+    }
+    candles.set(cols, out)
+  }
+  return out
+}
+
+export function pointPairs(cols, arr) {
+  return memo(pairs, arr, cols.x, () => {
+    const out = new Array(arr.length)
+    for (let i = 0; i < arr.length; i++) out[i] = [cols.x[i], nullable(arr[i])]
+    return out
+  })
+}
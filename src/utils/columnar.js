@@ -0,0 +1,65 @@
+// market_data.json schemaVersion 2 (columnar) → 기존 행(row) 형식으로 복원
+// 레이아웃 설명은 scripts/columnar.py 참고
+
+export const COLUMNAR_VERSION = 2
+
+const DAY_MS = 86_400_000
+
+/** ISO 문자열 배열 또는 { start, deltas } 델타 인코딩 → ISO 문자열 배열 */
+export function decodeDates(enc) {
+  if (Array.isArray(enc)) return enc
+  const out = new Array(enc.deltas.length + 1)
+  let t = Date.parse(`${enc.start}T00:00:00Z`)
+  out[0] = enc.start
+  for (let i = 0; i < enc.deltas.length; i++) {
+    t += enc.deltas[i] * DAY_MS
+    out[i + 1] = new Date(t).toISOString().slice(0, 10)
+  }
+  return out
+}
+
+function toRows(table, axis) {
+  const dates = table.dates ? decodeDates(table.dates) : axis
+  const fields = Object.keys(table).filter(k => k !== 'dates')
+  return dates.map((date, i) => {
+    const row = { date }
+    for (const k of fields) row[k] = table[k][i]
+    return row
+  })
+}
+
+function toValueRows(val, axis) {
+  if (Array.isArray(val)) return val.map((value, i) => ({ date: axis[i], value }))
+  const dates = decodeDates(val.dates)
+  return dates.map((date, i) => ({ date, value: val.values[i] }))
+}
+
+/** schemaVersion 2 문서를 컴포넌트가 쓰는 행 형식 문서로 변환 */
+export function fromColumnar(doc) {
+  const axis = decodeDates(doc.dates)
+  const out = {}
+  for (const [key, val] of Object.entries(doc)) {
+    if (key === 'schemaVersion' || key === 'dates') continue
+    if (key === 'ohlcv') {
+      out[key] = toRows(val, axis)
+    } else if (key === 'indicators') {
+      out[key] = Object.fromEntries(Object.entries(val).map(([k, v]) => [k, toValueRows(v, axis)]))
+    } else if (key === 'comparison') {
+      out[key] = Object.fromEntries(Object.entries(val).map(([k, v]) =>
+        [k, k.endsWith('_normalized') ? toValueRows(v, axis) : v]))
+    } else if (key === 'correlations') {
+      out[key] = { ...val, rolling60: toRows(val.rolling60, axis) }
+    } else if (key === 'supplyDemand') {
+      out[key] = Object.fromEntries(Object.entries(val).map(([m, d]) =>
+        [m, { ...d, series: toRows(d.series, axis) }]))
+    } else {
+      out[key] = val
+    }
+  }
+  return out
+}
+
+/** 두 형식 모두 받아 행 형식으로 반환 */
+export function normalizeMarketData(json) {
+  return json?.schemaVersion === COLUMNAR_VERSION ? fromColumnar(json) : json
+}
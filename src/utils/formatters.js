@@ -43,21 +43,13 @@ export function fmtCorr(val) {
   return `${sign}${n.toFixed(3)}`
 }
 
+/** metrics.intervals 의 [하한, 상한] → "하한 ~ 상한" (없으면 null) */
+export function fmtInterval(pair, fmt = v => v.toFixed(2)) {
+  if (!Array.isArray(pair) || pair[0] == null || pair[1] == null) return null
+  return `${fmt(pair[0])} ~ ${fmt(pair[1])}`
+}
+
 /** Convert date string to timestamp for ApexCharts */
 export function toTs(dateStr) {
   return new Date(dateStr).getTime()
 }
-
-/** Align indicator array to ohlcv date set */
-export function alignToOHLCV(ohlcv, indArr) {
-  const map = {}
-  if (Array.isArray(indArr)) {
-    for (const item of indArr) {
-      map[item.date] = item.value
-    }
-  }
-  return ohlcv.map(c => ({
-    x: toTs(c.date),
-    y: map[c.date] !== undefined ? map[c.date] : null,
-  }))
-}
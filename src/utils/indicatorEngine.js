@@ -0,0 +1,245 @@
+// 사용자 파라미터 지표 엔진 — scripts/fetch_data.py 의 compute_indicators / generate_signals 를
+// Float64Array 위에서 다시 계산한다 (Web Worker: src/workers/indicatorWorker.js).
+// 결과는 파라미터 조합별로 캐시되므로 슬라이더 하나를 움직이면 그 지표만 다시 계산된다.
+// 입력은 indicator_kernel 과 같이 유한한 값이어야 한다 (null 거래량은 0 으로 본다).
+
+export const DEFAULT_PARAMS = {
+  maPeriods: [5, 20, 60, 120, 240],
+  bbPeriod: 20,
+  bbK: 2,
+  rsiPeriod: 14,
+  rsiLow: 30,
+  rsiHigh: 70,
+  macdFast: 12,
+  macdSlow: 26,
+  macdSignal: 9,
+  crossFast: 5,      // 골든/데드크로스에 쓰는 MA 쌍 (fetch_data: ma5 / ma20)
+  crossSlow: 20,
+}
+
+// fetch_data.SIGNAL_RULES 와 같은 순서 — 같은 날 여러 조건이 겹치면 앞의 규칙이 채택된다
+export const SIGNAL_RULES = [
+  { type: 'BUY',  reason: 'BB하단+RSI과매도반등', strength: 'STRONG' },
+  { type: 'SELL', reason: 'BB상단+RSI과매수',     strength: 'STRONG' },
+  { type: 'BUY',  reason: '골든크로스(MA5/MA20)', strength: 'MODERATE' },
+  { type: 'SELL', reason: '데드크로스(MA5/MA20)', strength: 'MODERATE' },
+  { type: 'BUY',  reason: 'MACD골든크로스',       strength: 'WEAK' },
+  { type: 'SELL', reason: 'MACD데드크로스',       strength: 'WEAK' },
+]
+
+const EPS = Number.EPSILON          // np.finfo(float).eps
+const CACHE_LIMIT = 64              // 파라미터 조합별 결과 배열 수 (LRU)
+
+// ── 계산 블록 ─────────────────────────────────────────
+
+/** Series.rolling(p).mean() — 첫 값만큼 평행이동한 누적합으로 상쇄 오차를 줄인다 */
+export function rollingMean(csum, shift, p, n) {
+  const out = new Float64Array(n).fill(NaN)
+  for (let i = p - 1; i < n; i++) out[i] = (csum[i + 1] - csum[i + 1 - p]) / p + shift
+  return out
+}
+
+/** Series.rolling(p).std() (표본표준편차) — 창마다 평균 편차 제곱합을 직접 더한다 (O(n·p)) */
+export function rollingStd(x, mean, p) {
+  const n = x.length
+  const out = new Float64Array(n).fill(NaN)
+  if (p < 2) return out
+  for (let i = p - 1; i < n; i++) {
+    const m = mean[i]
+    let ss = 0
+    for (let j = i - p + 1; j <= i; j++) {
+      const d = x[j] - m
+      ss += d * d
+    }
+    out[i] = Math.sqrt(ss / (p - 1))
+  }
+  return out
+}
+
+/**
+ * pandas 의 ewm 평균 루프 (adjust=True/False) 를 같은 연산 순서로 옮긴 것.
+ * 보합일의 RSI 처럼 이론상 같은 값이 비트 단위로도 같아야 신호 비교(rsi > 직전)가
+ * Python 과 어긋나지 않는다. 첫 NaN 들은 건너뛰고, 관측 수 < minPeriods 이면 NaN.
+ */
+function ewmMean(x, alpha, adjust, minPeriods, out) {
+  const n = x.length
+  const oldFactor = 1 - alpha
+  const newWt = adjust ? 1 : alpha
+  let weighted = NaN, oldWt = 1, nobs = 0
+  for (let i = 0; i < n; i++) {
+    const cur = x[i]
+    const obs = !Number.isNaN(cur)
+    if (obs) nobs++
+    if (!Number.isNaN(weighted)) {
+      oldWt *= oldFactor
+      if (obs) {
+        if (weighted !== cur) weighted = (oldWt * weighted + newWt * cur) / (oldWt + newWt)
+        oldWt = adjust ? oldWt + newWt : 1
+      }
+    } else if (obs) {
+      weighted = cur
+    }
+    out[i] = nobs >= minPeriods ? weighted : NaN
+  }
+  return out
+}
+
+/** Series.ewm(span=span, adjust=False).mean() */
+export function ema(x, span) {
+  return ewmMean(x, 1 / (1 + (span - 1) / 2), false, 0, new Float64Array(x.length))
+}
+
+/** compute_rsi: 상승/하락폭의 ewm(com=period-1, adjust=True, min_periods=period) 비율 */
+export function rsi(close, period) {
+  const n = close.length
+  const gain = new Float64Array(n).fill(NaN)
+  const loss = new Float64Array(n).fill(NaN)
+  for (let i = 1; i < n; i++) {
+    const d = close[i] - close[i - 1]
+    gain[i] = d > 0 ? d : 0
+    loss[i] = d < 0 ? -d : 0
+  }
+  const alpha = 1 / (1 + (period - 1))
+  ewmMean(gain, alpha, true, period, gain)
+  ewmMean(loss, alpha, true, period, loss)
+  for (let i = 0; i < n; i++) gain[i] = 100 - 100 / (1 + gain[i] / (loss[i] === 0 ? EPS : loss[i]))
+  return gain
+}
+
+/** compute_obv: 종가 방향 부호를 붙인 거래량의 누적합 */
+export function obv(close, volume) {
+  const n = close.length
+  const out = new Float64Array(n)
+  for (let i = 1; i < n; i++) {
+    const d = close[i] - close[i - 1]
+    // 종가가 NaN 인 날(과 그 다음 날)은 보합처럼 직전 OBV 를 유지한다
+    out[i] = out[i - 1] + (d > 0 ? volume[i] : d < 0 ? -volume[i] : 0)
+  }
+  return out
+}
+
+/** fetch_data.signal_codes — 봉마다 SIGNAL_RULES 인덱스 (-1 = 신호 없음) */
+export function signalCodes(close, { rsi: r, macd, macdSignal: ms, bbUpper, bbLower, maFast, maSlow }, rsiLow, rsiHigh) {
+  const n = close.length
+  const codes = new Int8Array(n).fill(-1)
+  for (let i = 1; i < n; i++) {
+    if (Number.isNaN(r[i]) || Number.isNaN(macd[i])) continue
+    const j = i - 1
+    // NaN 비교는 false — numpy 와 같다
+    if (close[i] <= bbLower[i] && r[i] < rsiLow && r[i] > r[j]) codes[i] = 0
+    else if (close[i] >= bbUpper[i] && r[i] > rsiHigh && r[i] < r[j]) codes[i] = 1
+    else if (maFast[i] > maSlow[i] && maFast[j] <= maSlow[j]) codes[i] = 2
+    else if (maFast[i] < maSlow[i] && maFast[j] >= maSlow[j]) codes[i] = 3
+    else if (macd[i] > ms[i] && macd[j] <= ms[j]) codes[i] = 4
+    else if (macd[i] < ms[i] && macd[j] >= ms[j]) codes[i] = 5
+  }
+  return codes
+}
+
+// ── 엔진 ─────────────────────────────────────────────
+
+/**
+ * 한 종목(종가/거래량)에 대한 파라미터별 지표 캐시.
+ * compute(params) → { indicators, changed, signals }
+ *   indicators: { ma<p>, bb_middle, bb_upper, bb_lower, rsi, macd, macd_signal, macd_hist, obv }
+ *               (ohlcv 와 같은 길이의 Float64Array, NaN = 결측; rsi 는 RSI(params.rsiPeriod))
+ *   changed:    직전 compute 이후 값이 달라진 이름 (워커는 이것만 보낸다)
+ *   signals:    generate_signals 와 같은 { date, type, reason, price, strength } 배열
+ */
+export class IndicatorEngine {
+  constructor(dates, close, volume) {
+    this.dates = dates
+    this.close = close
+    this.volume = volume
+    const n = close.length
+    // rollingMean 용 누적합 — 주기와 무관하므로 한 번만 만든다
+    this.shift = n ? close[0] : 0
+    this.csum = new Float64Array(n + 1)
+    for (let i = 0; i < n; i++) this.csum[i + 1] = this.csum[i] + (close[i] - this.shift)
+    this.cache = new Map()
+    this.emitted = {}
+  }
+
+  memo(key, fn) {
+    let val = this.cache.get(key)
+    if (val) {
+      this.cache.delete(key)           // 최근 사용으로 갱신
+    } else {
+      val = fn()
+      if (this.cache.size >= CACHE_LIMIT) this.cache.delete(this.cache.keys().next().value)
+    }
+    this.cache.set(key, val)
+    return val
+  }
+
+  ma(p) {
+    return this.memo(`ma:${p}`, () => rollingMean(this.csum, this.shift, p, this.close.length))
+  }
+
+  bands(p, k) {
+    return this.memo(`bb:${p}:${k}`, () => {
+      const mid = this.ma(p)
+      const sd = this.memo(`sd:${p}`, () => rollingStd(this.close, mid, p))
+      const upper = new Float64Array(mid.length)
+      const lower = new Float64Array(mid.length)
+      for (let i = 0; i < mid.length; i++) {
+        upper[i] = mid[i] + k * sd[i]
+        lower[i] = mid[i] - k * sd[i]
+      }
+      return { upper, lower }
+    })
+  }
+
+  macd(fast, slow, signal) {
+    return this.memo(`macd:${fast}:${slow}:${signal}`, () => {
+      const f = this.memo(`ema:${fast}`, () => ema(this.close, fast))
+      const s = this.memo(`ema:${slow}`, () => ema(this.close, slow))
+      const line = new Float64Array(f.length)
+      for (let i = 0; i < f.length; i++) line[i] = f[i] - s[i]
+      const sig = ema(line, signal)
+      const hist = new Float64Array(f.length)
+      for (let i = 0; i < f.length; i++) hist[i] = line[i] - sig[i]
+      return { line, signal: sig, hist }
+    })
+  }
+
+  compute(params = DEFAULT_PARAMS) {
+    const p = { ...DEFAULT_PARAMS, ...params }
+    const bb = this.bands(p.bbPeriod, p.bbK)
+    const m = this.macd(p.macdFast, p.macdSlow, p.macdSignal)
+    const r = this.memo(`rsi:${p.rsiPeriod}`, () => rsi(this.close, p.rsiPeriod))
+
+    const indicators = {}
+    for (const period of p.maPeriods) indicators[`ma${period}`] = this.ma(period)
+    Object.assign(indicators, {
+      bb_middle: this.ma(p.bbPeriod), bb_upper: bb.upper, bb_lower: bb.lower,
+      rsi: r, macd: m.line, macd_signal: m.signal, macd_hist: m.hist,
+      obv: this.memo('obv', () => obv(this.close, this.volume)),
+    })
+
+    const codes = signalCodes(this.close, {
+      rsi: r, macd: m.line, macdSignal: m.signal, bbUpper: bb.upper, bbLower: bb.lower,
+      maFast: this.ma(p.crossFast), maSlow: this.ma(p.crossSlow),
+    }, p.rsiLow, p.rsiHigh)
+    const signals = []
+    for (let i = 0; i < codes.length; i++) {
+      if (codes[i] < 0) continue
+      const price = this.close[i]
+      signals.push({ date: this.dates[i], ...SIGNAL_RULES[codes[i]], price: Number.isFinite(price) ? price : null })
+    }
+
+    // 캐시에서 같은 배열을 돌려받은 이름은 바뀌지 않은 것
+    const changed = Object.keys(indicators).filter(name => this.emitted[name] !== indicators[name])
+    this.emitted = indicators
+    return { indicators, changed, signals }
+  }
+}
+
+/** ohlcv 행 배열 → 엔진 입력 ({ dates, close, volume }) */
+export function ohlcvArrays(ohlcv) {
+  return {
+    dates: ohlcv.map(r => r.date),
+    close: Float64Array.from(ohlcv, r => r.close ?? NaN),
+    volume: Float64Array.from(ohlcv, r => r.volume ?? 0),
+  }
+}
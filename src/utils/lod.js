@@ -0,0 +1,48 @@
+// 장기 조회(5/10/20년)용 LOD 시리즈 — 레이아웃은 scripts/lod.py 참고
+// 1년 이하 구간은 기존 일봉(chart shard)을, 그보다 긴 구간은 lod-<기간> shard 를 쓴다
+import { indicatorColumn, ohlcvColumns, valueColumns } from './chartData'
+
+export const LOD_LOOKBACKS = [
+  { key: '1y',  days: 366 },
+  { key: '5y',  days: 5 * 366 },
+  { key: '10y', days: 10 * 366 },
+  { key: '20y', days: 20 * 366 },
+]
+
+/** 보이는 기간(일)을 덮는 가장 짧은 lookback 키 ('1y' = 일봉 원본) */
+export function pickLookback(visibleDays) {
+  const hit = LOD_LOOKBACKS.find(l => l.days >= visibleDays)
+  return (hit ?? LOD_LOOKBACKS[LOD_LOOKBACKS.length - 1]).key
+}
+
+/** lookback 키 → useShard 에 넘길 shard 이름 (일봉은 chart shard) */
+export function lodShardName(key) {
+  return key === '1y' ? 'chart' : `lod-${key}`
+}
+
+/**
+ * lod 항목 → { resolution, cols, lines } — chartData 의 평행 배열 (점마다 객체를 만들지 않는다).
+ * 지표는 LTTB 로 골라낸 자체 날짜를 가지므로 봉 날짜 축(indicatorColumn)에 맞추지 않고
+ * 시리즈마다 { x, y } 컬럼(valueColumns)으로 둔다.
+ */
+export function lodSeries(entry) {
+  if (!entry) return null
+  return {
+    resolution: entry.resolution,
+    cols: ohlcvColumns(entry.ohlcv),
+    lines: Object.fromEntries(Object.entries(entry.indicators).map(([name, s]) => [name, valueColumns(s)])),
+  }
+}
+
+/** lodShardName(key) 로 받은 shard → lodSeries 와 같은 모양 (1y 는 일봉 + 봉 날짜 축의 지표) */
+export function lookbackSeries(shard, key) {
+  if (key !== '1y') return lodSeries(shard?.lod?.[key])
+  if (!shard?.ohlcv) return null
+  const cols = ohlcvColumns(shard.ohlcv)
+  return {
+    resolution: 'daily',
+    cols,
+    lines: Object.fromEntries(Object.entries(shard.indicators ?? {}).map(([name, s]) =>
+      [name, { x: cols.x, y: indicatorColumn(cols, s) }])),
+  }
+}
@@ -0,0 +1,42 @@
+// 지연 로딩 shard — 레이아웃은 scripts/shards.py 참고
+// manifest.json 은 매번 새로 받고, 해시가 붙은 shard 파일은 브라우저 캐시를 그대로 쓴다
+import { normalizeMarketData } from './columnar'
+
+async function fetchJson(url, init) {
+  const res = await fetch(url, init)
+  if (!res.ok) throw new Error(`HTTP ${res.status}: ${res.statusText}`)
+  return res.json()
+}
+
+export function loadManifest(base) {
+  return fetchJson(`${base}data/manifest.json`, { cache: 'no-cache' })
+}
+
+/** name → Promise<shard 문서> (같은 shard 는 한 번만 요청, 실패 시 재시도 가능) */
+export function createShardLoader(base, manifest) {
+  const pending = new Map()
+  return name => {
+    const entry = manifest.shards[name]
+    if (!entry) return Promise.resolve({})
+    if (!pending.has(name)) {
+      const p = fetchJson(`${base}data/${entry.file}`).then(normalizeMarketData)
+      p.catch(() => pending.delete(name))
+      pending.set(name, p)
+    }
+    return pending.get(name)
+  }
+}
+
+/** 단일 파일(market_data.json/.bin) 문서용 로더 — 모든 shard 가 같은 문서 */
+export function wholeDocumentLoader(doc) {
+  return () => Promise.resolve(doc)
+}
+
+/** summary.latest — latest 섹션이 없는 이전 파일은 ohlcv 에서 계산 */
+export function latestOf(data) {
+  if (data?.latest) return data.latest
+  const rows = data?.ohlcv ?? []
+  const last = rows[rows.length - 1]
+  if (!last) return null
+  return { date: last.date, close: last.close, prevClose: rows[rows.length - 2]?.close ?? null, volume: last.volume }
+}
@@ -0,0 +1,22 @@
+// 지표 엔진 워커 — 계산은 src/utils/indicatorEngine.js, 메시지 흐름은 hooks/useIndicatorEngine.js 참고
+//   { type: 'load', gen, dates, close, volume }  → 새 시계열 (캐시 초기화)
+//   { type: 'compute', gen, params }             → { type: 'result', gen, names, changed, signals, ms }
+// 캐시된 배열은 워커에 남아야 하므로 바뀐 지표만 복사해서 transfer 로 넘긴다.
+import { IndicatorEngine } from '../utils/indicatorEngine'
+
+let engine = null
+
+self.onmessage = ({ data: msg }) => {
+  if (msg.type === 'load') {
+    engine = new IndicatorEngine(msg.dates, msg.close, msg.volume)
+    return
+  }
+  if (msg.type !== 'compute' || !engine) return
+  const t0 = performance.now()
+  const { indicators, changed, signals } = engine.compute(msg.params)
+  const out = Object.fromEntries(changed.map(name => [name, indicators[name].slice()]))
+  self.postMessage(
+    { type: 'result', gen: msg.gen, names: Object.keys(indicators), changed: out, signals, ms: performance.now() - t0 },
+    Object.values(out).map(a => a.buffer),
+  )
+}
@@ -0,0 +1,13 @@
+"""
+Shared pytest setup: the pipeline modules live in scripts/ and import each
+other by bare name, like the benchmark scripts. scripts/benchmarks is on the
+path too, for its fixtures and stand-ins (naver_stub, bench_indicator_engine).
+"""
+
+import os
+import sys
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts")
+for path in (os.path.join(SCRIPTS_DIR, "benchmarks"), SCRIPTS_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,144 @@
+"""market_data.bin round trip: Python writer/reader and the JS reader + chart columns."""
+
+import json
+import os
+import shutil
+import subprocess
+from datetime import date, datetime, timezone
+
+import numpy as np
+import pytest
+
+import binary_artifact as ba
+
+SRC_UTILS = os.path.join(os.path.dirname(os.path.dirname(ba.__file__)), "src", "utils")
+
+# 바이너리 → toMarketData → 차트 컬럼, 같은 문서의 JSON 행 → 차트 컬럼: 두 경로를 모두 출력
+NODE_READER = """
+import { readFileSync } from 'fs'
+import { parseBinaryMarketData, toMarketData } from '%s'
+import { chartValues, indicatorColumn, ohlcvColumns } from '%s'
+const [binPath, jsonPath] = process.argv.slice(2)
+const bin = readFileSync(binPath)
+const data = toMarketData(parseBinaryMarketData(bin.buffer.slice(bin.byteOffset, bin.byteOffset + bin.length)))
+const doc = JSON.parse(readFileSync(jsonPath, 'utf8'))
+const chart = (ohlcv, indicators) => {
+  const cols = ohlcvColumns(ohlcv)
+  const out = { x: Array.from(cols.x), indicators: {} }
+  for (const f of ['open', 'high', 'low', 'close', 'volume']) out[f] = chartValues(cols[f])
+  for (const name of Object.keys(indicators)) out.indicators[name] = chartValues(indicatorColumn(cols, indicators[name]))
+  // JSON 은 NaN 을 null 로 쓰므로 NaN 이 그대로 남았는지는 여기서 센다
+  out.nan = [out.open, out.high, out.low, out.close, out.volume, ...Object.values(out.indicators)]
+    .reduce((n, arr) => n + arr.filter(Number.isNaN).length, 0)
+  return out
+}
+console.log(JSON.stringify({
+  rows: data.ohlcv,
+  document: Object.fromEntries(Object.keys(doc).filter(k => k !== 'ohlcv' && k !== 'indicators').map(k => [k, data[k]])),
+  binary: chart(data.columns, data.indicators),
+  json: chart(doc.ohlcv, doc.indicators),
+}))
+"""
+
+DATES = ["2025-01-02", "2025-01-03", "2025-01-06", "2025-01-07", "2025-01-08"]
+
+
+def document():
+    closes = [2500.5, None, 2510.25, 2490.0, 2520.75]
+    return {
+        "metadata": {"lastUpdated": "2025-01-08T16:00:00", "dataStart": DATES[0], "dataEnd": DATES[-1]},
+        "ohlcv": [{"date": d, "open": None if c is None else c - 1, "high": None if c is None else c + 5,
+                   "low": None if c is None else c - 5, "close": c, "volume": 1000 * (i + 1)}
+                  for i, (d, c) in enumerate(zip(DATES, closes))],
+        "indicators": {
+            "ma5": [{"date": d, "value": v} for d, v in zip(DATES, [None, None, None, None, 2505.1])],
+            "rsi14": [{"date": d, "value": v} for d, v in zip(DATES, [55.5, None, 60.0, 48.25, 61.0])],
+            "vkospi": [],
+        },
+        "signals": [{"date": DATES[2], "type": "BUY", "reason": "테스트"}],
+    }
+
+
+def empty_document():
+    return {"metadata": {"totalDays": 0}, "ohlcv": [], "indicators": {"ma5": [], "vkospi": []}}
+
+
+def write(tmp_path, doc):
+    path = str(tmp_path / "market_data.bin")
+    size = ba.write_binary(path, doc)
+    with open(path, "rb") as f:
+        buf = f.read()
+    assert len(buf) == size
+    return path, buf
+
+
+@pytest.mark.parametrize("make", [document, empty_document])
+def test_python_round_trip(tmp_path, make):
+    doc = make()
+    _, buf = write(tmp_path, doc)
+    header, cols = ba.read_binary(buf)
+    assert header["rows"] == len(doc["ohlcv"])
+    assert ba.to_document(header, cols) == doc
+
+
+def test_columns_are_aligned_and_nan_for_null(tmp_path):
+    _, buf = write(tmp_path, document())
+    header, cols = ba.read_binary(buf)
+    for c in header["columns"]:
+        assert c["offset"] % 8 == 0
+    assert np.isnan(cols["close"][1]) and np.isnan(cols["ma5"][:4]).all()
+    assert len(cols["vkospi"]) == 0
+    assert cols["volume"].dtype == np.dtype("<i8")
+
+
+def test_missing_indicator_date_and_null_volume(tmp_path):
+    doc = document()
+    doc["ohlcv"][3]["volume"] = None                   # int64 컬럼 — null 은 0 으로 저장
+    del doc["indicators"]["rsi14"][2]                  # 봉 날짜에 없는 값은 null 로 채워진다
+    _, buf = write(tmp_path, doc)
+    back = ba.to_document(*ba.read_binary(buf))
+    assert back["ohlcv"][3]["volume"] == 0
+    assert back["indicators"]["rsi14"][2] == {"date": DATES[2], "value": None}
+
+
+def test_rejects_other_artifacts():
+    with pytest.raises(ValueError):
+        ba.read_binary(ba.PREFIX.pack(b"XXXX", ba.VERSION, 0, 0))
+
+
+def run_node(tmp_path, doc):
+    bin_path, _ = write(tmp_path, doc)
+    json_path = tmp_path / "market_data.json"
+    json_path.write_text(json.dumps(doc, ensure_ascii=False), encoding="utf-8")
+    script = tmp_path / "reader.mjs"
+    script.write_text(NODE_READER % (os.path.join(SRC_UTILS, "binaryData.js"),
+                                     os.path.join(SRC_UTILS, "chartData.js")), encoding="utf-8")
+    out = subprocess.run(["node", str(script), bin_path, str(json_path)],
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+
+def expected_chart(doc):
+    rows = doc["ohlcv"]
+    x = [datetime.combine(date.fromisoformat(r["date"]), datetime.min.time(), timezone.utc).timestamp() * 1000
+         for r in rows]
+    out = {"x": x, "indicators": {}, "nan": 0}
+    for f in ("open", "high", "low", "close", "volume"):
+        out[f] = [r[f] for r in rows]
+    for name, series in doc["indicators"].items():
+        by_date = {p["date"]: p["value"] for p in series}
+        out["indicators"][name] = [by_date.get(r["date"]) for r in rows]
+    return out
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+@pytest.mark.parametrize("make", [document, empty_document])
+def test_js_reader_matches_python(tmp_path, make):
+    doc = make()
+    got = run_node(tmp_path, doc)
+    assert got["rows"] == doc["ohlcv"]
+    assert got["document"] == {k: v for k, v in doc.items() if k not in ("ohlcv", "indicators")}
+    want = expected_chart(doc)
+    # 바이너리 컬럼과 JSON 행이 같은 차트 입력이 된다 (null = NaN, 빈 시리즈 = 전부 null)
+    assert got["binary"] == want
+    assert got["json"] == want
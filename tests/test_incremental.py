@@ -0,0 +1,71 @@
+"""--incremental: the stored history extended run after run equals a full run."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import fetch_data as fd
+import state_store as ss
+
+FIRST_RUN = datetime(2026, 3, 2, 18, 0)
+# 매일 장 마감 후 실행 + 주말 실행 + 열흘 건너뛴 실행
+RUNS = [FIRST_RUN + timedelta(days=d) for d in [*range(1, 40), 50]]
+
+
+def prices(days=800):
+    index = pd.bdate_range(end=RUNS[-1].date(), periods=days)
+    rng = np.random.default_rng(7)
+    close = 2500 + np.cumsum(rng.standard_normal(days) * 20)
+    return pd.DataFrame({"Open": close - 3, "High": close + 10, "Low": close - 10, "Close": close,
+                         "Volume": rng.integers(100_000, 900_000, days).astype(float)}, index=index)
+
+
+@pytest.fixture
+def market(monkeypatch):
+    df = prices()
+
+    def download(ticker, start, end, refresh=False):
+        return df[(df.index >= start) & (df.index < end)].copy()
+
+    def fetch_prices(start, end, tickers=fd.TICKERS, refresh=False):
+        return tuple(download(t, start, end) for t in tickers.values())
+
+    monkeypatch.setattr(fd, "download", download)
+    monkeypatch.setattr(fd, "fetch_prices", fetch_prices)
+
+
+def full_run(now):
+    start = now - timedelta(days=fd.HISTORY_DAYS + fd.FETCH_SLACK_DAYS)
+    kospi, _, _, vkospi = fd.anchor_history(*fd.fetch_prices(start, now))
+    return fd.compute_indicators(kospi, vkospi)
+
+
+def incremental_run(now, path):
+    start = now - timedelta(days=fd.HISTORY_DAYS + fd.FETCH_SLACK_DAYS)
+    return fd.update_incremental(start, now, path)[0]
+
+
+def test_incremental_matches_full_run(market, tmp_path):
+    path = str(tmp_path / "market_state.npz")
+    incremental_run(FIRST_RUN, path)
+    for now in RUNS:
+        got, want = incremental_run(now, path), full_run(now)
+        assert got.index[0] == want.index[0]
+        # 저장소를 거친 인덱스는 해상도(ns/us)와 freq 만 다를 수 있다 — 출력은 날짜 문자열
+        pd.testing.assert_frame_equal(got[want.columns], want, check_exact=True,
+                                      check_index_type=False, check_freq=False)
+
+
+def test_state_continues_from_the_window_start(market, tmp_path):
+    path = str(tmp_path / "market_state.npz")
+    for now in [FIRST_RUN, *RUNS[:5]]:
+        incremental_run(now, path)
+    frames, state = ss.load_store(path)
+    hist = frames["kospi"]
+    # 저장된 상태로 다음 봉을 이어 붙인 값 = 같은 창 위 전체 재계산의 마지막 행
+    rebuilt = ss.build_state(hist[ss.OHLCV_COLS])[1]
+    assert state.last_obv == rebuilt.last_obv == hist["obv"].iloc[-1]
+    for name in ss.IndicatorState.EWMS:
+        assert getattr(state, name).to_dict() == pytest.approx(getattr(rebuilt, name).to_dict())
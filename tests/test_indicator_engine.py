@@ -0,0 +1,63 @@
+"""src/utils/indicatorEngine.js against the Python indicators and signals (shared fixture)."""
+
+import json
+import os
+import shutil
+import subprocess
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import fetch_data as fd
+from bench_indicator_engine import CHECK, PARAM_SETS, build_fixture
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+
+ENGINE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                      "src", "utils", "indicatorEngine.js")
+SIZES = [250, 1250]
+
+
+@pytest.fixture(scope="module")
+def checked(tmp_path_factory):
+    """(fixture, indicator_engine_check.mjs report) for the bench's cases."""
+    fixture = build_fixture(SIZES)
+    path = tmp_path_factory.mktemp("engine") / "indicator_fixture.json"
+    path.write_text(json.dumps(fixture, ensure_ascii=False), encoding="utf-8")
+    res = subprocess.run(["node", CHECK, str(path)], capture_output=True, text=True, check=True)
+    return fixture, json.loads(res.stdout)
+
+
+def test_fixture_covers_every_case(checked):
+    fixture, _ = checked
+    assert len(fixture["cases"]) == len(SIZES) * len(PARAM_SETS)
+
+
+def test_indicators_match_python(checked):
+    fixture, report = checked
+    names = {name for case in fixture["cases"] for name in case["expected"]["indicators"]}
+    assert set(report["errors"]) == names
+    assert not report["failures"], "\n".join(report["failures"][:20])
+    assert max(report["errors"].values()) <= fixture["tolerance"]
+
+
+def test_signals_match_python(checked):
+    _, report = checked
+    assert report["signals"] > 0
+    assert report["signalMismatches"] == 0
+
+
+def test_obv_matches_python_on_nan_closes(tmp_path):
+    close = [100.0, np.nan, 101.0, 99.0, np.nan, np.nan, 98.0, 98.0, 102.0]
+    volume = [10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 70.0, 80.0, 90.0]
+    script = tmp_path / "obv.mjs"
+    # JSON 에는 NaN 이 없으므로 null 로 넘기고 ohlcvArrays 처럼 NaN 으로 되돌린다
+    script.write_text(
+        f"import {{ obv }} from '{ENGINE}'\n"
+        f"const close = Float64Array.from({json.dumps([None if np.isnan(c) else c for c in close])}, v => v ?? NaN)\n"
+        f"console.log(JSON.stringify(Array.from(obv(close, Float64Array.from({json.dumps(volume)})))))\n",
+        encoding="utf-8")
+    out = subprocess.run(["node", str(script)], capture_output=True, text=True, check=True)
+    want = fd.compute_obv(pd.Series(close), pd.Series(volume)).tolist()
+    assert json.loads(out.stdout) == want
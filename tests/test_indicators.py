@@ -0,0 +1,43 @@
+"""compute_obv against the original per-bar loop, including NaN closes."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import fetch_data as fd
+
+
+def loop_obv(close, volume):
+    """The original compute_obv: a NaN comparison is neither up nor down."""
+    obv = np.zeros(len(close))
+    for i in range(1, len(close)):
+        if close.iloc[i] > close.iloc[i - 1]:
+            obv[i] = obv[i - 1] + volume.iloc[i]
+        elif close.iloc[i] < close.iloc[i - 1]:
+            obv[i] = obv[i - 1] - volume.iloc[i]
+        else:
+            obv[i] = obv[i - 1]
+    return obv
+
+
+@pytest.mark.parametrize("close", [
+    [100.0, 101.0, 101.0, 99.0, 102.0],
+    [100.0, np.nan, 101.0, 99.0, 102.0],
+    [np.nan, 100.0, 101.0, np.nan, np.nan, 98.0, 99.0],
+    [100.0],
+    [],
+])
+def test_obv_matches_loop(close):
+    index = pd.bdate_range("2024-01-01", periods=len(close))
+    close = pd.Series(close, index=index, dtype=float)
+    volume = pd.Series(np.arange(1, len(close) + 1) * 1000.0, index=index)
+    got = fd.compute_obv(close, volume)
+    np.testing.assert_array_equal(got.to_numpy(), loop_obv(close, volume))
+    assert got.index.equals(close.index)
+
+
+def test_obv_nan_close_keeps_previous_value():
+    close = pd.Series([100.0, 101.0, np.nan, 102.0, 103.0])
+    volume = pd.Series([10.0, 20.0, 30.0, 40.0, 50.0])
+    # NaN 이후에도 OBV 가 이어진다 (NaN 이 누적합 끝까지 번지지 않는다)
+    assert fd.compute_obv(close, volume).tolist() == [0.0, 20.0, 20.0, 20.0, 70.0]
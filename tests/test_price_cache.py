@@ -0,0 +1,114 @@
+"""OHLCVCache / PriceLoader: upstream revisions, contiguous coverage, refresh."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from price_cache import OHLCVCache, PriceLoader
+
+DAYS = pd.bdate_range("2024-01-01", periods=60)
+
+
+class FrameProvider:
+    """Serves slices of an in-memory OHLCV frame and records the requested ranges."""
+
+    def __init__(self, frame):
+        self.frame = frame
+        self.calls = []
+
+    def fetch(self, tickers, start, end):
+        self.calls.append((pd.Timestamp(start), pd.Timestamp(end)))
+        df = self.frame[(self.frame.index >= start) & (self.frame.index < end)]
+        return {t: df.copy() for t in tickers}
+
+
+def ohlcv(close):
+    close = np.asarray(close, dtype=float)
+    return pd.DataFrame({"Open": close, "High": close * 1.01, "Low": close * 0.99,
+                         "Close": close, "Volume": np.full(len(close), 1000.0)}, index=DAYS[:len(close)])
+
+
+@pytest.fixture
+def base():
+    return ohlcv(100 + np.arange(len(DAYS), dtype=float))
+
+
+def loader(tmp_path, frame, ttl=3600):
+    provider = FrameProvider(frame)
+    return PriceLoader(provider, OHLCVCache(str(tmp_path), ttl=ttl), max_workers=1), provider
+
+
+def test_revision_refetches_whole_range(tmp_path, base):
+    prices, provider = loader(tmp_path, base.iloc[:40], ttl=0)
+    prices.fetch(["X"], DAYS[0], DAYS[40])
+
+    # 45번째 날 배당락 — auto_adjust 가 그 이전 가격을 모두 3% 낮춘다
+    adjusted = base.iloc[:50].copy()
+    adjusted.loc[adjusted.index < DAYS[45], ["Open", "High", "Low", "Close"]] *= 0.97
+    provider.frame = adjusted
+    got = prices.fetch(["X"], DAYS[0], DAYS[50])["X"]
+
+    pd.testing.assert_frame_equal(got, adjusted, check_freq=False, check_index_type=False)
+    assert provider.calls[-1] == (DAYS[0], DAYS[50])
+    # 캐시도 재조정된 값으로 바뀌었다
+    cached, meta = prices.cache.load("X")
+    pd.testing.assert_frame_equal(cached, adjusted, check_freq=False, check_index_type=False)
+
+
+def test_unchanged_overlap_fetches_only_the_tail(tmp_path, base):
+    prices, provider = loader(tmp_path, base, ttl=0)
+    prices.fetch(["X"], DAYS[0], DAYS[40])
+    got = prices.fetch(["X"], DAYS[0], DAYS[50])["X"]
+    pd.testing.assert_frame_equal(got, base.iloc[:50], check_freq=False, check_index_type=False)
+    assert len(provider.calls) == 2 and provider.calls[-1][0] > DAYS[0]
+
+
+def test_disjoint_request_does_not_cover_the_hole(tmp_path, base):
+    prices, provider = loader(tmp_path, base)
+    prices.fetch(["X"], DAYS[0], DAYS[10])
+    prices.fetch(["X"], DAYS[30], DAYS[40])
+    _, meta = prices.cache.load("X")
+    assert (pd.Timestamp(meta["start"]), pd.Timestamp(meta["end"])) == (DAYS[30], DAYS[40])
+
+    got = prices.fetch(["X"], DAYS[0], DAYS[40])["X"]
+    pd.testing.assert_frame_equal(got, base.iloc[:40], check_freq=False, check_index_type=False)
+
+
+def test_fully_cached_request_skips_the_provider(tmp_path, base):
+    prices, provider = loader(tmp_path, base)
+    prices.fetch(["X"], DAYS[0], DAYS[40])
+    got = prices.fetch(["X"], DAYS[5], DAYS[20])["X"]
+    pd.testing.assert_frame_equal(got, base.iloc[5:20], check_freq=False, check_index_type=False)
+    assert len(provider.calls) == 1
+
+
+def test_refresh_bypasses_cached_bars(tmp_path, base):
+    prices, provider = loader(tmp_path, base)
+    prices.fetch(["X"], DAYS[0], DAYS[40])
+    revised = base * 0.5
+    provider.frame = revised
+    assert prices.fetch(["X"], DAYS[0], DAYS[40])["X"]["Close"].iloc[0] == base["Close"].iloc[0]
+    got = prices.fetch(["X"], DAYS[0], DAYS[40], refresh=True)["X"]
+    pd.testing.assert_frame_equal(got, revised.iloc[:40], check_freq=False, check_index_type=False)
+
+
+class SerialProvider(FrameProvider):
+    """FrameProvider that, like yfinance, must not be called concurrently."""
+
+    concurrent = False
+
+
+def test_serial_provider_gets_one_request_for_the_union(tmp_path, base):
+    provider = SerialProvider(base)
+    prices = PriceLoader(provider, OHLCVCache(str(tmp_path)), max_workers=4)
+    prices.fetch(["X"], DAYS[0], DAYS[40])
+    prices.fetch(["Y"], DAYS[0], DAYS[20])
+    provider.calls.clear()
+
+    # X 는 [40, 50), Y 는 [20, 50) 이 빠졌다 — 구간별 두 요청 대신 합집합 한 번
+    got = prices.fetch(["X", "Y"], DAYS[0], DAYS[50])
+    assert provider.calls == [(DAYS[20], DAYS[50])]
+    for t in ("X", "Y"):
+        pd.testing.assert_frame_equal(got[t], base.iloc[:50], check_freq=False, check_index_type=False)
+        _, meta = prices.cache.load(t)
+        assert (pd.Timestamp(meta["start"]), pd.Timestamp(meta["end"])) == (DAYS[0], DAYS[50])
@@ -0,0 +1,87 @@
+"""Output windows follow the last bar / trading date, not the wall clock."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import batch
+import fetch_data as fd
+import supply_demand as sd
+from naver_stub import NaverStub, synthetic_rows
+
+FRIDAY = datetime(2026, 7, 31, 18, 0)
+# 같은 마지막 거래일(금요일) 이후의 실행: 주말, 월요일 장 시작 전, 연휴 중
+LATER_RUNS = [FRIDAY + timedelta(days=1), FRIDAY + timedelta(days=2, hours=12), FRIDAY + timedelta(days=10)]
+
+
+def frame(last, days=600):
+    index = pd.bdate_range(end=last, periods=days)
+    close = 100 + np.cumsum(np.random.default_rng(0).standard_normal(days))
+    return pd.DataFrame({"Open": close, "High": close + 1, "Low": close - 1,
+                         "Close": close, "Volume": np.full(days, 1e6)}, index=index)
+
+
+def test_window_start_matches_a_run_on_the_last_trading_day():
+    # 거래일 장 마감 후 실행의 옛 벽시계 창 (now - 365일 / now - 400일) 과 같은 첫 날짜
+    assert fd.window_start(pd.Timestamp(FRIDAY.date()), 365) == pd.Timestamp("2025-08-01")
+    assert sd.window_start("2026-07-31") == "2025-06-27"
+
+
+@pytest.mark.parametrize("now", LATER_RUNS)
+def test_history_is_anchored_to_the_last_bar(now):
+    prices = frame(pd.Timestamp(FRIDAY.date()))
+
+    def fetched(at):
+        start = at - timedelta(days=fd.HISTORY_DAYS + fd.FETCH_SLACK_DAYS)
+        kospi, qqq = fd.anchor_history(prices[prices.index >= start], prices[prices.index >= start])
+        return kospi, fd.one_year(kospi, fd.window_start(kospi.index[-1], fd.WINDOW_DAYS))
+
+    (full, year), (full_later, year_later) = fetched(FRIDAY), fetched(now)
+    pd.testing.assert_frame_equal(full, full_later)
+    pd.testing.assert_frame_equal(year, year_later)
+
+
+@pytest.fixture(scope="module")
+def naver():
+    rows = {"01": synthetic_rows(end=FRIDAY, seed=1), "02": synthetic_rows(end=FRIDAY, seed=2)}
+    with NaverStub(rows) as stub:
+        yield stub
+
+
+def supply(stub, now):
+    return sd.fetch_supply_demand(stub.base_url, concurrency=4, rate=1000.0, cache_dir=None, now=now)
+
+
+@pytest.mark.parametrize("now", LATER_RUNS)
+def test_supply_demand_window_is_anchored_to_the_last_trading_day(naver, now):
+    assert supply(naver, now) == supply(naver, FRIDAY)
+
+
+@pytest.mark.parametrize("now", LATER_RUNS)
+def test_lod_is_anchored_to_the_last_bar(monkeypatch, now):
+    prices = frame(pd.Timestamp(FRIDAY.date()), days=22 * 261)
+    monkeypatch.setattr(fd, "download", lambda ticker, start, end, refresh=False:
+                        prices[(prices.index >= start) & (prices.index < end)])
+    lod = fd.build_lod_section(FRIDAY, 300)
+    assert set(lod) == {"5y", "10y", "20y"}
+    assert fd.build_lod_section(now, 300) == lod
+
+
+@pytest.mark.parametrize("now", LATER_RUNS)
+def test_batch_windows_are_anchored_to_each_symbols_last_bar(now):
+    # B 는 수요일 이후 거래정지 — 창은 종목마다 자기 마지막 봉에서 잡힌다
+    prices = {"A": frame(pd.Timestamp(FRIDAY.date())), "B": frame(pd.Timestamp("2026-07-29"))}
+
+    def run(at):
+        start = at - timedelta(days=fd.HISTORY_DAYS + fd.FETCH_SLACK_DAYS)
+        index = batch.run_batch({t: df[df.index >= start] for t, df in prices.items()},
+                                out_dir=None, workers=1, resamples=0)
+        assert not index["errors"], index["errors"]
+        return {k: v for k, v in index.items() if k != "generated"}
+
+    first = run(FRIDAY)
+    assert [s["start"] for s in first["symbols"]] == ["2025-08-01", "2025-07-30"]
+    assert first["start"] == "2025-07-30"
+    assert run(now) == first